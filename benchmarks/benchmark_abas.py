@@ -0,0 +1,86 @@
+"""Páginas de detalhe por segundo e memória: uma aba em série, K abas em um Chrome ou K navegadores.
+
+O servidor simulado responde cada página com ``--latencia`` segundos de
+atraso, como um site lento. As mesmas URLs são abertas com ``driver.get`` em
+série (como os scripts faziam), com ``ExecutorAbas`` em um único navegador e
+com ``PoolNavegadores`` de K instâncias. A memória é a soma dos processos do
+chromedriver e do Chrome ao final de cada modo. Requer Chrome e ChromeDriver.
+
+Executar a partir da raiz do repositório:
+
+    python benchmarks/benchmark_abas.py --paginas 60 --abas 6 --latencia 0.5
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+RAIZ = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(RAIZ))
+sys.path.insert(0, str(RAIZ / "benchmarks"))
+
+from selenium.common.exceptions import WebDriverException
+
+from servidor_simulado import ServidorSimulado
+from utilitarios.abas import ExecutorAbas
+from utilitarios.navegador import criar_chrome
+from utilitarios.pool_navegadores import PoolNavegadores, memoria_mb
+
+
+def ler_pagina(driver, url):
+    return len(driver.page_source)
+
+
+def abrir_e_ler(driver, url):
+    driver.get(url)
+    return ler_pagina(driver, url)
+
+
+def formatar_memoria(memoria) -> str:
+    return "   n/d" if memoria is None else f"{memoria:6.0f}"
+
+
+def main(paginas: int, abas: int, latencia: float):
+    with ServidorSimulado(latencia=latencia) as servidor:
+        urls = [f"{servidor.url_base}{p}" for p in range(1, paginas + 1)]
+        try:
+            driver = criar_chrome()
+        except (WebDriverException, OSError) as e:  # Sem Chrome, ou webdriver-manager sem rede
+            print(f"Chrome indisponível: {e}")
+            return
+        print(f"{paginas} páginas, {abas} abas/navegadores, latência {latencia}s\n")
+        try:
+            inicio = time.perf_counter()
+            serie = [abrir_e_ler(driver, url) for url in urls]
+            tempo = time.perf_counter() - inicio
+            print(f"  {'uma aba em série':22} {paginas / tempo:6.1f} páginas/s  {formatar_memoria(memoria_mb(driver))} MiB")
+
+            with ExecutorAbas(driver, abas=abas) as executor:
+                inicio = time.perf_counter()
+                em_abas = executor.mapear(ler_pagina, urls)
+                tempo = time.perf_counter() - inicio
+                memoria = memoria_mb(driver)
+            print(f"  {f'{abas} abas, um Chrome':22} {paginas / tempo:6.1f} páginas/s  {formatar_memoria(memoria)} MiB")
+        finally:
+            driver.quit()
+
+        with PoolNavegadores(abas) as pool:
+            pool.mapear(abrir_e_ler, urls[:abas])  # Sobe as instâncias fora da medição
+            inicio = time.perf_counter()
+            no_pool = pool.mapear(abrir_e_ler, urls)
+            tempo = time.perf_counter() - inicio
+            memorias = [memoria_mb(d) for d in pool._abertos]
+            memoria = None if None in memorias else sum(memorias)
+        print(f"  {f'{abas} navegadores':22} {paginas / tempo:6.1f} páginas/s  {formatar_memoria(memoria)} MiB")
+
+        paridade = serie == em_abas == no_pool
+        print(f"\n  Paridade: {'ok' if paridade else 'DIVERGENTE'}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--paginas", type=int, default=60)
+    parser.add_argument("--abas", type=int, default=6)
+    parser.add_argument("--latencia", type=float, default=0.5)
+    args = parser.parse_args()
+    main(args.paginas, args.abas, args.latencia)
@@ -0,0 +1,86 @@
+"""Compara um arquivo temporário por página de detalhes com o ``ArquivoWARC``.
+
+Executar a partir da raiz do repositório:
+
+    python benchmarks/benchmark_arquivo_warc.py --paginas 2000
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+RAIZ = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(RAIZ))
+sys.path.insert(0, str(RAIZ / "benchmarks"))
+
+from servidor_simulado import gerar_pagina_df_imoveis
+from utilitarios.arquivo_warc import ArquivoWARC
+
+
+def medir_temporarios(paginas, workers: int):
+    """Caminho antigo: NamedTemporaryFile por página, releitura e remoção."""
+    inicio = time.perf_counter()
+
+    def gravar(conteudo):
+        with tempfile.NamedTemporaryFile(delete=False, suffix=".html") as arquivo:
+            arquivo.write(conteudo)
+            return arquivo.name
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        nomes = list(executor.map(gravar, paginas.values()))
+    gravacao = time.perf_counter() - inicio
+
+    for nome in nomes:
+        with open(nome, "r", encoding="utf-8") as arquivo:
+            arquivo.read()
+        os.remove(nome)
+    total = time.perf_counter() - inicio
+    return gravacao, total - gravacao, sum(len(c) for c in paginas.values())
+
+
+def medir_warc(paginas, workers: int, diretorio: str):
+    """Caminho novo: registros gzip acrescentados a um único .warc.gz."""
+    caminho = os.path.join(diretorio, "detalhes.warc.gz")
+    inicio = time.perf_counter()
+    with ArquivoWARC(caminho, novo=True) as arquivo:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(lambda item: arquivo.gravar(*item), paginas.items()))
+        gravacao = time.perf_counter() - inicio
+
+        for _ in arquivo.iterar():
+            pass
+        leitura = time.perf_counter() - inicio - gravacao
+
+        amostra = random.sample(list(paginas), min(200, len(paginas)))
+        tempo = time.perf_counter()
+        assert all(arquivo.ler(url) == paginas[url] for url in amostra)
+        acesso = (time.perf_counter() - tempo) / len(amostra)
+    return gravacao, leitura, os.path.getsize(caminho), acesso
+
+
+def main(paginas: int, workers: int):
+    conteudos = {
+        f"https://www.exemplo.com.br/imovel/{p}": gerar_pagina_df_imoveis(p, cards=10)
+        for p in range(1, paginas + 1)
+    }
+    grav_tmp, leit_tmp, bytes_tmp = medir_temporarios(conteudos, workers)
+    with tempfile.TemporaryDirectory() as diretorio:
+        grav_warc, leit_warc, bytes_warc, acesso = medir_warc(conteudos, workers, diretorio)
+
+    print(f"Páginas: {paginas} | workers: {workers}")
+    print(f"{'Temporários':14} gravação {grav_tmp:6.2f}s leitura {leit_tmp:6.2f}s {bytes_tmp / 1e6:7.1f} MB em {paginas} arquivos")
+    print(f"{'ArquivoWARC':14} gravação {grav_warc:6.2f}s leitura {leit_warc:6.2f}s {bytes_warc / 1e6:7.1f} MB em 1 arquivo")
+    print(f"Acesso direto (mmap) a um registro: {acesso * 1e3:.2f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark do arquivo WARC de páginas")
+    parser.add_argument("--paginas", type=int, default=2000)
+    parser.add_argument("--workers", type=int, default=10)
+
+    args = parser.parse_args()
+    main(args.paginas, args.workers)
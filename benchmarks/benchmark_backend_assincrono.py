@@ -0,0 +1,102 @@
+"""Anúncios por minuto no vivareal: caminho Selenium do script contra o backend assíncrono (Playwright).
+
+Um servidor local entrega páginas de listagem no formato do vivareal com
+``--latencia`` segundos de atraso. O caminho Selenium é o do
+``WebScraper`` (``carregar_pagina``, ``rolar_pagina`` e
+``extrair_dados_pagina``, uma página por vez, sem a pausa aleatória entre
+páginas); o assíncrono é ``coletar_assincrono``, com ``--paginas-abertas``
+páginas no mesmo event loop. Os dois usam o mesmo ``ANUNCIO`` e o mesmo
+perfil de bloqueio, e as linhas coletadas precisam coincidir. Requer Chrome
+e ChromeDriver para o Selenium e ``playwright install chromium`` para o
+backend assíncrono.
+
+Executar a partir da raiz do repositório:
+
+    python benchmarks/benchmark_backend_assincrono.py --paginas 12 --paginas-abertas 4 --latencia 0.5
+"""
+import argparse
+import asyncio
+import logging
+import sys
+import threading
+import time
+from http.server import ThreadingHTTPServer
+from pathlib import Path
+
+RAIZ = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(RAIZ))
+sys.path.insert(0, str(RAIZ / "benchmarks"))
+sys.path.insert(0, str(RAIZ / "sites_completos" / "vivareal"))
+
+from selenium.common.exceptions import WebDriverException
+
+import vivareal_scrapping
+from benchmark_extracao_navegador import ManipuladorListagem, gerar_listagem
+
+
+class ManipuladorLento(ManipuladorListagem):
+    latencia = 0.5
+
+    def do_GET(self):
+        time.sleep(self.latencia)
+        super().do_GET()
+
+
+def com_selenium(url_base: str, paginas: int):
+    scraper = vivareal_scrapping.WebScraper()
+    try:
+        linhas = []
+        for pagina in range(1, paginas + 1):
+            scraper.carregar_pagina(f"{url_base}?pagina={pagina}")
+            scraper.rolar_pagina()
+            linhas.extend(scraper.extrair_dados_pagina())
+        return linhas
+    finally:
+        scraper.fechar()
+
+
+def main(paginas: int, paginas_abertas: int, cards: int, latencia: float):
+    logging.disable(logging.INFO)
+    ManipuladorLento.listagem = gerar_listagem(cards)
+    ManipuladorLento.latencia = latencia
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), ManipuladorLento)
+    httpd.daemon_threads = True
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    url_base = f"http://127.0.0.1:{httpd.server_address[1]}/aluguel/"
+
+    print(f"{paginas} páginas de {cards} anúncios, latência {latencia}s\n")
+    resultados = {}
+    modos = (
+        ("Selenium", lambda: com_selenium(url_base, paginas)),
+        (
+            f"assíncrono ({paginas_abertas} páginas)",
+            lambda: asyncio.run(vivareal_scrapping.coletar_assincrono(url_base, paginas, paginas_abertas)),
+        ),
+    )
+    try:
+        for nome, coletar in modos:
+            inicio = time.perf_counter()
+            try:
+                linhas = coletar()
+            except (WebDriverException, OSError, RuntimeError) as e:  # Navegador do modo indisponível
+                print(f"  {nome:24} indisponível: {e}")
+                continue
+            tempo = time.perf_counter() - inicio
+            resultados[nome] = linhas
+            print(f"  {nome:24} {len(linhas) / tempo * 60:8.0f} anúncios/min  ({len(linhas)} em {tempo:.1f}s)")
+    finally:
+        httpd.shutdown()
+
+    if len(resultados) == 2:
+        selenium, assincrono = resultados.values()
+        print(f"\n  Paridade: {'ok' if selenium == assincrono else 'DIVERGENTE'}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--paginas", type=int, default=12)
+    parser.add_argument("--paginas-abertas", type=int, default=4)
+    parser.add_argument("--cards", type=int, default=36)
+    parser.add_argument("--latencia", type=float, default=0.5)
+    args = parser.parse_args()
+    main(args.paginas, args.paginas_abertas, args.cards, args.latencia)
@@ -0,0 +1,155 @@
+"""Tempo de carregamento e tráfego de uma listagem com e sem o bloqueio de recursos do DevTools.
+
+Um servidor local entrega uma listagem com as dependências típicas dos sites
+(imagens dos cards, fontes, CSS, tag manager, analytics e anúncios, com os
+domínios de terceiros no caminho da URL para casar com os padrões de
+``utilitarios.navegador.CATEGORIAS``). A mesma página é aberta pelo Chrome
+headless sem bloqueio e com cada perfil; o ``MonitorRecursos`` informa
+requisições, requisições bloqueadas e bytes recebidos. Requer Chrome e
+ChromeDriver.
+
+Executar a partir da raiz do repositório:
+
+    python benchmarks/benchmark_bloqueio.py --paginas 10
+"""
+import argparse
+import logging
+import statistics
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import urlsplit
+
+RAIZ = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(RAIZ))
+sys.path.insert(0, str(RAIZ / "benchmarks"))
+
+from selenium.common.exceptions import WebDriverException
+
+from paginas_simuladas import CARD_CREDITO_REAL, MOLDURA, _itens_next
+from utilitarios.navegador import PERFIS, MonitorRecursos, aplicar_bloqueio, criar_chrome
+
+# caminho -> (tipo, tamanho em bytes, atraso em segundos)
+RECURSOS = {
+    "/static/app.css": ("text/css", 180_000, 0.02),
+    "/static/fonts/inter.woff2": ("font/woff2", 90_000, 0.02),
+    "/static/fonts/inter-bold.woff2": ("font/woff2", 90_000, 0.02),
+    "/www.googletagmanager.com/gtm.js": ("application/javascript", 250_000, 0.12),
+    "/www.google-analytics.com/analytics.js": ("application/javascript", 50_000, 0.10),
+    "/connect.facebook.net/fbevents.js": ("application/javascript", 120_000, 0.10),
+    "/securepubads.doubleclick.net/tag.js": ("application/javascript", 300_000, 0.15),
+    "/static/app.js": ("application/javascript", 60_000, 0.01),
+}
+IMAGENS = 30  # Uma foto por card
+TAMANHO_IMAGEM = 60_000
+
+
+def gerar_listagem() -> bytes:
+    cards = list(_itens_next(1, IMAGENS))
+    corpo = "".join(
+        CARD_CREDITO_REAL.format(**item) + f"<img src='/fotos/{item['indice']}.jpg?w=640'>" for item in cards
+    )
+    cabecalho = "".join(
+        f"<link rel='stylesheet' href='{c}'>" if c.endswith(".css") else f"<script src='{c}'></script>"
+        for c in RECURSOS
+        if not c.endswith(".woff2")
+    )
+    fontes = "".join(
+        f"@font-face {{ font-family: f{i}; src: url('{c}'); }} body {{ font-family: f{i}; }}"
+        for i, c in enumerate(c for c in RECURSOS if c.endswith(".woff2"))
+    )
+    html = MOLDURA.format(titulo="listagem", corpo=f"<main>{corpo}</main>")
+    return html.replace("</head>", f"{cabecalho}<style>{fontes}</style></head>", 1).encode("utf-8")
+
+
+class ManipuladorRecursos(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    listagem = b""
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        caminho = urlsplit(self.path).path
+        if caminho.startswith("/fotos/"):
+            tipo, tamanho, atraso = "image/jpeg", TAMANHO_IMAGEM, 0.03
+        elif caminho in RECURSOS:
+            tipo, tamanho, atraso = RECURSOS[caminho]
+        else:
+            tipo, tamanho, atraso = "text/html; charset=utf-8", None, 0.05
+        time.sleep(atraso)
+        if tamanho is None:
+            conteudo = self.listagem
+        elif tipo.endswith("javascript"):
+            conteudo = b"/*" + b" " * (tamanho - 4) + b"*/"
+        elif tipo == "text/css":
+            conteudo = b".x{}" * (tamanho // 4)
+        else:
+            conteudo = b"\0" * tamanho
+        self.send_response(200)
+        self.send_header("Content-Type", tipo)
+        self.send_header("Content-Length", str(len(conteudo)))
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        self.wfile.write(conteudo)
+
+
+def medir(driver, monitor, url: str, paginas: int):
+    relatorios = []
+    for pagina in range(paginas):
+        driver.get(f"{url}?pagina={pagina}")
+        relatorios.append(monitor.registrar(f"página {pagina}"))
+    return relatorios
+
+
+def main(paginas: int, perfis):
+    logging.disable(logging.INFO)  # Os relatórios por página saem no resumo abaixo
+    ManipuladorRecursos.listagem = gerar_listagem()
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), ManipuladorRecursos)
+    httpd.daemon_threads = True
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{httpd.server_address[1]}/vendas"
+
+    try:
+        driver = criar_chrome(perfil="padrao")
+    except (WebDriverException, OSError) as e:  # Sem Chrome, ou webdriver-manager sem rede
+        print(f"Chrome indisponível: {e}")
+        return
+    try:
+        print(f"{paginas} carregamentos por configuração ({len(ManipuladorRecursos.listagem) // 1024} KiB de HTML)\n")
+        base = None
+        for nome in [None, *perfis]:
+            aplicar_bloqueio(driver, nome)
+            monitor = MonitorRecursos(driver, nome)
+            medir(driver, monitor, url, 1)  # Aquecimento
+            monitor.relatorios.clear()
+            relatorios = medir(driver, monitor, url, paginas)
+            tempo = statistics.median(r.tempo_carregamento or 0 for r in relatorios)
+            requisicoes = statistics.mean(r.requisicoes for r in relatorios)
+            bloqueadas = statistics.mean(r.bloqueadas for r in relatorios)
+            recebidos = statistics.mean(r.bytes_recebidos for r in relatorios)
+            if base is None:
+                base = (tempo, recebidos)
+                comparacao = ""
+            else:
+                comparacao = (
+                    f"  ({base[0] / max(tempo, 1e-3):4.1f}x mais rápido, "
+                    f"{(base[1] - recebidos) / 1024:5.0f} KiB economizados por página)"
+                )
+            print(
+                f"  {nome or 'sem bloqueio':12} load {tempo:5.2f}s  {requisicoes:4.0f} requisições "
+                f"({bloqueadas:3.0f} bloqueadas)  {recebidos / 1024:6.0f} KiB{comparacao}"
+            )
+    finally:
+        driver.quit()
+        httpd.shutdown()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--paginas", type=int, default=10)
+    parser.add_argument("--perfil", action="append", choices=sorted(PERFIS), dest="perfis")
+    args = parser.parse_args()
+    main(args.paginas, args.perfis or ["padrao", "vivareal"])
@@ -0,0 +1,106 @@
+"""Compara páginas/s do pool de threads com o motor asyncio no DF Imóveis.
+
+Executar a partir da raiz do repositório:
+
+    python benchmarks/benchmark_busca_df_imoveis.py --paginas 500 --latencia 0.1
+"""
+import argparse
+import importlib.util
+import logging
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+
+RAIZ = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(RAIZ))
+sys.path.insert(0, str(RAIZ / "benchmarks"))
+sys.path.insert(0, str(RAIZ / "sites_completos" / "df_imoveis"))
+
+from servidor_simulado import ServidorSimulado
+from utilitarios.busca_assincrona import buscar_paginas
+from utilitarios.controle_taxa import ControladorTaxa
+
+# Teto alto para que o controlador não limite o servidor local
+TAXA_MAXIMA = 1000
+
+
+class SemCache:
+    """Substitui o cache em disco do script para medir apenas a rede."""
+
+    def obter(self, sessao, url, **kwargs):
+        resposta = sessao.get(url, **kwargs)
+        resposta.raise_for_status()
+        return resposta.content
+
+
+def carregar_script_df_imoveis():
+    """Importa ``script-df-imoveis.py`` (o hífen impede o import normal)."""
+    caminho = RAIZ / "sites_completos" / "df_imoveis" / "script-df-imoveis.py"
+    spec = importlib.util.spec_from_file_location("script_df_imoveis", caminho)
+    modulo = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = modulo  # Permite ao pickle achar as funções do script
+    spec.loader.exec_module(modulo)
+    modulo.CACHE = SemCache()
+    return modulo
+
+
+def medir_threads(script, url_base: str, paginas: int) -> float:
+    """Executa o caminho original (ThreadPoolExecutor + requests)."""
+    script.BASE_URL = url_base
+    script.CONTROLADOR = ControladorTaxa(taxa_inicial=5, taxa_maxima=TAXA_MAXIMA)
+    inicio = time.perf_counter()
+    with script.criar_sessao() as sessao:
+        with ThreadPoolExecutor(max_workers=script.MAX_WORKERS) as executor:
+            futures = [
+                executor.submit(script.buscar_pagina, sessao, p)
+                for p in range(1, paginas + 1)
+            ]
+            obtidas = sum(1 for f in as_completed(futures) if f.result())
+    duracao = time.perf_counter() - inicio
+    assert obtidas == paginas, f"{paginas - obtidas} páginas falharam"
+    return paginas / duracao
+
+
+def medir_assincrono(script, url_base: str, paginas: int) -> float:
+    """Executa o motor asyncio com o limite por host do script."""
+    urls = [f"{url_base}{p}" for p in range(1, paginas + 1)]
+    inicio = time.perf_counter()
+    conteudos = buscar_paginas(
+        urls,
+        headers=script.HEADERS,
+        limite_por_host=script.LIMITE_POR_HOST,
+        max_tentativas=script.MAX_RETRIES,
+        controlador=ControladorTaxa(taxa_inicial=5, taxa_maxima=TAXA_MAXIMA),
+    )
+    duracao = time.perf_counter() - inicio
+    obtidas = sum(1 for c in conteudos if c)
+    assert obtidas == paginas, f"{paginas - obtidas} páginas falharam"
+    return paginas / duracao
+
+
+def main(paginas: int, latencia: float, taxa_429: float, retry_after: int):
+    logging.disable(logging.WARNING)
+    script = carregar_script_df_imoveis()
+
+    with ServidorSimulado(
+        latencia=latencia, taxa_429=taxa_429, retry_after=retry_after
+    ) as servidor:
+        antes = medir_threads(script, servidor.url_base, paginas)
+        depois = medir_assincrono(script, servidor.url_base, paginas)
+
+    print(f"Páginas: {paginas} | latência: {latencia}s | 429: {taxa_429:.0%}")
+    print(f"Threads ({script.MAX_WORKERS} workers): {antes:8.1f} páginas/s")
+    print(f"Asyncio ({script.LIMITE_POR_HOST} por host): {depois:8.1f} páginas/s")
+    print(f"Ganho: {depois / antes:.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark de busca do DF Imóveis")
+    parser.add_argument("--paginas", type=int, default=500)
+    parser.add_argument("--latencia", type=float, default=0.1)
+    parser.add_argument("--taxa-429", type=float, default=0.05)
+    parser.add_argument("--retry-after", type=int, default=1)
+
+    args = parser.parse_args()
+    main(args.paginas, args.latencia, args.taxa_429, args.retry_after)
@@ -0,0 +1,97 @@
+"""Ganho de montar só os cards da listagem (``criar_soup(..., somente=CARDS)``).
+
+Para cada site, as mesmas páginas são analisadas inteiras e restritas aos
+cards (``SoupStrainer`` com a constante ``CARDS`` do script); mede o tempo por
+página e o pico de memória (``tracemalloc``) de cada modo e confere que os
+cards encontrados têm exatamente o mesmo HTML. Sem ``--warc`` usa as páginas
+de ``paginas_simuladas``, que imitam a proporção de menu, JSON de estado e
+rodapé das listagens reais; com ``--warc`` usa páginas gravadas por um
+``ArquivoWARC``.
+
+Executar a partir da raiz do repositório:
+
+    python benchmarks/benchmark_cards.py --paginas 30
+    python benchmarks/benchmark_cards.py --warc listagens.warc.gz --site lello
+"""
+import argparse
+import logging
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+RAIZ = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(RAIZ))
+sys.path.insert(0, str(RAIZ / "benchmarks"))
+
+from benchmark_parsers import carregar_script
+from paginas_simuladas import gerar_listagem
+from utilitarios.arquivo_warc import ArquivoWARC
+from utilitarios.parser_html import backends_disponiveis, criar_soup
+
+SITES = ("df_imoveis", "franciosi", "lello", "imovelweb")
+
+
+def analisar(entradas, cards, backend: str, somente: bool):
+    """(HTML dos cards de cada página, segundos por página, pico de memória em bytes)."""
+    resultados = []
+    pico = 0
+    inicio = time.perf_counter()
+    for _, html in entradas:
+        soup = criar_soup(html, backend, somente=cards if somente else None)
+        resultados.append([str(card) for card in soup.find_all(*cards)])
+    tempo = (time.perf_counter() - inicio) / len(entradas)
+
+    # Memória medida à parte: o tracemalloc deixa o parsing bem mais lento
+    tracemalloc.start()
+    for _, html in entradas[:5]:
+        soup = criar_soup(html, backend, somente=cards if somente else None)
+        _, pico_pagina = tracemalloc.get_traced_memory()
+        pico = max(pico, pico_pagina)
+        del soup
+        tracemalloc.reset_peak()
+    tracemalloc.stop()
+    return resultados, tempo, pico
+
+
+def main(paginas: int, caminho_warc: str, sites):
+    logging.disable(logging.CRITICAL)
+    backends = [b for b in backends_disponiveis() if b != "selectolax"]  # Ignora ``somente``
+    falhas = 0
+
+    for site in sites:
+        cards = carregar_script(site).CARDS
+        if caminho_warc:
+            with ArquivoWARC(caminho_warc) as arquivo:
+                entradas = list(arquivo.iterar())
+        else:
+            entradas = [(f"https://exemplo/{p}", gerar_listagem(site, p)) for p in range(1, paginas + 1)]
+        tamanho = sum(len(html) for _, html in entradas) / len(entradas) / 1024
+        print(f"\n{site}: {len(entradas)} páginas de {tamanho:.0f} KiB, cards {cards}")
+
+        for backend in backends:
+            completos, tempo_completo, pico_completo = analisar(entradas, cards, backend, False)
+            restritos, tempo_restrito, pico_restrito = analisar(entradas, cards, backend, True)
+            iguais = sum(a == b for a, b in zip(restritos, completos))
+            falhas += len(entradas) - iguais
+            total = sum(len(c) for c in completos)
+            print(
+                f"  {backend:12} {total} cards | inteira {tempo_completo * 1000:6.1f} ms "
+                f"{pico_completo / 2**20:5.1f} MiB | só cards {tempo_restrito * 1000:6.1f} ms "
+                f"{pico_restrito / 2**20:5.1f} MiB | {tempo_completo / tempo_restrito:4.1f}x, "
+                f"paridade {iguais}/{len(entradas)}"
+            )
+
+    if falhas:
+        print(f"\n{falhas} páginas com cards diferentes da análise completa.")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Análise completa x restrita aos cards")
+    parser.add_argument("--paginas", type=int, default=30)
+    parser.add_argument("--warc", help="Arquivo .warc.gz com listagens reais")
+    parser.add_argument("--site", action="append", choices=SITES, dest="sites")
+
+    args = parser.parse_args()
+    main(args.paginas, args.warc, args.sites or list(SITES))
@@ -0,0 +1,81 @@
+"""Tempo para obter o caminho do ChromeDriver em um processo novo: webdriver-manager direto ou o registro em disco.
+
+Cada medição roda em um processo Python separado, como a partida de um
+script: ``ChromeDriverManager().install()`` consulta a rede toda vez, e
+``resolver_chromedriver`` só na primeira (ou quando o Chrome muda de versão
+maior), reaproveitando o registro gravado em ``SCRAPING_DRIVER_DIR``. A
+última linha repete a resolução com ``SCRAPING_OFFLINE=1``.
+
+Executar a partir da raiz do repositório:
+
+    python benchmarks/benchmark_chromedriver.py --repeticoes 5
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+RAIZ = Path(__file__).resolve().parents[1]
+
+# O processo filho mede só a resolução (os imports ficam fora do tempo)
+FILHO = """
+import sys, time
+sys.path.insert(0, {raiz!r})
+{importar}
+inicio = time.perf_counter()
+caminho = {chamada}
+print(time.perf_counter() - inicio, caminho)
+"""
+MODOS = {
+    "webdriver-manager": (
+        "from webdriver_manager.chrome import ChromeDriverManager",
+        "ChromeDriverManager().install()",
+    ),
+    "registro em disco": ("from utilitarios.navegador import resolver_chromedriver", "resolver_chromedriver()"),
+}
+
+
+def medir(modo: str, ambiente: dict):
+    importar, chamada = MODOS[modo]
+    codigo = FILHO.format(raiz=str(RAIZ), importar=importar, chamada=chamada)
+    resultado = subprocess.run([sys.executable, "-c", codigo], capture_output=True, text=True, env=ambiente)
+    if resultado.returncode != 0:
+        erro = resultado.stderr.strip().splitlines()
+        return None, erro[-1] if erro else "erro"
+    segundos, caminho = resultado.stdout.split(maxsplit=1)
+    return float(segundos), caminho.strip()
+
+
+def main(repeticoes: int):
+    with tempfile.TemporaryDirectory() as diretorio:
+        ambiente = {**os.environ, "SCRAPING_DRIVER_DIR": diretorio}
+        ambiente.pop("SCRAPING_OFFLINE", None)
+        print(f"{repeticoes} processos por modo\n")
+        for modo in MODOS:
+            tempos = []
+            for _ in range(repeticoes):
+                segundos, detalhe = medir(modo, ambiente)
+                if segundos is None:
+                    print(f"  {modo:18} falhou: {detalhe}")
+                    break
+                tempos.append(segundos)
+            if tempos:
+                print(
+                    f"  {modo:18} primeira {tempos[0] * 1000:7.1f} ms | "
+                    f"mediana das demais {statistics.median(tempos[1:] or tempos) * 1000:7.1f} ms  ({detalhe})"
+                )
+        segundos, detalhe = medir("registro em disco", {**ambiente, "SCRAPING_OFFLINE": "1"})
+        if segundos is None:
+            print(f"  {'offline':18} falhou: {detalhe}")
+        else:
+            print(f"  {'offline':18} {segundos * 1000:7.1f} ms  ({detalhe})")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeticoes", type=int, default=5)
+    args = parser.parse_args()
+    main(args.repeticoes)
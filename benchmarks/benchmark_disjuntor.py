@@ -0,0 +1,82 @@
+"""Mede o custo de um domínio que cai no meio da coleta, com e sem disjuntor.
+
+O servidor simulado passa a responder 503 depois de ``--fora-do-ar-apos``
+requisições. Sem disjuntor cada página restante é tentada ``MAX_RETRIES + 1``
+vezes; com ele o domínio é pausado e as páginas restantes falham na hora.
+O piso do ``ControladorTaxa`` é elevado para ``TAXA_MINIMA`` para que a rodada
+sem disjuntor termine em minutos (com o piso real, 0.2 req/s, levaria horas).
+
+Executar a partir da raiz do repositório:
+
+    python benchmarks/benchmark_disjuntor.py --paginas 300 --fora-do-ar-apos 50
+"""
+import argparse
+import logging
+import math
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+RAIZ = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(RAIZ))
+sys.path.insert(0, str(RAIZ / "benchmarks"))
+sys.path.insert(0, str(RAIZ / "sites_completos" / "df_imoveis"))
+
+from benchmark_busca_df_imoveis import TAXA_MAXIMA, carregar_script_df_imoveis
+from servidor_simulado import ServidorSimulado
+from utilitarios.controle_taxa import ControladorTaxa
+from utilitarios.disjuntor import Disjuntor
+
+TAXA_MINIMA = 20
+
+
+def medir(script, servidor, paginas: int):
+    """Busca todas as páginas e retorna (páginas obtidas, requisições, segundos)."""
+    inicio = servidor.requisicoes
+    tempo = time.perf_counter()
+    with script.criar_sessao() as sessao:
+        with ThreadPoolExecutor(max_workers=script.MAX_WORKERS) as executor:
+            conteudos = list(
+                executor.map(
+                    lambda p: script.buscar_pagina(sessao, p), range(1, paginas + 1)
+                )
+            )
+    obtidas = sum(1 for c in conteudos if c)
+    return obtidas, servidor.requisicoes - inicio, time.perf_counter() - tempo
+
+
+def main(paginas: int, fora_do_ar_apos: int, latencia: float):
+    logging.disable(logging.CRITICAL)
+    script = carregar_script_df_imoveis()
+
+    disjuntores = {
+        # Nunca abre e nunca nega retentativa: equivale ao comportamento anterior
+        "Sem disjuntor": Disjuntor(
+            falhas_para_abrir=math.inf, proporcao_retentativas=1.0, minimo_retentativas=math.inf
+        ),
+        "Disjuntor + orçamento": Disjuntor(),
+    }
+    medicoes = {}
+    for nome, disjuntor in disjuntores.items():
+        with ServidorSimulado(latencia=latencia, fora_do_ar_apos=fora_do_ar_apos) as servidor:
+            script.BASE_URL = servidor.url_base
+            script.CONTROLADOR = ControladorTaxa(
+                taxa_inicial=TAXA_MINIMA, taxa_maxima=TAXA_MAXIMA, taxa_minima=TAXA_MINIMA
+            )
+            script.DISJUNTOR = disjuntor
+            medicoes[nome] = medir(script, servidor, paginas)
+
+    print(f"Páginas: {paginas} | fora do ar após {fora_do_ar_apos} requisições")
+    for nome, (obtidas, requisicoes, duracao) in medicoes.items():
+        print(f"{nome:24} {obtidas:5} páginas {requisicoes:6} requisições {duracao:7.2f}s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark do disjuntor por domínio")
+    parser.add_argument("--paginas", type=int, default=300)
+    parser.add_argument("--fora-do-ar-apos", type=int, default=50)
+    parser.add_argument("--latencia", type=float, default=0.02)
+
+    args = parser.parse_args()
+    main(args.paginas, args.fora_do_ar_apos, args.latencia)
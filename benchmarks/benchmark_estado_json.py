@@ -0,0 +1,111 @@
+"""Estado JSON embutido (``__NEXT_DATA__``) x cards do HTML nas listagens Next.js.
+
+Para Crédito Real e Loft, as mesmas páginas são extraídas pelo estado JSON
+(com ``orjson`` e com o ``json`` da biblioteca padrão) e pelo caminho antigo,
+que percorre os cards pelas classes geradas. As linhas dos dois caminhos são
+comparadas depois do pós-processamento real de cada script
+(``clean_numeric_columns`` na Loft, ``converter_numericos`` na Crédito
+Real), de modo que um número do JSON inflado ou truncado na conversão
+aparece como divergência. Sem ``--warc`` usa as páginas de
+``paginas_simuladas.gerar_pagina_next``, com preços e áreas decimais.
+
+Executar a partir da raiz do repositório:
+
+    python benchmarks/benchmark_estado_json.py --paginas 30
+"""
+import argparse
+import logging
+import os
+import sys
+import time
+from pathlib import Path
+
+os.environ.setdefault("TQDM_DISABLE", "1")  # O caminho HTML da Crédito Real mostra uma barra por página
+
+RAIZ = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(RAIZ))
+sys.path.insert(0, str(RAIZ / "benchmarks"))
+
+from benchmark_parsers import carregar_script
+from paginas_simuladas import gerar_pagina_next
+from utilitarios import estado_json
+from utilitarios.arquivo_warc import ArquivoWARC
+import pandas as pd
+
+# site -> (extração pelo estado JSON, extração pelo HTML, pós-processamento do script)
+SITES = {
+    "credito_real": ("IMOVEIS_JSON", "processar_html_pagina", lambda script, df: script.converter_numericos(df)),
+    "loft": ("PROPERTIES_JSON", "extract_data_from_html", lambda script, df: script.clean_numeric_columns(df, script.NUMERIC_COLUMNS)),
+}
+
+
+def tratar(linhas, script, pos_processar) -> pd.DataFrame:
+    """As linhas de uma página como o script as deixa depois de converter os números."""
+    return pos_processar(script, pd.DataFrame(linhas)).reset_index(drop=True)
+
+
+def primeira_diferenca(json, html):
+    """Primeiro par de linhas divergentes, para o relatório."""
+    for (_, a), (_, b) in zip(json.iterrows(), html.iterrows()):
+        if not a.equals(b):
+            return a[a != b].to_dict(), b[a != b].to_dict()
+    return f"{len(json)} linhas no JSON, {len(html)} no HTML"
+
+
+def medir(funcao, paginas):
+    inicio = time.perf_counter()
+    resultados = [funcao(html) for html in paginas]
+    return resultados, (time.perf_counter() - inicio) / len(paginas)
+
+
+def main(paginas: int, caminho_warc: str, sites):
+    logging.disable(logging.CRITICAL)
+    falhas = 0
+    orjson = estado_json.orjson
+    for site in sites:
+        nome_json, nome_html, pos_processar = SITES[site]
+        script = carregar_script(site)
+        if caminho_warc:
+            with ArquivoWARC(caminho_warc) as arquivo:
+                entradas = [html for _, html in arquivo.iterar()]
+        else:
+            entradas = [gerar_pagina_next(site, p) for p in range(1, paginas + 1)]
+        tamanho = sum(len(html) for html in entradas) / len(entradas) / 1024
+
+        html, tempo_html = medir(getattr(script, nome_html), entradas)
+        json_rapido, tempo_json = medir(getattr(script, nome_json), entradas)
+        estado_json.orjson = None
+        json_padrao, tempo_padrao = medir(getattr(script, nome_json), entradas)
+        estado_json.orjson = orjson
+
+        tratadas = [
+            (None if j is None else tratar(j, script, pos_processar), tratar(h, script, pos_processar))
+            for j, h in zip(json_rapido, html)
+        ]
+        iguais = sum(j is not None and j.equals(h) for j, h in tratadas)
+        falhas += len(entradas) - iguais
+        linhas = sum(len(h) for h in html)
+        print(f"\n{site}: {len(entradas)} páginas de {tamanho:.0f} KiB, {linhas} linhas")
+        print(f"  cards no HTML        {tempo_html * 1000:7.2f} ms/página")
+        if orjson is not None:
+            print(f"  estado JSON (orjson) {tempo_json * 1000:7.2f} ms/página ({tempo_html / tempo_json:5.1f}x)")
+        print(f"  estado JSON (json)   {tempo_padrao * 1000:7.2f} ms/página ({tempo_html / tempo_padrao:5.1f}x)")
+        print(f"  paridade {iguais}/{len(entradas)}")
+        for pagina, (j, h) in enumerate(tratadas, 1):
+            if j is None or not j.equals(h):
+                print(f"    página {pagina}: {'sem estado JSON' if j is None else primeira_diferenca(j, h)}")
+                break
+
+    if falhas:
+        print(f"\n{falhas} páginas com linhas diferentes entre o estado JSON e o HTML.")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Estado JSON x cards do HTML")
+    parser.add_argument("--paginas", type=int, default=30)
+    parser.add_argument("--warc", help="Arquivo .warc.gz com listagens reais")
+    parser.add_argument("--site", action="append", choices=sorted(SITES), dest="sites")
+
+    args = parser.parse_args()
+    main(args.paginas, args.warc, args.sites or list(SITES))
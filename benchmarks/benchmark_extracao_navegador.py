@@ -0,0 +1,163 @@
+"""Idas e voltas ao WebDriver e tempo para ler os cards de uma página: campo a campo ou em um único script.
+
+Um servidor local entrega uma listagem no formato do vivareal (título, link,
+preço, área, quartos, banheiros, vagas e endereço por card). A mesma página
+é lida pelo Chrome headless de duas formas: com ``find_element``/``.text``
+por campo, como os scripts faziam, e com ``ExtratorNavegador``, que devolve
+todos os cards em um ``execute_script``. Os comandos enviados ao
+chromedriver são contados e as duas leituras precisam dar o mesmo
+resultado. Requer Chrome e ChromeDriver.
+
+Executar a partir da raiz do repositório:
+
+    python benchmarks/benchmark_extracao_navegador.py --cards 50 --repeticoes 5
+"""
+import argparse
+import statistics
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+RAIZ = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(RAIZ))
+sys.path.insert(0, str(RAIZ / "benchmarks"))
+
+from selenium.common.exceptions import NoSuchElementException, WebDriverException
+from selenium.webdriver.common.by import By
+
+from paginas_simuladas import MOLDURA
+from utilitarios.extrator import Campo
+from utilitarios.extrator_navegador import ExtratorNavegador
+from utilitarios.navegador import criar_chrome
+
+CARD = """
+<article class="listing-item">
+  <a href="/imovel/{i}"><h2 class="property-title">Apartamento {i} com {q} quartos</h2></a>
+  <div class="property-price">R$ {preco}</div>
+  <ul>
+    <li class="property-area">{area} m²</li>
+    <li class="property-rooms">{q} quartos</li>
+    <li class="property-bathrooms">{b} banheiros</li>
+    {vagas}
+  </ul>
+  <span class="property-address">Rua {i}, Setor Bueno, Goiânia, GO</span>
+</article>
+"""
+
+CAMPOS = {
+    "titulo": ("property-title", None),
+    "link": ("a", "href"),
+    "preco": ("property-price", None),
+    "area": ("property-area", None),
+    "quartos": ("property-rooms", None),
+    "banheiros": ("property-bathrooms", None),
+    "vagas": ("property-parking", None),
+    "endereco": ("property-address", None),
+}
+EM_LOTE = ExtratorNavegador(".listing-item", {
+    nome: Campo("a" if classe == "a" else f".{classe}", atributo=atributo, padrao="")
+    for nome, (classe, atributo) in CAMPOS.items()
+})
+
+
+def gerar_listagem(cards: int) -> bytes:
+    corpo = "".join(
+        CARD.format(
+            i=i,
+            q=i % 4 + 1,
+            b=i % 3 + 1,
+            preco=f"{300_000 + i * 1_000:,}".replace(",", "."),
+            area=50 + i,
+            vagas=f'<li class="property-parking">{i % 2 + 1} vagas</li>' if i % 5 else "",
+        )
+        for i in range(cards)
+    )
+    return MOLDURA.format(titulo="listagem", corpo=f"<main>{corpo}</main>").encode("utf-8")
+
+
+class ManipuladorListagem(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    listagem = b""
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(self.listagem)))
+        self.end_headers()
+        self.wfile.write(self.listagem)
+
+
+def campo_a_campo(driver):
+    """Como ``_processar_anuncio`` fazia: um ``find_element`` e um ``.text`` por campo."""
+    linhas = []
+    for anuncio in driver.find_elements(By.CLASS_NAME, "listing-item"):
+        linha = {}
+        for nome, (classe, atributo) in CAMPOS.items():
+            try:
+                if classe == "a":
+                    elemento = anuncio.find_element(By.TAG_NAME, "a")
+                else:
+                    elemento = anuncio.find_element(By.CLASS_NAME, classe)
+                linha[nome] = elemento.get_attribute(atributo) if atributo else elemento.text
+            except NoSuchElementException:
+                linha[nome] = ""
+        linhas.append(linha)
+    return linhas
+
+
+def contar_comandos(driver):
+    """Envolve ``driver.execute`` (por onde passam também os comandos dos WebElements) com um contador."""
+    executar, contador = driver.execute, [0]
+
+    def execute(*args, **kwargs):
+        contador[0] += 1
+        return executar(*args, **kwargs)
+
+    driver.execute = execute
+    return contador
+
+
+def main(cards: int, repeticoes: int):
+    ManipuladorListagem.listagem = gerar_listagem(cards)
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), ManipuladorListagem)
+    httpd.daemon_threads = True
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+
+    try:
+        driver = criar_chrome()
+    except (WebDriverException, OSError) as e:  # Sem Chrome, ou webdriver-manager sem rede
+        print(f"Chrome indisponível: {e}")
+        httpd.shutdown()
+        return
+    try:
+        driver.get(f"http://127.0.0.1:{httpd.server_address[1]}/vendas")
+        contador = contar_comandos(driver)
+        print(f"{cards} cards, {len(CAMPOS)} campos por card, {repeticoes} repetições\n")
+        resultados = {}
+        for nome, extrair in (("campo a campo", campo_a_campo), ("um script", EM_LOTE)):
+            tempos = []
+            for _ in range(repeticoes):
+                contador[0] = 0
+                inicio = time.perf_counter()
+                resultados[nome] = extrair(driver)
+                tempos.append(time.perf_counter() - inicio)
+            comandos = contador[0]
+            print(f"  {nome:14} {statistics.median(tempos) * 1000:8.1f} ms  {comandos:5} comandos ao chromedriver")
+        paridade = resultados["campo a campo"] == resultados["um script"]
+        print(f"\n  Paridade: {'ok' if paridade else 'DIVERGENTE'}")
+    finally:
+        driver.quit()
+        httpd.shutdown()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cards", type=int, default=50)
+    parser.add_argument("--repeticoes", type=int, default=5)
+    args = parser.parse_args()
+    main(args.cards, args.repeticoes)
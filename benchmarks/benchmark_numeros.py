@@ -0,0 +1,173 @@
+"""``normalizar_numeros`` x conversões linha a linha dos scripts, em 1 milhão de linhas.
+
+Gera uma coluna com os formatos encontrados nas listagens (``R$ 1.234,56``,
+``80 m²``, ``120,00 m²``, ``Sob Consulta``, ``R$ 800 mil``, ``R$ 1,2 mi``,
+``3 hectares``, faixas ``R$ 1.000 a R$ 2.000``) junto com o valor esperado e
+mede o tempo (o menor de ``--repeticoes``) e a fração de acertos de cada
+conversão. As funções ``antigo_*`` reproduzem o código que os scripts usavam
+antes do ``utilitarios.numeros``.
+
+Executar a partir da raiz do repositório:
+
+    python benchmarks/benchmark_numeros.py --linhas 1000000
+"""
+import argparse
+import math
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from utilitarios import numeros
+
+
+def _milhares(valor: int) -> str:
+    return f"{valor:,}".replace(",", ".")
+
+
+def gerar_coluna(linhas: int, semente: int = 42):
+    """Textos e valores esperados (``NaN`` para ``Sob Consulta``)."""
+    aleatorio = random.Random(semente)
+    textos, esperados = [], []
+    for _ in range(linhas):
+        tipo = aleatorio.randrange(9)
+        inteiro = aleatorio.randrange(50, 5_000_000)
+        centavos = aleatorio.randrange(100)
+        if tipo == 0:
+            texto, valor = f"R$ {_milhares(inteiro)}", inteiro
+        elif tipo == 1:
+            texto, valor = f"R$ {_milhares(inteiro)},{centavos:02d}", inteiro + centavos / 100
+        elif tipo == 2:
+            area = inteiro % 900 + 20
+            texto, valor = f"{area} m²", area
+        elif tipo == 3:
+            area = inteiro % 900 + 20
+            texto, valor = f"{area},{centavos:02d} m²", area + centavos / 100
+        elif tipo == 4:
+            texto, valor = "Sob Consulta", math.nan
+        elif tipo == 5:
+            mil = inteiro % 900 + 100
+            texto, valor = f"R$ {mil} mil", mil * 1000
+        elif tipo == 6:
+            decimo = inteiro % 50 + 10
+            texto, valor = f"R$ {decimo // 10},{decimo % 10} mi", decimo * 100_000
+        elif tipo == 7:
+            hectares = inteiro % 300 + 1
+            texto, valor = f"{hectares} hectares", hectares * 10_000
+        else:
+            maximo = inteiro + aleatorio.randrange(1, 100_000)
+            texto, valor = f"R$ {_milhares(inteiro)} a R$ {_milhares(maximo)}", inteiro
+        textos.append(texto)
+        esperados.append(float(valor))
+    return pd.Series(textos, dtype=object), np.array(esperados)
+
+
+def antigo_df_imoveis(serie: pd.Series) -> pd.Series:
+    """``re.sub(r"\\D", "", ...)`` por célula e depois ``pd.to_numeric``."""
+    return pd.to_numeric(serie.map(lambda t: re.sub(r"\D", "", t) or "0"), errors="coerce")
+
+
+def antigo_vivareal(serie: pd.Series) -> pd.Series:
+    """``_processar_preco``: remove ``R$`` e pontos e troca a vírgula, por célula."""
+
+    def converter(texto):
+        try:
+            return float(texto.replace("R$", "").replace(".", "").replace(",", "."))
+        except ValueError:
+            return 0.0
+
+    return serie.map(converter)
+
+
+def antigo_web_escritorios(serie: pd.Series) -> pd.Series:
+    """``normalizar_numero`` por célula."""
+
+    def converter(valor):
+        try:
+            valor = re.sub(r"[^\d,.-]", "", valor)
+            valor = valor.replace(".", "").replace(",", ".")
+            return float(valor) if valor else 0
+        except ValueError:
+            return 0
+
+    return serie.map(converter)
+
+
+def antigo_credito_real(serie: pd.Series) -> pd.Series:
+    """Primeiro número e multiplicador de hectares, por célula."""
+
+    def converter(texto):
+        encontrado = re.search(r"(\d+)", texto)
+        if not encontrado:
+            return 0.0
+        return float(encontrado.group(1)) * (10000 if "hectares" in texto.lower() else 1)
+
+    return serie.map(converter)
+
+
+def antigo_franciosi(serie: pd.Series) -> pd.Series:
+    """``limpar_converter_coluna``: ``.str.replace`` encadeados e o primeiro número."""
+    serie = serie.astype(str)
+    return serie.str.replace(".", "").str.replace(",", "").str.extract(r"(\d+)")[0].astype(float).fillna(0)
+
+
+def acertos(resultado: pd.Series, esperados: np.ndarray) -> float:
+    resultado = np.asarray(resultado, dtype=float)
+    # "Sob Consulta" conta como acerto se virar NaN ou 0 (o que os scripts filtram depois)
+    sem_valor = np.isnan(esperados) & (np.isnan(resultado) | (resultado == 0))
+    iguais = np.isclose(resultado, esperados, rtol=1e-9)
+    return float(np.mean(sem_valor | iguais))
+
+
+def main(linhas: int, repeticoes: int):
+    inicio = time.perf_counter()
+    serie, esperados = gerar_coluna(linhas)
+    print(f"{linhas} linhas geradas em {time.perf_counter() - inicio:.1f}s\n")
+
+    conversoes = {
+        "df_imoveis (re.sub \\D)": antigo_df_imoveis,
+        "vivareal (_processar_preco)": antigo_vivareal,
+        "web_escritorios (normalizar_numero)": antigo_web_escritorios,
+        "credito_real (hectares)": antigo_credito_real,
+        "franciosi (limpar_converter_coluna)": antigo_franciosi,
+    }
+    if numeros.pa is not None:
+        conversoes["normalizar_numeros (pyarrow)"] = numeros.normalizar_numeros
+        coluna_arrow = serie.astype("string[pyarrow]")
+        conversoes["normalizar_numeros (string[pyarrow])"] = lambda _: numeros.normalizar_numeros(coluna_arrow)
+
+    def sem_pyarrow(coluna):
+        pa, pc = numeros.pa, numeros.pc
+        numeros.pa = numeros.pc = None
+        try:
+            return numeros.normalizar_numeros(coluna)
+        finally:
+            numeros.pa, numeros.pc = pa, pc
+
+    conversoes["normalizar_numeros (pandas .str)"] = sem_pyarrow
+
+    referencia = None
+    for nome, conversao in conversoes.items():
+        tempos = []
+        for _ in range(repeticoes):
+            inicio = time.perf_counter()
+            resultado = conversao(serie)
+            tempos.append(time.perf_counter() - inicio)
+        tempo = min(tempos)
+        referencia = referencia or tempo
+        print(f"  {nome:38} {tempo:6.2f}s ({referencia / tempo:5.1f}x)  acertos {acertos(resultado, esperados):6.1%}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Normalização vetorizada de números brasileiros")
+    parser.add_argument("--linhas", type=int, default=1_000_000)
+    parser.add_argument("--repeticoes", type=int, default=3, help="Vale o menor tempo")
+
+    args = parser.parse_args()
+    main(args.linhas, args.repeticoes)
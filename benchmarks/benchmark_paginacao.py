@@ -0,0 +1,86 @@
+"""Compara a lista fixa de páginas com o ``PlanejadorPaginacao`` no DF Imóveis.
+
+Executar a partir da raiz do repositório:
+
+    python benchmarks/benchmark_paginacao.py --ultima-pagina 300 --palpite 1365
+"""
+import argparse
+import logging
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import partial
+from pathlib import Path
+
+RAIZ = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(RAIZ))
+sys.path.insert(0, str(RAIZ / "benchmarks"))
+sys.path.insert(0, str(RAIZ / "sites_completos" / "df_imoveis"))
+
+from benchmark_busca_df_imoveis import TAXA_MAXIMA, carregar_script_df_imoveis
+from servidor_simulado import ServidorSimulado
+from utilitarios.controle_taxa import ControladorTaxa
+from utilitarios.paginacao import PlanejadorPaginacao
+
+
+def medir_palpite(script, servidor, palpite: int):
+    """Caminho antigo: busca ``range(1, palpite + 1)`` independentemente do fim real."""
+    inicio = servidor.requisicoes
+    tempo = time.perf_counter()
+    imoveis = []
+    with script.criar_sessao() as sessao:
+        with ThreadPoolExecutor(max_workers=script.MAX_WORKERS) as executor:
+            futures = [
+                executor.submit(script.buscar_pagina, sessao, p)
+                for p in range(1, palpite + 1)
+            ]
+            for future in as_completed(futures):
+                conteudo = future.result()
+                if conteudo:
+                    imoveis.extend(script.processar_conteudo_pagina(conteudo))
+    return len(imoveis), servidor.requisicoes - inicio, time.perf_counter() - tempo
+
+
+def medir_planejador(script, servidor, descobrir: bool):
+    """Caminho novo, com ou sem leitura da última página nos links."""
+    inicio = servidor.requisicoes
+    tempo = time.perf_counter()
+    with script.criar_sessao() as sessao:
+        planejador = PlanejadorPaginacao(
+            partial(script.buscar_pagina, sessao),
+            script.processar_conteudo_pagina,
+            max_workers=script.MAX_WORKERS,
+            **({} if descobrir else {"descobrir": None}),
+        )
+        imoveis = planejador.coletar()
+    return len(imoveis), servidor.requisicoes - inicio, time.perf_counter() - tempo
+
+
+def main(ultima_pagina: int, palpite: int, latencia: float):
+    logging.disable(logging.WARNING)
+    script = carregar_script_df_imoveis()
+
+    with ServidorSimulado(latencia=latencia, ultima_pagina=ultima_pagina) as servidor:
+        script.BASE_URL = servidor.url_base
+        medicoes = {}
+        for nome, medir in (
+            (f"Palpite fixo ({palpite})", partial(medir_palpite, palpite=palpite)),
+            ("Planejador (links)", partial(medir_planejador, descobrir=True)),
+            ("Planejador (especulativo)", partial(medir_planejador, descobrir=False)),
+        ):
+            script.CONTROLADOR = ControladorTaxa(taxa_inicial=5, taxa_maxima=TAXA_MAXIMA)
+            medicoes[nome] = medir(script, servidor)
+
+    print(f"Última página real: {ultima_pagina} | latência: {latencia}s")
+    for nome, (imoveis, requisicoes, duracao) in medicoes.items():
+        print(f"{nome:28} {imoveis:7} imóveis {requisicoes:6} requisições {duracao:7.2f}s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark de paginação do DF Imóveis")
+    parser.add_argument("--ultima-pagina", type=int, default=300)
+    parser.add_argument("--palpite", type=int, default=1365)
+    parser.add_argument("--latencia", type=float, default=0.05)
+
+    args = parser.parse_args()
+    main(args.ultima_pagina, args.palpite, args.latencia)
@@ -0,0 +1,149 @@
+"""Paridade e vazão dos backends de ``utilitarios.parser_html`` nos parsers dos scripts.
+
+Para cada função de parsing, as linhas extraídas com ``lxml`` e
+``selectolax`` são comparadas às do ``html.parser`` (a referência) e a vazão
+de cada backend é medida. Sem ``--warc`` usa as páginas de
+``paginas_simuladas``; com ``--warc`` usa páginas reais gravadas por um
+``ArquivoWARC`` (por exemplo, os detalhes da última execução). Páginas
+divergentes são listadas com o primeiro campo diferente. Scripts que fixam o
+parser da listagem em ``PARSER_LISTAGEM`` (a Franciosi, cujo card deixa um
+``<p>`` aberto antes do ``<ul>``) são medidos só nesse backend. A paridade
+também é verificada por ``tests/test_parser_html.py``.
+
+Executar a partir da raiz do repositório:
+
+    python benchmarks/benchmark_parsers.py --paginas 50
+    python benchmarks/benchmark_parsers.py --warc .cache_http/franciosi/detalhes.warc.gz --parser franciosi.detalhe
+"""
+import argparse
+import importlib.util
+import logging
+import os
+import sys
+import time
+from pathlib import Path
+from typing import List
+
+RAIZ = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(RAIZ))
+sys.path.insert(0, str(RAIZ / "benchmarks"))
+
+from paginas_simuladas import gerar_detalhe, gerar_listagem
+from utilitarios.arquivo_warc import ArquivoWARC
+from utilitarios.parser_html import backends_disponiveis
+
+SCRIPTS = {
+    "df_imoveis": "sites_completos/df_imoveis/script-df-imoveis.py",
+    "franciosi": "sites_completos/franciosi_imobiliaria/franciosi_scrapping.py",
+    "lello": "sites_completos/lello_imoveis/lello_scraping.py",
+    "imovelweb": "sites_completos/imovel_web/imovel_web_scrapping.py",
+    "auxiliadora": "sites_completos/auxiliodora_predial/auxiliadora_predial_scrap_in.py",
+    "credito_real": "sites_completos/credito_real/credito_real_scrap_in.py",
+    "loft": "sites_completos/loft/loft_scraping.py",
+}
+
+# nome -> (script, função, recebe registro (url, html)?, gerador de páginas)
+PARSERS = {
+    "df_imoveis.listagem": ("df_imoveis", "processar_conteudo_pagina", False, gerar_listagem),
+    "franciosi.listagem": ("franciosi", "processar_conteudo_pagina", False, gerar_listagem),
+    "franciosi.detalhe": ("franciosi", "extrair_informacoes_adicionais", True, gerar_detalhe),
+    "lello.listagem": ("lello", "process_page_content", False, gerar_listagem),
+    "auxiliadora.listagem": ("auxiliadora", "processar_conteudo_pagina", False, gerar_listagem),
+    "auxiliadora.detalhe": ("auxiliadora", "extrair_informacoes_adicionais", True, gerar_detalhe),
+}
+
+
+def carregar_script(site: str):
+    """Importa o script do site pelo caminho (alguns nomes têm hífen)."""
+    caminho = RAIZ / SCRIPTS[site]
+    sys.path.insert(0, str(caminho.parent))
+    spec = importlib.util.spec_from_file_location(f"script_{site}", caminho)
+    modulo = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(modulo)
+    return modulo
+
+
+def backends_do_parser(nome: str, script) -> List[str]:
+    """Backends em que o parser roda: só o fixado pelo script, se houver."""
+    fixo = getattr(script, "PARSER_LISTAGEM", None) if nome.endswith(".listagem") else None
+    return [fixo] if fixo else backends_disponiveis()
+
+
+def extrair_todas(funcao, entradas, registro: bool, backend: str):
+    os.environ["SCRAPING_PARSER"] = backend
+    inicio = time.perf_counter()
+    resultados = [funcao((url, html) if registro else html) for url, html in entradas]
+    return resultados, time.perf_counter() - inicio
+
+
+def descrever_diferenca(resultado, referencia) -> str:
+    """Primeiro campo que difere entre as linhas de uma página."""
+    linhas = resultado if isinstance(resultado, list) else [resultado]
+    linhas_ref = referencia if isinstance(referencia, list) else [referencia]
+    if len(linhas) != len(linhas_ref):
+        return f"{len(linhas)} linhas em vez de {len(linhas_ref)}"
+    for linha, linha_ref in zip(linhas, linhas_ref):
+        if linha == linha_ref:
+            continue
+        if isinstance(linha, dict) and isinstance(linha_ref, dict):
+            campos = [c for c in linha_ref if linha.get(c) != linha_ref.get(c)]
+            return "; ".join(f"{c}: {linha.get(c)!r} != {linha_ref.get(c)!r}" for c in campos[:2])
+        if isinstance(linha, list) and isinstance(linha_ref, list):
+            campos = [i for i, (a, b) in enumerate(zip(linha, linha_ref)) if a != b]
+            return "; ".join(f"coluna {i}: {linha[i]!r} != {linha_ref[i]!r}" for i in campos[:2])
+        return f"{linha!r} != {linha_ref!r}"
+    return ""
+
+
+def main(paginas: int, caminho_warc: str, nomes):
+    logging.disable(logging.CRITICAL)
+    backends = backends_disponiveis()
+    scripts = {}
+    falhas = 0
+
+    print(f"Backends: {', '.join(backends)}")
+    for nome in nomes:
+        site, nome_funcao, registro, gerar = PARSERS[nome]
+        if site not in scripts:
+            scripts[site] = carregar_script(site)
+        funcao = getattr(scripts[site], nome_funcao)
+
+        if caminho_warc:
+            with ArquivoWARC(caminho_warc) as arquivo:
+                entradas = list(arquivo.iterar())
+        else:
+            entradas = [(f"https://exemplo/{p}", gerar(site, p)) for p in range(1, paginas + 1)]
+
+        referencia, tempo_ref = extrair_todas(funcao, entradas, registro, "html.parser")
+        linhas = sum(len(r) if isinstance(r, list) else int(r is not None) for r in referencia)
+        print(f"\n{nome}: {len(entradas)} páginas, {linhas} linhas")
+        for backend in backends_do_parser(nome, scripts[site]):
+            if backend == "html.parser":
+                resultados, tempo = referencia, tempo_ref
+            else:
+                resultados, tempo = extrair_todas(funcao, entradas, registro, backend)
+            iguais = sum(r == ref for r, ref in zip(resultados, referencia))
+            falhas += len(entradas) - iguais
+            print(
+                f"  {backend:12} {len(entradas) / tempo:8.1f} páginas/s "
+                f"({tempo_ref / tempo:4.1f}x) paridade {iguais}/{len(entradas)}"
+            )
+            for (url, _), r, ref in zip(entradas, resultados, referencia):
+                if r != ref:
+                    print(f"    {url}: {descrever_diferenca(r, ref)}")
+                    break
+
+    os.environ.pop("SCRAPING_PARSER", None)
+    if falhas:
+        print(f"\n{falhas} páginas com linhas diferentes da referência html.parser.")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Paridade e vazão dos parsers de HTML")
+    parser.add_argument("--paginas", type=int, default=50)
+    parser.add_argument("--warc", help="Arquivo .warc.gz com páginas reais")
+    parser.add_argument("--parser", action="append", choices=sorted(PARSERS), dest="parsers")
+
+    args = parser.parse_args()
+    main(args.paginas, args.warc, args.parsers or list(PARSERS))
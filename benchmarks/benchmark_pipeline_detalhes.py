@@ -0,0 +1,74 @@
+"""Tempo total de listagem + detalhes: duas fases com barreira contra o pipeline com fila limitada.
+
+O servidor simulado responde cada requisição com ``--latencia`` segundos de
+atraso; cada página da listagem traz ``--cards`` links de detalhe. Na
+versão com barreira (como os scripts faziam) todos os detalhes esperam a
+última página da listagem; no ``PipelineDetalhes`` os links de cada página
+entram na fila assim que ela é extraída. O tempo esperado do pipeline é o
+da fase mais lenta, não a soma das duas.
+
+Executar a partir da raiz do repositório:
+
+    python benchmarks/benchmark_pipeline_detalhes.py --paginas 20 --latencia 0.2
+"""
+import argparse
+import re
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from pathlib import Path
+
+RAIZ = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(RAIZ))
+sys.path.insert(0, str(RAIZ / "benchmarks"))
+
+from servidor_simulado import ServidorSimulado
+from utilitarios.pipeline import PipelineDetalhes, lotes_em_paralelo
+from utilitarios.sessao import criar_sessao_http
+
+LINKS = re.compile(rb'href="(/imovel/[^"]+)"')
+
+
+def main(paginas: int, cards: int, latencia: float, workers_listagem: int, workers_detalhes: int):
+    with ServidorSimulado(latencia=latencia, cards=cards) as servidor:
+        raiz = servidor.url_base.split("/aluguel")[0]
+        sessao = criar_sessao_http(workers_listagem + workers_detalhes)
+
+        def buscar(pagina):
+            return sessao.get(f"{servidor.url_base}{pagina}").content
+
+        def extrair(conteudo):
+            return [{"Link": raiz + link.decode()} for link in LINKS.findall(conteudo)]
+
+        def detalhar(url):
+            return len(sessao.get(url).content)
+
+        listagem = partial(lotes_em_paralelo, buscar, extrair, range(1, paginas + 1), workers_listagem)
+
+        inicio = time.perf_counter()
+        itens = [item for lote in listagem() for item in lote]
+        meio = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=workers_detalhes) as executor:
+            barreira = dict(zip((i["Link"] for i in itens), executor.map(detalhar, [i["Link"] for i in itens])))
+        fim = time.perf_counter()
+
+        pipeline = PipelineDetalhes(detalhar, workers_detalhes)
+        _, resultados = pipeline.executar(listagem())
+        sessao.close()
+
+    print(f"{paginas} páginas × {cards} detalhes, latência {latencia}s, workers {workers_listagem}/{workers_detalhes}\n")
+    print(f"  {'duas fases':12} {fim - inicio:6.2f}s  (listagem {meio - inicio:.2f}s + detalhes {fim - meio:.2f}s)")
+    print(f"  {'pipeline':12} {pipeline.tempo_total:6.2f}s  (listagem terminou em {pipeline.tempo_listagem:.2f}s)")
+    print(f"\n  Paridade: {'ok' if barreira == resultados else 'DIVERGENTE'}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--paginas", type=int, default=20)
+    parser.add_argument("--cards", type=int, default=30)
+    parser.add_argument("--latencia", type=float, default=0.2)
+    parser.add_argument("--workers-listagem", type=int, default=2)
+    parser.add_argument("--workers-detalhes", type=int, default=20)
+    args = parser.parse_args()
+    main(args.paginas, args.cards, args.latencia, args.workers_listagem, args.workers_detalhes)
@@ -0,0 +1,67 @@
+"""Compara parsing na thread principal com o pipeline busca→parse em processos.
+
+Executar a partir da raiz do repositório:
+
+    python benchmarks/benchmark_pipeline_parse.py --ultima-pagina 400 --latencia 0.01
+"""
+import argparse
+import logging
+import os
+import sys
+import time
+from functools import partial
+from pathlib import Path
+
+RAIZ = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(RAIZ))
+sys.path.insert(0, str(RAIZ / "benchmarks"))
+sys.path.insert(0, str(RAIZ / "sites_completos" / "df_imoveis"))
+
+from benchmark_busca_df_imoveis import TAXA_MAXIMA, carregar_script_df_imoveis
+from servidor_simulado import ServidorSimulado
+from utilitarios.controle_taxa import ControladorTaxa
+from utilitarios.paginacao import PlanejadorPaginacao
+
+
+def medir(script, processos: int):
+    """Coleta todas as páginas e retorna (imóveis, páginas/s)."""
+    script.CONTROLADOR = ControladorTaxa(taxa_inicial=5, taxa_maxima=TAXA_MAXIMA)
+    inicio = time.perf_counter()
+    with script.criar_sessao() as sessao:
+        planejador = PlanejadorPaginacao(
+            partial(script.buscar_pagina, sessao),
+            script.processar_conteudo_pagina,
+            max_workers=script.MAX_WORKERS,
+            processos=processos,
+        )
+        imoveis = planejador.coletar()
+    return len(imoveis), planejador.ultima_pagina / (time.perf_counter() - inicio)
+
+
+def main(ultima_pagina: int, latencia: float, cards: int, processos: int):
+    logging.disable(logging.WARNING)
+    script = carregar_script_df_imoveis()
+
+    with ServidorSimulado(
+        latencia=latencia, cards=cards, ultima_pagina=ultima_pagina
+    ) as servidor:
+        script.BASE_URL = servidor.url_base
+        imoveis_antes, antes = medir(script, 0)
+        imoveis_depois, depois = medir(script, processos)
+
+    assert imoveis_antes == imoveis_depois, "Os dois modos divergiram"
+    print(f"Páginas: {ultima_pagina} | cards por página: {cards} | latência: {latencia}s")
+    print(f"Parse na thread principal: {antes:8.1f} páginas/s")
+    print(f"Pipeline ({processos} processos): {depois:8.1f} páginas/s")
+    print(f"Ganho: {depois / antes:.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark do pipeline busca→parse")
+    parser.add_argument("--ultima-pagina", type=int, default=400)
+    parser.add_argument("--latencia", type=float, default=0.01)
+    parser.add_argument("--cards", type=int, default=30)
+    parser.add_argument("--processos", type=int, default=os.cpu_count() or 1)
+
+    args = parser.parse_args()
+    main(args.ultima_pagina, args.latencia, args.cards, args.processos)
@@ -0,0 +1,92 @@
+"""Mostra o efeito de dimensionar o pool de conexões pelo número de workers.
+
+As páginas são buscadas em ondas de ``--workers`` requisições simultâneas,
+como os scripts fazem por página da listagem (um ``executor.map`` por lote
+de detalhes). No ``HTTPAdapter`` padrão (``pool_maxsize=10``,
+``pool_block=False``) cada onda abre conexões além das 10 do pool e, ao
+devolvê-las, o urllib3 descarta o excesso ("Connection pool is full"); a
+onda seguinte abre tudo de novo. Com o pool dimensionado pelos workers as
+mesmas conexões servem todas as ondas. Os descartes são contados pelo aviso
+do urllib3.
+
+Executar a partir da raiz do repositório:
+
+    python benchmarks/benchmark_pool.py --paginas 500 --workers 20
+"""
+import argparse
+import logging
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from requests.adapters import HTTPAdapter
+
+RAIZ = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(RAIZ))
+sys.path.insert(0, str(RAIZ / "benchmarks"))
+
+from servidor_simulado import ServidorSimulado
+from utilitarios.sessao import _instrumentar, criar_sessao_http
+
+
+class ContadorDescartes(logging.Handler):
+    """Conta os avisos "Connection pool is full, discarding connection" do urllib3."""
+
+    def __init__(self):
+        super().__init__(logging.WARNING)
+        self.descartes = 0
+
+    def emit(self, registro: logging.LogRecord) -> None:
+        if "Connection pool is full" in registro.getMessage():
+            self.descartes += 1
+
+
+def medir(servidor, sessao, paginas: int, workers: int) -> float:
+    """Busca as páginas em ondas de ``workers`` requisições simultâneas e retorna páginas/s."""
+    inicio = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for onda in range(1, paginas + 1, workers):
+            list(
+                executor.map(
+                    lambda p: sessao.get(f"{servidor.url_base}{p}").content,
+                    range(onda, min(onda + workers, paginas + 1)),
+                )
+            )
+    return paginas / (time.perf_counter() - inicio)
+
+
+def main(paginas: int, workers: int, latencia: float):
+    registro_urllib3 = logging.getLogger("urllib3.connectionpool")
+    registro_urllib3.propagate = False  # Conta os avisos sem imprimi-los
+    resultados = []
+    with ServidorSimulado(latencia=latencia) as servidor:
+        # Antes: HTTPAdapter padrão (pool_maxsize=10, pool_block=False) com mais workers que conexões
+        antiga = criar_sessao_http(workers)
+        adaptador = HTTPAdapter()
+        _instrumentar(adaptador, antiga.estatisticas)
+        antiga.mount("http://", adaptador)
+        nova = criar_sessao_http(workers)
+
+        for nome, sessao in (("Pool padrão (10)", antiga), (f"Pool dimensionado ({workers})", nova)):
+            contador = ContadorDescartes()
+            registro_urllib3.addHandler(contador)
+            try:
+                taxa = medir(servidor, sessao, paginas, workers)
+            finally:
+                registro_urllib3.removeHandler(contador)
+            resultados.append((nome, sessao, taxa, contador.descartes))
+
+    print(f"Páginas: {paginas} em ondas de {workers} | workers: {workers} | latência: {latencia}s")
+    for nome, sessao, taxa, descartes in resultados:
+        print(f"{nome:24} {taxa:7.1f} páginas/s | {descartes:4d} descartes | {sessao.estatisticas.resumo()}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark do dimensionamento do pool")
+    parser.add_argument("--paginas", type=int, default=500)
+    parser.add_argument("--workers", type=int, default=20)
+    parser.add_argument("--latencia", type=float, default=0.05)
+
+    args = parser.parse_args()
+    main(args.paginas, args.workers, args.latencia)
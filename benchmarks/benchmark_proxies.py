@@ -0,0 +1,108 @@
+"""Compara o sorteio uniforme de proxies com o ``PoolProxies`` usando proxies locais.
+
+O conjunto simula uma lista real: um proxy rápido, um lento, um instável
+(50% de 502), dois mudos (aceitam a conexão e nunca respondem, como os
+proxies públicos que morreram) e uma entrada duplicada.
+
+Executar a partir da raiz do repositório:
+
+    python benchmarks/benchmark_proxies.py --requisicoes 300
+"""
+import argparse
+import logging
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from pathlib import Path
+from random import choice
+
+import requests
+
+RAIZ = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(RAIZ))
+sys.path.insert(0, str(RAIZ / "benchmarks"))
+
+from servidor_simulado import ProxySimulado, ServidorSimulado
+from utilitarios.pool_proxies import PoolProxies
+
+TENTATIVAS = 3
+
+
+def buscar_aleatorio(sessao, url: str, proxies) -> bool:
+    """Caminho antigo: um proxy sorteado por chamada, repetido nas 3 tentativas."""
+    proxy = choice(proxies)
+    for _ in range(TENTATIVAS):
+        try:
+            resposta = sessao.get(url, proxies={"http": proxy, "https": proxy}, timeout=2)
+            resposta.raise_for_status()
+            return True
+        except requests.exceptions.RequestException:
+            pass
+    return False
+
+
+def buscar_pool(sessao, url: str, pool: PoolProxies) -> bool:
+    """Caminho novo: cada tentativa sorteia do pool e alimenta as estatísticas."""
+    for _ in range(TENTATIVAS):
+        proxy = pool.escolher()
+        if proxy is None:
+            return False
+        inicio = time.monotonic()
+        resposta = None
+        try:
+            resposta = sessao.get(url, proxies={"http": proxy, "https": proxy}, timeout=2)
+            resposta.raise_for_status()
+            return True
+        except requests.exceptions.RequestException:
+            pass
+        finally:
+            pool.registrar_resposta(proxy, resposta, time.monotonic() - inicio)
+    return False
+
+
+def medir(buscar, requisicoes: int, workers: int, url_base: str):
+    inicio = time.perf_counter()
+    with requests.Session() as sessao, ThreadPoolExecutor(max_workers=workers) as executor:
+        resultados = list(
+            executor.map(lambda p: buscar(sessao, f"{url_base}{p}"), range(1, requisicoes + 1))
+        )
+    return sum(resultados), time.perf_counter() - inicio
+
+
+def main(requisicoes: int, workers: int):
+    logging.disable(logging.WARNING)
+    with ExitStack() as pilha:
+        servidor = pilha.enter_context(ServidorSimulado(latencia=0.01))
+        rapido = pilha.enter_context(ProxySimulado(latencia=0.01))
+        lento = pilha.enter_context(ProxySimulado(latencia=0.3))
+        instavel = pilha.enter_context(ProxySimulado(latencia=0.02, taxa_falha=0.5))
+        mudos = [pilha.enter_context(ProxySimulado(latencia=60)) for _ in range(2)]
+        proxies = [rapido.url, lento.url, instavel.url] + [m.url for m in mudos] + [rapido.url]
+
+        medicoes = {
+            "Sorteio uniforme": medir(
+                lambda s, u: buscar_aleatorio(s, u, proxies), requisicoes, workers, servidor.url_base
+            )
+        }
+        tempo = time.perf_counter()
+        with PoolProxies(proxies, url_teste=f"{servidor.url_base}1", timeout=2) as pool:
+            sondagem = time.perf_counter() - tempo
+            medicoes["PoolProxies"] = medir(
+                lambda s, u: buscar_pool(s, u, pool), requisicoes, workers, servidor.url_base
+            )
+            ativos = pool.ativos()
+
+    print(f"Requisições: {requisicoes} | workers: {workers} | proxies: {len(proxies)} (1 duplicado)")
+    for nome, (ok, duracao) in medicoes.items():
+        print(f"{nome:18} {ok:5} sucessos {duracao:7.2f}s ({ok / duracao:6.1f} sucessos/s)")
+    print(f"Primeira sondagem: {sondagem:.2f}s | ativos ao final: {len(ativos)}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark do pool de proxies")
+    parser.add_argument("--requisicoes", type=int, default=300)
+    parser.add_argument("--workers", type=int, default=10)
+
+    args = parser.parse_args()
+    main(args.requisicoes, args.workers)
@@ -0,0 +1,71 @@
+"""Mede bytes transferidos e páginas/s por transporte e ``Accept-Encoding``.
+
+Executar a partir da raiz do repositório:
+
+    python benchmarks/benchmark_transporte.py --paginas 300
+
+O servidor simulado só fala HTTP/1.1, então aqui o ``AdaptadorHTTP2`` mede
+o custo da ponte requests→httpx; a multiplexação aparece em sites com h2.
+"""
+import argparse
+import logging
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import requests
+
+RAIZ = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(RAIZ))
+sys.path.insert(0, str(RAIZ / "benchmarks"))
+
+from servidor_simulado import ServidorSimulado
+from utilitarios.transporte_http2 import AdaptadorHTTP2, codificacoes_aceitas
+
+
+def medir(servidor, sessao: requests.Session, paginas: int, workers: int):
+    """Retorna (KB recebidos por página, páginas/s) buscando ``paginas`` páginas."""
+    bytes_antes = servidor.bytes_enviados
+    inicio = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        conteudos = list(
+            executor.map(
+                lambda p: sessao.get(f"{servidor.url_base}{p}").content,
+                range(1, paginas + 1),
+            )
+        )
+    duracao = time.perf_counter() - inicio
+    assert all(b"new-card" in c for c in conteudos), "Conteúdo não decodificado"
+    return (servidor.bytes_enviados - bytes_antes) / paginas / 1024, paginas / duracao
+
+
+def main(paginas: int, latencia: float, workers: int):
+    logging.disable(logging.WARNING)
+    cenarios = []
+    with ServidorSimulado(latencia=latencia, comprimir=True) as servidor:
+        for nome, codificacao, http2 in (
+            ("HTTP/1.1 sem compressão", "identity", False),
+            ("HTTP/1.1 gzip, deflate", "gzip, deflate", False),
+            (f"HTTP/1.1 {codificacoes_aceitas()}", codificacoes_aceitas(), False),
+            ("AdaptadorHTTP2", codificacoes_aceitas(), True),
+        ):
+            with requests.Session() as sessao:
+                sessao.headers["Accept-Encoding"] = codificacao
+                if http2:
+                    sessao.mount("http://", AdaptadorHTTP2(max_conexoes=workers))
+                cenarios.append((nome, *medir(servidor, sessao, paginas, workers)))
+
+    print(f"Páginas: {paginas} | latência: {latencia}s | workers: {workers}")
+    for nome, kb, taxa in cenarios:
+        print(f"{nome:40} {kb:7.1f} KB/página {taxa:8.1f} páginas/s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark de transporte e compressão")
+    parser.add_argument("--paginas", type=int, default=300)
+    parser.add_argument("--latencia", type=float, default=0.05)
+    parser.add_argument("--workers", type=int, default=20)
+
+    args = parser.parse_args()
+    main(args.paginas, args.latencia, args.workers)
@@ -0,0 +1,240 @@
+"""Páginas de exemplo no formato de cada site, para os benchmarks de parsing.
+
+Os cards seguem os seletores dos parsers dos scripts e incluem as
+irregularidades comuns do HTML real (entidades, ``&nbsp;``, ``<p>`` sem
+fechamento, comentários e scripts) para que a comparação entre parsers não
+dependa de HTML perfeito.
+"""
+import json
+
+from servidor_simulado import CARD_DF_IMOVEIS
+
+# Menu, estado da aplicação em JSON e rodapé com a proporção típica das
+# listagens reais (a maior parte dos bytes da página fica fora dos cards)
+MENU = "".join(
+    f"<li class='menu-item'><a href='/aluguel/df/{i}'>Bairro {i}</a>"
+    f"<ul class='submenu'><li><a href='/aluguel/df/{i}/apartamento'>Apartamentos</a></li>"
+    f"<li><a href='/aluguel/df/{i}/casa'>Casas</a></li></ul></li>"
+    for i in range(150)
+)
+ESTADO = json.dumps({"filtros": [{"id": i, "nome": f"Filtro {i}", "contagem": i * 7} for i in range(600)]})
+RODAPE = "".join(f"<a class='rodape-link' href='/institucional/{i}'>Link {i}</a>" for i in range(80))
+
+MOLDURA = (
+    "<!DOCTYPE html><html><head><meta charset='utf-8'><title>{titulo}</title>"
+    "<script>window.dataLayer = [{{'evento': 'listagem'}}];</script>"
+    "<script id='__ESTADO__' type='application/json'>" + ESTADO.replace("{", "{{").replace("}", "}}") + "</script>"
+    "<style>.card {{ margin: 0 }}</style></head><body>"
+    "<header><nav><ul class='menu'>" + MENU + "</ul></nav></header>"
+    "<!-- conteúdo -->{corpo}"
+    "<footer><p>Todos os direitos reservados &copy; 2024<p>CRECI 1234" + RODAPE + "</footer></body></html>"
+)
+
+CARD_FRANCIOSI = """
+<div class="card card-imo">
+  <a href="imovel/{indice}/casa-centro">
+    <div class="card-valores">R$ {preco}.000 V<br>R$ 2.{indice:03d} L</div>
+  </a>
+  <p class="card-bairro-cidade my-1 pt-1">Centro &amp; Região - Chapecó/SC</p>
+  <p class="card-texto corta-card-desc my-4">Casa ampla&nbsp;com {indice} m² de quintal
+  <ul class="list-group list-group-horizontal">
+    <li class="list-group-item d-flex align-items-center justify-content-center card-itens">Dorm. <span>{quartos}</span></li>
+    <li class="list-group-item d-flex align-items-center justify-content-center card-itens">Suítes <span>1</span></li>
+    <li class="list-group-item d-flex align-items-center justify-content-center card-itens">Banho <span>2</span></li>
+    <li class="list-group-item d-flex align-items-center justify-content-center card-itens">Garagens <span>{quartos}</span></li>
+  </ul>
+</div>
+"""
+
+DETALHE_FRANCIOSI = """
+<div class="px-3 px-lg-0"><h1 class="titulo-imovel">Casa {indice} no Centro</h1></div>
+<div class="row">
+  <div class="col-6 col-md-4 col-lg-3 tipo-prop">Tipo <strong>Casa</strong></div>
+  <div class="col-6 col-md-4 col-lg-3 codigo-imo">Código <span>{indice}</span></div>
+  <div class="col-6 col-md-4 col-lg-3 a-terr-ico-imo"><strong>{area},00 m²</strong></div>
+  <div class="col-6 col-md-4 col-lg-3 a-const-ico-imo"><strong>1{indice} m²</strong></div>
+  <div class="col-6 col-md-4 col-lg-3 a-util-ico-imo"><strong>9{indice} m²</strong></div>
+</div>
+<div class="itens-imo">Churrasqueira</div><div class="itens-imo"> Piscina </div><div class="itens-imo">Sacada</div>
+"""
+
+CARD_LELLO = """
+<article data-testid="realty-card" class="card">
+  <a class="d-flex flex-column justify-content-between h-100" href="/imovel/{indice}">
+    <div class="mb-2 card-title h5"><h2>Apartamento</h2></div>
+    <h3 class="font-weight-bold f-3 text-truncate text-neutral mb-0 f-2">Rua Augusta, {indice}</h3>
+    <span class="card-text-neighborhood f-1 text-truncate">Consolação, São Paulo</span>
+    <div class="totalItemstyle__TotalItem-sc-t6cs2k-0 cyBCVE d-flex flex-column justify-content-between w-100 text-neutral-darkest realtyItemstyle__TotalItem-sc-dxx1wg-1 fYHxEW">
+      <p>R$&nbsp;{preco}.000</p><p>Condomínio R$ 8{indice:02d}</p>
+    </div>
+    <meta itemprop="value" content="{area}"><meta itemprop="numberOfBedrooms" content="{quartos}">
+    <meta itemprop="numberOfBathroomsTotal" content="2">
+    <span data-testid="realty-parking-lot-quantity"> {quartos} vagas </span>
+  </a>
+</article>
+"""
+
+CARD_IMOVELWEB = """
+<div data-qa="posting PROPERTY" data-to-posting="/propriedades/apartamento-{indice}.html">
+  <div class="LocationAddress-sc-ge2uzh-0 iylBOA postingAddress">SQN 210 Bloco {indice}</div>
+  <h2 data-qa="POSTING_CARD_LOCATION">Asa Norte, Brasília</h2>
+  <img data-qa="POSTING_CARD_PUBLISHER" src="/logos/{indice}.png">
+  <div data-qa="POSTING_CARD_PRICE">R$ {preco}.000</div>
+  <div data-qa="expensas">R$ 9{indice:02d} Condominio</div>
+  <h3 data-qa="POSTING_CARD_FEATURES"><span>{area} m² tot.</span><span>{quartos} quartos</span><span>2 ban.</span><span>1 vaga</span></h3>
+</div>
+"""
+
+CARD_AUXILIADORA = """
+<div class="content">
+  <a href="/imovel/venda/{indice}">
+    <div class="oldValue">R$ {preco}.000,00</div>
+    <div class="RuaContainer">Av. Ipiranga, {indice}</div>
+    <div class="Location">Partenon, Porto Alegre</div>
+    <div class="Details"><div>{area} m²</div><div>{quartos} dorm</div><div>1 vaga</div><div>2 banh</div></div>
+  </a>
+</div>
+"""
+
+DETALHE_AUXILIADORA = """
+<h2 class="titulo-imovel-detalhe">Apartamento {indice} com vista</h2>
+<p class="endereco-caracteristicas">Av. Ipiranga, {indice} - Partenon</p>
+<div class="text title medium caracteristica-imovel">{quartos} Suítes</div>
+<div class="caracteristica-imovel-sobre">Portaria 24h</div><div class="caracteristica-imovel-sobre">Elevador</div>
+"""
+
+# Sites em Next.js: cards renderizados com classes geradas e o mesmo conteúdo no
+# JSON do <script id="__NEXT_DATA__">
+CARD_CREDITO_REAL = """
+<a class="sc-613ef922-1 iJQgSL" href="/imovel/{indice}">
+  <span class="sc-e9fa241f-0 bTpAju imovel-type">{tipo}</span>
+  <span class="sc-e9fa241f-1 fdybXW">Rua Padre Chagas, {indice}</span>
+  <span class="sc-e9fa241f-1 hqggtn">Moinhos de Vento, Porto Alegre</span>
+  <p class="sc-e9fa241f-1 ericyj">R$ {preco_texto}</p>
+  <div class="sc-b308a2c-2 iYXIja">
+    <p class="sc-e9fa241f-1 jUSYWw">{area_texto} {unidade}</p>
+    <p class="sc-e9fa241f-1 jUSYWw">{quartos} quartos</p>
+    <p class="sc-e9fa241f-1 jUSYWw">{vagas} vagas</p>
+  </div>
+</a>
+"""
+
+CARD_LOFT = """
+<a class="MuiButtonBase-root MuiCardActionArea-root jss319" href="/imovel/{indice}">
+  <span id="property-type">{tipo}</span>
+  <div class="jss363"><span>R$ {preco_texto}</span></div>
+  <h2 class="MuiTypography-root jss203 jss181 jss194 jss368 MuiTypography-body1 MuiTypography-noWrap">Rua Harmonia {indice}, Vila Madalena</h2>
+  <div class="jss369"><span>{area_texto} m²</span></div><div class="jss369"><span>{quartos}</span></div><div class="jss369"><span>{vagas}</span></div>
+</a>
+"""
+
+
+def _formato_br(valor: float) -> str:
+    """``450000.5`` → ``450.000,50``; ``72.5`` → ``72,5``; inteiros sem decimais."""
+    if float(valor).is_integer():
+        return f"{int(valor):,}".replace(",", ".")
+    decimais = 2 if valor >= 1000 else 1
+    return f"{valor:,.{decimais}f}".replace(",", "_").replace(".", ",").replace("_", ".")
+
+
+def _itens_next(pagina: int, cards: int):
+    for i in range(cards):
+        # Preços com centavos e áreas fracionadas em parte dos itens: o estado
+        # JSON traz floats (450000.5, 72.5) e o card o texto brasileiro
+        preco = (300 + i) * 1000 + (0.5 if i % 4 == 1 else 0)
+        area = 40 + i + (0.5 if i % 3 == 1 else 0)
+        yield {
+            "indice": pagina * 100 + i,
+            "tipo": ("Casa", "Apartamento", "Terreno")[i % 3],
+            "preco": preco,
+            "preco_texto": _formato_br(preco),
+            "area": area,
+            "area_texto": _formato_br(area),
+            "unidade": "hectares" if i % 10 == 9 else "m²",
+            "quartos": 1 + i % 4,
+            "vagas": i % 3,
+        }
+
+
+def _estado_credito_real(item: dict) -> dict:
+    return {
+        "id": item["indice"],
+        "url": f"/imovel/{item['indice']}",
+        "type": item["tipo"],
+        "address": {"street": f"Rua Padre Chagas, {item['indice']}", "neighborhood": "Moinhos de Vento", "city": "Porto Alegre"},
+        "salePrice": item["preco"],
+        "area": item["area"],
+        "areaUnit": "hectares" if item["unidade"] == "hectares" else "m2",
+        "bedrooms": item["quartos"],
+        "parkingSpaces": item["vagas"],
+        "photos": [f"https://cdn.exemplo/{item['indice']}/{f}.jpg" for f in range(12)],
+    }
+
+
+def _estado_loft(item: dict) -> dict:
+    return {
+        "id": str(item["indice"]),
+        "url": f"/imovel/{item['indice']}",
+        "propertyType": item["tipo"],
+        "address": {"streetName": f"Rua Harmonia {item['indice']}", "neighborhood": "Vila Madalena"},
+        "price": item["preco"],
+        "area": item["area"],
+        "bedrooms": item["quartos"],
+        "parkingSpots": item["vagas"],
+        "photos": [f"https://cdn.exemplo/{item['indice']}/{f}.jpg" for f in range(12)],
+    }
+
+
+SITES_NEXT = {
+    "credito_real": (CARD_CREDITO_REAL, "properties", _estado_credito_real),
+    "loft": (CARD_LOFT, "listings", _estado_loft),
+}
+
+
+def gerar_pagina_next(site: str, pagina: int, cards: int = 30) -> bytes:
+    """Listagem de um site Next.js (chaves de ``SITES_NEXT``): cards no HTML e o estado em ``__NEXT_DATA__``."""
+    molde, chave, estado_item = SITES_NEXT[site]
+    itens = list(_itens_next(pagina, cards))
+    estado = {
+        "props": {"pageProps": {chave: [estado_item(i) for i in itens], "filtros": json.loads(ESTADO)["filtros"]}},
+        "page": "/vendas",
+        "buildId": "abc123",
+    }
+    script = json.dumps(estado).replace("</", "\\u003c/")
+    corpo = "".join(molde.format(**item) for item in itens)
+    corpo += f'<script id="__NEXT_DATA__" type="application/json">{script}</script>'
+    return MOLDURA.format(titulo=site, corpo=f"<main>{corpo}</main>").encode("utf-8")
+
+
+CARDS_LISTAGEM = {
+    "df_imoveis": CARD_DF_IMOVEIS,
+    "franciosi": CARD_FRANCIOSI,
+    "lello": CARD_LELLO,
+    "imovelweb": CARD_IMOVELWEB,
+    "auxiliadora": CARD_AUXILIADORA,
+}
+
+
+def _pagina(molde: str, titulo: str, pagina: int, cards: int) -> bytes:
+    corpo = "".join(
+        molde.format(
+            pagina=pagina,
+            indice=pagina * 100 + i,
+            preco=300 + i,
+            area=40 + i,
+            quartos=1 + i % 4,
+        )
+        for i in range(cards)
+    )
+    return MOLDURA.format(titulo=titulo, corpo=f"<main>{corpo}</main>").encode("utf-8")
+
+
+def gerar_listagem(site: str, pagina: int, cards: int = 30) -> bytes:
+    """Página de listagem de ``site`` (chaves de ``CARDS_LISTAGEM``)."""
+    return _pagina(CARDS_LISTAGEM[site], site, pagina, cards)
+
+
+def gerar_detalhe(site: str, indice: int) -> bytes:
+    """Página de detalhes de um imóvel (franciosi ou auxiliadora)."""
+    moldes = {"franciosi": DETALHE_FRANCIOSI, "auxiliadora": DETALHE_AUXILIADORA}
+    return _pagina(moldes[site], site, indice, 1)
@@ -0,0 +1,234 @@
+"""Servidor HTTP local que imita as listagens do DF Imóveis para benchmarks."""
+import gzip
+import random
+import threading
+import time
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+CARD_DF_IMOVEIS = """
+<a class="new-card" href="/imovel/apartamento-2-quartos-aguas-claras-{pagina}-{indice}">
+  <h2 class="new-title">Apartamento em ÁGUAS CLARAS {pagina}-{indice}</h2>
+  <h3 class="new-simple phrase">Rua 12 Norte, Lote {indice}</h3>
+  <div class="new-price"><h4>R$ {preco}</h4></div>
+  <ul class="new-details-ul">
+    <li class="m-area">{area} m²</li>
+    <li>2 quartos</li>
+    <li>1 suítes</li>
+    <li>1 vagas</li>
+  </ul>
+  <div class="new-anunciante"><img alt="Imobiliária {indice}" src="/logo.png"></div>
+</a>
+"""
+
+
+def gerar_pagina_df_imoveis(pagina: int, cards: int = 30, ultima_pagina: int = 0) -> bytes:
+    """Gera uma página de listagem no formato do DF Imóveis."""
+    if ultima_pagina and pagina > ultima_pagina:
+        corpo = "<p>Nenhum imóvel encontrado</p>"
+    else:
+        corpo = "".join(
+            CARD_DF_IMOVEIS.format(
+                pagina=pagina,
+                indice=i,
+                preco=f"{1000 + i * 10:,}".replace(",", "."),
+                area=40 + i,
+            )
+            for i in range(cards)
+        )
+    paginacao = ""
+    if ultima_pagina:
+        paginacao = "".join(
+            f'<a href="?pagina={p}">{p}</a>' for p in (1, 2, 3, ultima_pagina)
+        )
+    html = (
+        "<html><head><title>DF Imóveis</title>"
+        "<script>var dados = {};</script></head><body>"
+        f"<header><nav>menu</nav></header><main>{corpo}</main>"
+        f"<div class='pagination'>{paginacao}</div>"
+        "<footer>rodapé</footer></body></html>"
+    )
+    return html.encode("utf-8")
+
+
+def comprimir(conteudo: bytes, aceitas: str):
+    """Comprime com a melhor codificação aceita pelo cliente (zstd, br ou gzip)."""
+    aceitas = {c.split(";")[0].strip() for c in aceitas.split(",")}
+    if "zstd" in aceitas:
+        try:
+            import zstandard
+
+            return zstandard.ZstdCompressor().compress(conteudo), "zstd"
+        except ImportError:
+            pass
+    if "br" in aceitas:
+        try:
+            import brotli
+
+            return brotli.compress(conteudo, quality=5), "br"  # Nível típico de compressão dinâmica
+        except ImportError:
+            pass
+    if "gzip" in aceitas:
+        return gzip.compress(conteudo), "gzip"
+    return conteudo, None
+
+
+class ManipuladorSimulado(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        servidor = self.server
+        time.sleep(servidor.latencia)
+        with servidor.trava:
+            servidor.requisicoes += 1
+
+        if servidor.fora_do_ar_apos and servidor.requisicoes > servidor.fora_do_ar_apos:
+            self.send_response(503)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        if servidor.taxa_429 and random.random() < servidor.taxa_429:
+            self.send_response(429)
+            if servidor.retry_after is not None:
+                self.send_header("Retry-After", str(servidor.retry_after))
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        consulta = parse_qs(urlsplit(self.path).query)
+        pagina = int(consulta.get("pagina", ["1"])[0])
+        conteudo = gerar_pagina_df_imoveis(
+            pagina, servidor.cards, servidor.ultima_pagina
+        )
+        codificacao = None
+        if servidor.comprimir:
+            conteudo, codificacao = comprimir(
+                conteudo, self.headers.get("Accept-Encoding", "")
+            )
+        with servidor.trava:
+            servidor.bytes_enviados += len(conteudo)
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        if codificacao:
+            self.send_header("Content-Encoding", codificacao)
+        self.send_header("Content-Length", str(len(conteudo)))
+        self.end_headers()
+        self.wfile.write(conteudo)
+
+
+class ServidorSimulado:
+    """Sobe o servidor em uma thread; use como context manager."""
+
+    def __init__(
+        self,
+        latencia: float = 0.05,
+        taxa_429: float = 0.0,
+        retry_after=None,
+        cards: int = 30,
+        ultima_pagina: int = 0,
+        comprimir: bool = False,
+        fora_do_ar_apos: int = 0,
+    ):
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), ManipuladorSimulado)
+        self.httpd.daemon_threads = True
+        self.httpd.request_queue_size = 1024
+        self.httpd.latencia = latencia
+        self.httpd.taxa_429 = taxa_429
+        self.httpd.retry_after = retry_after
+        self.httpd.cards = cards
+        self.httpd.ultima_pagina = ultima_pagina
+        self.httpd.comprimir = comprimir
+        self.httpd.fora_do_ar_apos = fora_do_ar_apos  # Responde 503 a tudo depois de N requisições
+        self.httpd.requisicoes = 0
+        self.httpd.bytes_enviados = 0
+        self.httpd.trava = threading.Lock()
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def url_base(self) -> str:
+        host, porta = self.httpd.server_address
+        return f"http://{host}:{porta}/aluguel/df/todos/imoveis?pagina="
+
+    @property
+    def requisicoes(self) -> int:
+        return self.httpd.requisicoes
+
+    @property
+    def bytes_enviados(self) -> int:
+        return self.httpd.bytes_enviados
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+class ManipuladorProxy(BaseHTTPRequestHandler):
+    """Proxy HTTP de encaminhamento mínimo (apenas GET para destinos http://)."""
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def handle(self):
+        try:
+            super().handle()
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # Cliente desistiu (timeout) antes da resposta
+
+    def do_GET(self):
+        servidor = self.server
+        time.sleep(servidor.latencia)
+        if servidor.taxa_falha and random.random() < servidor.taxa_falha:
+            self.send_response(502)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        cabecalhos = {
+            k: v for k, v in self.headers.items() if k.lower() not in ("host", "proxy-connection")
+        }
+        with urllib.request.urlopen(urllib.request.Request(self.path, headers=cabecalhos)) as resposta:
+            conteudo = resposta.read()
+            status, repassados = resposta.status, resposta.headers.items()
+        self.send_response(status)
+        for chave, valor in repassados:
+            if chave.lower() not in ("content-length", "connection", "transfer-encoding"):
+                self.send_header(chave, valor)
+        self.send_header("Content-Length", str(len(conteudo)))
+        self.end_headers()
+        self.wfile.write(conteudo)
+
+
+class ProxySimulado:
+    """Proxy local com latência extra e taxa de falhas (502) configuráveis."""
+
+    def __init__(self, latencia: float = 0.0, taxa_falha: float = 0.0):
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), ManipuladorProxy)
+        self.httpd.daemon_threads = True
+        self.httpd.latencia = latencia
+        self.httpd.taxa_falha = taxa_falha
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, porta = self.httpd.server_address
+        return f"http://{host}:{porta}"
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
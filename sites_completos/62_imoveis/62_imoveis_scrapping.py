@@ -1,13 +1,20 @@
+import os
+import sys
+from pathlib import Path
 import requests
-from bs4 import BeautifulSoup
 import pandas as pd
-import re
 import numpy as np
 import logging
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import partial
 from distrito_federal_setor import setores
 from tqdm import tqdm
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from utilitarios.cache_http import criar_cache
+from utilitarios.extrator import Campo, Extrator, digitos, item_com, primeiro_numero
+from utilitarios.paginacao import PlanejadorPaginacao
+from utilitarios.parser_html import criar_soup
+
 # Configuração de logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
@@ -16,72 +23,66 @@ HEADERS = {
     'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/58.0.3029.110 Safari/537.3',
 }
 
-# URL base e número de páginas
+# URL base; a última página é descoberta pelos links de paginação
 BASE_URL = 'https://www.62imoveis.com.br/aluguel/go/todos/imoveis?pagina='
-NUM_PAGES = 100
+
+# Processos que parseiam o HTML enquanto as threads seguem buscando
+PROCESSOS_PARSE = os.cpu_count() or 1
+
+# Só os cards entram na árvore do parser (cabeçalho, scripts e rodapé são ignorados)
+CARDS = ('a', {'class': 'new-card'})
+
+# Campos de cada card, extraídos em uma única visita aos nós
+IMOVEL = Extrator({
+    'titulo': Campo('h2.new-title', obrigatorio=True),
+    'href': Campo(':scope', atributo='href', obrigatorio=True),
+    'subtitulo': Campo('h3.new-simple', obrigatorio=True),
+    'imobiliaria': Campo('div.new-anunciante img[alt]', atributo='alt', obrigatorio=True),
+    'preco': Campo('div.new-price h4', pos=digitos, padrao=''),
+    'area': Campo('li.m-area', pos=primeiro_numero),
+    'quarto': Campo('ul.new-details-ul li', todos=True, pos=item_com('quartos', primeiro_numero), padrao='0'),
+    'suite': Campo('ul.new-details-ul li', todos=True, pos=item_com('suítes', primeiro_numero), padrao='0'),
+    'vaga': Campo('ul.new-details-ul li', todos=True, pos=item_com('vagas', primeiro_numero), padrao='0'),
+})
+
+# Cache em disco compartilhado entre execuções (SCRAPING_OFFLINE=1 reprocessa sem rede)
+CACHE = criar_cache('62_imoveis')
 
 def fetch_page(session, page):
     try:
         url = f'{BASE_URL}{page}'
-        response = session.get(url)
-        response.raise_for_status()
-        return response.content
+        return CACHE.obter(session, url)
     except requests.exceptions.RequestException as e:
         logging.error(f'Erro ao acessar a página {page}: {e}')
         return None
 
 def parse_imovel(imovel):
-    try:
-        titulo = imovel.find('h2', attrs={'class': 'new-title'}).text.strip()
-        link = 'https://www.dfimoveis.com.br' + imovel['href']
-        subtitulo = imovel.find('h3', attrs={'class': 'new-simple'}).text.strip()
-        imobiliaria = imovel.find('div', attrs={'class': 'new-anunciante'}).find('img', alt=True)['alt']
-        preco = re.sub(r'\D', '', imovel.find('div', attrs={'class': 'new-price'}).find('h4').text.strip())
-
-        metro_text = imovel.find('li', attrs={'class': 'm-area'}).text.replace('m²', '').strip()
-        metro_match = re.search(r'\d+', metro_text)
-        metro_value = metro_match.group() if metro_match else None
-
-        quarto_suite_vaga = imovel.find('ul', attrs={'class': 'new-details-ul'})
-        quarto = suite = vaga = '0'
-        if quarto_suite_vaga:
-            lista = quarto_suite_vaga.findAll('li')
-            for item in lista:
-                text = item.text.lower()
-                if 'quartos' in text:
-                    quarto_match = re.search(r'(\d+)', text)
-                    quarto = quarto_match.group(1) if quarto_match else '0'
-                elif 'suítes' in text:
-                    suite_match = re.search(r'(\d+)', text)
-                    suite = suite_match.group(1) if suite_match else '0'
-                elif 'vagas' in text:
-                    vaga_match = re.search(r'(\d+)', text)
-                    vaga = vaga_match.group(1) if vaga_match else '0'
-
-        return [titulo, subtitulo, link, preco, metro_value, quarto, suite, vaga, imobiliaria]
-    except Exception as e:
-        logging.error(f'Erro ao parsear o imóvel: {e}')
+    dados = IMOVEL(imovel)
+    if dados is None:
+        logging.error('Erro ao parsear o imóvel: campo obrigatório ausente')
         return None
+    link = 'https://www.dfimoveis.com.br' + dados['href']
+    return [dados['titulo'], dados['subtitulo'], link, dados['preco'], dados['area'],
+            dados['quarto'], dados['suite'], dados['vaga'], dados['imobiliaria']]
 
 def process_page_content(content):
-    site = BeautifulSoup(content, 'html.parser')
-    imoveis = site.findAll('a', attrs={'class': 'new-card'})
-    data = [parse_imovel(imovel) for imovel in imoveis if parse_imovel(imovel)]
+    site = criar_soup(content, somente=CARDS)
+    imoveis = site.findAll(*CARDS)
+    data = [dados for dados in (parse_imovel(imovel) for imovel in imoveis) if dados]
     return data
 
 def main():
-    lista_de_imoveis = []
-    
     with requests.Session() as session:
         session.headers.update(HEADERS)
-        
-        with ThreadPoolExecutor(max_workers=20) as executor:  # Increased number of workers
-            futures = [executor.submit(fetch_page, session, page) for page in range(1, NUM_PAGES + 1)]
-            
-            for future in tqdm(as_completed(futures), total=len(futures), desc="Processando páginas"):
-                content = future.result()
-                if content:
-                    lista_de_imoveis.extend(process_page_content(content))
+
+        planejador = PlanejadorPaginacao(
+            partial(fetch_page, session),
+            process_page_content,
+            max_workers=20,
+            processos=PROCESSOS_PARSE,
+        )
+        with tqdm(desc="Processando páginas") as barra:
+            lista_de_imoveis = planejador.coletar(ao_concluir=lambda: barra.update(1))
     
     df_imovel = pd.DataFrame(lista_de_imoveis, columns=['Título', 'Subtítulo', 'Link', 'Preço', 'Área', 'Quarto', 'Suite', 'Vaga', 'Imobiliária'])
     
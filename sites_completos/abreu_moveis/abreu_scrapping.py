@@ -3,16 +3,20 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.keys import Keys
-from webdriver_manager.chrome import ChromeDriverManager
-import time
+import sys
+from pathlib import Path
 from bs4 import BeautifulSoup
 import pandas as pd
 import re
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from utilitarios.incremental import CursorCards
+from utilitarios.navegador import caminho_chromedriver
+
 # Configurar o Selenium
 options = webdriver.ChromeOptions()
 options.add_argument("--headless")  # Executar o navegador em modo headless (sem interface gráfica)
-driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
+driver = webdriver.Chrome(service=Service(caminho_chromedriver()), options=options)
 
 # URL do site
 url = "https://abreuimoveis.com.br/venda/residencial_comercial/"
@@ -25,33 +29,27 @@ NUM_IMOVEIS = 1000
 imoveis_extraidos = 0
 dados_imoveis = []
 codigos_imoveis = set()
-imoveis_anteriores = 0
 tentativas_sem_novos_imoveis = 0
+# Cards novos acumulados na própria página entre uma rolagem e outra
+cursor = CursorCards(driver, "div.col-xs-12.imovel-box-single", raiz="#imovel-boxes")
 
 while imoveis_extraidos < NUM_IMOVEIS and tentativas_sem_novos_imoveis < 10:
-    # Rolar a página com ActionChains
+    # Rolar a página com ActionChains e esperar a página reagir (no máximo 5s)
     element = driver.find_element(By.CSS_SELECTOR, ".col-xs-12.clb-search-result-property")
     actions = ActionChains(driver)
-    actions.move_to_element(element).click().send_keys(Keys.PAGE_DOWN).perform()
-    
-    # Esperar o carregamento da nova parte da página
-    time.sleep(2)
-    
-    # Analisar o HTML carregado com BeautifulSoup
-    soup = BeautifulSoup(driver.page_source, 'html.parser')
-    
-    # Encontrar os imóveis
-    imoveis = soup.find('div', id='imovel-boxes').find_all('div', class_='col-xs-12 imovel-box-single')
-    
+    cursor.avancar(lambda: actions.move_to_element(element).click().send_keys(Keys.PAGE_DOWN).perform(), tempo_maximo=5)
+
+    # Analisar apenas os cards inseridos desde a última rolagem
+    novos = cursor.coletar()
+
     # Verificar se novos imóveis foram carregados
-    if len(imoveis) == imoveis_anteriores:
+    if not novos:
         tentativas_sem_novos_imoveis += 1
         print("Nenhum novo imóvel carregado. Tentativa:", tentativas_sem_novos_imoveis)
         continue
-    else:
-        tentativas_sem_novos_imoveis = 0
-        imoveis_anteriores = len(imoveis)
-    
+    tentativas_sem_novos_imoveis = 0
+    imoveis = BeautifulSoup("".join(novos), 'html.parser').find_all('div', class_='col-xs-12 imovel-box-single')
+
     for imovel in imoveis:
         if imoveis_extraidos >= NUM_IMOVEIS:
             break
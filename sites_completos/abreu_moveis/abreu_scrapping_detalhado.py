@@ -1,23 +1,23 @@
-from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
+import sys
 import time
+from pathlib import Path
 from bs4 import BeautifulSoup
 import pandas as pd
 from tqdm import tqdm
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from utilitarios.abas import ExecutorAbas
+from utilitarios.incremental import CursorCards
+from utilitarios.navegador import criar_chrome
+
 # Definir a variável de reorganização de colunas
 reorganizar_colunas = True  # Defina como True se desejar reorganizar as colunas
 
-# Configurar o Selenium
-options = webdriver.ChromeOptions()
-options.add_argument("--headless")  # Executar o navegador em modo headless (sem interface gráfica)
-
 # Bloquear recursos de terceiros
 prefs = {
     "profile.managed_default_content_settings.images": 2,
@@ -30,9 +30,11 @@ prefs = {
     "profile.managed_default_content_settings.notifications": 2,
     "profile.managed_default_content_settings.media_stream": 2,
 }
-options.add_experimental_option("prefs", prefs)
 
-driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
+# Configurar o Selenium (headless); o perfil "abreu" bloqueia imagens, fontes e
+# rastreadores pelo DevTools, e o ExecutorAbas o repete em cada aba de detalhe
+PERFIL = "abreu"
+driver = criar_chrome(prefs=prefs, perfil=PERFIL)
 
 # URL do site
 url = "https://abreuimoveis.com.br/venda/residencial_comercial/natal/"
@@ -41,46 +43,41 @@ driver.get(url)
 # Variável para selecionar quantos imóveis deseja extrair
 NUM_IMOVEIS = 1112
 
+# Abas do mesmo navegador carregando as páginas de detalhe em paralelo
+ABAS = 6
+
 # Emular a rolagem da página e coletar os dados
 imoveis_extraidos = 0
 dados_imoveis = []
 codigos_imoveis = set()
 caracteristicas_unicas = set()
 infraestrutura_unicas = set()
-imoveis_anteriores = 0
 tentativas_sem_novos_imoveis = 0
 
 # Primeiro passo: Extrair dados básicos dos imóveis
 print("Extraindo dados básicos dos imóveis...")
+# Cards novos acumulados na própria página entre uma rolagem e outra
+cursor = CursorCards(driver, "div.col-xs-12.imovel-box-single", raiz="#imovel-boxes")
 with tqdm(total=NUM_IMOVEIS, desc="Imóveis extraídos", unit="imóvel") as pbar:
     while imoveis_extraidos < NUM_IMOVEIS and tentativas_sem_novos_imoveis < 20:
         try:
-            # Rolar a página com ActionChains
+            # Rolar a página com ActionChains e esperar a página reagir
             element = WebDriverWait(driver, 20).until(
                 EC.presence_of_element_located((By.CSS_SELECTOR, ".col-xs-12.clb-search-result-property"))
             )
             actions = ActionChains(driver)
-            actions.move_to_element(element).click().send_keys(Keys.PAGE_DOWN).perform()
+            cursor.avancar(lambda: actions.move_to_element(element).click().send_keys(Keys.PAGE_DOWN).perform(), tempo_maximo=5)
 
-            # Esperar o carregamento da nova parte da página de forma explícita
-            WebDriverWait(driver, 20).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, ".col-xs-12.clb-search-result-property"))
-            )
-
-            # Analisar o HTML carregado com BeautifulSoup
-            soup = BeautifulSoup(driver.page_source, 'html.parser')
-
-            # Encontrar os imóveis
-            imoveis = soup.find('div', id='imovel-boxes').find_all('div', class_='col-xs-12 imovel-box-single')
+            # Analisar apenas os cards inseridos desde a última rolagem
+            novos = cursor.coletar()
 
             # Verificar se novos imóveis foram carregados
-            if len(imoveis) == imoveis_anteriores:
+            if not novos:
                 tentativas_sem_novos_imoveis += 1
                 print("Nenhum novo imóvel carregado. Tentativa:", tentativas_sem_novos_imoveis)
                 continue
-            else:
-                tentativas_sem_novos_imoveis = 0
-                imoveis_anteriores = len(imoveis)
+            tentativas_sem_novos_imoveis = 0
+            imoveis = BeautifulSoup("".join(novos), 'html.parser').find_all('div', class_='col-xs-12 imovel-box-single')
 
             for imovel in imoveis:
                 if imoveis_extraidos >= NUM_IMOVEIS:
@@ -147,49 +144,53 @@ with tqdm(total=NUM_IMOVEIS, desc="Imóveis extraídos", unit="imóvel") as pbar
             print(f"Erro ao rolar a página ou carregar novos imóveis: {e}")
             break
 
-# Segundo passo: Extrair informações adicionais de cada imóvel
+def extrair_informacoes_adicionais(driver_imovel, link):
+    """Extrai as informações adicionais da página do imóvel já carregada na aba."""
+    soup_imovel = BeautifulSoup(driver_imovel.page_source, 'html.parser')
+
+    # Extrair informações adicionais
+    visualizacoes_element = soup_imovel.find('div', id='amenity-view-counter')
+    visualizacoes = visualizacoes_element.find('span').text.strip() if visualizacoes_element else '0'
+    banheiros_element = soup_imovel.find('div', id='amenity-banheiros')
+    banheiros = banheiros_element.find('span').text.strip() if banheiros_element else '0'
+
+    # Extrair características adicionais do imóvel
+    caracteristicas_element = soup_imovel.find('div', class_='col-xs-12 col-sm-12 col-md-7 col-lg-8 clb-carac-imo')
+    caracteristicas = [carac.text.strip() for carac in caracteristicas_element.find_all('p')] if caracteristicas_element else []
+
+    # Extrair infraestrutura do imóvel
+    infraestrutura_element = soup_imovel.find('div', class_='col-xs-12 col-sm-12 col-md-7 col-lg-8 clb-infra-imo')
+    infraestrutura = [infra.text.strip() for infra in infraestrutura_element.find_all('p')] if infraestrutura_element else []
+
+    return {
+        "Banheiros": banheiros,
+        "Visualizações": visualizacoes,
+        "Características": caracteristicas,
+        "Infraestrutura": infraestrutura,
+    }
+
+# Segundo passo: Extrair informações adicionais de cada imóvel em ABAS abas do
+# navegador da listagem; cada aba que termina de carregar é lida e recebe o
+# próximo link (páginas que não carregam voltam à fila)
 print("Extraindo informações adicionais dos imóveis...")
-with tqdm(total=len(dados_imoveis), desc="Imóveis processados", unit="imóvel") as pbar:
-    for imovel in dados_imoveis:
-        try:
-            # Acessar a página do imóvel
-            driver.get(imovel["Link"])
-            WebDriverWait(driver, 20).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, 'body'))
-            )
-            soup_imovel = BeautifulSoup(driver.page_source, 'html.parser')
-
-            # Extrair informações adicionais
-            visualizacoes_element = soup_imovel.find('div', id='amenity-view-counter')
-            visualizacoes = visualizacoes_element.find('span').text.strip() if visualizacoes_element else '0'
-            banheiros_element = soup_imovel.find('div', id='amenity-banheiros')
-            banheiros = banheiros_element.find('span').text.strip() if banheiros_element else '0'
-
-            # Extrair características adicionais do imóvel
-            caracteristicas_element = soup_imovel.find('div', class_='col-xs-12 col-sm-12 col-md-7 col-lg-8 clb-carac-imo')
-            caracteristicas = [carac.text.strip() for carac in caracteristicas_element.find_all('p')] if caracteristicas_element else []
-            caracteristicas_unicas.update(caracteristicas)
-
-            # Extrair infraestrutura do imóvel
-            infraestrutura_element = soup_imovel.find('div', class_='col-xs-12 col-sm-12 col-md-7 col-lg-8 clb-infra-imo')
-            infraestrutura = [infra.text.strip() for infra in infraestrutura_element.find_all('p')] if infraestrutura_element else []
-            infraestrutura_unicas.update(infraestrutura)
-
-            # Adicionar informações adicionais ao dicionário do imóvel
-            imovel["Banheiros"] = banheiros
-            imovel["Visualizações"] = visualizacoes
-            imovel["Características"] = caracteristicas
-            imovel["Infraestrutura"] = infraestrutura
-
-            pbar.update(1)
-
-        except Exception as e:
-            print(f"Erro ao acessar informações adicionais do imóvel: {e}")
-            continue
+with ExecutorAbas(driver, abas=ABAS, tempo_carregamento=20, perfil=PERFIL) as executor:
+    adicionais = executor.mapear(
+        extrair_informacoes_adicionais,
+        [imovel["Link"] for imovel in dados_imoveis],
+        descricao="Imóveis processados",
+    )
+    print(executor.estatisticas.resumo())
 
 # Fechar o navegador
 driver.quit()
 
+for imovel, informacoes in zip(dados_imoveis, adicionais):
+    if informacoes is None:
+        informacoes = {"Banheiros": '0', "Visualizações": '0', "Características": [], "Infraestrutura": []}
+    imovel.update(informacoes)
+    caracteristicas_unicas.update(informacoes["Características"])
+    infraestrutura_unicas.update(informacoes["Infraestrutura"])
+
 # Criar um DataFrame com os dados
 df = pd.DataFrame(dados_imoveis)
 
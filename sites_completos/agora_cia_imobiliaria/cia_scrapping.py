@@ -3,19 +3,23 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.keys import Keys
-from webdriver_manager.chrome import ChromeDriverManager
 import time
 import pandas as pd
 import re
 from bs4 import BeautifulSoup
 from tqdm import tqdm
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from utilitarios.navegador import caminho_chromedriver
 
 # Configuração do WebDriver
 options = webdriver.ChromeOptions()
 options.add_argument('--headless')  # Para rodar o navegador em modo headless (sem interface gráfica)
 options.add_argument('--no-sandbox')
 options.add_argument('--disable-dev-shm-usage')
-driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
+driver = webdriver.Chrome(service=Service(caminho_chromedriver()), options=options)
 
 # Função para limpar e converter valores numéricos
 def clean_numeric(value):
@@ -1,16 +1,22 @@
 import requests
-from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
-from bs4 import BeautifulSoup
 import pandas as pd
 import re
 import time
 import logging
-import concurrent.futures
 from tqdm import tqdm
+from functools import partial
 from pathlib import Path
 import os
-import tempfile
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from utilitarios.arquivo_warc import criar_arquivo_paginas
+from utilitarios.cache_http import criar_cache, modo_offline_ativo
+from utilitarios.extrator import Campo, Extrator, digitos, item
+from utilitarios.parser_html import criar_soup
+from utilitarios.pipeline import PipelineDetalhes, lotes_em_paralelo, mapear_em_processos
+from utilitarios.sessao import criar_sessao_http
 
 # Configuração de logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -21,99 +27,73 @@ HEADERS = {
     'Referer': 'https://www.auxiliadorapredial.com.br/',
 }
 
+# Cache em disco compartilhado entre execuções (SCRAPING_OFFLINE=1 reprocessa sem rede)
+CACHE = criar_cache('auxiliadora_predial')
+
+# Campos de cada card da listagem, extraídos em uma única visita aos nós
+IMOVEL = Extrator({
+    'Link': Campo('a[href]', atributo='href', pos=lambda href: 'https://www.auxiliadorapredial.com.br' + href),
+    'Preço': Campo('div.oldValue', pos=digitos),
+    'Título': Campo('div.RuaContainer'),
+    'Subtítulo': Campo('div.Location'),
+    'Metro Quadrado': Campo('div.Details div', todos=True, pos=item(0, digitos)),
+    'Quartos': Campo('div.Details div', todos=True, pos=item(1, digitos)),
+    'Vagas': Campo('div.Details div', todos=True, pos=item(2, digitos)),
+    'Banheiros': Campo('div.Details div', todos=True, pos=item(3, digitos)),
+})
+
+# Threads da listagem e dos detalhes (cada fase); as duas rodam juntas, então o
+# pool da sessão tem uma conexão por thread das duas
+MAX_WORKERS = 20
+PAGINAS = range(1, 5)  # Reduzindo para 5 páginas para teste
+PROCESSOS_PARSE = os.cpu_count() or 1  # Processos que parseiam as páginas de detalhes
+
 def configurar_sessao():
     """Configura a sessão de requests com headers customizados."""
-    session = requests.Session()
-    session.headers.update(HEADERS)
     retry_strategy = Retry(
         total=3,
         backoff_factor=1,
         status_forcelist=[429, 500, 502, 503, 504],
         allowed_methods=["HEAD", "GET", "OPTIONS"]
     )
-    adapter = HTTPAdapter(max_retries=retry_strategy, pool_connections=100, pool_maxsize=100)
-    session.mount("https://", adapter)
-    session.mount("http://", adapter)
-    return session
+    return criar_sessao_http(2 * MAX_WORKERS, HEADERS, max_retries=retry_strategy)
 
 def extrair_dados_pagina(sessao, pagina):
     """Extrai o conteúdo HTML de uma página específica."""
     url = f'https://www.auxiliadorapredial.com.br/comprar/residencial/rs+porto-alegre?page={pagina}'
     try:
-        response = sessao.get(url)
-        response.raise_for_status()
-        return response.content
+        return CACHE.obter(sessao, url)
     except requests.exceptions.RequestException as e:
         logging.error(f'Erro ao acessar a página {pagina}: {e}')
         return None
 
 def parsear_imovel(imovel):
     """Extrai informações de um imóvel específico a partir do HTML."""
-    try:
-        # Link do imóvel
-        link_tag = imovel.find('a', href=True)
-        link = 'https://www.auxiliadorapredial.com.br' + link_tag['href'] if link_tag else None
-
-        # Preço
-        preco_tag = imovel.find('div', class_='oldValue')
-        preco = re.sub(r'\D', '', preco_tag.text) if preco_tag else None
-
-        # Título e Subtítulo
-        titulo_tag = imovel.find('div', class_='RuaContainer')
-        titulo = titulo_tag.text.strip() if titulo_tag else None
-
-        subtitulo_tag = imovel.find('div', class_='Location')
-        subtitulo = subtitulo_tag.text.strip() if subtitulo_tag else None
-
-        # Detalhes do imóvel
-        detalhes_tag = imovel.find('div', class_='Details')
-        metro_quadrado, quartos, vagas, banheiros = None, None, None, None
-        if detalhes_tag:
-            detalhes = detalhes_tag.find_all('div')
-            metro_quadrado = re.sub(r'\D', '', detalhes[0].text) if detalhes else None
-            quartos = re.sub(r'\D', '', detalhes[1].text) if len(detalhes) > 1 else None
-            vagas = re.sub(r'\D', '', detalhes[2].text) if len(detalhes) > 2 else None
-            banheiros = re.sub(r'\D', '', detalhes[3].text) if len(detalhes) > 3 else None
-
-        return {
-            'Link': link,
-            'Preço': preco,
-            'Título': titulo,
-            'Subtítulo': subtitulo,
-            'Metro Quadrado': metro_quadrado,
-            'Quartos': quartos,
-            'Vagas': vagas,
-            'Banheiros': banheiros
-        }
-
-    except AttributeError as e:
-        logging.warning(f'Erro ao extrair dados do imóvel: {e}')
-        return None
+    return IMOVEL(imovel)
 
 def processar_conteudo_pagina(conteudo):
     """Processa o conteúdo HTML da página e extrai dados dos imóveis."""
-    site = BeautifulSoup(conteudo, 'html.parser')
+    site = criar_soup(conteudo)
     imoveis = site.find_all('div', class_='content')
     data = [parsear_imovel(imovel) for imovel in imoveis]
     return [item for item in data if item]
 
-def baixar_html(sessao, link):
-    """Baixa o conteúdo HTML de um link específico e salva em um arquivo temporário."""
+def baixar_html(sessao, link, arquivo):
+    """Baixa o conteúdo HTML de um link específico e o acrescenta ao arquivo WARC."""
     try:
         response = sessao.get(link)
         response.raise_for_status()
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.html') as tmp_file:
-            tmp_file.write(response.content)
-            return tmp_file.name
+        arquivo.gravar(link, response.content, response.headers.get('Content-Type', 'text/html'))
+        return True
     except requests.exceptions.RequestException as e:
         logging.error(f'Erro ao acessar o link {link}: {e}')
-        return None
+        return False
 
-def extrair_informacoes_adicionais(filepath):
-    """Extrai informações adicionais de um imóvel a partir do arquivo HTML salvo."""
+def extrair_informacoes_adicionais(registro):
+    """Extrai informações adicionais de um imóvel a partir de um registro (URL, HTML) do arquivo."""
+    link, conteudo = registro
     try:
-        with open(filepath, 'r', encoding='utf-8') as file:
-            soup = BeautifulSoup(file, 'html.parser')
+        soup = criar_soup(conteudo, from_encoding='utf-8')
         
         descricao_tag = soup.find('h2', class_='titulo-imovel-detalhe')
         descricao = descricao_tag.text.strip() if descricao_tag else None
@@ -130,13 +110,14 @@ def extrair_informacoes_adicionais(filepath):
         amenidades = [tag.text.strip() for tag in amenidades_tags]
 
         return {
+            'Link': link,
             'Descrição': descricao,
             'Endereço': endereco,
             'Suítes': suites,
             'Amenidades': amenidades
         }
     except Exception as e:
-        logging.error(f'Erro ao extrair dados do arquivo {filepath}: {e}')
+        logging.error(f'Erro ao extrair dados da página {link}: {e}')
         return None
 
 def main():
@@ -145,37 +126,34 @@ def main():
 
     # Usando context manager para garantir que a sessão seja fechada corretamente
     with configurar_sessao() as sessao:
-        todos_dados = []
-
-        # Extrair dados das páginas
-        with concurrent.futures.ThreadPoolExecutor(max_workers=20) as executor:
-            futures = {executor.submit(extrair_dados_pagina, sessao, pagina): pagina for pagina in range(1, 5)}  # Reduzindo para 5 páginas para teste
-            for future in tqdm(concurrent.futures.as_completed(futures), total=len(futures), desc="Processando páginas"):
-                conteudo = future.result()
-                if conteudo:
-                    todos_dados.extend(processar_conteudo_pagina(conteudo))
-
-        # Filtrando dados nulos
-        todos_dados = [dados for dados in todos_dados if dados]
-
-        # Criação do DataFrame inicial
-        df_imovel = pd.DataFrame(todos_dados)
-
-        html_files = []
-        with concurrent.futures.ThreadPoolExecutor(max_workers=20) as executor:
-            futures = {executor.submit(baixar_html, sessao, imovel['Link']): imovel['Link'] for imovel in todos_dados if imovel['Link']}
-            for future in tqdm(concurrent.futures.as_completed(futures), total=len(futures), desc="Baixando páginas adicionais"):
-                html_file = future.result()
-                if html_file:
-                    html_files.append(html_file)
-
-        # Extrair informações adicionais dos imóveis
+        # Páginas de detalhes vão para um único .warc.gz; com SCRAPING_OFFLINE=1 o
+        # arquivo da execução anterior é reprocessado sem baixar nada
         informacoes_adicionais = []
-        for file in tqdm(html_files, desc="Processando informações adicionais"):
-            info = extrair_informacoes_adicionais(file)
-            if info:
-                informacoes_adicionais.append(info)
-            os.remove(file)  # Remove o arquivo temporário
+        with criar_arquivo_paginas('auxiliadora_predial') as arquivo:
+            with tqdm(total=len(PAGINAS), desc="Processando páginas") as barra:
+                lotes = lotes_em_paralelo(
+                    partial(extrair_dados_pagina, sessao),
+                    processar_conteudo_pagina,
+                    PAGINAS,
+                    MAX_WORKERS,
+                    ao_concluir=lambda: barra.update(1),
+                )
+                if modo_offline_ativo():
+                    todos_dados = [dados for lote in lotes for dados in lote if dados]
+                else:
+                    # Cada página da listagem já enfileira seus detalhes para download
+                    pipeline = PipelineDetalhes(partial(baixar_html, sessao, arquivo=arquivo), MAX_WORKERS)
+                    todos_dados, _ = pipeline.executar(lotes, descricao="Baixando páginas adicionais")
+
+            # Criação do DataFrame inicial
+            df_imovel = pd.DataFrame(todos_dados)
+
+            # Extrair informações adicionais dos imóveis em paralelo, lendo o arquivo em sequência
+            # Lotes limitados: as páginas são descomprimidas conforme os processos as consomem
+            resultados = mapear_em_processos(extrair_informacoes_adicionais, arquivo.iterar(), PROCESSOS_PARSE)
+            for info in tqdm(resultados, total=len(arquivo), desc="Processando informações adicionais"):
+                if info:
+                    informacoes_adicionais.append(info)
 
         df_adicional = pd.DataFrame(informacoes_adicionais)
 
@@ -185,8 +163,8 @@ def main():
             df_adicional[amenidade] = df_adicional['Amenidades'].apply(lambda x: 1 if amenidade in x else 0)
         df_adicional.drop(columns=['Amenidades'], inplace=True)
 
-        # Merge dos DataFrames
-        df_imovel = pd.concat([df_imovel, df_adicional], axis=1)
+        # Merge pelo link: os detalhes chegam fora da ordem da listagem
+        df_imovel = pd.merge(df_imovel, df_adicional, on='Link', how='left')
 
         # Função para limpar e converter colunas numéricas
         def limpar_converter_coluna(coluna):
@@ -1,11 +1,15 @@
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.service import Service as ChromeService
-from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.chrome.options import Options
 import pandas as pd
 import time
 import re
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from utilitarios.navegador import caminho_chromedriver
 
 # Configurar opções do Chrome
 chrome_options = Options()
@@ -14,7 +18,7 @@ chrome_options.add_argument("--disable-gpu")
 chrome_options.add_argument("--no-sandbox")
 
 # Configurar o driver do Chrome
-service = ChromeService(ChromeDriverManager().install())
+service = ChromeService(caminho_chromedriver())
 driver = webdriver.Chrome(service=service, options=chrome_options)
 
 # URL base com a variável de paginação
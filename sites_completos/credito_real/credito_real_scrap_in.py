@@ -1,16 +1,24 @@
 import requests
-from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
-from bs4 import BeautifulSoup
 import pandas as pd
 import re
 import numpy as np
 import time
 import logging
-from concurrent.futures import ThreadPoolExecutor
+import sys
+from pathlib import Path
+from functools import partial
 from tqdm import tqdm
 from multiprocessing import cpu_count
-from cachetools import cached, TTLCache
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from utilitarios.cache_http import criar_cache
+from utilitarios.estado_json import CampoJSON, ExtratorJSON
+from utilitarios.extrator import Campo, Extrator, item, item_com, primeiro_numero
+from utilitarios.numeros import normalizar_colunas
+from utilitarios.parser_html import criar_soup
+from utilitarios.pipeline import PipelineDetalhes, lotes_em_paralelo
+from utilitarios.sessao import criar_sessao_http
 
 # Configuração de logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -24,101 +32,102 @@ HEADERS = {
 # Variável para definir o número de páginas a serem percorridas
 NUM_PAGINAS = 10 # Altere este valor para o número de páginas desejado
 
-# Cache de TTL para armazenar respostas HTTP (10 minutos)
-cache = TTLCache(maxsize=1000, ttl=600)
+# Cache em disco compartilhado entre execuções (SCRAPING_OFFLINE=1 reprocessa sem rede)
+CACHE = criar_cache('credito_real')
+
+# Campos de cada card da listagem, extraídos em uma única visita aos nós; preço e
+# área ficam como texto ("R$ 350.000", "3 hectares") e são convertidos em tratar_dados
+DETALHES_CARD = 'div.sc-b308a2c-2.iYXIja p.sc-e9fa241f-1.jUSYWw'
+LINK_INDISPONIVEL = 'Link não disponível'
+IMOVEL = Extrator({
+    'Título': Campo('span.sc-e9fa241f-1.fdybXW', padrao='Título não disponível'),
+    'Subtítulo': Campo('span.sc-e9fa241f-1.hqggtn', padrao='Subtítulo não disponível'),
+    'Link': Campo(':scope', atributo='href', pos=lambda href: 'https://www.creditoreal.com.br' + href, padrao=LINK_INDISPONIVEL),
+    'Preço': Campo('p.sc-e9fa241f-1.ericyj', padrao='0'),
+    'Metro Quadrado': Campo(DETALHES_CARD, todos=True, pos=item(0), padrao=0),
+    'Quarto': Campo(DETALHES_CARD, todos=True, pos=item_com('quartos', lambda t: int(primeiro_numero(t) or 0)), padrao=0),
+    'Vaga': Campo(DETALHES_CARD, todos=True, pos=item_com('vaga', lambda t: int(primeiro_numero(t) or 0)), padrao=0),
+    'Tipo': Campo('span.sc-e9fa241f-0.bTpAju.imovel-type', padrao='Tipo não disponível'),
+})
+
+# A página (Next.js) traz a listagem completa no JSON do <script id="__NEXT_DATA__">;
+# ler esse estado dispensa as classes geradas pelo styled-components, que mudam a
+# cada deploy. O HTML (IMOVEL acima) fica como alternativa quando o estado falta
+# ou quando a maioria dos itens não tem link e preço (nomes de campos mudaram).
+USAR_ESTADO_JSON = True
+
+def area_json(imovel):
+    """Área do item do estado em m² (``areaUnit`` indica hectares nos rurais)."""
+    area = imovel.get('area')
+    if area is None:
+        return None
+    return float(area) * (10000 if str(imovel.get('areaUnit', '')).lower().startswith('hect') else 1)
+
+IMOVEIS_JSON = ExtratorJSON(
+    {
+        'Título': CampoJSON('address.street', padrao='Título não disponível'),
+        'Subtítulo': CampoJSON('address', pos=lambda e: ', '.join(filter(None, (e.get('neighborhood'), e.get('city')))), padrao='Subtítulo não disponível'),
+        'Link': CampoJSON('url', pos=lambda url: 'https://www.creditoreal.com.br' + url, obrigatorio=True),
+        'Preço': CampoJSON('salePrice', obrigatorio=True),
+        'Metro Quadrado': CampoJSON('', pos=area_json, padrao=0),
+        'Quarto': CampoJSON('bedrooms', pos=int, padrao=0),
+        'Vaga': CampoJSON('parkingSpaces', pos=int, padrao=0),
+        'Tipo': CampoJSON('type', padrao='Tipo não disponível'),
+    },
+    lista='props.pageProps.properties',
+    chaves=('url', 'salePrice'),
+)
+
+# Threads da listagem e dos detalhes (cada fase); as duas rodam juntas, então o
+# pool da sessão tem uma conexão por thread das duas
+MAX_WORKERS = cpu_count() * 2
 
 def configurar_sessao():
     """Configura a sessão de requests com headers customizados."""
-    session = requests.Session()
-    session.headers.update(HEADERS)
     retry_strategy = Retry(
         total=5,
         backoff_factor=1,
         status_forcelist=[429, 500, 502, 503, 504],
         allowed_methods=["HEAD", "GET", "OPTIONS"]
     )
-    adapter = HTTPAdapter(max_retries=retry_strategy, pool_connections=200, pool_maxsize=200)
-    session.mount("https://", adapter)
-    session.mount("http://", adapter)
-    return session
+    return criar_sessao_http(2 * MAX_WORKERS, HEADERS, max_retries=retry_strategy)
 
-@cached(cache)
 def extrair_dados_pagina(sessao, pagina):
     """Extrai o conteúdo HTML de uma página específica."""
     url = f'https://www.creditoreal.com.br/vendas?page={pagina}'
     try:
-        response = sessao.get(url)
-        response.raise_for_status()
-        return response.content
+        return CACHE.obter(sessao, url)
     except requests.exceptions.RequestException as e:
         logging.error(f'Erro ao acessar a página {pagina}: {e}')
         return None
 
 def parsear_imovel(imovel_html):
     """Extrai informações de um imóvel específico a partir do HTML."""
-    try:
-        titulo_elem = imovel_html.find('span', class_='sc-e9fa241f-1 fdybXW')
-        titulo = titulo_elem.text.strip() if titulo_elem else 'Título não disponível'
-
-        link = 'https://www.creditoreal.com.br' + imovel_html['href'] if imovel_html.get('href') else 'Link não disponível'
-
-        subtitulo_elem = imovel_html.find('span', class_='sc-e9fa241f-1 hqggtn')
-        subtitulo = subtitulo_elem.text.strip() if subtitulo_elem else 'Subtítulo não disponível'
-
-        tipo_elem = imovel_html.find('span', class_='sc-e9fa241f-0 bTpAju imovel-type')
-        tipo = tipo_elem.text.strip() if tipo_elem else 'Tipo não disponível'
-
-        preco_elem = imovel_html.find('p', class_='sc-e9fa241f-1 ericyj')
-        preco = re.sub(r'\D', '', preco_elem.text) if preco_elem and preco_elem.text else '0'
-
-        metro_area = imovel_html.find('div', class_='sc-b308a2c-2 iYXIja')
-        metro_value = 0
-        if metro_area:
-            metro_text_elem = metro_area.find('p', class_='sc-e9fa241f-1 jUSYWw')
-            metro_text = metro_text_elem.text.strip() if metro_text_elem else ''
-            if re.search(r'(\d+)', metro_text):
-                metro_value = float(re.search(r'(\d+)', metro_text).group(1))
-                if 'hectares' in metro_text.lower():
-                    metro_value *= 10000
-
-        quarto_vaga = metro_area.findAll('p', class_='sc-e9fa241f-1 jUSYWw') if metro_area else []
-        quarto, vaga = 0, 0
-        for item in quarto_vaga:
-            text = item.text.lower()
-            if 'quartos' in text:
-                quarto = int(re.search(r'(\d+)', text).group(1)) if re.search(r'(\d+)', text) else 0
-            elif 'vaga' in text:
-                vaga = int(re.search(r'(\d+)', text).group(1)) if re.search(r'(\d+)', text) else 0
-
-        return {
-            'Título': titulo,
-            'Subtítulo': subtitulo,
-            'Link': link,
-            'Preço': preco,
-            'Metro Quadrado': metro_value,
-            'Quarto': quarto,
-            'Vaga': vaga,
-            'Tipo': tipo
-        }
-
-    except AttributeError as e:
-        logging.warning(f'Erro ao extrair dados do imóvel: {e}')
-        return None
+    return IMOVEL(imovel_html)
 
 def processar_conteudo_pagina(conteudo):
+    """Extrai os imóveis do estado JSON da página, ou do HTML se o estado não estiver lá."""
+    if USAR_ESTADO_JSON:
+        imoveis = IMOVEIS_JSON(conteudo)
+        if imoveis is not None:
+            return imoveis
+        logging.warning('Estado __NEXT_DATA__ ausente na página; extraindo do HTML.')
+    return processar_html_pagina(conteudo)
+
+def processar_html_pagina(conteudo):
     """Processa o conteúdo HTML da página e extrai dados dos imóveis."""
-    site = BeautifulSoup(conteudo, 'html.parser')
+    site = criar_soup(conteudo)
     imoveis = site.findAll('a', class_='sc-613ef922-1 iJQgSL')
     data = [parsear_imovel(imovel) for imovel in tqdm(imoveis, desc="Processando imóveis")]
     return [item for item in data if item]
 
-@cached(cache)
 def extrair_informacoes_adicionais(sessao, link):
     """Extrai informações adicionais de um imóvel a partir de uma URL."""
     try:
-        response = sessao.get(link)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.content, 'html.parser')
+        conteudo = CACHE.obter(sessao, link)
+        if conteudo is None:
+            return None
+        soup = criar_soup(conteudo)
     
         endereco_elem = soup.find('span', class_='sc-e9fa241f-1 hqggtn')
         endereco = endereco_elem.text.strip() if endereco_elem else 'Endereço não disponível'
@@ -152,14 +161,17 @@ def extrair_informacoes_adicionais(sessao, link):
         logging.error(f'Erro ao extrair dados do link {link}: {e}')
         return None
 
+def converter_numericos(df):
+    """Preço e área (texto do HTML ou número do estado JSON) em float; quartos e vagas em int."""
+    normalizar_colunas(df, ['Preço', 'Metro Quadrado'])
+    df['Quarto'] = pd.to_numeric(df['Quarto'], errors='coerce').fillna(0).astype(int)
+    df['Vaga'] = pd.to_numeric(df['Vaga'], errors='coerce').fillna(0).astype(int)
+    return df
+
 def tratar_dados(df):
     """Trata os dados do DataFrame."""
     try:
-        # Remover caracteres não numéricos e converter colunas para numéricas
-        df['Preço'] = pd.to_numeric(df['Preço'], errors='coerce')
-        df['Metro Quadrado'] = pd.to_numeric(df['Metro Quadrado'], errors='coerce')
-        df['Quarto'] = pd.to_numeric(df['Quarto'], errors='coerce').fillna(0).astype(int)
-        df['Vaga'] = pd.to_numeric(df['Vaga'], errors='coerce').fillna(0).astype(int)
+        converter_numericos(df)
 
         # Excluir imóveis com preço ou metro quadrado inválidos
         df = df[(df['Preço'] > 0) & (df['Metro Quadrado'] > 0)]
@@ -197,31 +209,33 @@ def tratar_dados(df):
 
     return df
 
+def link_detalhe(dado):
+    """URL da página de detalhes do imóvel, ou None quando o card não tem link."""
+    link = dado.get('Link')
+    return None if link == LINK_INDISPONIVEL else link
+
 def main():
     """Função principal que executa o scraping e processa os dados."""
     inicio = time.time()
 
     with configurar_sessao() as sessao:
-        todos_dados = []
-
-        # Extrair dados das páginas
-        with ThreadPoolExecutor(max_workers=cpu_count() * 2) as executor:
-            conteudos_paginas = list(tqdm(executor.map(lambda p: extrair_dados_pagina(sessao, p), range(1, NUM_PAGINAS + 1)), total=NUM_PAGINAS, desc="Baixando páginas"))
-
-        for conteudo in conteudos_paginas:
-            if conteudo:
-                todos_dados.extend(processar_conteudo_pagina(conteudo))
-
-        # Filtrando dados nulos
-        todos_dados = [dado for dado in todos_dados if dado is not None]
-
-        # Baixar HTML adicional e extrair informações adicionais
-        with ThreadPoolExecutor(max_workers=cpu_count() * 2) as executor:
-            infos_adicionais = list(tqdm(executor.map(lambda link: extrair_informacoes_adicionais(sessao, link), 
-                                                      [dado['Link'] for dado in todos_dados]), total=len(todos_dados), desc="Extraindo informações adicionais"))
+        # Cada página da listagem já enfileira os links dos seus imóveis: as
+        # informações adicionais são baixadas enquanto as outras páginas chegam
+        with tqdm(total=NUM_PAGINAS, desc="Baixando páginas") as barra:
+            lotes = lotes_em_paralelo(
+                partial(extrair_dados_pagina, sessao),
+                processar_conteudo_pagina,
+                range(1, NUM_PAGINAS + 1),
+                MAX_WORKERS,
+                ao_concluir=lambda: barra.update(1),
+            )
+            # Cards sem link ficam só na listagem: o marcador não é baixado nem vira chave
+            pipeline = PipelineDetalhes(partial(extrair_informacoes_adicionais, sessao), MAX_WORKERS, chave=link_detalhe)
+            todos_dados, infos_adicionais = pipeline.executar(lotes, descricao="Extraindo informações adicionais")
 
         # Atualizar os dados com as informações adicionais
-        for dado, info_adicional in zip(todos_dados, infos_adicionais):
+        for dado in todos_dados:
+            info_adicional = infos_adicionais.get(link_detalhe(dado))
             if info_adicional:
                 dado.update(info_adicional)
 
@@ -1,17 +1,28 @@
 import os
-import re
-import time
+import sys
 import logging
+import argparse
+from functools import partial
+from pathlib import Path
 from typing import List, Optional, Dict, Any
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor
 import requests
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
-from bs4 import BeautifulSoup
 import pandas as pd
 from tqdm import tqdm
 from distrito_federal_setor import setores as setores_list
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from utilitarios.busca_assincrona import buscar_paginas
+from utilitarios.cache_http import criar_cache
+from utilitarios.controle_taxa import STATUS_SOBRECARGA, ControladorTaxa
+from utilitarios.disjuntor import CircuitoAberto, Disjuntor
+from utilitarios.extrator import Campo, Extrator, item_com, primeiro_numero
+from utilitarios.numeros import normalizar_colunas
+from utilitarios.paginacao import PlanejadorPaginacao, descobrir_ultima_pagina
+from utilitarios.parser_html import criar_soup
+from utilitarios.sessao import criar_sessao_http
+from utilitarios.transporte_http2 import codificacoes_aceitas
+
 # Configurações globais
 logging.basicConfig(
     level=logging.INFO,
@@ -21,14 +32,33 @@ logging.basicConfig(
 
 HEADERS = {
     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/58.0.3029.110 Safari/537.3",
+    "Accept-Encoding": codificacoes_aceitas(),  # br/zstd quando instalados
 }
 
 BASE_URL = "https://www.dfimoveis.com.br/aluguel/df/todos/imoveis?pagina="
-NUM_PAGES = 1365
 MAX_RETRIES = 5
-BACKOFF_FACTOR = 2
-INITIAL_WAIT = 5
 MAX_WORKERS = min(20, (os.cpu_count() or 1) * 4)  # Aumentado o limite de workers
+LIMITE_POR_HOST = 100  # Requisições simultâneas no modo assíncrono
+PROCESSOS_PARSE = os.cpu_count() or 1  # Processos que parseiam o HTML em paralelo à busca
+CACHE = criar_cache("df_imoveis")  # SCRAPING_OFFLINE=1 reprocessa sem rede
+CARDS = ("a", {"class": "new-card"})  # Só os cards entram na árvore do parser
+CONTROLADOR = ControladorTaxa(taxa_inicial=5, taxa_maxima=100)  # Ritmo AIMD por domínio
+DISJUNTOR = Disjuntor()  # Pausa o domínio fora do ar e limita retentativas a ~10%
+
+# Campos de cada card, extraídos em uma única visita aos nós
+IMOVEL = Extrator(
+    {
+        "titulo": Campo("h2.new-title", obrigatorio=True),
+        "href": Campo(":scope", atributo="href", obrigatorio=True),
+        "subtitulo": Campo("h3.new-simple.phrase", padrao=""),
+        "preco": Campo("div.new-price h4", padrao="0"),  # Texto; convertido em processar_dados
+        "area": Campo("li.m-area", padrao="0"),
+        "quarto": Campo("ul.new-details-ul li", todos=True, pos=item_com("quartos", primeiro_numero), padrao="0"),
+        "suite": Campo("ul.new-details-ul li", todos=True, pos=item_com("suítes", primeiro_numero), padrao="0"),
+        "vaga": Campo("ul.new-details-ul li", todos=True, pos=item_com("vagas", primeiro_numero), padrao="0"),
+        "imobiliaria": Campo("div.new-anunciante img[alt]", atributo="alt", padrao=""),
+    }
+)
 
 # Estruturas de dados otimizadas
 setores_set = set(setores_list)
@@ -65,40 +95,47 @@ COLUNAS = [
 ]
 
 
-def criar_sessao() -> requests.Session:
-    """Cria e configura uma sessão HTTP com política de retry."""
-    session = requests.Session()
-    retry = Retry(
-        total=MAX_RETRIES,
-        backoff_factor=BACKOFF_FACTOR,
-        status_forcelist=[429, 500, 502, 503, 504],
-        allowed_methods=["GET"],
+def criar_sessao(http2: bool = False) -> requests.Session:
+    """Cria uma sessão HTTP com controle de taxa, disjuntor e pool por worker.
+
+    Sem ``Retry`` do urllib3: as retentativas ficam só em ``buscar_pagina``,
+    sujeitas ao orçamento do ``DISJUNTOR``. Com ``http2`` as páginas são
+    multiplexadas em poucas conexões pelo ``AdaptadorHTTP2``.
+    """
+    return criar_sessao_http(
+        MAX_WORKERS,
+        HEADERS,
+        controlador=CONTROLADOR,
+        http2=http2,
+        disjuntor=DISJUNTOR,
     )
-    adapter = HTTPAdapter(max_retries=retry)
-    session.mount("https://", adapter)
-    session.headers.update(HEADERS)
-    return session
 
 
 def buscar_pagina(sessao: requests.Session, pagina: int) -> Optional[bytes]:
-    """Obtém o conteúdo de uma página com tratamento de erros robusto."""
+    """Obtém o conteúdo de uma página com tratamento de erros robusto.
+
+    Não há esperas fixas: o ``AdaptadorControlado`` da sessão espaça as
+    tentativas conforme a taxa atual do domínio e o ``Retry-After``. Com o
+    domínio pausado pelo ``DISJUNTOR`` ou sem orçamento de retentativas, a
+    página é dada como perdida na hora.
+    """
     url = f"{BASE_URL}{pagina}"
-    tentativas = 0
-    espera = INITIAL_WAIT
 
-    while tentativas <= MAX_RETRIES:
+    for tentativa in range(MAX_RETRIES + 1):
+        if tentativa and not DISJUNTOR.liberar_retentativa(url):
+            logging.error(f"Orçamento de retentativas esgotado na página {pagina}.")
+            return None
         try:
-            resposta = sessao.get(url, timeout=30)
-            resposta.raise_for_status()
-            return resposta.content
+            return CACHE.obter(sessao, url, timeout=30)
+        except CircuitoAberto as e:
+            logging.error(f"Página {pagina} ignorada: {e}")
+            return None
         except requests.exceptions.HTTPError as e:
-            if e.response.status_code == 429:
+            if e.response.status_code in STATUS_SOBRECARGA:
                 logging.warning(
-                    f"Erro 429 na página {pagina}. Tentando novamente em {espera}s..."
+                    f"Erro {e.response.status_code} na página {pagina}. Nova tentativa a "
+                    f"{CONTROLADOR.taxa(url):.2f} req/s..."
                 )
-                time.sleep(espera)
-                espera *= BACKOFF_FACTOR
-                tentativas += 1
             else:
                 logging.error(
                     f"Erro HTTP {e.response.status_code} na página {pagina}: {e}"
@@ -106,82 +143,34 @@ def buscar_pagina(sessao: requests.Session, pagina: int) -> Optional[bytes]:
                 return None
         except requests.exceptions.RequestException as e:
             logging.error(f"Erro de conexão na página {pagina}: {e}")
-            tentativas += 1
-            time.sleep(espera)
-            espera *= BACKOFF_FACTOR
 
     logging.error(f"Falha definitiva na página {pagina} após {MAX_RETRIES} tentativas.")
     return None
 
 
 def parsear_imovel(imovel: Any) -> Optional[List[str]]:
-    """Extrai dados de um imóvel com verificações robustas de elementos."""
-    try:
-        # Elementos obrigatórios
-        titulo = imovel.find("h2", class_="new-title").text.strip()
-        link = f"https://www.dfimoveis.com.br{imovel['href']}"
-
-        # Elementos opcionais
-        subtitulo_elemento = imovel.find("h3", class_="new-simple phrase")
-        subtitulo = subtitulo_elemento.text.strip() if subtitulo_elemento else ""
-
-        # Processamento de preço
-        preco_elemento = imovel.find("div", class_="new-price")
-        preco_texto = preco_elemento.find("h4").text.strip() if preco_elemento else ""
-        preco = re.sub(r"\D", "", preco_texto) or "0"
-
-        # Processamento de área
-        area_elemento = imovel.find("li", class_="m-area")
-        area_texto = (
-            area_elemento.text.replace("m²", "").strip() if area_elemento else ""
-        )
-        metro_match = re.search(r"\d+", area_texto)
-        area = metro_match.group() if metro_match else "0"
-
-        # Detalhes adicionais
-        detalhes = {"quarto": "0", "suite": "0", "vaga": "0"}
-        lista_detalhes = imovel.find("ul", class_="new-details-ul")
-        if lista_detalhes:
-            for item in lista_detalhes.findAll("li"):
-                texto = item.text.lower()
-                if "quartos" in texto:
-                    detalhes["quarto"] = re.search(r"\d+", texto).group() or "0"
-                elif "suítes" in texto:
-                    detalhes["suite"] = re.search(r"\d+", texto).group() or "0"
-                elif "vagas" in texto:
-                    detalhes["vaga"] = re.search(r"\d+", texto).group() or "0"
-
-        # Imobiliária
-        imobiliaria_elemento = imovel.find("div", class_="new-anunciante")
-        imobiliaria_img = (
-            imobiliaria_elemento.find("img", alt=True) if imobiliaria_elemento else None
-        )
-        imobiliaria = imobiliaria_img["alt"] if imobiliaria_img else ""
-
-        return [
-            titulo,
-            subtitulo,
-            link,
-            preco,
-            area,
-            detalhes["quarto"],
-            detalhes["suite"],
-            detalhes["vaga"],
-            imobiliaria,
-        ]
-
-    except AttributeError as e:
-        logging.debug(f"Elemento não encontrado no imóvel: {e}")
-        return None
-    except Exception as e:
-        logging.error(f"Erro crítico ao processar imóvel: {e}", exc_info=True)
+    """Extrai dados de um imóvel; cards sem título ou link são descartados."""
+    dados = IMOVEL(imovel)
+    if dados is None:
+        logging.debug("Card sem título ou link ignorado.")
         return None
+    return [
+        dados["titulo"],
+        dados["subtitulo"],
+        f"https://www.dfimoveis.com.br{dados['href']}",
+        dados["preco"],
+        dados["area"],
+        dados["quarto"],
+        dados["suite"],
+        dados["vaga"],
+        dados["imobiliaria"],
+    ]
 
 
 def processar_conteudo_pagina(conteudo: bytes) -> List[List[str]]:
     """Processa o conteúdo HTML de uma página extraindo dados de imóveis."""
-    soup = BeautifulSoup(conteudo, "html.parser")
-    imoveis = soup.findAll("a", class_="new-card")
+    soup = criar_soup(conteudo, somente=CARDS)
+    imoveis = soup.findAll(*CARDS)
     return [imovel for imovel in (parsear_imovel(i) for i in imoveis) if imovel]
 
 
@@ -200,8 +189,9 @@ def classificar_tipo(link: str) -> str:
 
 def processar_dados(df: pd.DataFrame) -> pd.DataFrame:
     """Realiza transformações e limpezas no DataFrame."""
-    # Conversão numérica
-    numeric_cols = ["Preço", "Área", "Quarto", "Suite", "Vaga"]
+    # Conversão numérica: preço e área ("R$ 1.500,00", "120,5 m²") em uma passada por coluna
+    normalizar_colunas(df, ["Preço", "Área"])
+    numeric_cols = ["Quarto", "Suite", "Vaga"]
     df[numeric_cols] = df[numeric_cols].apply(pd.to_numeric, errors="coerce")
 
     # Filtragem e cálculos
@@ -215,27 +205,76 @@ def processar_dados(df: pd.DataFrame) -> pd.DataFrame:
     return df
 
 
-def main():
+def coletar_paginas_threads(
+    processos: int = PROCESSOS_PARSE, http2: bool = False
+) -> List[List[str]]:
+    """Coleta as páginas com um pool de threads, parando na primeira página vazia.
+
+    Com ``processos`` > 0 o parsing roda em outros processos enquanto as
+    threads seguem buscando; com 0 ele roda na thread principal.
+    """
+    with criar_sessao(http2) as sessao:
+        planejador = PlanejadorPaginacao(
+            buscar=partial(buscar_pagina, sessao),
+            extrair=processar_conteudo_pagina,
+            max_workers=MAX_WORKERS,
+            processos=processos,
+        )
+        with tqdm(desc="Coletando páginas", unit="página") as barra:
+            return planejador.coletar(ao_concluir=lambda: barra.update(1))
+
+
+def coletar_paginas_assincrono(
+    processos: int = PROCESSOS_PARSE, http2: bool = False
+) -> List[List[str]]:
+    """Coleta as páginas com asyncio, mantendo centenas de requisições em voo.
+
+    A última página é lida dos links de paginação da página 1; se ela não
+    for encontrada (mudança no HTML, por exemplo), a coleta segue pelo pool
+    de threads, que para na primeira página vazia.
+    """
+    with criar_sessao(http2) as sessao:
+        primeira = buscar_pagina(sessao, 1)
+    if not primeira:
+        return []
+
+    ultima = descobrir_ultima_pagina(primeira)
+    if ultima is None:
+        logging.warning(
+            "Última página não encontrada na paginação da página 1; "
+            "coletando pelo pool de threads até a primeira página vazia."
+        )
+        return coletar_paginas_threads(processos, http2)
+    urls = [f"{BASE_URL}{p}" for p in range(2, ultima + 1)]
+    with tqdm(total=len(urls), desc="Coletando páginas", unit="página") as barra:
+        conteudos = [primeira] + buscar_paginas(
+            urls,
+            ao_concluir=lambda: barra.update(1),
+            headers=HEADERS,
+            limite_por_host=LIMITE_POR_HOST,
+            max_tentativas=MAX_RETRIES,
+            controlador=CONTROLADOR,
+            http2=http2,
+            disjuntor=DISJUNTOR,
+        )
+
+    conteudos = [c for c in conteudos if c]
+    if processos:
+        with ProcessPoolExecutor(max_workers=processos) as executor:
+            paginas = list(executor.map(processar_conteudo_pagina, conteudos, chunksize=8))
+    else:
+        paginas = [processar_conteudo_pagina(c) for c in conteudos]
+    return [imovel for pagina in paginas for imovel in pagina]
+
+
+def main(assincrono: bool = False, processos: int = PROCESSOS_PARSE, http2: bool = False):
     """Fluxo principal de execução do programa."""
     logging.info("Iniciando coleta de dados...")
 
-    imoveis_coletados = []
-    with criar_sessao() as sessao:
-        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
-            futures = {
-                executor.submit(buscar_pagina, sessao, p): p
-                for p in range(1, NUM_PAGES + 1)
-            }
-
-            for future in tqdm(
-                as_completed(futures),
-                total=len(futures),
-                desc="Coletando páginas",
-                unit="página",
-            ):
-                conteudo = future.result()
-                if conteudo:
-                    imoveis_coletados.extend(processar_conteudo_pagina(conteudo))
+    if assincrono:
+        imoveis_coletados = coletar_paginas_assincrono(processos, http2)
+    else:
+        imoveis_coletados = coletar_paginas_threads(processos, http2)
 
     logging.info("Processando dados coletados...")
     df = pd.DataFrame(imoveis_coletados, columns=COLUNAS)
@@ -251,4 +290,24 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Scraper do DF Imóveis")
+    parser.add_argument(
+        "--assincrono",
+        action="store_true",
+        help="Usa o motor asyncio em vez do pool de threads",
+    )
+    parser.add_argument(
+        "--processos",
+        type=int,
+        default=PROCESSOS_PARSE,
+        help="Processos de parsing em paralelo (0 parseia na thread principal)",
+    )
+
+    parser.add_argument(
+        "--http2",
+        action="store_true",
+        help="Multiplexa as requisições em HTTP/2 (requer o pacote h2)",
+    )
+
+    args = parser.parse_args()
+    main(assincrono=args.assincrono, processos=args.processos, http2=args.http2)
@@ -1,21 +1,117 @@
+import os
+import sys
 import time
+from pathlib import Path
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.service import Service as ChromeService
 from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
 from bs4 import BeautifulSoup
 import pandas as pd
 import re
 import numpy as np
 from distrito_federal_setor import setores
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from utilitarios.navegador import caminho_chromedriver, criar_chrome
+from utilitarios.pool_navegadores import PoolNavegadores
+
 # Configurar o Selenium com Chrome e WebDriver Manager
 chrome_options = Options()
 chrome_options.add_argument("--headless")  # Executar em modo headless (sem abrir o navegador)
-driver = webdriver.Chrome(service=ChromeService(ChromeDriverManager().install()), options=chrome_options)
+driver = webdriver.Chrome(service=ChromeService(caminho_chromedriver()), options=chrome_options)
+
+# Navegadores abrindo os anúncios em paralelo (um por núcleo)
+NAVEGADORES = os.cpu_count() or 1
+
+def extrair_imovel(driver_imovel, link):
+    """Abre o anúncio em um navegador do pool e extrai a linha do imóvel (None se o preço for inválido)."""
+    driver_imovel.get(link)
+    #time.sleep(5)  # Aumentar o tempo de espera para garantir que a página carregue
 
-lista_de_imoveis = []
+    conteudo = driver_imovel.page_source
+    site = BeautifulSoup(conteudo, 'html.parser')
+
+    # Extração de informações adicionais dentro do anúncio
+    try:
+        titulo = site.find('h1', attrs={'class': 'mb-0 font-weight-600 fs-1-5'}).text.strip()
+    except AttributeError:
+        titulo = 'N/A'
+
+    try:
+        preco = site.find('small', attrs={'class': 'display-5 text-warning precoAntigoSalao'}).text.strip()
+    except AttributeError:
+        preco = 'N/A'
+
+    # Filtrar preços inválidos
+    if preco in ['N/A', 'Sob Consulta'] or not re.search(r'\d', preco):
+        return None  # Pular este imóvel se o preço for inválido
+
+    # Remover texto não numérico do preço
+    preco = re.sub(r'[^\d,]', '', preco).replace(',', '.')
+
+    try:
+        imobiliaria = site.find('h6', attrs={'class': 'pb-0 mb-0'}).text.strip()
+    except AttributeError:
+        imobiliaria = 'N/A'
+
+    try:
+        subtitulo = site.find('p', attrs={'class': 'w-100 pb-3 mb-0 texto-descricao'}).text.strip()
+    except AttributeError:
+        subtitulo = 'N/A'
+
+    try:
+        area = site.find('small', attrs={'class': 'display-5 text-warning'}).text.strip()
+    except AttributeError:
+        area = 'N/A'
+
+    try:
+        detalhes_div = site.find('div', attrs={'class': 'row justify-content-between flex-row flex-nowrap mt-1 mb-2'})
+        detalhes_itens = detalhes_div.find_all('small', attrs={'class': 'text-muted'})
+        quarto = detalhes_itens[0].text.strip() if detalhes_itens else 'N/A'
+        suite = detalhes_itens[1].text.strip() if len(detalhes_itens) > 1 else 'N/A'
+        vaga = detalhes_itens[2].text.strip() if len(detalhes_itens) > 2 else 'N/A'
+        cidade = detalhes_itens[3].text.strip() if len(detalhes_itens) > 3 else 'N/A'
+    except AttributeError:
+        quarto = suite = vaga = cidade = 'N/A'
+
+    try:
+        detalhe1 = site.find('h6', attrs={'class': 'text-normal mb-0'}).text.strip()
+    except AttributeError:
+        detalhe1 = 'N/A'
+
+    try:
+        memorial = site.find('small', text=re.compile('Memorial de Incorporação')).text.strip()
+    except AttributeError:
+        memorial = 'N/A'
+
+    try:
+        codigo = site.find('small', text=re.compile(r'\d{9}')).text.strip()
+    except AttributeError:
+        codigo = 'N/A'
+
+    try:
+        ultima_atualizacao = site.find('small', text=re.compile(r'\d{2}/\d{2}/\d{4}')).text.strip()
+    except AttributeError:
+        ultima_atualizacao = 'N/A'
+
+    try:
+        fase = site.find('h5', text=re.compile('Fase')).find('span').text.strip()
+    except AttributeError:
+        fase = 'N/A'
+
+    try:
+        caracteristicas_ul = site.find('ul', attrs={'class': 'checkboxes'})
+        caracteristicas = [li.text.strip() for li in caracteristicas_ul.find_all('li')] if caracteristicas_ul else []
+    except AttributeError:
+        caracteristicas = []
+
+    return [
+        titulo, subtitulo, link, preco, area, quarto, suite, vaga, cidade,
+        imobiliaria, detalhe1, memorial, codigo, ultima_atualizacao, fase, caracteristicas
+    ]
+
+links_imoveis = []
 
 for pagina in range(1, 2):
     driver.get(f'https://www.dfimoveis.com.br/aluguel/df/todos/imoveis?pagina={pagina}')
@@ -23,97 +119,17 @@ for pagina in range(1, 2):
 
     # Capturar os links dos imóveis
     imoveis = driver.find_elements(By.CSS_SELECTOR, 'a.new-card')
-    links_imoveis = [imovel.get_attribute('href') for imovel in imoveis]
-
-    for link in links_imoveis:
-        driver.get(link)
-        #time.sleep(5)  # Aumentar o tempo de espera para garantir que a página carregue
-        
-        conteudo = driver.page_source
-        site = BeautifulSoup(conteudo, 'html.parser')
-
-        # Extração de informações adicionais dentro do anúncio
-        try:
-            titulo = site.find('h1', attrs={'class': 'mb-0 font-weight-600 fs-1-5'}).text.strip()
-        except AttributeError:
-            titulo = 'N/A'
-        
-        try:
-            preco = site.find('small', attrs={'class': 'display-5 text-warning precoAntigoSalao'}).text.strip()
-        except AttributeError:
-            preco = 'N/A'
-        
-        # Filtrar preços inválidos
-        if preco in ['N/A', 'Sob Consulta'] or not re.search(r'\d', preco):
-            continue  # Pular este imóvel se o preço for inválido
-        
-        # Remover texto não numérico do preço
-        preco = re.sub(r'[^\d,]', '', preco).replace(',', '.')
-
-        try:
-            imobiliaria = site.find('h6', attrs={'class': 'pb-0 mb-0'}).text.strip()
-        except AttributeError:
-            imobiliaria = 'N/A'
-        
-        try:
-            subtitulo = site.find('p', attrs={'class': 'w-100 pb-3 mb-0 texto-descricao'}).text.strip()
-        except AttributeError:
-            subtitulo = 'N/A'
-        
-        try:
-            area = site.find('small', attrs={'class': 'display-5 text-warning'}).text.strip()
-        except AttributeError:
-            area = 'N/A'
-        
-        try:
-            detalhes_div = site.find('div', attrs={'class': 'row justify-content-between flex-row flex-nowrap mt-1 mb-2'})
-            detalhes_itens = detalhes_div.find_all('small', attrs={'class': 'text-muted'})
-            quarto = detalhes_itens[0].text.strip() if detalhes_itens else 'N/A'
-            suite = detalhes_itens[1].text.strip() if len(detalhes_itens) > 1 else 'N/A'
-            vaga = detalhes_itens[2].text.strip() if len(detalhes_itens) > 2 else 'N/A'
-            cidade = detalhes_itens[3].text.strip() if len(detalhes_itens) > 3 else 'N/A'
-        except AttributeError:
-            quarto = suite = vaga = cidade = 'N/A'
-
-        try:
-            detalhe1 = site.find('h6', attrs={'class': 'text-normal mb-0'}).text.strip()
-        except AttributeError:
-            detalhe1 = 'N/A'
-
-        try:
-            memorial = site.find('small', text=re.compile('Memorial de Incorporação')).text.strip()
-        except AttributeError:
-            memorial = 'N/A'
-        
-        try:
-            codigo = site.find('small', text=re.compile(r'\d{9}')).text.strip()
-        except AttributeError:
-            codigo = 'N/A'
-
-        try:
-            ultima_atualizacao = site.find('small', text=re.compile(r'\d{2}/\d{2}/\d{4}')).text.strip()
-        except AttributeError:
-            ultima_atualizacao = 'N/A'
-
-        try:
-            fase = site.find('h5', text=re.compile('Fase')).find('span').text.strip()
-        except AttributeError:
-            fase = 'N/A'
-
-        try:
-            caracteristicas_ul = site.find('ul', attrs={'class': 'checkboxes'})
-            caracteristicas = [li.text.strip() for li in caracteristicas_ul.find_all('li')] if caracteristicas_ul else []
-        except AttributeError:
-            caracteristicas = []
-
-        lista_de_imoveis.append([
-            titulo, subtitulo, link, preco, area, quarto, suite, vaga, cidade,
-            imobiliaria, detalhe1, memorial, codigo, ultima_atualizacao, fase, caracteristicas
-        ])
-
-# Fechar o driver
+    links_imoveis.extend(imovel.get_attribute('href') for imovel in imoveis)
+
+# Fechar o driver da listagem
 driver.quit()
 
+# Visitar os anúncios com NAVEGADORES instâncias consumindo a mesma fila de links
+with PoolNavegadores(NAVEGADORES, fabrica=criar_chrome) as pool:
+    linhas = pool.mapear(extrair_imovel, links_imoveis, descricao="Anúncios")
+    print(pool.estatisticas.resumo())
+lista_de_imoveis = [linha for linha in linhas if linha is not None]
+
 # Criar o DataFrame
 df_imovel = pd.DataFrame(lista_de_imoveis, columns=[
     'Título', 'Subtítulo', 'Link', 'Preço', 'Área', 'Quarto', 'Suite', 'Vaga', 'Cidade',
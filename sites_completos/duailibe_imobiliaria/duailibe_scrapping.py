@@ -1,9 +1,9 @@
-import time
+import sys
+from pathlib import Path
 import pandas as pd
 import logging
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
@@ -11,11 +11,16 @@ from bs4 import BeautifulSoup
 from tqdm import tqdm
 import re
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from utilitarios.espera import aguardar_estabilidade
+from utilitarios.incremental import CursorCards
+from utilitarios.navegador import caminho_chromedriver
+
 # Configuração de logging
 logging.basicConfig(level=logging.INFO)
 
 # Inicializar o navegador com Selenium
-service = Service(ChromeDriverManager().install())
+service = Service(caminho_chromedriver())
 options = webdriver.ChromeOptions()
 options.add_argument("--headless")
 driver = webdriver.Chrome(service=service, options=options)
@@ -25,15 +30,17 @@ url = "https://www.duailibeimobiliaria.com.br/imoveis/para-alugar"
 driver.get(url)
 
 
-# Função para carregar mais imóveis
+# Cards novos acumulados na própria página entre um clique e outro
+cursor = CursorCards(driver, "div.card.card-listing")
+
+
+# Função para carregar mais imóveis: retorna o HTML de cada card, coletado a
+# cada clique (só os que acabaram de entrar na página)
 def carregar_mais_imoveis(quantidade_cliques):
+    fragmentos = cursor.coletar()
     for _ in range(quantidade_cliques):
         try:
-            # Número de imóveis antes do clique
-            num_imoveis_antes = len(
-                driver.find_elements(By.CSS_SELECTOR, "div.card.card-listing")
-            )
-            logging.info(f"Número de imóveis antes do clique: {num_imoveis_antes}")
+            logging.info(f"Número de imóveis antes do clique: {cursor.total}")
 
             load_more_button = WebDriverWait(driver, 20).until(
                 EC.element_to_be_clickable(
@@ -43,27 +50,33 @@ def carregar_mais_imoveis(quantidade_cliques):
                     )
                 )
             )
-            driver.execute_script("arguments[0].click();", load_more_button)
 
             # Esperar até que novos imóveis sejam carregados
-            WebDriverWait(driver, 30).until(
-                lambda d: len(d.find_elements(By.CSS_SELECTOR, "div.card.card-listing"))
-                > num_imoveis_antes
+            resultado = cursor.avancar(
+                lambda: driver.execute_script("arguments[0].click();", load_more_button),
+                tempo_maximo=30,
             )
+            novos = cursor.coletar()
+            if not novos:
+                logging.error(f"Nenhum imóvel novo após o clique ({resultado.motivo}).")
+                break
+            fragmentos.extend(novos)
         except Exception as e:
             logging.error(f"Erro ao carregar mais imóveis: {e}")
             break
+    # Cards que chegaram depois da última coleta: retorna quando o DOM e a rede
+    # se estabilizam (no máximo 10s)
+    aguardar_estabilidade(driver, tempo_maximo=10)
+    fragmentos.extend(cursor.coletar())
+    return fragmentos
 
 
 # Definir a quantidade de vezes que deseja clicar no botão de carregar mais imóveis
 quantidade_cliques = 100  # Aumentar a quantidade de cliques
-carregar_mais_imoveis(quantidade_cliques)
-
-# Esperar um pouco mais para garantir que todos os imóveis sejam carregados
-time.sleep(10)
+fragmentos = carregar_mais_imoveis(quantidade_cliques)
 
 # Extrair informações básicas dos imóveis
-soup = BeautifulSoup(driver.page_source, "html.parser")
+soup = BeautifulSoup("".join(fragmentos), "html.parser")
 imoveis = soup.find_all("div", class_="card card-listing")
 logging.info(f"Total de imóveis encontrados: {len(imoveis)}")
 
@@ -195,6 +208,9 @@ colunas = [
 ]
 df = df[colunas]
 
+# Cards re-renderizados pelo site chegam de novo pelo cursor
+df = df.drop_duplicates(subset="Link")
+
 # Remover imóveis que possuem preço de venda inválido (zero ou nulo)
 df = df[df["Preço Venda"] > 0]
 
@@ -1,14 +1,25 @@
 import requests
-from bs4 import BeautifulSoup
 import pandas as pd
 import time
-import concurrent.futures
 from tqdm import tqdm
 import re
 import os
+import sys
 import logging
 import numpy as np
-import tempfile
+from pathlib import Path
+from functools import partial
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from utilitarios.arquivo_warc import criar_arquivo_paginas
+from utilitarios.cache_http import criar_cache, modo_offline_ativo
+from utilitarios.controle_taxa import ControladorTaxa
+from utilitarios.extrator import Campo, Extrator, digitos, item_com
+from utilitarios.numeros import normalizar_numeros
+from utilitarios.paginacao import PlanejadorPaginacao, descobrir_ultima_pagina
+from utilitarios.parser_html import criar_soup
+from utilitarios.pipeline import PipelineDetalhes, mapear_em_processos
+from utilitarios.sessao import criar_sessao_http
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
@@ -16,113 +27,111 @@ headers = {
     'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
 }
 
+# Só os cards entram na árvore do parser (cabeçalho, scripts e rodapé são ignorados)
+CARDS = ('div', {'class': 'card card-imo'})
+# O card deixa o <p> da descrição aberto antes do <ul> de itens: o html.parser
+# põe a lista dentro do subtítulo e os parsers HTML5 (lxml, selectolax) não,
+# então a listagem fica fixa no html.parser, ignorando SCRAPING_PARSER
+PARSER_LISTAGEM = 'html.parser'
+
+def valor_marcado(marcador):
+    """Pós-processador do quadro de valores: o preço seguido de ``V`` (venda) ou ``L`` (aluguel)."""
+    padrao = re.compile(rf'(R\$ [\d.,]+) {marcador}')
+
+    def extrair(texto):
+        encontrado = padrao.search(texto)
+        return encontrado.group(1) if encontrado else None
+
+    return extrair
+
+# Campos de cada card, extraídos em uma única visita aos nós
+ITENS_CARD = 'li.list-group-item.card-itens'
+IMOVEL = Extrator({
+    'Link': Campo('a[href]', atributo='href', pos=lambda href: 'https://www.franciosi.com.br/' + href),
+    'Preço Venda': Campo('div.card-valores', pos=valor_marcado('V')),
+    'Preço Aluguel': Campo('div.card-valores', pos=valor_marcado('L')),
+    'Endereço': Campo('p.card-bairro-cidade'),
+    'Subtítulo': Campo('p.card-texto.corta-card-desc'),
+    'Quartos': Campo(ITENS_CARD, todos=True, pos=item_com('Dorm.', digitos)),
+    'Suítes': Campo(ITENS_CARD, todos=True, pos=item_com('Suítes', digitos)),
+    'Banheiros': Campo(ITENS_CARD, todos=True, pos=item_com('Banho', digitos)),
+    'Garagens': Campo(ITENS_CARD, todos=True, pos=item_com('Garagens', digitos)),
+})
+
+# Cache em disco compartilhado entre execuções (SCRAPING_OFFLINE=1 reprocessa sem rede)
+CACHE = criar_cache('franciosi')
+
+# Ritmo adaptativo por domínio no lugar do sleep fixo entre tentativas
+CONTROLADOR = ControladorTaxa(taxa_inicial=5, taxa_maxima=50)
+
+# Workers da listagem e dos detalhes; as duas fases rodam juntas na mesma sessão,
+# então o pool de conexões comporta a soma
+WORKERS_LISTAGEM = 20
+WORKERS_DETALHES = 10
+PROCESSOS_PARSE = os.cpu_count() or 1  # Processos que parseiam as páginas de detalhes
+
 def configurar_sessao():
-    sessao = requests.Session()
-    sessao.headers.update(headers)
-    adapter = requests.adapters.HTTPAdapter(pool_connections=100, pool_maxsize=100)
-    sessao.mount('http://', adapter)
-    sessao.mount('https://', adapter)
-    return sessao
+    return criar_sessao_http(WORKERS_LISTAGEM + WORKERS_DETALHES, headers, controlador=CONTROLADOR)
 
 def extrair_dados_pagina(sessao, pagina, tentativas=3):
     url = f'https://www.franciosi.com.br/pesquisa-de-imoveis/?locacao_venda=V&id_cidade[]=26&finalidade=&dormitorio=&garagem=&vmi=&vma=&ordem=4&&pag={pagina}'
     for tentativa in range(tentativas):
         try:
-            response = sessao.get(url)
-            response.raise_for_status()
-            return response.content
+            return CACHE.obter(sessao, url)
         except requests.exceptions.RequestException as e:
             logging.error(f'Erro ao acessar a página {pagina}, tentativa {tentativa+1}/{tentativas}: {e}')
-            time.sleep(2)
     return None
 
 def parsear_imovel(imovel):
-    try:
-        link_tag = imovel.find('a', href=True)
-        link = 'https://www.franciosi.com.br/' + link_tag['href'] if link_tag else None
-
-        preco_tags = imovel.find('div', class_='card-valores')
-        preco_venda, preco_aluguel = None, None
-        if preco_tags:
-            preco_text = preco_tags.text
-            preco_venda = re.sub(r'\D', '', re.search(r'R\$ [\d.,]+ V', preco_text).group()) if re.search(r'R\$ [\d.,]+ V', preco_text) else None
-            preco_aluguel = re.sub(r'\D', '', re.search(r'R\$ [\d.,]+ L', preco_text).group()) if re.search(r'R\$ [\d.,]+ L', preco_text) else None
-
-        endereco_tag = imovel.find('p', class_='card-bairro-cidade my-1 pt-1')
-        endereco_text = endereco_tag.text.strip() if endereco_tag else None
-        bairro, cidade, estado = None, None, None
-        if endereco_text:
-            partes = endereco_text.split(' - ')
-            if len(partes) == 2:
-                bairro = partes[0].strip()
-                cidade_estado = partes[1].split('/')
-                if len(cidade_estado) == 2:
-                    cidade = cidade_estado[0].strip()
-                    estado = cidade_estado[1].strip()
-
-        subtitulo_tag = imovel.find('p', class_='card-texto corta-card-desc my-4')
-        subtitulo = subtitulo_tag.text.strip() if subtitulo_tag else None
-
-        detalhes_tag = imovel.find_all('li', class_='list-group-item d-flex align-items-center justify-content-center card-itens')
-        quartos, suites, banheiros, garagens = None, None, None, None
-        if detalhes_tag:
-            for detalhe in detalhes_tag:
-                if 'Dorm.' in detalhe.get_text():
-                    quartos = re.sub(r'\D', '', detalhe.find('span').text.strip())
-                elif 'Suítes' in detalhe.get_text():
-                    suites = re.sub(r'\D', '', detalhe.find('span').text.strip())
-                elif 'Banho' in detalhe.get_text():
-                    banheiros = re.sub(r'\D', '', detalhe.find('span').text.strip())
-                elif 'Garagens' in detalhe.get_text():
-                    garagens = re.sub(r'\D', '', detalhe.find('span').text.strip())
-
-        return {
-            'Link': link,
-            'Preço Venda': preco_venda,
-            'Preço Aluguel': preco_aluguel,
-            'Bairro': bairro,
-            'Cidade': cidade,
-            'Estado': estado,
-            'Subtítulo': subtitulo,
-            'Quartos': quartos,
-            'Suítes': suites,
-            'Banheiros': banheiros,
-            'Garagens': garagens
-        }
-
-    except AttributeError as e:
-        logging.warning(f'Erro ao extrair dados do imóvel: {e}')
-        return None
+    dados = IMOVEL(imovel)
+    endereco_text = dados.pop('Endereço')
+    bairro, cidade, estado = None, None, None
+    if endereco_text:
+        partes = endereco_text.split(' - ')
+        if len(partes) == 2:
+            bairro = partes[0].strip()
+            cidade_estado = partes[1].split('/')
+            if len(cidade_estado) == 2:
+                cidade = cidade_estado[0].strip()
+                estado = cidade_estado[1].strip()
+
+    return {
+        'Link': dados['Link'],
+        'Preço Venda': dados['Preço Venda'],
+        'Preço Aluguel': dados['Preço Aluguel'],
+        'Bairro': bairro,
+        'Cidade': cidade,
+        'Estado': estado,
+        'Subtítulo': dados['Subtítulo'],
+        'Quartos': dados['Quartos'],
+        'Suítes': dados['Suítes'],
+        'Banheiros': dados['Banheiros'],
+        'Garagens': dados['Garagens']
+    }
 
 def processar_conteudo_pagina(conteudo):
-    site = BeautifulSoup(conteudo, 'html.parser')
-    imoveis = site.find_all('div', class_='card card-imo')
+    site = criar_soup(conteudo, PARSER_LISTAGEM, somente=CARDS)
+    imoveis = site.find_all(*CARDS)
     data = [parsear_imovel(imovel) for imovel in imoveis]
     return [item for item in data if item]
 
-def baixar_html(sessao, url, tentativas=3):
+def baixar_html(sessao, url, arquivo, tentativas=3):
+    """Baixa a página de detalhes e a acrescenta ao arquivo WARC."""
     for tentativa in range(tentativas):
         try:
             response = sessao.get(url)
             response.raise_for_status()
-            with tempfile.NamedTemporaryFile(delete=False, suffix='.html') as tmp_file:
-                tmp_file.write(response.content)
-                return tmp_file.name
+            arquivo.gravar(url, response.content, response.headers.get('Content-Type', 'text/html'))
+            return True
         except requests.exceptions.RequestException as e:
             logging.error(f'Erro ao baixar a página {url}, tentativa {tentativa+1}/{tentativas}: {e}')
-            time.sleep(2)
-    return None
+    return False
 
-def extrair_informacoes_adicionais(filepath):
+def extrair_informacoes_adicionais(registro):
+    url, conteudo = registro
     try:
-        # First attempt to read the file with 'utf-8' encoding
-        try:
-            with open(filepath, 'r', encoding='utf-8') as file:
-                soup = BeautifulSoup(file, 'html.parser')
-        except UnicodeDecodeError:
-            # If 'utf-8' decoding fails, fallback to 'latin-1' encoding
-            with open(filepath, 'r', encoding='latin-1') as file:
-                soup = BeautifulSoup(file, 'html.parser')
+        # Sem charset declarado, a codificação (utf-8 ou latin-1) é detectada pelo parser
+        soup = criar_soup(conteudo)
 
         titulo_tag = soup.find('div', class_='px-3 px-lg-0').find('h1', class_='titulo-imovel')
         titulo = titulo_tag.text.strip() if titulo_tag else None
@@ -134,19 +143,19 @@ def extrair_informacoes_adicionais(filepath):
         codigo = codigo_tag.find('span').text.strip() if codigo_tag else None
 
         area_terreno_tag = soup.find('div', class_='col-6 col-md-4 col-lg-3 a-terr-ico-imo')
-        area_terreno = re.sub(r'\D', '', area_terreno_tag.find('strong').text) if area_terreno_tag else None
+        area_terreno = area_terreno_tag.find('strong').text.strip() if area_terreno_tag else None
 
         area_construida_tag = soup.find('div', class_='col-6 col-md-4 col-lg-3 a-const-ico-imo')
-        area_construida = re.sub(r'\D', '', area_construida_tag.find('strong').text) if area_construida_tag else None
+        area_construida = area_construida_tag.find('strong').text.strip() if area_construida_tag else None
 
         area_util_tag = soup.find('div', class_='col-6 col-md-4 col-lg-3 a-util-ico-imo')
-        area_util = re.sub(r'\D', '', area_util_tag.find('strong').text) if area_util_tag else None
+        area_util = area_util_tag.find('strong').text.strip() if area_util_tag else None
 
         amenidades_tags = soup.find_all('div', class_='itens-imo')
         amenidades = [tag.text.strip() for tag in amenidades_tags]
 
         return {
-            'Link': filepath.split('_')[-1].split('.')[0],  # Extracting link ID from filename
+            'Link': url,
             'Título': titulo,
             'Tipo': tipo,
             'Código': codigo,
@@ -156,7 +165,7 @@ def extrair_informacoes_adicionais(filepath):
             'Amenidades': amenidades
         }
     except Exception as e:
-        logging.error(f'Erro ao extrair dados do arquivo {filepath}: {e}')
+        logging.error(f'Erro ao extrair dados da página {url}: {e}')
         return None
 
 def processar_amenidades(df, amenidades_col):
@@ -167,46 +176,46 @@ def processar_amenidades(df, amenidades_col):
 
 def limpar_converter_coluna(df, coluna):
     if coluna in df.columns:
-        df[coluna] = df[coluna].str.replace('.', '').str.replace(',', '').str.extract(r'(\d+)').astype(float)
-        df[coluna].fillna(0, inplace=True)
+        # "R$ 1.250.000", "360,00 m²": separadores brasileiros, uma passada por coluna
+        df[coluna] = normalizar_numeros(df[coluna]).fillna(0)
 
 def main():
     inicio = time.time()
 
     sessao = configurar_sessao()
-    todos_dados = []
-
-    with concurrent.futures.ThreadPoolExecutor(max_workers=20) as executor:
-        futures = {executor.submit(extrair_dados_pagina, sessao, pagina): pagina for pagina in range(1, 200)}
-        for future in tqdm(concurrent.futures.as_completed(futures), total=len(futures), desc="Processando páginas"):
-            conteudo = future.result()
-            if conteudo:
-                dados_pagina = processar_conteudo_pagina(conteudo)
-                todos_dados.extend(dados_pagina)
+    planejador = PlanejadorPaginacao(
+        partial(extrair_dados_pagina, sessao),
+        processar_conteudo_pagina,
+        descobrir=partial(descobrir_ultima_pagina, parametro='pag'),
+        max_workers=WORKERS_LISTAGEM,
+    )
+
+    # Páginas de detalhes vão para um único .warc.gz; com SCRAPING_OFFLINE=1 o
+    # arquivo da execução anterior é reprocessado sem baixar nada
+    with criar_arquivo_paginas('franciosi') as arquivo:
+        with tqdm(desc="Processando páginas") as barra:
+            lotes = planejador.iterar(ao_concluir=lambda: barra.update(1))
+            if modo_offline_ativo():
+                todos_dados = [item for lote in lotes for item in lote]
+            else:
+                # Cada página da listagem já enfileira seus detalhes para download
+                pipeline = PipelineDetalhes(partial(baixar_html, sessao, arquivo=arquivo), WORKERS_DETALHES)
+                todos_dados, _ = pipeline.executar(lotes, descricao="Baixando páginas adicionais")
+        sessao.close()
+
+        informacoes_adicionais = []
+        # Lotes limitados: as páginas são descomprimidas conforme os processos as consomem
+        resultados = mapear_em_processos(extrair_informacoes_adicionais, arquivo.iterar(), PROCESSOS_PARSE)
+        for info in tqdm(resultados, total=len(arquivo), desc="Processando informações adicionais"):
+            if info:
+                informacoes_adicionais.append(info)
 
     df_imovel = pd.DataFrame(todos_dados)
-
-    html_files = []
-    with concurrent.futures.ThreadPoolExecutor(max_workers=10) as executor:
-        futures = {executor.submit(baixar_html, sessao, imovel['Link']): imovel['Link'] for imovel in todos_dados if imovel['Link']}
-        for future in tqdm(concurrent.futures.as_completed(futures), total=len(futures), desc="Baixando páginas adicionais"):
-            html_file = future.result()
-            if html_file:
-                html_files.append(html_file)
-
-    informacoes_adicionais = []
-    for file in tqdm(html_files, desc="Processando informações adicionais"):
-        info = extrair_informacoes_adicionais(file)
-        if info:
-            informacoes_adicionais.append(info)
-        os.remove(file)
-
     df_adicional = pd.DataFrame(informacoes_adicionais)
 
-    if not df_adicional.empty and 'Link' in df_adicional.columns:
-        df_adicional.set_index('Link', inplace=True)
-        if 'Amenidades' in df_adicional.columns:
-            processar_amenidades(df_adicional, df_adicional['Amenidades'])
+    # Link continua como coluna: é a chave do merge com a listagem
+    if 'Amenidades' in df_adicional.columns:
+        processar_amenidades(df_adicional, df_adicional['Amenidades'])
 
     if 'Link' in df_imovel.columns and 'Link' in df_adicional.columns:
         df_completo = pd.merge(df_imovel, df_adicional, on='Link', how='left')
@@ -1,10 +1,14 @@
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
 import pandas as pd
 from tqdm import tqdm
 import time
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from utilitarios.navegador import caminho_chromedriver
 
 def scrape_data():
     # Configurações do WebDriver
@@ -13,7 +17,7 @@ def scrape_data():
     options.add_argument('--no-sandbox')
     options.add_argument('--disable-dev-shm-usage')
 
-    driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
+    driver = webdriver.Chrome(service=Service(caminho_chromedriver()), options=options)
     driver.get("https://imobiliariabelluzzo.com.br/imovel?operacao=1&codigo=&tipoimovel=&imos_codigo=&empreendimento=&destaque=false&vlini=&vlfim=&exclusivo=false&cidade=&pais=&filtropais=false&order=maxval&limit=9&page=2&minhacasa=false")
     
     # Scroll down until all properties are loaded
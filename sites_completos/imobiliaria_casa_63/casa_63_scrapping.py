@@ -2,84 +2,91 @@ import pandas as pd
 import re
 import logging
 from tqdm import tqdm
-from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
 from selenium.common.exceptions import NoSuchElementException, TimeoutException
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-import time
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from utilitarios.espera import acionar_e_aguardar, aguardar_estabilidade
+from utilitarios.extrator import Campo
+from utilitarios.extrator_navegador import ExtratorNavegador
+from utilitarios.navegador import MonitorRecursos, criar_chrome
 
 # Configuração do logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
-# Configuração do Selenium com WebDriver Manager
-options = Options()
-options.add_argument("--headless")  # Executar em modo headless
-options.add_argument("--disable-gpu")  # Desabilitar GPU
-options.add_argument("--no-sandbox")  # Adicionar opções de segurança
-options.add_argument("--disable-dev-shm-usage")  # Adicionar opções de segurança
-service = Service(ChromeDriverManager().install())
+# Imagens, fontes, rastreadores e anúncios bloqueados pelo DevTools (perfil em utilitarios/navegador.py)
+PERFIL_BLOQUEIO = "casa_63"
+# True carrega a primeira página também sem bloqueio, para medir os bytes economizados
+MEDIR_ECONOMIA = False
 
-# Função para configurar e criar um driver
+# Função para configurar e criar um driver (headless, sem GPU, sandbox e /dev/shm)
 def create_driver():
-    return webdriver.Chrome(service=service, options=options)
+    return criar_chrome(perfil=PERFIL_BLOQUEIO)
 
 driver = create_driver()
 driver.implicitly_wait(10)  # Espera implícita
-
-# Função para extrair e limpar informações de cada imóvel
+monitor = MonitorRecursos(driver, PERFIL_BLOQUEIO)
+
+# Campos de todos os cards da página lidos em um único execute_script (com a
+# espera implícita, cada find_element de um campo ausente custava 10s)
+IMOVEL = ExtratorNavegador(".card", {
+    "titulo": Campo(".card-title", obrigatorio=True),
+    "endereco": Campo(".container-endereco .card-text", obrigatorio=True),
+    "codigo": Campo(".container-endereco .preco-cond-card", obrigatorio=True),
+    "preco": Campo(".preco-imovel-card", padrao=""),
+    "icones": Campo(".container-icon", todos=True, padrao=[]),
+}, raiz="#container-resultado-busca")
+
+# Função para limpar as informações de cada imóvel
 def extrair_informacoes(imovel):
-    try:
-        titulo = imovel.find_element(By.CLASS_NAME, "card-title").text.strip()
-        
-        endereco_codigo = imovel.find_element(By.CLASS_NAME, "container-endereco")
-        endereco = endereco_codigo.find_element(By.CLASS_NAME, "card-text").text.strip()
-        codigo = endereco_codigo.find_element(By.CLASS_NAME, "preco-cond-card").text.strip().replace("Código. ", "")
-        
-        preco_str = imovel.find_element(By.CLASS_NAME, "preco-imovel-card").text.strip().replace("R$", "").replace(".", "").replace(",", "").strip()
-        if not preco_str:
-            logging.warning(f"Imóvel sem preço encontrado: {titulo}")
-            return None
-        
-        area_str = imovel.find_elements(By.CLASS_NAME, "container-icon")[0].text.strip()
-        area = float(re.sub(r'[^\d.]', '', area_str.replace(" m²", ""))) if area_str else 0
-        
-        quartos_str = imovel.find_elements(By.CLASS_NAME, "container-icon")[1].text.strip()
-        quartos = int(re.sub(r'[^\d]', '', quartos_str.replace(" quartos", ""))) if quartos_str else 0
-        
-        vagas_str = imovel.find_elements(By.CLASS_NAME, "container-icon")[2].text.strip()
-        vagas = int(re.sub(r'[^\d]', '', vagas_str.replace(" vagas", ""))) if vagas_str else 0
-        
-        return {
-            "Título": titulo,
-            "Endereço": endereco,
-            "Código": codigo,
-            "Preço": preco_str,
-            "Área (m²)": area,
-            "Quartos": quartos,
-            "Vagas": vagas
-        }
-    except NoSuchElementException as e:
-        logging.error(f"Erro ao extrair informações de um imóvel: {e}")
+    if imovel is None:
+        logging.error("Erro ao extrair informações de um imóvel: título, endereço ou código ausente.")
+        return None
+    titulo = imovel["titulo"]
+    preco_str = imovel["preco"].replace("R$", "").replace(".", "").replace(",", "").strip()
+    if not preco_str:
+        logging.warning(f"Imóvel sem preço encontrado: {titulo}")
+        return None
+
+    icones = imovel["icones"]
+    if len(icones) < 3:
+        logging.error(f"Erro ao extrair informações de um imóvel: {len(icones)} ícones em {titulo}")
         return None
+    area_str, quartos_str, vagas_str = icones[:3]
+    area = float(re.sub(r'[^\d.]', '', area_str.replace(" m²", ""))) if area_str else 0
+    quartos = int(re.sub(r'[^\d]', '', quartos_str.replace(" quartos", ""))) if quartos_str else 0
+    vagas = int(re.sub(r'[^\d]', '', vagas_str.replace(" vagas", ""))) if vagas_str else 0
+
+    return {
+        "Título": titulo,
+        "Endereço": imovel["endereco"],
+        "Código": imovel["codigo"].replace("Código. ", ""),
+        "Preço": preco_str,
+        "Área (m²)": area,
+        "Quartos": quartos,
+        "Vagas": vagas
+    }
 
 # Função para realizar o scraping das páginas
 def fazer_scraping(url_base, num_paginas):
     lista_imoveis = []
 
+    if MEDIR_ECONOMIA:
+        monitor.calibrar(url_base)
     driver.get(url_base)
 
     for page in tqdm(range(1, num_paginas + 1), desc="Scraping páginas", unit="página"):
         try:
             wait = WebDriverWait(driver, 20)
             wait.until(EC.presence_of_element_located((By.ID, "container-resultado-busca")))
-            time.sleep(2)
+            # Retorna quando o DOM para de mudar e não há requisições pendentes
+            aguardar_estabilidade(driver)
             
-            container_resultado = driver.find_element(By.ID, "container-resultado-busca")
-            imoveis = container_resultado.find_elements(By.CLASS_NAME, "card")
+            imoveis = IMOVEL(driver)
         except (NoSuchElementException, TimeoutException) as e:
             logging.warning(f"Nenhum imóvel encontrado ou houve um erro: {e}")
             driver.save_screenshot("erro_pagina.png")
@@ -95,17 +102,19 @@ def fazer_scraping(url_base, num_paginas):
                 lista_imoveis.append(info_imovel)
             else:
                 logging.warning("Imóvel não possui informações completas ou válidas.")
+        monitor.registrar(f"Página {page}")
 
         try:
             # Encontra o botão da próxima página
             botao_proxima_pagina = driver.find_element(By.XPATH, f"//div[@class='container-paginacao']//div[@class='btn-paginacao'][span[text()='{page + 1}']]")
-            botao_proxima_pagina.click()
-            time.sleep(2)  # Tempo para garantir que a página carregue
+            # Espera a troca dos resultados em vez de um tempo fixo
+            acionar_e_aguardar(driver, botao_proxima_pagina.click)
         except NoSuchElementException:
             logging.warning("Botão de próxima página não encontrado. Finalizando scraping.")
             break
 
     logging.info(f"Total de imóveis extraídos: {len(lista_imoveis)}")
+    logging.info(monitor.resumo())
     return lista_imoveis
 
 # URL base do site
@@ -1,19 +1,25 @@
 import re
-import time
+import sys
 import requests
 from bs4 import BeautifulSoup
 import pandas as pd
 from distrito_federal_setor import setores
 import concurrent.futures
 import logging
-from random import randint, choice
+import time
+from random import choice
 from typing import List, Dict
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from utilitarios.controle_taxa import AdaptadorControlado, ControladorTaxa
+from utilitarios.parser_html import criar_soup
+from utilitarios.pool_proxies import PoolProxies
 
 # Configurações de logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
 # Configurações
-TEMPO_ESPERA = 3  # Aumenta o tempo de espera entre requisições
 NUM_PAGINAS = 10
 URL_BASE = "https://www.imovelweb.com.br"
 ARQUIVO_SAIDA = r"C:\Users\galva\OneDrive\Documentos\GitHub\web-scrapping-com-python\base_de_dados_excel\imovel_web_data_base\imovel_web_aluguel_df_05_2024.xlsx"
@@ -42,10 +48,17 @@ PROXIES = [
     'http://64.225.97.57:8080',
     'http://46.101.53.59:8080',
     'http://167.172.236.149:39313',
-    'http://167.172.236.149:39313',
     # Adicione mais proxies conforme necessário
 ]
 
+# Só os cards entram na árvore do parser (cabeçalho, scripts e rodapé são ignorados)
+CARDS = ("div", {"data-qa": "posting PROPERTY"})
+
+# Ritmo adaptativo por domínio no lugar das esperas fixas entre requisições
+CONTROLADOR = ControladorTaxa(taxa_inicial=1, taxa_maxima=5)
+# Sondado em segundo plano; cada requisição usa um proxy saudável, favorecendo os mais rápidos
+POOL_PROXIES = PoolProxies(PROXIES)
+
 def extrair_setor(titulo: str) -> str:
     """Extrai o setor a partir do título do imóvel."""
     palavras = titulo.split()
@@ -131,24 +144,35 @@ def obter_pagina(url: str, session: requests.Session) -> BeautifulSoup:
     """Obtém o conteúdo de uma página."""
     headers = HEADERS.copy()
     headers["User-Agent"] = choice(USER_AGENTS)  # Rotaciona o User-Agent a cada requisição
-    proxy = {"http": choice(PROXIES), "https": choice(PROXIES)}  # Seleciona um proxy aleatório
-    for _ in range(3):  # Tentar 3 vezes
+    for _ in range(3):  # Tentar 3 vezes, cada uma com um proxy sorteado do pool
+        proxy = POOL_PROXIES.escolher()
+        if proxy is None:
+            logging.error("Nenhum proxy ativo no pool.")
+            return None
+        inicio = time.monotonic()
+        resposta = None
         try:
-            resposta = session.get(url, headers=headers, proxies=proxy, timeout=10)  # Adicionado timeout
+            resposta = session.get(
+                url, headers=headers, proxies={"http": proxy, "https": proxy}, timeout=10
+            )
             resposta.raise_for_status()
-            return BeautifulSoup(resposta.content, "html.parser")
+            return criar_soup(resposta.content, somente=CARDS)
         except requests.exceptions.RequestException as e:
-            logging.warning(f"Erro ao acessar a página: {e}")
-            time.sleep(TEMPO_ESPERA + randint(1, 3))  # Espera um tempo aleatório
+            logging.warning(f"Erro ao acessar a página via {proxy}: {e}")
+        finally:
+            POOL_PROXIES.registrar_resposta(proxy, resposta, time.monotonic() - inicio)
     return None
 
-def obter_lista_de_imoveis(paginas: int = NUM_PAGINAS, tempo_espera: int = TEMPO_ESPERA) -> List[Dict[str, str]]:
+def obter_lista_de_imoveis(paginas: int = NUM_PAGINAS) -> List[Dict[str, str]]:
     """Obtém a lista de imóveis de várias páginas."""
     lista_de_imoveis = []
     urls_adicionados = set()
 
-    with requests.Session() as session:
+    with POOL_PROXIES, requests.Session() as session:
         session.headers.update(HEADERS)
+        adaptador = AdaptadorControlado(CONTROLADOR)
+        session.mount("http://", adaptador)
+        session.mount("https://", adaptador)
         urls = [f"{URL_BASE}/imoveis-aluguel-distrito-federal-pagina-{pagina}.html" for pagina in range(1, paginas + 1)]
         
         with concurrent.futures.ThreadPoolExecutor(max_workers=5) as executor:
@@ -158,7 +182,7 @@ def obter_lista_de_imoveis(paginas: int = NUM_PAGINAS, tempo_espera: int = TEMPO
                 try:
                     site = future.result()
                     if site:
-                        imoveis = site.findAll("div", attrs={"data-qa": "posting PROPERTY"})
+                        imoveis = site.findAll(*CARDS)
                         for imovel in imoveis:
                             dados_imovel = obter_dados_imovel(imovel)
                             if (
@@ -175,8 +199,6 @@ def obter_lista_de_imoveis(paginas: int = NUM_PAGINAS, tempo_espera: int = TEMPO
                                 logging.info("Imóvel ignorado devido a dados ausentes ou preço 'Sob Consulta'")
                 except Exception as e:
                     logging.error(f"Erro ao processar página {url}: {e}")
-
-                time.sleep(tempo_espera + randint(1, 3))  # Espera um tempo aleatório
     return lista_de_imoveis
 
 def processar_dados(lista_de_imoveis: List[Dict[str, str]]) -> pd.DataFrame:
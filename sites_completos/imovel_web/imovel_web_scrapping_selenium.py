@@ -1,5 +1,7 @@
+import sys
 import time
 import random
+from pathlib import Path
 import pandas as pd
 import requests
 from bs4 import BeautifulSoup
@@ -8,13 +10,19 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.action_chains import ActionChains
-from webdriver_manager.chrome import ChromeDriverManager
+from selenium.common.exceptions import NoSuchElementException
 
-# Função para extrair informações de um imóvel
-def extrair_informacoes_imovel(driver, link, lista_de_imoveis):
-    driver.get(link)
-    time.sleep(random.uniform(1, 5))  # Pausa aleatória entre 1 e 5 segundos para simular comportamento humano
-    
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from utilitarios.abas import ExecutorAbas
+from utilitarios.navegador import caminho_chromedriver
+
+# Abas do mesmo navegador abrindo os anúncios em paralelo
+ABAS = 6
+# Segundos entre o início de duas navegações (espaça as requisições sem travar as abas)
+INTERVALO_ANUNCIOS = 1.0
+
+# Função para extrair informações de um imóvel (roda na aba em que o anúncio terminou de carregar)
+def extrair_informacoes_imovel(driver, link):
     try:
         # Verificar se o site pede confirmação de que não é um robô
         if "imovelweb.com.br" in driver.current_url:
@@ -68,10 +76,11 @@ def extrair_informacoes_imovel(driver, link, lista_de_imoveis):
         imobiliaria_element = driver.find_element(By.XPATH, "//*[@id='reactPublisherData']/div/div/div/h3")
         imobiliaria = imobiliaria_element.text.strip() if imobiliaria_element else ""
         
-        # Adicionar informações à lista de imóveis
-        lista_de_imoveis.append([titulo, subtitulo, tipo, area, preco, preco_condominio, descricao, imobiliaria, quartos, banheiros, vagas, suites, anos, link])
-    except Exception as e:
+        # Linha do imóvel
+        return [titulo, subtitulo, tipo, area, preco, preco_condominio, descricao, imobiliaria, quartos, banheiros, vagas, suites, anos, link]
+    except NoSuchElementException as e:
         print(f"Erro ao extrair informações do imóvel: {e}")
+        return None
 
 def scrape_imoveis():
     opts = Options()
@@ -89,24 +98,19 @@ def scrape_imoveis():
     chrome_options.add_argument(f"user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/90.0.4430.85 Safari/537.36")
 
     driver = webdriver.Chrome(
-        service=Service(ChromeDriverManager().install()), options=chrome_options
+        service=Service(caminho_chromedriver()), options=chrome_options
     )
 
     return driver
 
-# Lista para armazenar os dados dos imóveis
-lista_de_imoveis = []
-
 # Usar um conjunto para armazenar os URLs dos imóveis já adicionados
 urls_adicionados = set()
+links_imoveis = []
 
 # Defina um intervalo de tempo mínimo e máximo para as pausas (em segundos)
 # Tempo de espera entre solicitações (em segundos)
 TEMPO_ESPERA = 0  # 1 segundo
 
-# Configurar o driver
-driver = scrape_imoveis()
-
 for pagina in range(1, 10):
     print(f"Navegando na página {pagina}")
     url = f"https://www.imovelweb.com.br/imoveis-aluguel-distrito-federal-pagina-{pagina}.html"
@@ -132,15 +136,22 @@ for pagina in range(1, 10):
 
         # Adicionar o URL do imóvel à lista de URLs adicionados
         urls_adicionados.add(link)
+        links_imoveis.append(link)
 
-        # Extrair informações detalhadas do imóvel usando o Selenium
-        extrair_informacoes_imovel(driver, link, lista_de_imoveis)
-        
     # Adicione um tempo de espera entre as solicitações
     time.sleep(TEMPO_ESPERA)
 
-# Fechar o navegador após a coleta de dados
-driver.quit()
+# Extrair informações detalhadas dos imóveis em ABAS abas de um único navegador;
+# cada aba que termina de carregar é lida e recebe o próximo link
+driver = scrape_imoveis()
+try:
+    with ExecutorAbas(driver, abas=ABAS, intervalo_inicio=INTERVALO_ANUNCIOS) as executor:
+        linhas = executor.mapear(extrair_informacoes_imovel, links_imoveis, descricao="Imóveis")
+        print(executor.estatisticas.resumo())
+finally:
+    driver.quit()
+
+lista_de_imoveis = [linha for linha in linhas if linha is not None]
 
 # Criar DataFrame com os dados dos imóveis
 df_imovel = pd.DataFrame(
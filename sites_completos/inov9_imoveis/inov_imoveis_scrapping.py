@@ -1,26 +1,43 @@
 import logging
 import re
-import time
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
+import sys
+from pathlib import Path
+from urllib.parse import urljoin
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
 import pandas as pd
 from tqdm import tqdm
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from utilitarios.espera import acionar_e_aguardar
+from utilitarios.extrator import Campo
+from utilitarios.extrator_navegador import ExtratorNavegador
+from utilitarios.navegador import MonitorRecursos, criar_chrome
+
 # Configuração de logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
+# Imagens, fontes, rastreadores e anúncios bloqueados pelo DevTools (perfil em utilitarios/navegador.py)
+PERFIL_BLOQUEIO = "inov9"
+CARDS = "a.card-with-buttons.borderHover"
+BASE_URL = "https://www.inov9imoveis.com.br"
+
+# Campos de todos os cards lidos em um único execute_script
+IMOVEL = ExtratorNavegador(CARDS, {
+    "link": Campo(":scope", atributo="href", padrao=""),
+    "tipo": Campo("p.card-with-buttons__title", padrao=""),
+    "endereco": Campo("h2.card-with-buttons__heading", padrao=""),
+    "detalhes": Campo("div.card-with-buttons__footer ul li", todos=True, padrao=[]),
+    "preco": Campo("div.card-with-buttons__value-container p.card-with-buttons__value", padrao=""),
+})
+
 def configure_driver():
     """Configura o WebDriver do Chrome."""
-    options = webdriver.ChromeOptions()
-    options.add_argument("--headless")
-    options.add_argument("--disable-extensions")
-    options.add_argument("--ignore-certificate-errors")
-    driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
-    return driver
+    return criar_chrome(
+        argumentos=("--disable-extensions", "--ignore-certificate-errors"),
+        perfil=PERFIL_BLOQUEIO,
+    )
 
 def accept_cookies(driver):
     """Aceita os cookies da página."""
@@ -40,36 +57,30 @@ def click_ver_mais(driver, times):
             ver_mais_button = WebDriverWait(driver, 10).until(
                 EC.element_to_be_clickable((By.CSS_SELECTOR, "div.pagination-cell button.btn-next"))
             )
-            ver_mais_button.click()
-            time.sleep(2)
-            logging.info("Botão 'Ver mais' clicado.")
+            # Retorna quando os novos cards chegam e o DOM se estabiliza
+            resultado = acionar_e_aguardar(driver, ver_mais_button.click, seletor=CARDS, crescer=True)
+            if resultado.motivo == "sem novos itens":
+                logging.info("Nenhum imóvel novo após o clique em 'Ver mais'.")
+                break
+            logging.info(f"Botão 'Ver mais' clicado: {resultado.contagem} imóveis em {resultado.segundos:.1f}s.")
         except Exception as e:
             logging.error(f"Erro ao clicar no botão 'Ver mais': {e}")
             break
 
 def extract_property_data(driver):
-    """Extrai as informações dos imóveis listados na página."""
-    properties = driver.find_elements(By.CSS_SELECTOR, "a.card-with-buttons.borderHover")
+    """Extrai as informações dos imóveis listados na página (uma única chamada ao navegador)."""
+    properties = IMOVEL(driver)
     logging.info(f"Número de imóveis encontrados: {len(properties)}")
     data = []
     
     for prop in tqdm(properties, desc="Extraindo dados dos imóveis"):
-        try:
-            link = f"https://www.inov9imoveis.com.br{prop.get_attribute('href')}"
-            logging.info(f"Link: {link}")
-        except Exception as e:
-            link = ""
-            logging.error(f"Erro ao extrair link: {e}")
-        
-        try:
-            tipo = prop.find_element(By.CSS_SELECTOR, "p.card-with-buttons__title").text
-            logging.info(f"Tipo: {tipo}")
-        except Exception as e:
-            tipo = ""
-            logging.error(f"Erro ao extrair tipo: {e}")
+        link = urljoin(BASE_URL, prop["link"])
+        tipo = prop["tipo"]
+        logging.info(f"Link: {link}")
+        logging.info(f"Tipo: {tipo}")
         
         try:
-            endereco = prop.find_element(By.CSS_SELECTOR, "h2.card-with-buttons__heading").text
+            endereco = prop["endereco"]
             bairro, cidade, estado = endereco.split(" - ")
             logging.info(f"Endereço: {endereco}")
             logging.info(f"Bairro: {bairro}, Cidade: {cidade}, Estado: {estado}")
@@ -77,24 +88,16 @@ def extract_property_data(driver):
             bairro, cidade, estado = "", "", ""
             logging.error(f"Erro ao extrair endereço: {e}")
         
-        try:
-            detalhes = prop.find_element(By.CSS_SELECTOR, "div.card-with-buttons__footer ul").find_elements(By.TAG_NAME, "li")
-            area = re.sub(r'\D', '', detalhes[0].text) if len(detalhes) > 0 else "0"
-            quartos = re.sub(r'\D', '', detalhes[1].text) if len(detalhes) > 1 else "0"
-            suites = re.sub(r'\D', '', detalhes[2].text) if len(detalhes) > 2 else "0"
-            banheiros = re.sub(r'\D', '', detalhes[3].text) if len(detalhes) > 3 else "0"
-            vagas = re.sub(r'\D', '', detalhes[4].text) if len(detalhes) > 4 else "0"
-            logging.info(f"Área: {area}, Quartos: {quartos}, Suítes: {suites}, Banheiros: {banheiros}, Vagas: {vagas}")
-        except Exception as e:
-            area, quartos, suites, banheiros, vagas = "0", "0", "0", "0", "0"
-            logging.error(f"Erro ao extrair detalhes: {e}")
+        detalhes = prop["detalhes"]
+        area = re.sub(r'\D', '', detalhes[0]) if len(detalhes) > 0 else "0"
+        quartos = re.sub(r'\D', '', detalhes[1]) if len(detalhes) > 1 else "0"
+        suites = re.sub(r'\D', '', detalhes[2]) if len(detalhes) > 2 else "0"
+        banheiros = re.sub(r'\D', '', detalhes[3]) if len(detalhes) > 3 else "0"
+        vagas = re.sub(r'\D', '', detalhes[4]) if len(detalhes) > 4 else "0"
+        logging.info(f"Área: {area}, Quartos: {quartos}, Suítes: {suites}, Banheiros: {banheiros}, Vagas: {vagas}")
         
-        try:
-            preco = re.sub(r'\D', '', prop.find_element(By.CSS_SELECTOR, "div.card-with-buttons__value-container p.card-with-buttons__value").text)
-            logging.info(f"Preço: {preco}")
-        except Exception as e:
-            preco = "0"
-            logging.error(f"Erro ao extrair preço: {e}")
+        preco = re.sub(r'\D', '', prop["preco"])
+        logging.info(f"Preço: {preco}")
         
         # Garantir que os valores numéricos não sejam vazios
         area = int(area) if area.isdigit() else 0
@@ -122,11 +125,14 @@ def extract_property_data(driver):
 
 def main(url, ver_mais_clicks):
     driver = configure_driver()
+    monitor = MonitorRecursos(driver, PERFIL_BLOQUEIO)
     
     try:
         driver.get(url)
+        monitor.registrar("Listagem")
         accept_cookies(driver)
         click_ver_mais(driver, ver_mais_clicks)
+        monitor.registrar(f"{ver_mais_clicks} cliques em 'Ver mais'")
         property_data = extract_property_data(driver)
     finally:
         driver.quit()
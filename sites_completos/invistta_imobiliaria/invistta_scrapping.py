@@ -2,33 +2,32 @@ import pandas as pd
 import re
 import logging
 from tqdm import tqdm
-from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
 from selenium.common.exceptions import NoSuchElementException, TimeoutException
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-import time
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from utilitarios.espera import acionar_e_aguardar, aguardar_estabilidade
+from utilitarios.navegador import MonitorRecursos, criar_chrome
 
 # Configuração do logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
-# Configuração do Selenium com WebDriver Manager
-options = Options()
-options.add_argument("--headless")  # Executar em modo headless
-options.add_argument("--disable-gpu")  # Desabilitar GPU
-options.add_argument("--no-sandbox")  # Adicionar opções de segurança
-options.add_argument("--disable-dev-shm-usage")  # Adicionar opções de segurança
-service = Service(ChromeDriverManager().install())
+# Imagens, fontes, rastreadores e anúncios bloqueados pelo DevTools (perfil em utilitarios/navegador.py)
+PERFIL_BLOQUEIO = "invistta"
+# True carrega a primeira página também sem bloqueio, para medir os bytes economizados
+MEDIR_ECONOMIA = False
 
-# Função para configurar e criar um driver
+# Função para configurar e criar um driver (headless, sem GPU, sandbox e /dev/shm)
 def create_driver():
-    return webdriver.Chrome(service=service, options=options)
+    return criar_chrome(perfil=PERFIL_BLOQUEIO)
 
 driver = create_driver()
 driver.implicitly_wait(10)  # Espera implícita
+monitor = MonitorRecursos(driver, PERFIL_BLOQUEIO)
 
 # Função para extrair e limpar informações de cada imóvel
 def extrair_informacoes(imovel):
@@ -74,13 +73,16 @@ def extrair_informacoes(imovel):
 def fazer_scraping(url_base, num_paginas):
     lista_imoveis = []
 
+    if MEDIR_ECONOMIA:
+        monitor.calibrar(url_base)
     driver.get(url_base)
 
     for page in tqdm(range(1, num_paginas + 1), desc="Scraping páginas", unit="página"):
         try:
             wait = WebDriverWait(driver, 20)
             wait.until(EC.presence_of_element_located((By.ID, "container-resultado-busca")))
-            time.sleep(2)
+            # Retorna quando o DOM para de mudar e não há requisições pendentes
+            aguardar_estabilidade(driver)
             
             container_resultado = driver.find_element(By.ID, "container-resultado-busca")
             imoveis = container_resultado.find_elements(By.CLASS_NAME, "card")
@@ -99,17 +101,19 @@ def fazer_scraping(url_base, num_paginas):
                 lista_imoveis.append(info_imovel)
             else:
                 logging.warning("Imóvel não possui informações completas ou válidas.")
+        monitor.registrar(f"Página {page}")
 
         try:
             # Encontra o botão da próxima página
             botao_proxima_pagina = driver.find_element(By.XPATH, f"//div[@class='container-paginacao']//div[@class='btn-paginacao'][span[text()='{page + 1}']]")
-            botao_proxima_pagina.click()
-            time.sleep(2)  # Tempo para garantir que a página carregue
+            # Espera a troca dos resultados em vez de um tempo fixo
+            acionar_e_aguardar(driver, botao_proxima_pagina.click)
         except NoSuchElementException:
             logging.warning("Botão de próxima página não encontrado. Finalizando scraping.")
             break
 
     logging.info(f"Total de imóveis extraídos: {len(lista_imoveis)}")
+    logging.info(monitor.resumo())
     return lista_imoveis
 
 # URL base do site
@@ -1,12 +1,18 @@
+import sys
+from pathlib import Path
 import requests
-from bs4 import BeautifulSoup
 import pandas as pd
-import re
 import time
 import logging
 import concurrent.futures
 from tqdm import tqdm
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from utilitarios.cache_http import criar_cache
+from utilitarios.extrator import Campo, Extrator, digitos, item, primeiro_numero
+from utilitarios.parser_html import criar_soup
+from utilitarios.sessao import criar_sessao_http
+
 # Configuração de logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
@@ -16,18 +22,40 @@ HEADERS = {
     'Referer': 'https://www.lelloimoveis.com.br',
 }
 
+MAX_WORKERS = 10  # Threads de busca; o pool da sessão tem uma conexão para cada
+
+# As ~1000 páginas são multiplexadas em poucas conexões HTTP/2 (HTTP/1.1 sem o pacote h2)
+USAR_HTTP2 = True
+
+# Só os cards entram na árvore do parser (cabeçalho, scripts e rodapé são ignorados)
+CARDS = ('article', {'data-testid': 'realty-card'})
+
+# Campos de cada card, extraídos em uma única visita aos nós
+PRECO_CONDOMINIO = 'div.totalItemstyle__TotalItem-sc-t6cs2k-0 p'
+IMOVEL = Extrator({
+    'titulo': Campo('h3.font-weight-bold.text-truncate.text-neutral'),
+    'href': Campo('a.d-flex.flex-column.justify-content-between.h-100', atributo='href'),
+    'subtitulo': Campo('span.card-text-neighborhood'),
+    'tipo': Campo('div.card-title h2'),
+    'preco': Campo(PRECO_CONDOMINIO, todos=True, pos=item(0, digitos)),
+    'condominio': Campo(PRECO_CONDOMINIO, todos=True, pos=item(1, digitos), padrao='0'),
+    'area': Campo('meta[itemprop=value]', atributo='content'),
+    'quarto': Campo('meta[itemprop=numberOfBedrooms]', atributo='content'),
+    'banheiro': Campo('meta[itemprop=numberOfBathroomsTotal]', atributo='content'),
+    'vaga': Campo('span[data-testid=realty-parking-lot-quantity]', pos=primeiro_numero),
+})
+
+# Cache em disco compartilhado entre execuções (SCRAPING_OFFLINE=1 reprocessa sem rede)
+CACHE = criar_cache('lello')
+
 # Configuração da sessão
 def configure_session():
-    session = requests.Session()
-    session.headers.update(HEADERS)
-    return session
+    return criar_sessao_http(MAX_WORKERS, HEADERS, http2=USAR_HTTP2)
 
 # Extração dos dados da página
 def extract_page_data(session, url):
     try:
-        response = session.get(url)
-        response.raise_for_status()
-        return response.content
+        return CACHE.obter(session, url)
     except requests.exceptions.RequestException as e:
         logging.error(f'Erro ao acessar a URL {url}: {e}')
         return None
@@ -35,43 +63,15 @@ def extract_page_data(session, url):
 # Parser do imóvel
 def parse_imovel(imovel):
     try:
-        titulo_tag = imovel.find('h3', class_='font-weight-bold f-3 text-truncate text-neutral mb-0 f-2')
-        titulo = titulo_tag.text.strip() if titulo_tag else None
-
-        link_tag = imovel.find('a', class_='d-flex flex-column justify-content-between h-100')
-        link = 'https://www.lelloimoveis.com.br' + link_tag['href'] if link_tag else None
-
-        subtitulo_tag = imovel.find('span', class_='card-text-neighborhood f-1 text-truncate')
-        subtitulo = subtitulo_tag.text.strip() if subtitulo_tag else None
+        dados = IMOVEL(imovel)
+        titulo, subtitulo = dados['titulo'], dados['subtitulo']
+        link = 'https://www.lelloimoveis.com.br' + dados['href'] if dados['href'] else None
 
         # Dividindo Subtítulo em Bairro e Cidade
         bairro, cidade = subtitulo.split(', ') if subtitulo and ', ' in subtitulo else (subtitulo, None)
 
-        tipo_tag = imovel.find('div', class_='mb-2 card-title h5')
-        tipo = tipo_tag.h2.text.strip() if tipo_tag else None
-
-        preco_condominio_tag = imovel.find('div', class_='totalItemstyle__TotalItem-sc-t6cs2k-0 cyBCVE d-flex flex-column justify-content-between w-100 text-neutral-darkest realtyItemstyle__TotalItem-sc-dxx1wg-1 fYHxEW')
-        preco = None
-        condominio = None
-        if preco_condominio_tag:
-            preco = re.sub(r'\D', '', preco_condominio_tag.find_all('p')[0].text)
-            condominio_text = preco_condominio_tag.find_all('p')[1].text if len(preco_condominio_tag.find_all('p')) > 1 else None
-            condominio = re.sub(r'\D', '', condominio_text) if condominio_text else '0'
-
-        area_tag = imovel.find('meta', itemprop='value')
-        area = area_tag['content'] if area_tag else None
-
-        quarto_tag = imovel.find('meta', itemprop='numberOfBedrooms')
-        quarto = quarto_tag['content'] if quarto_tag else None
-
-        banheiro_tag = imovel.find('meta', itemprop='numberOfBathroomsTotal')
-        banheiro = banheiro_tag['content'] if banheiro_tag else None
-
-        vaga_tag = imovel.find('span', attrs={'data-testid': 'realty-parking-lot-quantity'})
-        vaga = None
-        if vaga_tag:
-            vaga_text = vaga_tag.text.strip()
-            vaga = re.search(r'\d+', vaga_text).group(0) if vaga_text else None
+        preco, condominio, area = dados['preco'], dados['condominio'], dados['area']
+        quarto, banheiro, vaga, tipo = dados['quarto'], dados['banheiro'], dados['vaga'], dados['tipo']
 
         logging.debug(f'Título: {titulo}, Bairro: {bairro}, Cidade: {cidade}, Link: {link}, Preço: {preco}, Condomínio: {condominio}, Área: {area}, Quarto: {quarto}, Banheiro: {banheiro}, Vaga: {vaga}, Tipo: {tipo}')
 
@@ -85,8 +85,8 @@ def parse_imovel(imovel):
 
 # Processamento do conteúdo da página
 def process_page_content(content):
-    site = BeautifulSoup(content, 'html.parser')
-    imoveis = site.findAll('article', {'data-testid': 'realty-card'})
+    site = criar_soup(content, somente=CARDS)
+    imoveis = site.findAll(*CARDS)
     data = [parse_imovel(imovel) for imovel in imoveis]
     return [item for item in data if item]
 
@@ -101,7 +101,7 @@ def main():
         ('https://www.lelloimoveis.com.br/venda/residencial/{}-pagina/', 813)
     ]
     
-    with concurrent.futures.ThreadPoolExecutor(max_workers=10) as executor:
+    with concurrent.futures.ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
         # Lista para armazenar futuros
         futures = []
         
@@ -116,6 +116,7 @@ def main():
             content = future.result()
             if content:
                 all_data.extend(process_page_content(content))
+    session.close()
 
     df_imovel = pd.DataFrame(all_data, columns=['Título', 'Bairro', 'Cidade', 'Link', 'Preço', 'Condomínio', 'Área', 'Quarto', 'Banheiro', 'Vaga', 'Tipo'])
 
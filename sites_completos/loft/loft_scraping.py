@@ -2,13 +2,21 @@ import requests
 from bs4 import BeautifulSoup
 import pandas as pd
 import re
-import time
+import sys
 import logging
 from tqdm import tqdm
 from datetime import datetime
 from random import randint
-from typing import List, Dict
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, Dict, Optional
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from utilitarios.controle_taxa import AdaptadorControlado, ControladorTaxa
+from utilitarios.estado_json import CampoJSON, ExtratorJSON
+from utilitarios.extrator import Campo, Extrator
+from utilitarios.numeros import normalizar_colunas
+from utilitarios.paginacao import PlanejadorPaginacao
+from utilitarios.transporte_http2 import codificacoes_aceitas
 
 # Configuração do logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -19,64 +27,94 @@ HEADERS = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/
 
 MAX_RETRIES = 3
 
+# Adaptive per-domain pacing instead of a fixed sleep between retries
+CONTROLLER = ControladorTaxa(taxa_inicial=2, taxa_maxima=20)
+
+def detail(index: int):
+    """Text of the first span in the ``index``-th ``div.jss369``; the card needs all three details."""
+    def pick(values: List[Optional[str]]) -> Optional[str]:
+        return values[index] if len(values) >= 3 else None
+    return pick
+
+# Card fields, extracted in a single walk over each card's nodes
+PROPERTY = Extrator({
+    'Link': Campo(':scope', atributo='href', pos=lambda href: BASE_URL + href),
+    'Tipo do Imóvel': Campo('span#property-type'),
+    'Preço': Campo('div.jss363 span'),
+    'Endereço': Campo('h2.jss368'),
+    'Área': Campo('div.jss369', todos=True, filho='span', pos=detail(0)),
+    'Quartos': Campo('div.jss369', todos=True, filho='span', pos=detail(1)),
+    'Vagas': Campo('div.jss369', todos=True, filho='span', pos=detail(2)),
+})
+
+# The Next.js page embeds the whole listing in <script id="__NEXT_DATA__">; reading
+# that state avoids the generated MUI class names, which change on every deploy.
+# The DOM extractor above stays as the fallback when the state is missing or
+# most of its items lack the link or the price (the field names changed).
+# Numbers stay numeric; clean_numeric_columns converts both paths.
+USE_JSON_STATE = True
+
+PROPERTIES_JSON = ExtratorJSON(
+    {
+        'Link': CampoJSON('url', pos=lambda url: BASE_URL + url, obrigatorio=True),
+        'Tipo do Imóvel': CampoJSON('propertyType'),
+        'Preço': CampoJSON('price', obrigatorio=True),
+        'Endereço': CampoJSON('address', pos=lambda a: ', '.join(filter(None, (a.get('streetName'), a.get('neighborhood'))))),
+        'Área': CampoJSON('area'),
+        'Quartos': CampoJSON('bedrooms'),
+        'Vagas': CampoJSON('parkingSpots'),
+    },
+    lista='props.pageProps.listings',
+    chaves=('url', 'price'),
+)
+
+def configure_session() -> requests.Session:
+    """Creates the shared session whose requests are paced by the rate controller."""
+    session = requests.Session()
+    session.headers.update(HEADERS)
+    session.headers['Accept-Encoding'] = codificacoes_aceitas()  # br/zstd quando instalados
+    adapter = AdaptadorControlado(CONTROLLER, pool_maxsize=10)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+SESSION = configure_session()
+
+NUMERIC_COLUMNS = ['Preço', 'Área', 'Quartos', 'Vagas']
+
 # Função para limpar colunas numéricas
 def clean_numeric_columns(df: pd.DataFrame, columns: List[str]) -> pd.DataFrame:
-    """Remove non-numeric characters and converts columns to numeric."""
-    for column in columns:
-        df[column] = df[column].str.replace(r'\D', '', regex=True)
-        df[column] = pd.to_numeric(df[column], errors='coerce')
-    return df
+    """Converts card texts ("R$ 450.000,50", "72,5 m²") and JSON numbers to float."""
+    return normalizar_colunas(df, columns)
 
-# Função para extrair dados de uma página
-def extract_data_from_page(page_url: str) -> List[Dict]:
-    """Extracts property data from a given page URL."""
+# Função para baixar uma página de resultados
+def fetch_page(page: int) -> Optional[bytes]:
+    """Downloads a search results page, returning None after all retries fail."""
+    page_url = SEARCH_URL.format(page)
     for attempt in range(MAX_RETRIES):
         try:
-            response = requests.get(page_url, headers=HEADERS)
+            response = SESSION.get(page_url)
             response.raise_for_status()
-            break
+            return response.content
         except requests.RequestException as e:
             logging.error(f"Request failed (attempt {attempt+1}/{MAX_RETRIES}): {e}")
-            time.sleep(2)
-    else:
-        return []
+    return None
 
-    soup = BeautifulSoup(response.content, 'html.parser')
+# Função para extrair dados de uma página
+def extract_data_from_page(content: bytes) -> List[Dict]:
+    """Extracts property data from the page's JSON state, falling back to the HTML."""
+    if USE_JSON_STATE:
+        properties = PROPERTIES_JSON(content)
+        if properties is not None:
+            return properties
+        logging.warning("No __NEXT_DATA__ state on the page; extracting from the HTML.")
+    return extract_data_from_html(content)
+
+def extract_data_from_html(content: bytes) -> List[Dict]:
+    """Extracts property data from the HTML of a results page."""
+    soup = BeautifulSoup(content, 'html.parser')
     properties = soup.find_all('a', class_='MuiButtonBase-root MuiCardActionArea-root jss319')
-    data = []
-
-    for prop in properties:
-        try:
-            link = BASE_URL + prop['href'] if prop.get('href') else None
-            property_type = prop.find('span', id='property-type').text if prop.find('span', id='property-type') else None
-            price = prop.find('div', class_='jss363').find('span').text if prop.find('div', class_='jss363') and prop.find('div', class_='jss363').find('span') else None
-            address = prop.find('h2', class_='MuiTypography-root jss203 jss181 jss194 jss368 MuiTypography-body1 MuiTypography-noWrap').text if prop.find('h2', class_='MuiTypography-root jss203 jss181 jss194 jss368 MuiTypography-body1 MuiTypography-noWrap') else None
-            
-            area = None
-            bedrooms = None
-            parking_spaces = None
-
-            details = prop.find_all('div', class_='jss369')
-
-            if len(details) >= 3:
-                area = details[0].find('span').text if details[0].find('span') else None
-                bedrooms = details[1].find('span').text if details[1].find('span') else None
-                parking_spaces = details[2].find('span').text if details[2].find('span') else None
-
-            data.append({
-                'Link': link,
-                'Tipo do Imóvel': property_type,
-                'Preço': price,
-                'Endereço': address,
-                'Área': area,
-                'Quartos': bedrooms,
-                'Vagas': parking_spaces
-            })
-        except AttributeError as e:
-            logging.error(f"Error extracting property data: {e}")
-            continue
-
-    return data
+    return [PROPERTY(prop) for prop in properties]
 
 # Função para limpar e formatar endereço
 def clean_address(df: pd.DataFrame) -> pd.DataFrame:
@@ -85,25 +123,16 @@ def clean_address(df: pd.DataFrame) -> pd.DataFrame:
     return df
 
 # Função principal de scraping com paralelização
-def scrape_properties(num_pages: int, max_workers: int = 5) -> pd.DataFrame:
-    """Scrapes property data from multiple pages using multithreading."""
-    all_data = []
-
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        future_to_url = {executor.submit(extract_data_from_page, SEARCH_URL.format(page)): page for page in range(1, num_pages + 1)}
-        
-        for future in tqdm(as_completed(future_to_url), total=num_pages, desc="Scraping pages"):
-            try:
-                data = future.result()
-                all_data.extend(data)
-            except Exception as e:
-                logging.error(f"Error processing page: {e}")
-    
+def scrape_properties(max_workers: int = 5) -> pd.DataFrame:
+    """Scrapes every results page in parallel, stopping at the first empty one."""
+    planner = PlanejadorPaginacao(fetch_page, extract_data_from_page, max_workers=max_workers)
+    with tqdm(desc="Scraping pages") as progress:
+        all_data = planner.coletar(ao_concluir=lambda: progress.update(1))
+
     df = pd.DataFrame(all_data)
 
     # Limpar colunas numéricas
-    numeric_columns = ['Preço', 'Área', 'Quartos', 'Vagas']
-    df = clean_numeric_columns(df, numeric_columns)
+    df = clean_numeric_columns(df, NUMERIC_COLUMNS)
 
     # Remover imóveis com preços inválidos
     df = df.dropna(subset=['Preço'])
@@ -119,8 +148,7 @@ def scrape_properties(num_pages: int, max_workers: int = 5) -> pd.DataFrame:
 
 def main():
     """Main function to execute the scraping and save the results."""
-    num_pages = 132  # Ajuste o número de páginas conforme necessário
-    df = scrape_properties(num_pages, max_workers=10)
+    df = scrape_properties(max_workers=10)
 
     timestamp = datetime.now().strftime('%Y%m%d')
     file_name = f'imoveis_loft_{timestamp}.xlsx'
@@ -3,10 +3,14 @@ from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
 import logging
 import pandas as pd
 import re
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from utilitarios.navegador import caminho_chromedriver
 
 # Configuração do logging
 logging.basicConfig(level=logging.INFO)
@@ -16,7 +20,7 @@ options = webdriver.ChromeOptions()
 options.add_argument('--headless')  # Para rodar o navegador em modo headless
 options.add_argument('--no-sandbox')
 options.add_argument('--disable-dev-shm-usage')
-service = Service(ChromeDriverManager().install())
+service = Service(caminho_chromedriver())
 driver = webdriver.Chrome(service=service, options=options)
 
 # URL do site
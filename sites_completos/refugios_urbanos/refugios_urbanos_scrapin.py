@@ -1,8 +1,8 @@
-import time
+import sys
+from pathlib import Path
 import pandas as pd
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
@@ -10,8 +10,12 @@ from bs4 import BeautifulSoup
 from tqdm import tqdm
 import re
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from utilitarios.espera import aguardar_estabilidade
+from utilitarios.navegador import caminho_chromedriver
+
 # Inicializar o navegador com Selenium
-service = Service(ChromeDriverManager().install())
+service = Service(caminho_chromedriver())
 options = webdriver.ChromeOptions()
 options.add_argument('--headless')
 driver = webdriver.Chrome(service=service, options=options)
@@ -56,8 +60,8 @@ def carregar_mais_imoveis(quantidade_cliques):
 quantidade_cliques = 100  # Aumentar a quantidade de cliques
 carregar_mais_imoveis(quantidade_cliques)
 
-# Esperar um pouco mais para garantir que todos os imóveis sejam carregados
-time.sleep(10)
+# Esperar os últimos imóveis: retorna quando o DOM e a rede se estabilizam (no máximo 10s)
+aguardar_estabilidade(driver, tempo_maximo=10)
 
 # Extrair informações básicas dos imóveis
 soup = BeautifulSoup(driver.page_source, 'html.parser')
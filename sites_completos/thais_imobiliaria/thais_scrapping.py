@@ -1,17 +1,21 @@
+import sys
+from pathlib import Path
 import pandas as pd
 from bs4 import BeautifulSoup
-from selenium import webdriver
 from selenium.common.exceptions import NoSuchElementException, TimeoutException
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
-from webdriver_manager.chrome import ChromeDriverManager
 from tqdm import tqdm
 from distrito_federal_setor import setores
 import time
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from utilitarios.navegador import MonitorRecursos, criar_chrome
+
+# Imagens, fontes, rastreadores e anúncios bloqueados pelo DevTools (perfil em utilitarios/navegador.py)
+PERFIL_BLOQUEIO = "thais"
+
 def extrair_setor(titulo):
     palavras = titulo.split()
     palavras_upper = [palavra.upper() for palavra in palavras]
@@ -21,20 +25,18 @@ def extrair_setor(titulo):
     return "OUTRO"
 
 def configurar_driver():
-    chrome_options = Options()
-    chrome_options.add_argument("--headless")
-    chrome_options.add_argument("--disable-dev-shm-usage")
-    chrome_options.add_argument("--no-sandbox")
-    chrome_options.add_argument("--disable-gpu")
-    chrome_options.add_argument("--disable-software-rasterizer")
-    chrome_options.add_argument("--disable-setuid-sandbox")
-    return webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=chrome_options)
+    return criar_chrome(
+        argumentos=("--disable-software-rasterizer", "--disable-setuid-sandbox"),
+        perfil=PERFIL_BLOQUEIO,
+    )
 
 def scrape_imoveis(driver, num_clicks):
     lista_de_imoveis = []
+    monitor = MonitorRecursos(driver, PERFIL_BLOQUEIO)
 
     try:
         driver.get("https://www.thaisimobiliaria.com.br/imoveis/para-alugar")
+        monitor.registrar("Listagem")
 
         driver.execute_script("document.getElementById('cookies-component').remove();")
 
@@ -100,6 +102,7 @@ def scrape_imoveis(driver, num_clicks):
                 if link not in [imovel[2] for imovel in lista_de_imoveis]:
                     lista_de_imoveis.append([titulo_text, tipo_text, link, preco, metro_text, quarto, suite, banheiro, vaga, setor])
 
+        monitor.registrar(f"{num_clicks} cliques em 'Ver Mais'")
         return lista_de_imoveis
 
     except Exception as e:
@@ -3,14 +3,20 @@ import re
 import pandas as pd
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import NoSuchElementException, TimeoutException, StaleElementReferenceException
+from selenium.common.exceptions import NoSuchElementException, TimeoutException
 from tqdm import tqdm
 import logging
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from utilitarios.extrator import Campo
+from utilitarios.extrator_navegador import ExtratorNavegador
+from utilitarios.navegador import caminho_chromedriver
 
 # Configuração do logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -21,7 +27,7 @@ def configurar_driver():
     opcoes.add_argument('--disable-gpu')
     opcoes.add_argument('--no-sandbox')
     opcoes.add_argument('--disable-dev-shm-usage')
-    driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=opcoes)
+    driver = webdriver.Chrome(service=Service(caminho_chromedriver()), options=opcoes)
     return driver
 
 def aceitar_cookies(driver):
@@ -33,19 +39,27 @@ def aceitar_cookies(driver):
     except (NoSuchElementException, TimeoutException):
         pass
 
-def extrair_dados_imovel(elemento_imovel):
+# Campos de todos os cards lidos em um único execute_script
+IMOVEL = ExtratorNavegador("a.card-with-buttons.borderHover", {
+    "link": Campo(":scope", atributo="href"),
+    "tipo": Campo(".card-with-buttons__title", padrao=""),
+    "endereco": Campo(".card-with-buttons__heading", padrao=""),
+    "info": Campo("ul > li", todos=True, padrao=[]),
+    "preco": Campo(".card-with-buttons__value", padrao=""),
+})
+
+def extrair_dados_imovel(dados_imovel):
     try:
-        link = elemento_imovel.get_attribute("href")
-        tipo = elemento_imovel.find_element(By.CSS_SELECTOR, ".card-with-buttons__title").text
-        endereco = elemento_imovel.find_element(By.CSS_SELECTOR, ".card-with-buttons__heading").text
+        link = dados_imovel["link"]
+        tipo = dados_imovel["tipo"]
+        endereco = dados_imovel["endereco"]
 
         partes_endereco = endereco.split(" - ")
         bairro, cidade, estado = partes_endereco if len(partes_endereco) == 3 else (None, None, None)
 
-        lista_info = elemento_imovel.find_elements(By.CSS_SELECTOR, "ul > li")
         area = quartos = suites = banheiros = vagas = None
-        for info in lista_info:
-            texto = info.text.lower()
+        for info in dados_imovel["info"]:
+            texto = info.lower()
             if 'm²' in texto:
                 area = re.search(r'\d+', texto)
                 area = area.group() if area else 0
@@ -62,8 +76,7 @@ def extrair_dados_imovel(elemento_imovel):
                 vagas = re.search(r'\d+', texto)
                 vagas = vagas.group() if vagas else 0
 
-        preco_elemento = elemento_imovel.find_element(By.CSS_SELECTOR, ".card-with-buttons__value")
-        preco = re.search(r'\d+', preco_elemento.text.replace(".", "").replace(",", "."))
+        preco = re.search(r'\d+', dados_imovel["preco"].replace(".", "").replace(",", "."))
         preco = preco.group() if preco else 0
 
         return {
@@ -79,7 +92,7 @@ def extrair_dados_imovel(elemento_imovel):
             "Vagas": vagas,
             "Preço (R$)": preco
         }
-    except (NoSuchElementException, TimeoutException, AttributeError, StaleElementReferenceException) as e:
+    except (KeyError, AttributeError) as e:
         logging.error(f"Erro ao extrair dados do imóvel: {e}")
         return None
 
@@ -107,12 +120,13 @@ def extrair_imoveis(driver, url):
     
     carregar_todos_os_imoveis(driver)
     
-    elementos_imoveis = driver.find_elements(By.CSS_SELECTOR, "a.card-with-buttons.borderHover")
-    logging.info(f"Encontrados {len(elementos_imoveis)} elementos de imóveis na página.")
+    # Todos os cards de uma vez, em vez de um find_element por campo
+    dados_imoveis = IMOVEL(driver)
+    logging.info(f"Encontrados {len(dados_imoveis)} elementos de imóveis na página.")
     
     imoveis = []
-    for elemento_imovel in tqdm(elementos_imoveis, desc=f"Extraindo imóveis de {url}", unit="imóvel"):
-        dados = extrair_dados_imovel(elemento_imovel)
+    for dados_imovel in tqdm(dados_imoveis, desc=f"Extraindo imóveis de {url}", unit="imóvel"):
+        dados = extrair_dados_imovel(dados_imovel)
         if dados:
             imoveis.append(dados)
 
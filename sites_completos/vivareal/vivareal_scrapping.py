@@ -1,24 +1,31 @@
+import asyncio
 import os
+import sys
 import time
-import re
 import random
 import logging
 from typing import List, Optional, Tuple
 from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import (
-    NoSuchElementException,
     TimeoutException,
     ElementClickInterceptedException,
     WebDriverException,
 )
-from webdriver_manager.chrome import ChromeDriverManager
 import pandas as pd
 from tqdm import tqdm
 import argparse
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from utilitarios.espera import acionar_e_aguardar
+from utilitarios.extrator import Campo, primeiro_numero
+from utilitarios.extrator_navegador import ExtratorNavegador
+from utilitarios.navegador import MonitorRecursos, criar_chrome
+from utilitarios.navegador_assincrono import NavegadorAssincrono, acionar_e_aguardar as acionar_e_aguardar_async, executar_script
+from utilitarios.numeros import normalizar_numeros
 
 # Configuração de logging
 logging.basicConfig(
@@ -35,6 +42,32 @@ USER_AGENTS = [
     "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/90.0.4430.93 Safari/537.36",
 ]
 
+# Imagens, fontes, rastreadores e anúncios bloqueados pelo DevTools (perfil em utilitarios/navegador.py)
+PERFIL_BLOQUEIO = "vivareal"
+
+URL_BASE = "https://www.vivareal.com.br/aluguel/tocantins/palmas/"
+# Páginas da listagem carregando ao mesmo tempo no backend assíncrono (--assincrono)
+PAGINAS_ABERTAS = 4
+
+def _detalhe(texto: str) -> Optional[int]:
+    """Quartos, banheiros e vagas: o primeiro número do texto."""
+    numero = primeiro_numero(texto)
+    return int(numero) if numero else None
+
+
+# Campos de cada anúncio, lidos de todos os cards em um único execute_script.
+# Preço e área ficam em texto; a conversão é feita em processar_dados.
+ANUNCIO = ExtratorNavegador(".listing-item", {
+    "titulo": Campo(".property-title", obrigatorio=True),
+    "link": Campo("a", atributo="href", obrigatorio=True),
+    "endereco": Campo(".property-address", obrigatorio=True),
+    "preco": Campo(".property-price", padrao=""),
+    "area": Campo(".property-area", padrao=""),
+    "quartos": Campo(".property-rooms", pos=_detalhe, padrao=0),
+    "banheiros": Campo(".property-bathrooms", pos=_detalhe, padrao=0),
+    "vagas": Campo(".property-parking", pos=_detalhe, padrao=0),
+})
+
 COLUNAS = [
     "Título",
     "Link",
@@ -54,6 +87,7 @@ class WebScraper:
     def __init__(self, headless: bool = True):
         self.driver = self._configurar_driver(headless)
         self.wait = WebDriverWait(self.driver, 10)
+        self.monitor = MonitorRecursos(self.driver, PERFIL_BLOQUEIO)
 
     def _configurar_driver(self, headless: bool) -> webdriver.Chrome:
         """Configura e retorna uma instância do WebDriver."""
@@ -63,12 +97,8 @@ class WebScraper:
         chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
         chrome_options.add_experimental_option("useAutomationExtension", False)
 
-        if headless:
-            chrome_options.add_argument("--headless")
-
         try:
-            service = Service(ChromeDriverManager().install())
-            driver = webdriver.Chrome(service=service, options=chrome_options)
+            driver = criar_chrome(headless=headless, perfil=PERFIL_BLOQUEIO, opcoes=chrome_options)
             logger.info("Driver configurado com sucesso.")
             return driver
         except WebDriverException as e:
@@ -102,15 +132,24 @@ class WebScraper:
         return False
 
     def rolar_pagina(self) -> None:
-        """Rola a página até o final para carregar todos os elementos."""
+        """Rola a página até o final para carregar todos os elementos.
+
+        Cada rolagem espera o lote novo chegar e o DOM se estabilizar (no
+        máximo 5s) em vez de um intervalo fixo.
+        """
         altura_anterior = self.driver.execute_script(
             "return document.body.scrollHeight"
         )
         while True:
-            self.driver.execute_script(
-                "window.scrollTo(0, document.body.scrollHeight);"
+            acionar_e_aguardar(
+                self.driver,
+                lambda: self.driver.execute_script(
+                    "window.scrollTo(0, document.body.scrollHeight);"
+                ),
+                quietude=0.5,
+                tempo_maximo=5,
+                exigir_mudanca=False,
             )
-            time.sleep(random.uniform(1, 1.5))
             nova_altura = self.driver.execute_script(
                 "return document.body.scrollHeight"
             )
@@ -119,97 +158,95 @@ class WebScraper:
             altura_anterior = nova_altura
 
     def extrair_dados_pagina(self) -> List[List[str]]:
-        """Extrai os dados de cada imóvel na página."""
+        """Extrai os dados de cada imóvel na página (uma única chamada ao navegador)."""
         imoveis = []
         try:
-            anuncios = self.driver.find_elements(By.CLASS_NAME, "listing-item")
-            for anuncio in anuncios:
+            for dados in ANUNCIO(self.driver):
                 try:
-                    dados = self._processar_anuncio(anuncio)
                     if dados:
-                        imoveis.append(dados)
+                        imoveis.append(processar_anuncio(dados))
                 except Exception as e:
                     logger.error(f"Erro ao processar anúncio: {e}")
         except Exception as e:
             logger.error(f"Erro ao buscar anúncios: {e}")
         return imoveis
 
-    def _processar_anuncio(self, anuncio) -> Optional[List[str]]:
-        """Processa um anúncio individual e retorna os dados."""
-        try:
-            titulo = anuncio.find_element(By.CLASS_NAME, "property-title").text
-            link = anuncio.find_element(By.TAG_NAME, "a").get_attribute("href")
-            preco = self._processar_preco(anuncio)
-            area = self._processar_area(anuncio)
-            quartos = self._processar_detalhe(anuncio, "property-rooms")
-            banheiros = self._processar_detalhe(anuncio, "property-bathrooms")
-            vagas = self._processar_detalhe(anuncio, "property-parking")
-            endereco = anuncio.find_element(By.CLASS_NAME, "property-address").text
-
-            return [
-                titulo,
-                link,
-                *self._processar_endereco(endereco),
-                preco,
-                area,
-                quartos,
-                banheiros,
-                vagas,
-            ]
-        except NoSuchElementException as e:
-            logger.debug(f"Elemento não encontrado no anúncio: {e}")
-            return None
-        except Exception as e:
-            logger.error(f"Erro ao processar anúncio: {e}")
-            return None
+    def fechar(self) -> None:
+        """Fecha o driver."""
+        self.driver.quit()
 
-    def _processar_preco(self, anuncio) -> float:
-        """Processa e converte o preço."""
-        try:
-            preco_texto = anuncio.find_element(By.CLASS_NAME, "property-price").text
-            return float(
-                preco_texto.replace("R$", "").replace(".", "").replace(",", ".")
-            )
-        except:
-            return 0.0
 
-    def _processar_area(self, anuncio) -> float:
-        """Processa e converte a área."""
-        try:
-            area_texto = anuncio.find_element(By.CLASS_NAME, "property-area").text
-            return float(
-                area_texto.replace("m²", "").replace(".", "").replace(",", ".")
-            )
-        except:
-            return 0.0
+def processar_anuncio(dados: dict) -> List[str]:
+    """Monta a linha de um anúncio a partir dos campos lidos no navegador."""
+    return [
+        dados["titulo"],
+        dados["link"],
+        *processar_endereco(dados["endereco"]),
+        dados["preco"],
+        dados["area"],
+        dados["quartos"],
+        dados["banheiros"],
+        dados["vagas"],
+    ]
+
+
+def processar_endereco(endereco: str) -> Tuple[str, str, str, str]:
+    """Processa o endereço em componentes."""
+    partes = endereco.split(",")
+    return (
+        partes[0].strip() if len(partes) > 0 else "",
+        partes[1].strip() if len(partes) > 1 else "",
+        partes[2].strip() if len(partes) > 2 else "",
+        partes[3].strip() if len(partes) > 3 else "",
+    )
 
-    def _processar_detalhe(self, anuncio, classe: str) -> int:
-        """Processa detalhes como quartos, banheiros e vagas."""
-        try:
-            texto = anuncio.find_element(By.CLASS_NAME, classe).text
-            return int(re.search(r"\d+", texto).group())
-        except:
-            return 0
-
-    def _processar_endereco(self, endereco: str) -> Tuple[str, str, str, str]:
-        """Processa o endereço em componentes."""
-        partes = endereco.split(",")
-        return (
-            partes[0].strip() if len(partes) > 0 else "",
-            partes[1].strip() if len(partes) > 1 else "",
-            partes[2].strip() if len(partes) > 2 else "",
-            partes[3].strip() if len(partes) > 3 else "",
-        )
 
-    def fechar(self) -> None:
-        """Fecha o driver."""
-        self.driver.quit()
+async def rolar_pagina_async(pagina) -> None:
+    """``WebScraper.rolar_pagina`` em uma página do backend assíncrono."""
+    altura_anterior = await executar_script(pagina, "return document.body.scrollHeight")
+    while True:
+        await acionar_e_aguardar_async(
+            pagina,
+            lambda: executar_script(pagina, "window.scrollTo(0, document.body.scrollHeight);"),
+            quietude=0.5,
+            tempo_maximo=5,
+            exigir_mudanca=False,
+        )
+        nova_altura = await executar_script(pagina, "return document.body.scrollHeight")
+        if nova_altura == altura_anterior:
+            break
+        altura_anterior = nova_altura
+
+
+async def ler_listagem_async(pagina, url: str) -> List[List[str]]:
+    """Rola a página já carregada e extrai os anúncios com o mesmo ``ANUNCIO`` do Selenium."""
+    await rolar_pagina_async(pagina)
+    return [processar_anuncio(dados) for dados in await ANUNCIO.extrair_async(pagina) if dados]
+
+
+async def coletar_assincrono(url_base: str, num_paginas: int, paginas_abertas: int = PAGINAS_ABERTAS) -> List[List[str]]:
+    """Carrega as ``num_paginas`` páginas da listagem em paralelo, ``paginas_abertas`` por vez."""
+    async with NavegadorAssincrono(
+        paginas_abertas,
+        perfil=PERFIL_BLOQUEIO,
+        user_agent=random.choice(USER_AGENTS),
+        argumentos=("--disable-blink-features=AutomationControlled",),
+    ) as navegador:
+        paginas = await navegador.mapear(
+            ler_listagem_async,
+            [f"{url_base}?pagina={pagina}" for pagina in range(1, num_paginas + 1)],
+            descricao="Progresso",
+        )
+        logger.info(navegador.estatisticas.resumo())
+    return [imovel for imoveis in paginas if imoveis for imovel in imoveis]
 
 
 def processar_dados(df: pd.DataFrame) -> pd.DataFrame:
     """Realiza transformações e limpezas no DataFrame."""
-    # Conversão numérica
-    for coluna in ["Preço", "Área", "Quartos", "Banheiros", "Vagas"]:
+    # Conversão numérica: "R$ 1.500/mês", "80 m²" e faixas em uma passada por coluna
+    for coluna in ["Preço", "Área"]:
+        df[coluna] = normalizar_numeros(df[coluna]).fillna(0)
+    for coluna in ["Quartos", "Banheiros", "Vagas"]:
         df[coluna] = pd.to_numeric(df[coluna], errors="coerce").fillna(0)
 
     # Filtragem e cálculos
@@ -231,12 +268,14 @@ def salvar_dados(df: pd.DataFrame, base_nome: str) -> None:
     logger.info(f"Dados salvos em Excel: {excel_path}")
 
 
-def main(num_paginas: int, max_imoveis: int) -> None:
+def main(num_paginas: int, max_imoveis: int, medir_economia: bool = False) -> None:
     """Função principal de execução do scraper."""
     scraper = WebScraper()
-    url_base = "https://www.vivareal.com.br/aluguel/tocantins/palmas/"
+    url_base = URL_BASE
 
     try:
+        if medir_economia:
+            scraper.monitor.calibrar(url_base)
         if not scraper.carregar_pagina(url_base):
             return
 
@@ -250,6 +289,7 @@ def main(num_paginas: int, max_imoveis: int) -> None:
 
                 scraper.rolar_pagina()
                 dados_pagina = scraper.extrair_dados_pagina()
+                scraper.monitor.registrar(f"Página {pagina}")
                 dados_imoveis.extend(dados_pagina)
                 pbar.update(1)
 
@@ -266,9 +306,22 @@ def main(num_paginas: int, max_imoveis: int) -> None:
     except Exception as e:
         logger.error(f"Erro durante a execução: {e}")
     finally:
+        logger.info(scraper.monitor.resumo())
         scraper.fechar()
 
 
+def main_assincrono(num_paginas: int, max_imoveis: int, paginas_abertas: int = PAGINAS_ABERTAS) -> None:
+    """Mesma coleta pelo backend assíncrono (Playwright): as páginas da listagem carregam juntas."""
+    try:
+        dados_imoveis = asyncio.run(coletar_assincrono(URL_BASE, num_paginas, paginas_abertas))
+    except Exception as e:
+        logger.error(f"Erro durante a execução: {e}")
+        return
+    df = pd.DataFrame(dados_imoveis[:max_imoveis], columns=COLUNAS)
+    df = processar_dados(df)
+    salvar_dados(df, "palmas_vivareal_aluguel")
+
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Web Scraper de Imóveis")
     parser.add_argument(
@@ -280,6 +333,33 @@ if __name__ == "__main__":
         default=50,
         help="Número máximo de imóveis para coletar",
     )
+    parser.add_argument(
+        "--medir-economia",
+        action="store_true",
+        help="Carrega a primeira página também sem bloqueio para medir os bytes economizados",
+    )
+    parser.add_argument(
+        "--assincrono",
+        action="store_true",
+        help="Usa o backend assíncrono (Playwright) em vez do Selenium",
+    )
+    parser.add_argument(
+        "--paginas-abertas",
+        type=int,
+        default=PAGINAS_ABERTAS,
+        help="Páginas carregando ao mesmo tempo com --assincrono",
+    )
 
     args = parser.parse_args()
-    main(num_paginas=args.paginas, max_imoveis=args.max_imoveis)
+    if args.assincrono:
+        main_assincrono(
+            num_paginas=args.paginas,
+            max_imoveis=args.max_imoveis,
+            paginas_abertas=args.paginas_abertas,
+        )
+    else:
+        main(
+            num_paginas=args.paginas,
+            max_imoveis=args.max_imoveis,
+            medir_economia=args.medir_economia,
+        )
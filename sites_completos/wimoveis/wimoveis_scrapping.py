@@ -1,36 +1,46 @@
 from curses.ascii import alt
 import requests
-from bs4 import BeautifulSoup
 import pandas as pd
 import re
 import numpy as np
+import sys
 import time
+from functools import partial
+from pathlib import Path
 from distrito_federal_setor import setores
-inicio = time.time()
 
-lista_de_imoveis = []
-passou_aqui = 0
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from utilitarios.paginacao import PlanejadorPaginacao, descobrir_ultima_pagina
+from utilitarios.parser_html import criar_soup
+
+inicio = time.time()
 
 # Headers customizados
 headers = {
     'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/58.0.3029.110 Safari/537.3'
 }
 
+# Só os cards entram na árvore do parser (cabeçalho, scripts e rodapé são ignorados)
+CARDS = ('div', {'data-qa': 'posting PROPERTY'})
+
 # Usando sessões
-with requests.Session() as s:
-    s.headers.update(headers)
+s = requests.Session()
+s.headers.update(headers)
 
 
-for pagina in range(1, 191):
-    passou_aqui += 1
-    print(f'Passou aqui:{passou_aqui}')
+def buscar_pagina(pagina):
     url = f'https://www.wimoveis.com.br/terrenos-lotes-venda-distrito-federal-pagina-{pagina}.html'
     resposta = s.get(url)
-    #  # Levanta um erro se a requisição falhar
+    if resposta.status_code != 200:
+        print(f'Erro {resposta.status_code} na página {pagina}')
+        return None
+    return resposta.content
+
 
-    conteudo = resposta.content
-    site = BeautifulSoup(conteudo, 'html.parser')
-    imoveis = site.findAll('div', attrs={'data-qa': 'posting PROPERTY'})
+def processar_pagina(conteudo):
+    lista_de_imoveis = []
+    site = criar_soup(conteudo, somente=CARDS)
+    imoveis = site.findAll(*CARDS)
 
     for imovel in imoveis:
         # Título do imóvel
@@ -49,10 +59,8 @@ for pagina in range(1, 191):
         # Preco aluguel ou Venda
         preco = imovel.find('div', attrs={'data-qa': 'POSTING_CARD_PRICE'})
         
-        # Preço Condominio
-        condominio = imovel.find('div', attrs={'data-qa': 'expensas'}) 
-        
         # Metro quadrado
+        metro = None
         metro_area = imovel.find('h3', attrs={'data-qa': 'POSTING_CARD_FEATURES'})
         if metro_area is not None:
             metro = metro_area.find('span')
@@ -77,7 +85,19 @@ for pagina in range(1, 191):
         # Append to list only if 'Metro Quadrado' is not a range and 'Preço' is not "R$ Sob Consulta"
         if titulo is not None and subtitulo is not None and preco is not None and metro is not None:
             lista_de_imoveis.append([titulo.text.strip(), subtitulo.text.strip(), link, preco.text, metro.text.replace(' m² tot.', '').strip(), quarto, banheiro, vaga, imobiliaria])
-        
+
+    return lista_de_imoveis
+
+
+# A última página vem dos links "pagina-N.html"; a coleta para na primeira página vazia
+planejador = PlanejadorPaginacao(
+    buscar_pagina,
+    processar_pagina,
+    descobrir=partial(descobrir_ultima_pagina, padrao=r'pagina-(\d+)\.html'),
+    max_workers=5,
+)
+lista_de_imoveis = planejador.coletar()
+
 
 # Create DataFrame
 df_imovel = pd.DataFrame(lista_de_imoveis, columns=['Título', 'Subtítulo', 'Link', 'Preço','Metro Quadrado', 'Quarto', 'Banheiro', 'Vaga', 'Imobiliária'])
@@ -133,5 +153,4 @@ minutos = int(tempo_total_segundos // 60)
 segundos = int(tempo_total_segundos % 60)
 
 print(df_imovel)
-print(resposta)
 print("O script demorou", horas, "horas,", minutos, "minutos e", segundos, "segundos para ser executado.")
\ No newline at end of file
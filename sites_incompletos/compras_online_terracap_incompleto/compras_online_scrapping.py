@@ -3,10 +3,14 @@ from selenium.webdriver.chrome.service import Service as ChromeService
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
 from bs4 import BeautifulSoup
 import pandas as pd
 import re
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from utilitarios.navegador import caminho_chromedriver
 
 # Função para extrair conteúdo numérico de uma string
 def extract_numeric(text):
@@ -78,7 +82,7 @@ def extract_all_data(driver, base_url, max_pages):
 options = webdriver.ChromeOptions()
 # Adicione qualquer outra opção que precisar, como headless mode
 options.add_argument('--headless')
-service = ChromeService(ChromeDriverManager().install())
+service = ChromeService(caminho_chromedriver())
 driver = webdriver.Chrome(service=service, options=options)
 
 # URL base do site de leilões
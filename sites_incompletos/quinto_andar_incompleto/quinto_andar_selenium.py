@@ -3,17 +3,21 @@ from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.service import Service as ChromeService
 from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
 from bs4 import BeautifulSoup
 import pandas as pd
 import re
 import numpy as np
 from distrito_federal_setor import setores
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from utilitarios.navegador import caminho_chromedriver
 
 # Configurar o Selenium com Chrome e WebDriver Manager
 chrome_options = Options()
 chrome_options.add_argument("--headless")  # Executar em modo headless (sem abrir o navegador)
-driver = webdriver.Chrome(service=ChromeService(ChromeDriverManager().install()), options=chrome_options)
+driver = webdriver.Chrome(service=ChromeService(caminho_chromedriver()), options=chrome_options)
 
 lista_de_imoveis = []
 
@@ -3,11 +3,15 @@ from selenium.webdriver.chrome.service import Service as ChromeService
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
 import pandas as pd
 import time
 import random
-import requests
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from utilitarios.navegador import caminho_chromedriver
+from utilitarios.pool_proxies import PoolProxies
 
 # Lista de agentes de usuário
 user_agents = [
@@ -23,34 +27,17 @@ proxy_list = [
     # Adicione mais proxies conforme necessário
 ]
 
-# Função para verificar se o proxy está funcionando
-def verificar_proxy(proxy):
-    url = 'http://www.google.com'
-    proxies = {
-        'http': proxy,
-        'https': proxy,
-    }
-    try:
-        response = requests.get(url, proxies=proxies, timeout=5)
-        if response.status_code == 200:
-            return True
-    except Exception as e:
-        print(f"Proxy {proxy} falhou: {e}")
-    return False
-
-# Escolher um proxy funcional
-proxy = None
-for p in proxy_list:
-    if verificar_proxy(p):
-        proxy = p
-        break
+# Testar todos os proxies em paralelo e escolher um dos mais rápidos
+pool_proxies = PoolProxies(proxy_list)
+pool_proxies.sondar()
+proxy = pool_proxies.escolher()
 
 if proxy is None:
     print("Nenhum proxy funcional encontrado. Por favor, atualize a lista de proxies.")
     exit()
 
 # Configurar o driver do Selenium
-service = ChromeService(executable_path=ChromeDriverManager().install())
+service = ChromeService(executable_path=caminho_chromedriver())
 options = webdriver.ChromeOptions()
 options.add_argument('--headless')  # Executar em modo headless
 options.add_argument('--no-sandbox')
@@ -1,24 +1,16 @@
 import os
+import sys
 import logging
 import pandas as pd
-import random
-from typing import List
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import (
-    NoSuchElementException,
-    TimeoutException,
-    ElementClickInterceptedException,
-)
-from webdriver_manager.chrome import ChromeDriverManager
 from datetime import datetime
-import time
-import re
 from bs4 import BeautifulSoup
-import requests
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from utilitarios.navegador import criar_chrome
+from utilitarios.numeros import normalizar_colunas
+from utilitarios.paginacao import PlanejadorPaginacao
+from utilitarios.sessao_navegador import PortaoNavegador
 
 # Configuração do logger
 logging.basicConfig(
@@ -27,6 +19,8 @@ logging.basicConfig(
 logger = logging.getLogger()
 
 # Configurações globais
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/96.0.4664.110 Safari/537.36"
+MAX_WORKERS = 5
 CONFIGURACOES = {
     "Venda - Escritórios": "https://webescritorios.com.br/comprar/",
     "Venda - Industriais": "https://webindustrial.com.br/comprar/",
@@ -37,65 +31,16 @@ CONFIGURACOES = {
 
 def configurar_driver(headless=True):
     """Configura o WebDriver para o Selenium."""
-    options = webdriver.ChromeOptions()
-    options.add_argument("--disable-blink-features=AutomationControlled")
-    options.add_argument("--disable-infobars")
-    options.add_argument("--disable-dev-shm-usage")
-    options.add_argument("--no-sandbox")
-    options.add_argument("--disable-extensions")
-    options.add_argument("--start-maximized")
-    options.add_argument(
-        "user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/96.0.4664.110 Safari/537.36"
+    return criar_chrome(
+        headless=headless,
+        argumentos=(
+            "--disable-blink-features=AutomationControlled",
+            "--disable-infobars",
+            "--disable-extensions",
+            "--start-maximized",
+        ),
+        user_agent=USER_AGENT,
     )
-    if headless:
-        options.add_argument("--headless")
-    service = Service(ChromeDriverManager().install())
-    return webdriver.Chrome(service=service, options=options)
-
-
-def carregar_pagina(driver: webdriver.Chrome, url: str) -> bool:
-    """Carrega uma página e tenta resolver problemas de carregamento."""
-    max_retentativas = 3
-    for tentativa in range(max_retentativas):
-        try:
-            driver.get(url)
-            time.sleep(random.uniform(2, 4))  # Simula comportamento humano
-            return True
-        except Exception as e:
-            logger.warning(
-                f"Erro ao carregar a página (tentativa {tentativa + 1}/{max_retentativas}): {e}"
-            )
-            time.sleep(random.uniform(2, 5))
-    logger.error("Falha ao carregar a página após múltiplas tentativas.")
-    return False
-
-
-def clicar_no_proximo(driver: webdriver.Chrome) -> bool:
-    """Clica no botão 'Próximo' para ir para a próxima página."""
-    try:
-        botao_proximo = WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.ID, "proximo"))
-        )
-        driver.execute_script("arguments[0].scrollIntoView(true);", botao_proximo)
-        WebDriverWait(driver, 10).until(
-            EC.element_to_be_clickable(botao_proximo)
-        ).click()
-        time.sleep(random.uniform(2, 4))  # Delay para evitar bloqueios
-        return True
-    except (TimeoutException, NoSuchElementException, ElementClickInterceptedException):
-        logger.info("Botão 'Próximo' não encontrado ou sem mais páginas.")
-        return False
-
-
-def processar_pagina(driver: webdriver.Chrome, categoria: str, tipo_transacao: str):
-    """Processa a página atual do Selenium e retorna os dados extraídos."""
-    resultados = []
-    try:
-        conteudo_html = driver.page_source
-        resultados = processar_pagina_html(conteudo_html, categoria, tipo_transacao)
-    except Exception as e:
-        logger.error(f"Erro ao processar a página com Selenium: {e}")
-    return resultados
 
 
 def processar_pagina_html(conteudo_html, categoria, tipo_transacao):
@@ -115,28 +60,16 @@ def processar_pagina_html(conteudo_html, categoria, tipo_transacao):
     return resultados
 
 
-def normalizar_numero(valor):
-    """Normaliza valores numéricos (preço, área)."""
-    try:
-        valor = re.sub(r"[^\d,.-]", "", valor)  # Remove caracteres não numéricos
-        valor = valor.replace(".", "").replace(",", ".")  # Formato numérico padrão
-        return float(valor) if valor else 0  # Converte para float
-    except ValueError:
-        return 0  # Retorna 0 em caso de erro
-
-
 def extrair_informacoes_imovel_html(elemento, categoria, tipo_transacao):
     """Extrai informações de um imóvel a partir do BeautifulSoup."""
     try:
         titulo = elemento.select_one("h2.grid-offer-title").text.strip()
         descricao = elemento.select_one("p.grid-descricao-imovel").text.strip()
-        preco_texto = elemento.select_one("div.grid-price").text.strip()
-        area_texto = elemento.select_one("div.type-anuncio-destak-novo p").text.strip()
+        # Preço e área ficam como texto; salvar_para_excel converte a coluna inteira
+        preco = elemento.select_one("div.grid-price").text.strip()
+        area = elemento.select_one("div.type-anuncio-destak-novo p").text.strip()
         link = elemento.select_one("a")["href"]
 
-        preco = normalizar_numero(preco_texto)
-        area = normalizar_numero(area_texto)
-
         return {
             "Categoria": categoria,
             "Transação": tipo_transacao,
@@ -144,7 +77,6 @@ def extrair_informacoes_imovel_html(elemento, categoria, tipo_transacao):
             "Descrição": descricao,
             "Preço": preco,
             "Área (m²)": area,
-            "Preço por M2": preco / area if area > 0 else 0,
             "Link": link,
         }
     except Exception as e:
@@ -155,6 +87,11 @@ def extrair_informacoes_imovel_html(elemento, categoria, tipo_transacao):
 def salvar_para_excel(dados, nome_arquivo):
     """Salva os dados coletados em um arquivo Excel."""
     df = pd.DataFrame(dados)
+    if not df.empty:
+        normalizar_colunas(df, ["Preço", "Área (m²)"])
+        df[["Preço", "Área (m²)"]] = df[["Preço", "Área (m²)"]].fillna(0)
+        area = df["Área (m²)"].where(df["Área (m²)"] > 0)
+        df.insert(df.columns.get_loc("Área (m²)") + 1, "Preço por M2", (df["Preço"] / area).fillna(0))
     with pd.ExcelWriter(nome_arquivo, engine="xlsxwriter") as writer:
         df.to_excel(writer, index=False, sheet_name="Dados Imóveis")
         for idx, coluna in enumerate(df.columns):
@@ -162,48 +99,54 @@ def salvar_para_excel(dados, nome_arquivo):
             writer.sheets["Dados Imóveis"].set_column(idx, idx, max_largura)
 
 
-def coletar_dados_via_html(categoria, url):
-    """Coleta dados de imóveis iterando pelas páginas através da URL."""
-    resultados = []
-    pagina = 1
-    while True:
+def coletar_dados_via_html(categoria, url, portao, primeira_pagina=None):
+    """Coleta dados de imóveis buscando as páginas da URL em paralelo.
+
+    As páginas vêm da sessão HTTP que recebeu os cookies do navegador; a
+    página 1, já aberta no navegador, não é buscada de novo. A última página
+    vem dos links de paginação e a coleta para na primeira página sem imóveis.
+    """
+    tipo_transacao = "Venda" if "comprar" in url else "Aluguel"
+
+    def buscar(pagina):
+        if pagina == 1 and primeira_pagina is not None:
+            return primeira_pagina
         url_pagina = f"{url}?pagina={pagina}"
         logger.info(f"Processando URL: {url_pagina}")
-        resposta = requests.get(url_pagina, headers={"User-Agent": "Mozilla/5.0"})
+        try:
+            resposta = portao.get(url_pagina, timeout=30)
+        except Exception as e:
+            logger.error(f"Erro ao acessar a página {url_pagina}: {e}")
+            return None
         if resposta.status_code != 200:
             logger.error(f"Erro ao acessar a página: {url_pagina}")
-            break
-        conteudo_html = resposta.text
-        dados_pagina = processar_pagina_html(
-            conteudo_html, categoria, "Venda" if "comprar" in url else "Aluguel"
-        )
-        if not dados_pagina:  # Para quando não há mais dados
-            break
-        resultados.extend(dados_pagina)
-        pagina += 1
-    return resultados
+            return None
+        return resposta.content
+
+    planejador = PlanejadorPaginacao(
+        buscar,
+        lambda conteudo: processar_pagina_html(conteudo, categoria, tipo_transacao),
+        max_workers=MAX_WORKERS,
+    )
+    return planejador.coletar()
 
 
 def coletar_dados(categoria, url):
-    """Executa o scraping de todas as páginas combinando Selenium e requests."""
-    driver = configurar_driver(headless=True)
-    resultados = []
-    try:
-        if carregar_pagina(driver, url):
-            tipo_transacao = "Venda" if "comprar" in url else "Aluguel"
-            pagina_atual = 1
-            while True:
-                logger.info(f"Processando página {pagina_atual}")
-                resultados.extend(processar_pagina(driver, categoria, tipo_transacao))
-                if not clicar_no_proximo(driver):
-                    break
-                pagina_atual += 1
-    finally:
-        driver.quit()
-
-    # Complementar com requests + BeautifulSoup
-    resultados.extend(coletar_dados_via_html(categoria, url))
-    return resultados
+    """Coleta todas as páginas de uma categoria abrindo só a primeira no navegador.
+
+    O navegador passa pelos portões do site (cookies, consentimento,
+    anti-bot) e fecha; as demais páginas são buscadas em paralelo pela
+    sessão HTTP que herda cookies e headers dele.
+    """
+    with PortaoNavegador(
+        url, MAX_WORKERS, fabrica=configurar_driver, headers={"User-Agent": USER_AGENT}
+    ) as portao:
+        try:
+            primeira_pagina = portao.abrir()
+        except Exception as e:
+            logger.error(f"Erro ao abrir {url} no navegador: {e}")
+            return []
+        return coletar_dados_via_html(categoria, url, portao, primeira_pagina)
 
 
 def principal():
@@ -1,11 +1,15 @@
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.service import Service as ChromeService
-from webdriver_manager.chrome import ChromeDriverManager
 from bs4 import BeautifulSoup
 import pandas as pd
 import time
 import random
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from utilitarios.navegador import caminho_chromedriver
 
 # Lista de agentes de usuário
 user_agents = [
@@ -22,7 +26,7 @@ proxy_list = [
 ]
 
 # Configurar o driver do Selenium
-service = ChromeService(executable_path=ChromeDriverManager().install())
+service = ChromeService(executable_path=caminho_chromedriver())
 options = webdriver.ChromeOptions()
 options.add_argument('--headless')  # Executar em modo headless
 options.add_argument('--no-sandbox')
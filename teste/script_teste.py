@@ -3,11 +3,15 @@ import random
 import pandas as pd
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.common.exceptions import NoSuchElementException, TimeoutException
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from utilitarios.navegador import caminho_chromedriver
 
 
 # Função para configurar o navegador com WebDriver Manager e Selenium
@@ -30,7 +34,7 @@ def configurar_navegador():
     ]
     chrome_options.add_argument(f"user-agent={random.choice(user_agents)}")
 
-    service = Service(ChromeDriverManager().install())
+    service = Service(caminho_chromedriver())
     driver = webdriver.Chrome(service=service, options=chrome_options)
 
     return driver
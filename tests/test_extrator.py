@@ -0,0 +1,31 @@
+"""``Extrator``: campos por elemento com ``filho`` em todos os backends."""
+import pytest
+
+from utilitarios.extrator import Campo, Extrator, item
+from utilitarios.parser_html import backends_disponiveis, criar_soup
+
+CARD = """
+<a class="card" href="/imovel/1">
+  <div class="det"><span>72,5 m²</span><span>área útil</span></div>
+  <div class="det"><span>3</span></div>
+  <div class="det"><b>sem span</b></div>
+</a>
+"""
+
+DETALHES = Extrator({
+    'Área': Campo('div.det', todos=True, filho='span', pos=item(0)),
+    'Quartos': Campo('div.det', todos=True, filho='span', pos=item(1)),
+    'Vagas': Campo('div.det', todos=True, filho='span', pos=item(2), padrao='0'),
+    'Primeiro': Campo('div.det', filho='span'),
+})
+
+
+@pytest.mark.parametrize("backend", backends_disponiveis())
+def test_filho_le_o_primeiro_descendente_de_cada_elemento(backend):
+    card = criar_soup(CARD, backend).find('a', class_='card')
+    assert DETALHES(card) == {'Área': '72,5 m²', 'Quartos': '3', 'Vagas': '0', 'Primeiro': '72,5 m²'}
+
+
+def test_filho_exige_composto_simples():
+    with pytest.raises(ValueError):
+        Extrator({'x': Campo('div', filho='div span')})
@@ -0,0 +1,56 @@
+"""Paridade dos backends de ``utilitarios.parser_html`` com o html.parser nos parsers dos scripts."""
+import pytest
+
+from benchmark_parsers import PARSERS, backends_do_parser, carregar_script
+from utilitarios.parser_html import backends_disponiveis, criar_soup
+
+PAGINAS = 5
+_scripts = {}
+
+
+def script(site: str):
+    if site not in _scripts:
+        _scripts[site] = carregar_script(site)
+    return _scripts[site]
+
+
+def extrair(nome: str, backend: str, monkeypatch):
+    site, nome_funcao, registro, gerar = PARSERS[nome]
+    funcao = getattr(script(site), nome_funcao)
+    monkeypatch.setenv("SCRAPING_PARSER", backend)
+    entradas = [(f"https://exemplo/{p}", gerar(site, p)) for p in range(1, PAGINAS + 1)]
+    return [funcao((url, html) if registro else html) for url, html in entradas]
+
+
+CASOS = [
+    (nome, backend)
+    for nome in PARSERS
+    for backend in backends_disponiveis()
+    if backend != "html.parser"
+]
+
+
+@pytest.mark.parametrize("nome,backend", CASOS)
+def test_paridade_com_html_parser(nome, backend, monkeypatch):
+    site = PARSERS[nome][0]
+    if backend not in backends_do_parser(nome, script(site)):
+        pytest.skip(f"{nome} fixa o parser em {script(site).PARSER_LISTAGEM}")
+    referencia = extrair(nome, "html.parser", monkeypatch)
+    assert any(referencia)
+    assert extrair(nome, backend, monkeypatch) == referencia
+
+
+@pytest.mark.parametrize("backend", backends_disponiveis())
+def test_listagem_franciosi_ignora_scraping_parser(backend, monkeypatch):
+    """O card com ``<p>`` aberto só é lido como no html.parser se o backend ficar fixo."""
+    referencia = extrair("franciosi.listagem", "html.parser", monkeypatch)
+    assert extrair("franciosi.listagem", backend, monkeypatch) == referencia
+    assert "Dorm." in referencia[0][0]["Subtítulo"]
+
+
+@pytest.mark.parametrize("backend", backends_disponiveis())
+def test_somente_monta_apenas_os_cards(backend):
+    html = "<html><body><nav><a>menu</a></nav><div class='card x'><a href='/1'>um</a></div></body></html>"
+    soup = criar_soup(html, backend, somente=("div", {"class": "card x"}))
+    cards = soup.find_all("div", class_="card x")
+    assert [card.find("a")["href"] for card in cards] == ["/1"]
@@ -0,0 +1 @@
+"""Componentes compartilhados pelos scripts de scraping."""
@@ -0,0 +1,243 @@
+"""Várias abas de um único Chrome carregando páginas de detalhe ao mesmo tempo."""
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from selenium.common.exceptions import WebDriverException
+from tqdm import tqdm
+
+from utilitarios.navegador import PerfilBloqueio, aplicar_bloqueio
+from utilitarios.pool_navegadores import TEMPO_CARREGAMENTO, driver_vivo
+
+logger = logging.getLogger(__name__)
+
+ABAS = 4  # Abas carregando ao mesmo tempo no mesmo navegador
+INTERVALO_CONSULTA = 0.05  # Segundos entre duas voltas sem nenhuma aba pronta
+
+# Marca o documento atual e inicia a navegação sem esperar a página; a marca
+# some quando o documento novo substitui o antigo
+_NAVEGAR = "window.__abaCarregando = true; window.location.href = arguments[0];"
+_PRONTA = "return !window.__abaCarregando && document.readyState === 'complete';"
+
+
+@dataclass
+class EstatisticasAbas:
+    """Contadores de um executor de abas."""
+
+    concluidas: int = 0
+    falhas: int = 0
+    reenfileiradas: int = 0
+    abas_substituidas: int = 0
+
+    def resumo(self) -> str:
+        return (
+            f"Abas: {self.concluidas} URLs concluídas, {self.falhas} falhas, "
+            f"{self.reenfileiradas} reenfileiradas; {self.abas_substituidas} abas substituídas."
+        )
+
+
+class ExecutorAbas:
+    """Distribui URLs entre ``abas`` abas de um só navegador.
+
+    O WebDriver atende um comando por vez e ``driver.get`` bloqueia até a
+    página terminar de carregar; aqui a navegação é só iniciada em cada aba
+    (``location.href``) e o executor passa pelas abas perguntando se o
+    documento novo já está completo. A aba que termina primeiro recebe
+    ``tarefa(driver, url)``, com o driver já nela, e em seguida a próxima URL.
+    Assim a rede e a renderização de K páginas correm em paralelo com a
+    memória de um navegador, não de K.
+
+    A tarefa lê a página já carregada (não chama ``driver.get``). Páginas que
+    passam de ``tempo_carregamento`` e tarefas que levantam
+    ``WebDriverException`` voltam à fila até ``tentativas`` vezes; uma aba
+    que deixa de responder é fechada e trocada por outra. Se o navegador
+    inteiro cair, o erro é propagado. ``intervalo_inicio`` espaça o início
+    das navegações sem bloquear as abas que já estão carregando.
+
+    O ``Network.setBlockedURLs`` do DevTools vale só para a aba em que foi
+    enviado; com ``perfil`` o bloqueio é aplicado em cada aba aberta ou
+    substituída pelo executor, inclusive na original.
+    """
+
+    def __init__(
+        self,
+        driver,
+        abas: int = ABAS,
+        tempo_carregamento: float = TEMPO_CARREGAMENTO,
+        tentativas: int = 2,
+        intervalo_inicio: float = 0.0,
+        perfil: Union[str, PerfilBloqueio, None] = None,
+    ):
+        self.driver = driver
+        self.abas = max(1, abas)
+        self.tempo_carregamento = tempo_carregamento
+        self.tentativas = tentativas
+        self.intervalo_inicio = intervalo_inicio
+        self.perfil = perfil
+        self.estatisticas = EstatisticasAbas()
+        self._original: Optional[str] = None
+        self._handles: List[str] = []
+        self._ultimo_inicio = 0.0
+
+    def __enter__(self) -> "ExecutorAbas":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.fechar()
+
+    def _nova_aba(self) -> str:
+        """Abre uma aba, já com o bloqueio do perfil, e fica nela."""
+        self.driver.switch_to.new_window("tab")
+        if self.perfil is not None:
+            aplicar_bloqueio(self.driver, self.perfil)
+        return self.driver.current_window_handle
+
+    def _abrir_abas(self) -> None:
+        if self._handles:
+            return
+        self._original = self.driver.current_window_handle
+        if self.perfil is not None:
+            aplicar_bloqueio(self.driver, self.perfil)
+        self._handles = [self._original]
+        for _ in range(self.abas - 1):
+            self._handles.append(self._nova_aba())
+
+    def _substituir(self, handle: str) -> str:
+        """Fecha uma aba que não responde e abre outra no lugar."""
+        try:
+            self.driver.switch_to.window(handle)
+            self.driver.close()
+        except WebDriverException:
+            pass
+        restantes = [h for h in self._handles if h != handle]
+        self.driver.switch_to.window(restantes[0] if restantes else self.driver.window_handles[0])
+        novo = self._nova_aba()
+        self._handles[self._handles.index(handle)] = novo
+        if handle == self._original:
+            self._original = novo
+        self.estatisticas.abas_substituidas += 1
+        return novo
+
+    def _navegar(self, handle: str, url: str) -> None:
+        espera = self._ultimo_inicio + self.intervalo_inicio - time.monotonic()
+        if espera > 0:
+            time.sleep(espera)
+        self.driver.switch_to.window(handle)
+        self.driver.execute_script(_NAVEGAR, url)
+        self._ultimo_inicio = time.monotonic()
+
+    def _pronta(self, handle: str) -> bool:
+        self.driver.switch_to.window(handle)
+        try:
+            return bool(self.driver.execute_script(_PRONTA))
+        except WebDriverException:
+            if not driver_vivo(self.driver):
+                raise
+            return False  # Documento sendo trocado no meio do script
+
+    def iterar(
+        self,
+        tarefa: Callable[[Any, str], Any],
+        urls: Iterable[str],
+    ) -> Iterator[Tuple[int, Any]]:
+        """``(índice, resultado)`` na ordem em que as abas terminam; ``None`` nas URLs que falharam."""
+        self._abrir_abas()
+        fila = deque((indice, url, 0) for indice, url in enumerate(urls))
+        livres = deque(self._handles)
+        ativas: Dict[str, Tuple[int, str, int, float]] = {}
+
+        def devolver(indice: int, url: str, tentativa: int, motivo: str) -> bool:
+            if tentativa + 1 < self.tentativas:
+                fila.append((indice, url, tentativa + 1))
+                self.estatisticas.reenfileiradas += 1
+                return True
+            logger.error(f"Desistindo de {url} após {self.tentativas} tentativas: {motivo}")
+            self.estatisticas.falhas += 1
+            return False
+
+        while fila or ativas:
+            while livres and fila:
+                handle = livres.popleft()
+                indice, url, tentativa = fila.popleft()
+                try:
+                    self._navegar(handle, url)
+                except WebDriverException as e:
+                    if not driver_vivo(self.driver):
+                        raise
+                    livres.append(self._substituir(handle))
+                    if not devolver(indice, url, tentativa, e.msg or str(e)):
+                        yield indice, None
+                    continue
+                ativas[handle] = (indice, url, tentativa, time.monotonic())
+
+            alguma_pronta = False
+            for handle, (indice, url, tentativa, inicio) in list(ativas.items()):
+                pronta = self._pronta(handle)
+                if not pronta and time.monotonic() - inicio < self.tempo_carregamento:
+                    continue
+                del ativas[handle]
+                alguma_pronta = True
+                if not pronta:
+                    logger.warning(f"{url} não terminou de carregar em {self.tempo_carregamento:.0f} s.")
+                    try:
+                        self.driver.execute_script("window.stop();")
+                        livres.append(handle)
+                    except WebDriverException:
+                        livres.append(self._substituir(handle))
+                    if not devolver(indice, url, tentativa, "tempo de carregamento esgotado"):
+                        yield indice, None
+                    continue
+                try:
+                    resultado = tarefa(self.driver, url)
+                except WebDriverException as e:
+                    if not driver_vivo(self.driver):
+                        raise
+                    livres.append(self._substituir(handle))
+                    if not devolver(indice, url, tentativa, e.msg or str(e)):
+                        yield indice, None
+                    continue
+                except Exception as e:
+                    logger.error(f"Erro ao processar {url}: {e}")
+                    self.estatisticas.falhas += 1
+                    resultado = None
+                else:
+                    self.estatisticas.concluidas += 1
+                livres.append(handle)
+                yield indice, resultado
+            if not alguma_pronta:
+                time.sleep(INTERVALO_CONSULTA)
+
+    def mapear(
+        self,
+        tarefa: Callable[[Any, str], Any],
+        urls: Iterable[str],
+        descricao: Optional[str] = None,
+    ) -> List[Any]:
+        """``tarefa(driver, url)`` para cada URL, na ordem de ``urls``; ``None`` nas que falharam."""
+        urls = list(urls)
+        resultados: List[Any] = [None] * len(urls)
+        with tqdm(total=len(urls), desc=descricao, unit="página", disable=descricao is None) as barra:
+            for indice, resultado in self.iterar(tarefa, urls):
+                resultados[indice] = resultado
+                barra.update(1)
+        return resultados
+
+    def fechar(self) -> None:
+        """Fecha as abas extras e volta para a aba original (o navegador continua aberto)."""
+        for handle in self._handles:
+            if handle == self._original:
+                continue
+            try:
+                self.driver.switch_to.window(handle)
+                self.driver.close()
+            except WebDriverException:
+                pass
+        if self._original is not None:
+            try:
+                self.driver.switch_to.window(self._original)
+            except WebDriverException:
+                pass
+        self._handles = []
+        self._original = None
@@ -0,0 +1,175 @@
+"""Arquivo de páginas no formato WARC comprimido (``.warc.gz``), só de acréscimo."""
+import gzip
+import logging
+import mmap
+import os
+import threading
+import uuid
+import zlib
+from datetime import datetime, timezone
+from typing import Dict, Iterator, Optional, Tuple
+
+from utilitarios.cache_http import DIRETORIO_PADRAO, modo_offline_ativo
+
+logger = logging.getLogger(__name__)
+
+BLOCO_LEITURA = 64 * 1024
+
+
+def _montar_registro(url: str, conteudo: bytes, tipo_conteudo: str) -> bytes:
+    """Registro WARC/1.1 do tipo ``resource`` com o corpo da página."""
+    cabecalhos = [
+        "WARC/1.1",
+        "WARC-Type: resource",
+        f"WARC-Record-ID: <urn:uuid:{uuid.uuid4()}>",
+        f"WARC-Date: {datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')}",
+        f"WARC-Target-URI: {url}",
+        f"Content-Type: {tipo_conteudo}",
+        f"Content-Length: {len(conteudo)}",
+    ]
+    return "\r\n".join(cabecalhos).encode("utf-8") + b"\r\n\r\n" + conteudo + b"\r\n\r\n"
+
+
+def _ler_registro(registro: bytes) -> Tuple[str, bytes]:
+    """Separa a URL e o corpo de um registro descomprimido."""
+    cabecalho, _, resto = registro.partition(b"\r\n\r\n")
+    campos = {}
+    for linha in cabecalho.decode("utf-8").split("\r\n")[1:]:
+        nome, _, valor = linha.partition(":")
+        campos[nome.strip().lower()] = valor.strip()
+    tamanho = int(campos["content-length"])
+    return campos["warc-target-uri"], resto[:tamanho]
+
+
+class ArquivoWARC:
+    """Guarda respostas com suas URLs em um único ``.warc.gz``.
+
+    Cada registro é um membro gzip independente (a convenção dos arquivos
+    WARC), então o arquivo pode ser lido em sequência por ``iterar`` ou por
+    acesso direto a um registro com ``ler``, que descomprime só aquele trecho
+    de um ``mmap``. O índice URL → (posição, tamanho) fica em ``<caminho>.idx``
+    e é reconstruído varrendo o arquivo se estiver ausente. Com a mesma URL
+    gravada mais de uma vez, vale o registro mais recente.
+    """
+
+    def __init__(self, caminho: str, novo: bool = False):
+        self.caminho = caminho
+        self.caminho_indice = f"{caminho}.idx"
+        self._trava = threading.Lock()
+        os.makedirs(os.path.dirname(caminho) or ".", exist_ok=True)
+        if novo:
+            for arquivo in (caminho, self.caminho_indice):
+                if os.path.exists(arquivo):
+                    os.remove(arquivo)
+        self._arquivo = open(caminho, "ab")
+        self._indice_arquivo = open(self.caminho_indice, "a", encoding="utf-8")
+        self._indice: Dict[str, Tuple[int, int]] = self._carregar_indice()
+        self._mmap: Optional[mmap.mmap] = None
+        self._tamanho_mapeado = 0
+
+    def _carregar_indice(self) -> Dict[str, Tuple[int, int]]:
+        tamanho_arquivo = os.path.getsize(self.caminho)
+        indice = {}
+        with open(self.caminho_indice, "r", encoding="utf-8") as arquivo:
+            for linha in arquivo:
+                url, posicao, tamanho = linha.rstrip("\n").rsplit("\t", 2)
+                indice[url] = (int(posicao), int(tamanho))
+        cobertos = max((p + t for p, t in indice.values()), default=0)
+        if cobertos != tamanho_arquivo:
+            logger.info(f"Reconstruindo o índice de {self.caminho}.")
+            indice = {url: (p, t) for p, t, url, _ in self._membros()}
+            self._indice_arquivo.truncate(0)
+            self._indice_arquivo.writelines(f"{u}\t{p}\t{t}\n" for u, (p, t) in indice.items())
+            self._indice_arquivo.flush()
+        return indice
+
+    def gravar(self, url: str, conteudo: bytes, tipo_conteudo: str = "text/html") -> None:
+        """Acrescenta um registro (a compressão roda fora da trava)."""
+        membro = gzip.compress(_montar_registro(url, conteudo, tipo_conteudo), compresslevel=6)
+        with self._trava:
+            posicao = self._arquivo.tell()
+            self._arquivo.write(membro)
+            self._arquivo.flush()
+            self._indice[url] = (posicao, len(membro))
+            self._indice_arquivo.write(f"{url}\t{posicao}\t{len(membro)}\n")
+            self._indice_arquivo.flush()
+
+    def _mapear(self) -> mmap.mmap:
+        """Mapeia o arquivo em memória, remapeando se ele cresceu."""
+        tamanho = os.path.getsize(self.caminho)
+        if self._mmap is None or tamanho != self._tamanho_mapeado:
+            if self._mmap is not None:
+                self._mmap.close()
+            with open(self.caminho, "rb") as arquivo:
+                self._mmap = mmap.mmap(arquivo.fileno(), 0, access=mmap.ACCESS_READ)
+            self._tamanho_mapeado = tamanho
+        return self._mmap
+
+    def ler(self, url: str) -> Optional[bytes]:
+        """Corpo gravado para a URL, descomprimindo só o registro dela."""
+        with self._trava:
+            localizacao = self._indice.get(url)
+            if localizacao is None:
+                return None
+            posicao, tamanho = localizacao
+            membro = self._mapear()[posicao : posicao + tamanho]
+        return _ler_registro(gzip.decompress(membro))[1]
+
+    def _membros(self) -> Iterator[Tuple[int, int, str, bytes]]:
+        """Percorre os membros gzip: (posição, tamanho comprimido, URL, corpo)."""
+        if not os.path.getsize(self.caminho):
+            return
+        with open(self.caminho, "rb") as arquivo, mmap.mmap(
+            arquivo.fileno(), 0, access=mmap.ACCESS_READ
+        ) as dados:
+            posicao = 0
+            while posicao < len(dados):
+                descompressor = zlib.decompressobj(wbits=31)
+                partes = []
+                lido = posicao
+                while not descompressor.eof and lido < len(dados):
+                    partes.append(descompressor.decompress(dados[lido : lido + BLOCO_LEITURA]))
+                    lido += BLOCO_LEITURA
+                if not descompressor.eof:
+                    logger.warning(f"Registro truncado no fim de {self.caminho}; ignorado.")
+                    return
+                tamanho = min(lido, len(dados)) - posicao - len(descompressor.unused_data)
+                url, corpo = _ler_registro(b"".join(partes))
+                yield posicao, tamanho, url, corpo
+                posicao += tamanho
+
+    def iterar(self) -> Iterator[Tuple[str, bytes]]:
+        """Entrega (URL, corpo) do registro mais recente de cada URL, na ordem de gravação."""
+        for posicao, _, url, corpo in self._membros():
+            if self._indice.get(url, (posicao,))[0] == posicao:
+                yield url, corpo
+
+    def __contains__(self, url: str) -> bool:
+        return url in self._indice
+
+    def __len__(self) -> int:
+        return len(self._indice)
+
+    def fechar(self) -> None:
+        with self._trava:
+            if self._mmap is not None:
+                self._mmap.close()
+                self._mmap = None
+            self._arquivo.close()
+            self._indice_arquivo.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.fechar()
+
+
+def criar_arquivo_paginas(nome_site: str, nome: str = "detalhes") -> ArquivoWARC:
+    """Abre ``<SCRAPING_CACHE_DIR>/<nome_site>/<nome>.warc.gz``.
+
+    Numa execução normal o arquivo recomeça vazio; com ``SCRAPING_OFFLINE=1``
+    o arquivo da última execução é mantido para reprocessar sem rede.
+    """
+    caminho = os.path.join(DIRETORIO_PADRAO, nome_site, f"{nome}.warc.gz")
+    return ArquivoWARC(caminho, novo=not modo_offline_ativo())
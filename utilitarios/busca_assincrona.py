@@ -0,0 +1,155 @@
+"""Motor de busca assíncrono (asyncio + httpx) para listagens paginadas."""
+import asyncio
+import logging
+import time
+from typing import Callable, Dict, Iterable, List, Optional
+from urllib.parse import urlsplit
+
+import httpx
+
+from utilitarios.controle_taxa import ControladorTaxa
+from utilitarios.disjuntor import CircuitoAberto, Disjuntor
+from utilitarios.transporte_http2 import http2_disponivel
+
+logger = logging.getLogger(__name__)
+
+STATUS_REPETIVEIS = {429, 500, 502, 503, 504}
+
+
+class BuscadorAssincrono:
+    """Mantém muitas requisições em voo com limite de concorrência por host.
+
+    O backoff é feito com ``asyncio.sleep`` fora do semáforo do host, então
+    uma página limitada por 429 não ocupa uma vaga enquanto espera. Com um
+    ``controlador`` o ritmo (e o respeito a ``Retry-After``) fica a cargo do
+    ``ControladorTaxa`` e o backoff exponencial fixo é desativado. Com
+    ``http2`` as requisições de um host dividem poucas conexões multiplexadas.
+    """
+
+    def __init__(
+        self,
+        headers: Optional[Dict[str, str]] = None,
+        limite_por_host: int = 100,
+        max_tentativas: int = 5,
+        espera_inicial: float = 5.0,
+        fator_backoff: float = 2.0,
+        timeout: float = 30.0,
+        controlador: Optional[ControladorTaxa] = None,
+        http2: bool = False,
+        disjuntor: Optional[Disjuntor] = None,
+    ):
+        self.headers = headers or {}
+        self.limite_por_host = limite_por_host
+        self.max_tentativas = max_tentativas
+        self.espera_inicial = espera_inicial
+        self.fator_backoff = fator_backoff
+        self.timeout = timeout
+        self.controlador = controlador
+        self.http2 = http2 and http2_disponivel()
+        self.disjuntor = disjuntor
+        self._semaforos: Dict[str, asyncio.Semaphore] = {}
+
+    def _semaforo(self, url: str) -> asyncio.Semaphore:
+        """Retorna o semáforo do host da URL, criando-o se necessário."""
+        host = urlsplit(url).netloc
+        if host not in self._semaforos:
+            self._semaforos[host] = asyncio.Semaphore(self.limite_por_host)
+        return self._semaforos[host]
+
+    async def buscar(self, cliente: httpx.AsyncClient, url: str) -> Optional[bytes]:
+        """Obtém o conteúdo de uma URL com backoff exponencial não bloqueante.
+
+        Com ``disjuntor``, domínios pausados devolvem ``None`` na hora e cada
+        retentativa depende do orçamento do domínio.
+        """
+        espera = self.espera_inicial
+
+        for tentativa in range(self.max_tentativas + 1):
+            if self.disjuntor:
+                if tentativa and not self.disjuntor.liberar_retentativa(url):
+                    logger.error(f"Orçamento de retentativas esgotado em {url}.")
+                    return None
+                try:
+                    self.disjuntor.verificar(url)
+                except CircuitoAberto as e:
+                    logger.error(str(e))
+                    return None
+            if self.controlador:
+                await self.controlador.aguardar_async(url)
+            async with self._semaforo(url):
+                inicio = time.monotonic()
+                try:
+                    resposta = await cliente.get(url)
+                except httpx.HTTPError as e:
+                    logger.error(f"Erro de conexão em {url}: {e}")
+                    resposta = None
+            if self.controlador:
+                self.controlador.registrar(
+                    url,
+                    resposta.status_code if resposta is not None else None,
+                    time.monotonic() - inicio,
+                    resposta.headers.get("Retry-After") if resposta is not None else None,
+                )
+            if self.disjuntor:
+                self.disjuntor.registrar(
+                    url, resposta.status_code if resposta is not None else None
+                )
+
+            if resposta is not None:
+                if resposta.status_code < 400:
+                    return resposta.content
+                if resposta.status_code not in STATUS_REPETIVEIS:
+                    logger.error(f"Erro HTTP {resposta.status_code} em {url}")
+                    return None
+                logger.warning(
+                    f"Erro {resposta.status_code} em {url}. Tentando novamente..."
+                )
+
+            if tentativa < self.max_tentativas and not self.controlador:
+                await asyncio.sleep(espera)
+                espera *= self.fator_backoff
+
+        logger.error(f"Falha definitiva em {url} após {self.max_tentativas} tentativas.")
+        return None
+
+    def _criar_cliente(self) -> httpx.AsyncClient:
+        """Cria o cliente HTTP compartilhado por todas as requisições."""
+        limites = httpx.Limits(
+            max_connections=None,
+            max_keepalive_connections=self.limite_por_host,
+        )
+        return httpx.AsyncClient(
+            headers=self.headers,
+            timeout=self.timeout,
+            limits=limites,
+            follow_redirects=True,
+            http2=self.http2,
+        )
+
+    async def buscar_todas(
+        self,
+        urls: List[str],
+        ao_concluir: Optional[Callable[[], None]] = None,
+    ) -> List[Optional[bytes]]:
+        """Busca todas as URLs em paralelo, preservando a ordem de entrada."""
+
+        async def buscar_e_notificar(cliente, url):
+            conteudo = await self.buscar(cliente, url)
+            if ao_concluir:
+                ao_concluir()
+            return conteudo
+
+        async with self._criar_cliente() as cliente:
+            return await asyncio.gather(
+                *(buscar_e_notificar(cliente, url) for url in urls)
+            )
+
+
+def buscar_paginas(
+    urls: Iterable[str],
+    ao_concluir: Optional[Callable[[], None]] = None,
+    **opcoes,
+) -> List[Optional[bytes]]:
+    """Atalho síncrono: executa ``BuscadorAssincrono.buscar_todas`` em um loop novo."""
+    buscador = BuscadorAssincrono(**opcoes)
+    return asyncio.run(buscador.buscar_todas(list(urls), ao_concluir))
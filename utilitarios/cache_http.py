@@ -0,0 +1,168 @@
+"""Cache HTTP persistente em disco com revalidação condicional (ETag/Last-Modified)."""
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+DIRETORIO_PADRAO = os.environ.get("SCRAPING_CACHE_DIR", ".cache_http")
+TAMANHO_MAXIMO_PADRAO = 1024 * 1024 * 1024  # 1 GB por site
+
+
+def modo_offline_ativo() -> bool:
+    """Indica se a variável ``SCRAPING_OFFLINE=1`` pede replay sem rede."""
+    return os.environ.get("SCRAPING_OFFLINE") == "1"
+
+
+class CacheHTTP:
+    """Guarda respostas por URL e as revalida com GET condicional.
+
+    Cada entrada é um par ``<sha256>.html``/``<sha256>.json`` (corpo e
+    metadados). Quando o total passa de ``tamanho_maximo`` as entradas menos
+    acessadas recentemente são removidas. No modo offline nenhuma requisição
+    é feita: URLs ausentes do cache retornam ``None``.
+    """
+
+    def __init__(
+        self,
+        diretorio: str,
+        tamanho_maximo: int = TAMANHO_MAXIMO_PADRAO,
+        offline: Optional[bool] = None,
+    ):
+        self.diretorio = diretorio
+        self.tamanho_maximo = tamanho_maximo
+        self.offline = modo_offline_ativo() if offline is None else offline
+        self._trava = threading.Lock()
+        os.makedirs(diretorio, exist_ok=True)
+        self._indice: Dict[str, Tuple[int, float]] = self._carregar_indice()
+        self._tamanho_total = sum(tamanho for tamanho, _ in self._indice.values())
+
+    def _carregar_indice(self) -> Dict[str, Tuple[int, float]]:
+        """Lê tamanho e último acesso de cada entrada já gravada."""
+        indice = {}
+        for nome in os.listdir(self.diretorio):
+            if not nome.endswith(".json"):
+                continue
+            chave = nome[:-5]
+            corpo = os.path.join(self.diretorio, f"{chave}.html")
+            try:
+                estado = os.stat(corpo)
+            except FileNotFoundError:
+                continue
+            indice[chave] = (estado.st_size, estado.st_mtime)
+        return indice
+
+    def _caminhos(self, chave: str) -> Tuple[str, str]:
+        base = os.path.join(self.diretorio, chave)
+        return f"{base}.html", f"{base}.json"
+
+    @staticmethod
+    def _chave(url: str) -> str:
+        return hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+    def _ler(self, chave: str) -> Optional[Tuple[bytes, dict]]:
+        """Retorna corpo e metadados de uma entrada, se existir."""
+        caminho_corpo, caminho_meta = self._caminhos(chave)
+        try:
+            with open(caminho_meta, "r", encoding="utf-8") as arquivo:
+                meta = json.load(arquivo)
+            with open(caminho_corpo, "rb") as arquivo:
+                corpo = arquivo.read()
+        except (FileNotFoundError, ValueError):
+            return None
+        return corpo, meta
+
+    def _gravar_atomico(self, caminho: str, dados: bytes) -> None:
+        descritor, temporario = tempfile.mkstemp(dir=self.diretorio, suffix=".tmp")
+        with os.fdopen(descritor, "wb") as arquivo:
+            arquivo.write(dados)
+        os.replace(temporario, caminho)
+
+    def _gravar(self, chave: str, url: str, resposta: requests.Response) -> None:
+        """Armazena uma resposta 200 e aplica a política de tamanho."""
+        caminho_corpo, caminho_meta = self._caminhos(chave)
+        meta = {
+            "url": url,
+            "etag": resposta.headers.get("ETag"),
+            "last_modified": resposta.headers.get("Last-Modified"),
+            "content_type": resposta.headers.get("Content-Type"),
+            "armazenado_em": time.time(),
+        }
+        self._gravar_atomico(caminho_corpo, resposta.content)
+        self._gravar_atomico(caminho_meta, json.dumps(meta).encode("utf-8"))
+
+        with self._trava:
+            anterior, _ = self._indice.get(chave, (0, 0.0))
+            self._indice[chave] = (len(resposta.content), time.time())
+            self._tamanho_total += len(resposta.content) - anterior
+            self._despejar()
+
+    def _registrar_acesso(self, chave: str) -> None:
+        with self._trava:
+            if chave in self._indice:
+                tamanho, _ = self._indice[chave]
+                self._indice[chave] = (tamanho, time.time())
+        try:
+            os.utime(self._caminhos(chave)[0])
+        except FileNotFoundError:
+            pass
+
+    def _despejar(self) -> None:
+        """Remove entradas menos usadas até caber no limite (chamar com a trava)."""
+        if self._tamanho_total <= self.tamanho_maximo:
+            return
+        for chave, (tamanho, _) in sorted(self._indice.items(), key=lambda i: i[1][1]):
+            for caminho in self._caminhos(chave):
+                try:
+                    os.remove(caminho)
+                except FileNotFoundError:
+                    pass
+            del self._indice[chave]
+            self._tamanho_total -= tamanho
+            if self._tamanho_total <= self.tamanho_maximo:
+                break
+
+    def obter(self, sessao: requests.Session, url: str, **kwargs) -> Optional[bytes]:
+        """Equivalente a ``sessao.get(url).content`` passando pelo cache.
+
+        Erros HTTP são propagados com ``raise_for_status()``, como nas funções
+        de busca dos scripts. Um 304 devolve o corpo armazenado.
+        """
+        chave = self._chave(url)
+        armazenado = self._ler(chave)
+
+        if self.offline:
+            if armazenado is None:
+                logger.warning(f"Modo offline: {url} não está no cache.")
+                return None
+            self._registrar_acesso(chave)
+            return armazenado[0]
+
+        headers = dict(kwargs.pop("headers", None) or {})
+        if armazenado is not None:
+            _, meta = armazenado
+            if meta.get("etag"):
+                headers["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                headers["If-Modified-Since"] = meta["last_modified"]
+
+        resposta = sessao.get(url, headers=headers, **kwargs)
+        if resposta.status_code == 304 and armazenado is not None:
+            self._registrar_acesso(chave)
+            return armazenado[0]
+
+        resposta.raise_for_status()
+        self._gravar(chave, url, resposta)
+        return resposta.content
+
+
+def criar_cache(nome_site: str, **opcoes) -> CacheHTTP:
+    """Cria o cache do site em ``<SCRAPING_CACHE_DIR>/<nome_site>``."""
+    return CacheHTTP(os.path.join(DIRETORIO_PADRAO, nome_site), **opcoes)
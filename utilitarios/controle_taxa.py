@@ -0,0 +1,208 @@
+"""Controle adaptativo de taxa (AIMD) por domínio, em substituição aos sleeps fixos."""
+import asyncio
+import logging
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+STATUS_SOBRECARGA = {429, 500, 502, 503, 504}
+
+
+def segundos_retry_after(valor: Optional[str]) -> Optional[float]:
+    """Converte o cabeçalho ``Retry-After`` (segundos ou data HTTP) em segundos."""
+    if not valor:
+        return None
+    valor = valor.strip()
+    if valor.isdigit():
+        return float(valor)
+    try:
+        return max(0.0, parsedate_to_datetime(valor).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+@dataclass
+class EstadoDominio:
+    taxa: float
+    limiar: float
+    proximo_envio: float = 0.0
+    bloqueado_ate: float = 0.0
+    ultima_reducao: float = 0.0
+    latencia_media: Optional[float] = None
+    latencia_base: Optional[float] = None
+    medias_recentes: deque = field(default_factory=deque)  # Últimas médias, para a linha de base
+
+
+class ControladorTaxa:
+    """Ajusta a taxa de requisições de cada domínio pelo esquema AIMD.
+
+    Como no TCP, a taxa parte de ``taxa_inicial`` em partida lenta
+    (+``incremento`` por resposta saudável) até o primeiro corte; depois cresce
+    aditivamente (+``incremento`` a cada ``taxa`` respostas). 429, 5xx, erros
+    de conexão ou latência acima de ``limite_latencia`` vezes a linha de base
+    cortam a taxa por ``fator_reducao``, no máximo uma vez por
+    ``intervalo_reducao``. A linha de base é a menor média de latência das
+    últimas ``janela_latencia`` respostas: uma alta duradoura do servidor
+    vira a nova base em vez de manter a taxa presa em ``taxa_minima``.
+    ``Retry-After`` bloqueia o domínio pelo tempo pedido.
+    """
+
+    def __init__(
+        self,
+        taxa_inicial: float = 2.0,
+        taxa_minima: float = 0.2,
+        taxa_maxima: float = 50.0,
+        incremento: float = 1.0,
+        fator_reducao: float = 0.5,
+        limite_latencia: float = 3.0,
+        intervalo_reducao: float = 1.0,
+        janela_latencia: int = 100,
+    ):
+        self.taxa_inicial = taxa_inicial
+        self.taxa_minima = taxa_minima
+        self.taxa_maxima = taxa_maxima
+        self.incremento = incremento
+        self.fator_reducao = fator_reducao
+        self.limite_latencia = limite_latencia
+        self.intervalo_reducao = intervalo_reducao
+        self.janela_latencia = janela_latencia
+        self._dominios: Dict[str, EstadoDominio] = {}
+        self._trava = threading.Lock()
+
+    def _estado(self, url: str) -> EstadoDominio:
+        dominio = urlsplit(url).netloc
+        if dominio not in self._dominios:
+            self._dominios[dominio] = EstadoDominio(
+                taxa=self.taxa_inicial,
+                limiar=self.taxa_maxima,
+                medias_recentes=deque(maxlen=self.janela_latencia),
+            )
+        return self._dominios[dominio]
+
+    def taxa(self, url: str) -> float:
+        """Taxa atual (req/s) do domínio da URL."""
+        with self._trava:
+            return self._estado(url).taxa
+
+    def _reservar(self, url: str) -> float:
+        """Ocupa o horário de envio se ele já chegou; senão retorna quanto falta.
+
+        Nada é reservado no futuro: quem espera volta a consultar, de modo que
+        aumentos ou cortes de taxa valem imediatamente para a fila inteira.
+        """
+        with self._trava:
+            estado = self._estado(url)
+            agora = time.monotonic()
+            liberado = max(estado.proximo_envio, estado.bloqueado_ate)
+            if agora < liberado:
+                return liberado - agora
+            estado.proximo_envio = agora + 1.0 / estado.taxa
+            return 0.0
+
+    def aguardar(self, url: str) -> None:
+        """Bloqueia a thread até o domínio liberar a próxima requisição."""
+        while True:
+            espera = self._reservar(url)
+            if espera <= 0:
+                return
+            time.sleep(espera)
+
+    async def aguardar_async(self, url: str) -> None:
+        """Versão não bloqueante de ``aguardar`` para o motor asyncio."""
+        while True:
+            espera = self._reservar(url)
+            if espera <= 0:
+                return
+            await asyncio.sleep(espera)
+
+    def registrar(
+        self,
+        url: str,
+        status: Optional[int],
+        latencia: float,
+        retry_after: Optional[str] = None,
+    ) -> None:
+        """Atualiza a taxa com o resultado de uma requisição (status None = erro de rede)."""
+        with self._trava:
+            estado = self._estado(url)
+            agora = time.monotonic()
+
+            espera = segundos_retry_after(retry_after)
+            if espera:
+                estado.bloqueado_ate = max(estado.bloqueado_ate, agora + espera)
+
+            if status is None or status in STATUS_SOBRECARGA:
+                self._reduzir(estado, agora, f"status {status}")
+                return
+
+            if estado.latencia_media is None:
+                estado.latencia_media = latencia
+            else:
+                estado.latencia_media = 0.8 * estado.latencia_media + 0.2 * latencia
+            estado.medias_recentes.append(estado.latencia_media)
+            estado.latencia_base = min(estado.medias_recentes)
+
+            if estado.latencia_media > self.limite_latencia * estado.latencia_base:
+                self._reduzir(estado, agora, f"latência {estado.latencia_media:.2f}s")
+            elif estado.taxa < estado.limiar:
+                estado.taxa = min(self.taxa_maxima, estado.taxa + self.incremento)
+            else:
+                estado.taxa = min(
+                    self.taxa_maxima, estado.taxa + self.incremento / estado.taxa
+                )
+
+    def _reduzir(self, estado: EstadoDominio, agora: float, motivo: str) -> None:
+        """Corte multiplicativo, ignorando sinais repetidos da mesma rajada."""
+        if agora - estado.ultima_reducao < self.intervalo_reducao:
+            return
+        estado.ultima_reducao = agora
+        estado.taxa = max(self.taxa_minima, estado.taxa * self.fator_reducao)
+        estado.limiar = estado.taxa
+        logger.info(f"Reduzindo taxa para {estado.taxa:.2f} req/s ({motivo}).")
+
+
+class AdaptadorControlado(HTTPAdapter):
+    """HTTPAdapter que passa cada requisição pelo ``ControladorTaxa``.
+
+    Montado na sessão, cobre todas as chamadas (inclusive as feitas pelo
+    ``CacheHTTP``) sem alterar as funções de busca. Com um ``disjuntor``,
+    domínios pausados são recusados antes de esperar a vez no controlador.
+    """
+
+    def __init__(self, controlador: Optional[ControladorTaxa], *args, disjuntor=None, **kwargs):
+        self.controlador = controlador
+        self.disjuntor = disjuntor
+        super().__init__(*args, **kwargs)
+
+    def _registrar(self, url: str, status: Optional[int], latencia: float, retry_after=None):
+        if self.controlador:
+            self.controlador.registrar(url, status, latencia, retry_after)
+        if self.disjuntor:
+            self.disjuntor.registrar(url, status)
+
+    def send(self, request, *args, **kwargs):
+        if self.disjuntor:
+            self.disjuntor.verificar(request.url)
+        if self.controlador:
+            self.controlador.aguardar(request.url)
+        inicio = time.monotonic()
+        try:
+            resposta = super().send(request, *args, **kwargs)
+        except Exception:
+            self._registrar(request.url, None, time.monotonic() - inicio)
+            raise
+        self._registrar(
+            request.url,
+            resposta.status_code,
+            time.monotonic() - inicio,
+            resposta.headers.get("Retry-After"),
+        )
+        return resposta
@@ -0,0 +1,130 @@
+"""Disjuntor (circuit breaker) e orçamento de retentativas por domínio."""
+import enum
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+
+class EstadoCircuito(enum.Enum):
+    FECHADO = "fechado"  # Tráfego normal
+    ABERTO = "aberto"  # Domínio pausado: requisições falham na hora
+    MEIO_ABERTO = "meio aberto"  # Uma única sonda decide se o domínio volta
+
+
+class CircuitoAberto(requests.exceptions.ConnectionError):
+    """Requisição recusada sem ir à rede porque o domínio está pausado.
+
+    Herda de ``ConnectionError`` para que os ``except RequestException`` dos
+    scripts tratem a recusa como uma falha de conexão comum.
+    """
+
+
+@dataclass
+class EstadoDisjuntor:
+    estado: EstadoCircuito = EstadoCircuito.FECHADO
+    falhas_seguidas: int = 0
+    reabrir_em: float = 0.0
+    sonda_em_voo: bool = False
+    saldo_retentativas: float = 0.0
+
+
+class Disjuntor:
+    """Pausa domínios que falham seguidamente e limita a fração de retentativas.
+
+    Depois de ``falhas_para_abrir`` falhas seguidas (erro de conexão ou 5xx)
+    o domínio fica ABERTO por ``tempo_aberto`` segundos e toda requisição a ele
+    levanta ``CircuitoAberto`` sem custo de rede. Passado esse tempo uma única
+    sonda é liberada: sucesso fecha o circuito, falha o reabre.
+
+    O orçamento segue o modelo de balde: cada requisição deposita
+    ``proporcao_retentativas`` e cada retentativa consome 1, de modo que no
+    máximo essa fração do tráfego (além de ``minimo_retentativas``) seja
+    repetição.
+    """
+
+    def __init__(
+        self,
+        falhas_para_abrir: int = 5,
+        tempo_aberto: float = 30.0,
+        proporcao_retentativas: float = 0.1,
+        minimo_retentativas: float = 10.0,
+    ):
+        self.falhas_para_abrir = falhas_para_abrir
+        self.tempo_aberto = tempo_aberto
+        self.proporcao_retentativas = proporcao_retentativas
+        self.minimo_retentativas = minimo_retentativas
+        self._dominios: Dict[str, EstadoDisjuntor] = {}
+        self._trava = threading.Lock()
+
+    def _estado(self, url: str) -> EstadoDisjuntor:
+        dominio = urlsplit(url).netloc
+        if dominio not in self._dominios:
+            self._dominios[dominio] = EstadoDisjuntor(
+                saldo_retentativas=self.minimo_retentativas
+            )
+        return self._dominios[dominio]
+
+    def estado(self, url: str) -> EstadoCircuito:
+        """Estado atual do circuito do domínio da URL."""
+        with self._trava:
+            return self._estado(url).estado
+
+    def verificar(self, url: str) -> None:
+        """Libera a requisição ou levanta ``CircuitoAberto``."""
+        with self._trava:
+            estado = self._estado(url)
+            estado.saldo_retentativas = min(
+                self.minimo_retentativas,
+                estado.saldo_retentativas + self.proporcao_retentativas,
+            )
+            if estado.estado is EstadoCircuito.FECHADO:
+                return
+            if estado.estado is EstadoCircuito.ABERTO and time.monotonic() >= estado.reabrir_em:
+                estado.estado = EstadoCircuito.MEIO_ABERTO
+                estado.sonda_em_voo = False
+            if estado.estado is EstadoCircuito.MEIO_ABERTO and not estado.sonda_em_voo:
+                estado.sonda_em_voo = True
+                logger.info(f"Sondando {urlsplit(url).netloc} antes de retomar.")
+                return
+        raise CircuitoAberto(f"Circuito aberto para {urlsplit(url).netloc}: {url}")
+
+    def registrar(self, url: str, status: Optional[int]) -> None:
+        """Contabiliza o resultado (status None = erro de conexão)."""
+        falhou = status is None or status >= 500
+        with self._trava:
+            estado = self._estado(url)
+            if not falhou:
+                if estado.estado is not EstadoCircuito.FECHADO:
+                    logger.info(f"Circuito de {urlsplit(url).netloc} fechado.")
+                estado.estado = EstadoCircuito.FECHADO
+                estado.falhas_seguidas = 0
+                estado.sonda_em_voo = False
+                return
+
+            estado.falhas_seguidas += 1
+            sonda_falhou = estado.estado is EstadoCircuito.MEIO_ABERTO
+            if sonda_falhou or estado.falhas_seguidas >= self.falhas_para_abrir:
+                if estado.estado is not EstadoCircuito.ABERTO:
+                    logger.warning(
+                        f"Circuito de {urlsplit(url).netloc} aberto por "
+                        f"{self.tempo_aberto:.0f}s após {estado.falhas_seguidas} falhas seguidas."
+                    )
+                estado.estado = EstadoCircuito.ABERTO
+                estado.reabrir_em = time.monotonic() + self.tempo_aberto
+                estado.sonda_em_voo = False
+
+    def liberar_retentativa(self, url: str) -> bool:
+        """Consome uma retentativa do orçamento do domínio, se houver saldo."""
+        with self._trava:
+            estado = self._estado(url)
+            if estado.saldo_retentativas < 1:
+                return False
+            estado.saldo_retentativas -= 1
+            return True
@@ -0,0 +1,147 @@
+"""Esperas orientadas a eventos no navegador: DOM estável, contagem de cards e rede ociosa."""
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+from selenium.common.exceptions import JavascriptException, TimeoutException
+
+logger = logging.getLogger(__name__)
+
+QUIETUDE = 0.3  # Segundos sem mutações no DOM (e sem requisições) para considerar a página estável
+TEMPO_MAXIMO = 15.0
+INTERVALO = 50  # ms entre verificações dentro da página
+
+# Instala uma vez por documento: um MutationObserver que registra o instante da
+# última mutação e contadores de fetch/XHR em andamento. ``marco`` separa as
+# mutações anteriores a uma ação das provocadas por ela.
+_INSTALAR = """
+const w = window;
+if (!w.__espera) {
+  const e = w.__espera = {pendentes: 0, ultimaMutacao: performance.now(), ultimaRede: performance.now(), marco: 0};
+  new MutationObserver(() => { e.ultimaMutacao = performance.now(); })
+    .observe(document, {subtree: true, childList: true, attributes: true, characterData: true});
+  const concluir = () => { e.pendentes = Math.max(0, e.pendentes - 1); e.ultimaRede = performance.now(); };
+  if (w.fetch) {
+    const buscar = w.fetch;
+    w.fetch = function () { e.pendentes++; return buscar.apply(this, arguments).finally(concluir); };
+  }
+  const enviar = XMLHttpRequest.prototype.send;
+  XMLHttpRequest.prototype.send = function () {
+    e.pendentes++;
+    this.addEventListener('loadend', concluir, {once: true});
+    return enviar.apply(this, arguments);
+  };
+}
+"""
+
+_MARCAR = _INSTALAR + """
+window.__espera.marco = performance.now();
+return arguments[0] ? document.querySelectorAll(arguments[0]).length : null;
+"""
+
+_AGUARDAR = _INSTALAR + """
+const [seletor, minimo, quietude, maximo, rede, exigirMudanca, intervalo, pronto] = arguments;
+const e = window.__espera, inicio = performance.now();
+(function verificar() {
+  const agora = performance.now();
+  const contagem = seletor ? document.querySelectorAll(seletor).length : null;
+  const cresceu = minimo === null || contagem > minimo;
+  const mudou = !exigirMudanca || e.ultimaMutacao > e.marco;
+  const quieto = document.readyState === 'complete' && agora - e.ultimaMutacao >= quietude;
+  const ocioso = !rede || (e.pendentes === 0 && agora - e.ultimaRede >= quietude);
+  const resultado = {contagem: contagem, segundos: (agora - inicio) / 1000, pendentes: e.pendentes};
+  if (cresceu && mudou && quieto && ocioso) {
+    resultado.motivo = 'estavel';
+    return pronto(resultado);
+  }
+  if (agora - inicio >= maximo) {
+    resultado.motivo = !cresceu ? 'sem novos itens' : !mudou ? 'sem mudanca' : !ocioso ? 'rede ocupada' : 'dom ativo';
+    return pronto(resultado);
+  }
+  setTimeout(verificar, intervalo);
+})();
+"""
+
+
+@dataclass
+class ResultadoEspera:
+    """Como a espera terminou: ``estavel`` ou o critério que faltou quando o tempo acabou."""
+
+    motivo: str
+    segundos: float
+    contagem: Optional[int] = None
+
+    @property
+    def estavel(self) -> bool:
+        return self.motivo == "estavel"
+
+
+def marcar(driver, seletor: Optional[str] = None) -> Optional[int]:
+    """Instala o monitor na página e marca o instante antes de uma ação; retorna a contagem de ``seletor``."""
+    return driver.execute_script(_MARCAR, seletor)
+
+
+def aguardar_estabilidade(
+    driver,
+    seletor: Optional[str] = None,
+    minimo: Optional[int] = None,
+    quietude: float = QUIETUDE,
+    tempo_maximo: float = TEMPO_MAXIMO,
+    rede: bool = True,
+    exigir_mudanca: bool = False,
+) -> ResultadoEspera:
+    """Retorna assim que a página fica estável, ou depois de ``tempo_maximo`` segundos.
+
+    Estável: documento carregado, ``quietude`` segundos sem mutações no DOM
+    e, com ``rede``, sem fetch/XHR em andamento. Com ``minimo``, a contagem
+    de ``seletor`` precisa passar desse valor; com ``exigir_mudanca``, o DOM
+    precisa ter mudado desde o último ``marcar``. O tempo esgotado não é
+    erro: o resultado informa o critério que faltou e o chamador decide.
+    """
+    driver.set_script_timeout(tempo_maximo + 5)
+    inicio = time.perf_counter()
+    try:
+        dados = driver.execute_async_script(
+            _AGUARDAR, seletor, minimo, quietude * 1000, tempo_maximo * 1000, rede, exigir_mudanca, INTERVALO
+        )
+    except TimeoutException:
+        dados = {"motivo": "tempo esgotado", "segundos": time.perf_counter() - inicio}
+    except JavascriptException as e:
+        # Navegação no meio da espera destrói o contexto do script
+        logger.debug(f"Espera interrompida: {e.msg}")
+        dados = {"motivo": "navegacao", "segundos": time.perf_counter() - inicio}
+    resultado = ResultadoEspera(dados["motivo"], dados["segundos"], dados.get("contagem"))
+    if not resultado.estavel:
+        logger.debug(f"Espera encerrada após {resultado.segundos:.1f}s: {resultado.motivo}.")
+    return resultado
+
+
+def acionar_e_aguardar(
+    driver,
+    acao: Callable[[], Any],
+    seletor: Optional[str] = None,
+    crescer: bool = False,
+    quietude: float = QUIETUDE,
+    tempo_maximo: float = TEMPO_MAXIMO,
+    rede: bool = True,
+    exigir_mudanca: bool = True,
+) -> ResultadoEspera:
+    """Executa ``acao`` (um clique, uma rolagem) e espera a página reagir e se estabilizar.
+
+    Com ``crescer``, espera também a contagem de ``seletor`` aumentar (botões
+    "Ver mais" e rolagem infinita). Sem mudança alguma no DOM a espera dura
+    ``tempo_maximo``; use ``exigir_mudanca=False`` quando a ação pode não ter
+    efeito (fim da rolagem) e ``quietude`` já basta.
+    """
+    antes = marcar(driver, seletor)
+    acao()
+    return aguardar_estabilidade(
+        driver,
+        seletor,
+        minimo=antes if crescer else None,
+        quietude=quietude,
+        tempo_maximo=tempo_maximo,
+        rede=rede,
+        exigir_mudanca=exigir_mudanca,
+    )
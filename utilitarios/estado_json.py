@@ -0,0 +1,194 @@
+"""Extração de linhas do estado JSON embutido nas páginas (``__NEXT_DATA__`` e afins)."""
+import json
+import logging
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
+
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson
+except ImportError:  # O json da biblioteca padrão lê o mesmo conteúdo, só que mais devagar
+    orjson = None
+
+ID_NEXT_DATA = "__NEXT_DATA__"
+# Abaixo desta fração de itens com os campos obrigatórios o esquema do estado
+# é tratado como desconhecido e a página volta para a extração pelo HTML
+MINIMO_VALIDOS = 0.5
+
+
+def carregar_json(dados: Union[bytes, str]) -> Any:
+    """``orjson.loads`` quando instalado; senão ``json.loads``."""
+    if orjson is not None:
+        return orjson.loads(dados)
+    return json.loads(dados)
+
+
+def localizar_script(conteudo: Union[bytes, str], id_script: str = ID_NEXT_DATA) -> Optional[bytes]:
+    """Conteúdo bruto do ``<script id="...">`` sem montar a árvore HTML.
+
+    A busca é feita direto nos bytes: o JSON do estado vem escapado pelo
+    framework (``</`` vira ``\\u003c/``), então o primeiro ``</script>`` depois
+    da abertura fecha o bloco.
+    """
+    if isinstance(conteudo, str):
+        conteudo = conteudo.encode("utf-8")
+    for aspas in (b'"', b"'", b""):
+        posicao = conteudo.find(b"id=" + aspas + id_script.encode() + aspas)
+        if posicao < 0:
+            continue
+        abertura = conteudo.rfind(b"<", 0, posicao)
+        if conteudo[abertura : abertura + 7].lower() != b"<script":
+            continue
+        inicio = conteudo.find(b">", posicao) + 1
+        fim = conteudo.find(b"</script>", inicio)
+        if inicio and fim >= 0:
+            return conteudo[inicio:fim]
+    return None
+
+
+def extrair_estado(conteudo: Union[bytes, str], id_script: str = ID_NEXT_DATA) -> Optional[Any]:
+    """Estado da página decodificado, ou ``None`` sem o script ou com JSON inválido."""
+    bruto = localizar_script(conteudo, id_script)
+    if bruto is None:
+        return None
+    try:
+        return carregar_json(bruto)
+    except ValueError as e:
+        logger.warning(f"Estado JSON '{id_script}' inválido: {e}")
+        return None
+
+
+def valor_em(objeto: Any, caminho: str, padrao: Any = None) -> Any:
+    """Valor em ``caminho`` (chaves e índices separados por ponto); ``""`` é o próprio objeto."""
+    if not caminho:
+        return objeto
+    for parte in caminho.split("."):
+        if isinstance(objeto, dict):
+            objeto = objeto.get(parte)
+        elif isinstance(objeto, list) and parte.lstrip("-").isdigit():
+            indice = int(parte)
+            objeto = objeto[indice] if -len(objeto) <= indice < len(objeto) else None
+        else:
+            return padrao
+        if objeto is None:
+            return padrao
+    return objeto
+
+
+def encontrar_lista(estado: Any, chaves: Sequence[str]) -> Optional[List[dict]]:
+    """Maior lista de dicionários que têm todas as ``chaves``, em qualquer nível do estado."""
+    melhor: Optional[List[dict]] = None
+    pilha = [estado]
+    while pilha:
+        objeto = pilha.pop()
+        if isinstance(objeto, dict):
+            pilha.extend(objeto.values())
+        elif isinstance(objeto, list):
+            if (
+                objeto
+                and isinstance(objeto[0], dict)
+                and all(chave in objeto[0] for chave in chaves)
+                and (melhor is None or len(objeto) > len(melhor))
+            ):
+                melhor = objeto
+            pilha.extend(objeto)
+    return melhor
+
+
+@dataclass(frozen=True)
+class CampoJSON:
+    """Um campo da linha: ``caminho`` dentro do item da lista, ``pos``, ``padrao``
+    e ``obrigatorio`` como em ``utilitarios.extrator.Campo``. Um ``pos`` que
+    falha vale como campo ausente."""
+
+    caminho: str
+    pos: Optional[Callable[[Any], Any]] = None
+    padrao: Any = None
+    obrigatorio: bool = False
+
+
+class ExtratorJSON:
+    """Transforma o estado embutido de uma página de listagem em linhas.
+
+    A lista de imóveis é procurada em ``lista`` (caminho a partir da raiz do
+    estado); se o caminho mudar, vale a maior lista cujos itens têm todas as
+    ``chaves``. Itens sem um campo ``obrigatorio`` são descartados.
+
+    Retorna ``None`` quando a página não tem o estado ou a lista, ou quando
+    menos de ``minimo_validos`` dos itens têm os campos obrigatórios (o site
+    mudou os nomes dos campos), para o chamador recorrer à extração pelo HTML.
+    Campos ausentes em todos os itens da página geram um aviso.
+    """
+
+    def __init__(
+        self,
+        campos: Dict[str, CampoJSON],
+        lista: str,
+        chaves: Sequence[str] = (),
+        id_script: str = ID_NEXT_DATA,
+        minimo_validos: float = MINIMO_VALIDOS,
+    ):
+        self.campos = campos
+        self.lista = lista
+        self.chaves = tuple(chaves)
+        self.id_script = id_script
+        self.minimo_validos = minimo_validos
+
+    def itens(self, conteudo: Union[bytes, str]) -> Optional[List[dict]]:
+        estado = extrair_estado(conteudo, self.id_script)
+        if estado is None:
+            return None
+        itens = valor_em(estado, self.lista)
+        if not isinstance(itens, list) and self.chaves:
+            itens = encontrar_lista(estado, self.chaves)
+            if itens is not None:
+                logger.info(f"Lista de imóveis fora de '{self.lista}'; usando a encontrada pelas chaves.")
+        return itens if isinstance(itens, list) else None
+
+    def _valor(self, nome: str, campo: CampoJSON, item: dict) -> Any:
+        valor = valor_em(item, campo.caminho)
+        if valor is not None and campo.pos is not None:
+            try:
+                valor = campo.pos(valor)
+            except (TypeError, ValueError, AttributeError) as e:
+                logger.debug(f"Campo '{nome}' inválido no estado JSON ({valor!r}): {e}")
+                return None
+        return None if valor == "" else valor
+
+    def linha(self, item: dict, ausentes: Optional[set] = None) -> Optional[Dict[str, Any]]:
+        """Linha do item, ou ``None`` sem um campo obrigatório; ``ausentes`` recebe os campos sem valor."""
+        dados = {}
+        for nome, campo in self.campos.items():
+            valor = self._valor(nome, campo, item)
+            if valor is None:
+                if campo.obrigatorio:
+                    return None
+                if ausentes is not None:
+                    ausentes.add(nome)
+                valor = campo.padrao
+            dados[nome] = valor
+        return dados
+
+    def __call__(self, conteudo: Union[bytes, str]) -> Optional[List[Dict[str, Any]]]:
+        itens = self.itens(conteudo)
+        if itens is None:
+            return None
+        itens = [item for item in itens if isinstance(item, dict)]
+        linhas, ausentes_por_item = [], []
+        for item in itens:
+            ausentes: set = set()
+            linha = self.linha(item, ausentes)
+            if linha is not None:
+                linhas.append(linha)
+                ausentes_por_item.append(ausentes)
+        if itens and len(linhas) < self.minimo_validos * len(itens):
+            logger.warning(
+                f"Só {len(linhas)} de {len(itens)} itens do estado JSON têm os campos obrigatórios; "
+                "extraindo pelo HTML."
+            )
+            return None
+        if ausentes_por_item:
+            for nome in set.intersection(*ausentes_por_item):
+                logger.warning(f"Campo '{nome}' ausente em todos os itens do estado JSON.")
+        return linhas
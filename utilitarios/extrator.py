@@ -0,0 +1,261 @@
+"""Extração declarativa dos campos de um card: seletor, atributo e pós-processamento por campo."""
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+TOKEN_SELETOR = re.compile(
+    r"""(?P<escopo>:scope)|(?P<tag>[\w-]+|\*)|\.(?P<classe>[\w-]+)|\#(?P<id>[\w-]+)"""
+    r"""|\[\s*(?P<atributo>[\w-]+)\s*(?:=\s*(?:"(?P<aspas>[^"]*)"|'(?P<apostrofo>[^']*)'|(?P<valor>[^\]\s]+))\s*)?\]"""
+)
+
+# (tag ou None, classes exigidas, ((atributo, valor ou None), ...)); None = o próprio card
+Composto = Optional[Tuple[Optional[str], frozenset, Tuple[Tuple[str, Optional[str]], ...]]]
+
+
+@lru_cache(maxsize=None)
+def compilar_seletor(seletor: str) -> Tuple[Composto, ...]:
+    """Traduz um seletor CSS simples em compostos, do mais externo ao mais interno.
+
+    Aceita tag, ``.classe``, ``#id``, ``[atributo]``, ``[atributo=valor]``,
+    ``:scope`` (o próprio card) e o combinador de descendência (espaço).
+    """
+    compostos = []
+    for parte in seletor.split():
+        if parte == ":scope":
+            compostos.append(None)
+            continue
+        tag, classes, atributos = None, set(), []
+        posicao = 0
+        while posicao < len(parte):
+            token = TOKEN_SELETOR.match(parte, posicao)
+            if token is None:
+                raise ValueError(f"Seletor inválido: {seletor!r}")
+            if token["tag"] and token["tag"] != "*":
+                tag = token["tag"].lower()
+            elif token["classe"]:
+                classes.add(token["classe"])
+            elif token["id"]:
+                atributos.append(("id", token["id"]))
+            elif token["atributo"]:
+                valor = next((v for v in token.group("aspas", "apostrofo", "valor") if v is not None), None)
+                atributos.append((token["atributo"], valor))
+            posicao = token.end()
+        compostos.append((tag, frozenset(classes), tuple(atributos)))
+    if not compostos:
+        raise ValueError("Seletor vazio; use ':scope' para o próprio card.")
+    return tuple(compostos)
+
+
+def _casa(no, composto: Composto, card) -> bool:
+    if composto is None:
+        return no is card
+    tag, classes, atributos = composto
+    if tag is not None and no.name != tag:
+        return False
+    if classes and not classes.issubset(no.get("class") or ()):
+        return False
+    for nome, esperado in atributos:
+        atual = no.get(nome)
+        if atual is None:
+            return False
+        if esperado is not None:
+            if isinstance(atual, list):
+                atual = " ".join(atual)
+            if atual != esperado:
+                return False
+    return True
+
+
+def _casa_ancestrais(ancestrais: List[Any], compostos: Tuple[Composto, ...], card) -> bool:
+    """Confere os compostos externos contra os ancestrais, do mais próximo ao card."""
+    restantes = len(compostos) - 1
+    for ancestral in reversed(ancestrais):
+        if restantes == 0:
+            break
+        if _casa(ancestral, compostos[restantes - 1], card):
+            restantes -= 1
+    return restantes == 0
+
+
+def _composto_filho(filho: Optional[str]) -> Composto:
+    if filho is None:
+        return None
+    compostos = compilar_seletor(filho)
+    if len(compostos) != 1 or compostos[0] is None:
+        raise ValueError(f"Seletor de filho deve ser um composto simples: {filho!r}")
+    return compostos[0]
+
+
+def _primeiro_descendente(no, composto: Composto):
+    """Primeiro descendente de ``no`` (em ordem de documento) que casa com ``composto``, como o ``find`` do bs4."""
+    pilha = list(reversed(list(no.children)))
+    while pilha:
+        atual = pilha.pop()
+        if atual.name is None:
+            continue
+        if _casa(atual, composto, no):
+            return atual
+        pilha.extend(reversed(list(atual.children)))
+    return None
+
+
+@dataclass(frozen=True)
+class Campo:
+    """Um campo do card.
+
+    ``seletor`` localiza o elemento; o valor é o texto sem espaços nas pontas
+    ou, com ``atributo``, o valor daquele atributo. Com ``filho`` (um seletor
+    composto simples, como ``span``) o valor vem do primeiro descendente do
+    elemento que casa com ele, ou ``None``. Com ``todos=True`` o valor é a
+    lista de todos os elementos encontrados. ``pos`` transforma o valor;
+    se nada for encontrado (ou o resultado for vazio) vale ``padrao``. Um
+    campo ``obrigatorio`` ausente descarta o card inteiro.
+    """
+
+    seletor: str
+    atributo: Optional[str] = None
+    pos: Optional[Callable[[Any], Any]] = None
+    todos: bool = False
+    padrao: Any = None
+    obrigatorio: bool = False
+    filho: Optional[str] = None
+
+    @property
+    def chave(self) -> Tuple[str, Optional[str], bool, Optional[str]]:
+        """Campos com a mesma chave são lidos juntos."""
+        return self.seletor, self.atributo, self.todos, self.filho
+
+
+class Extrator:
+    """Especificação de campos compilada em uma única visita aos nós do card.
+
+    Os seletores são compilados uma vez, na criação, e indexados pela tag do
+    composto mais interno; campos com o mesmo seletor e atributo são
+    avaliados juntos. Em cada card os elementos são percorridos em ordem de
+    documento e cada um é testado só contra os alvos pendentes da sua tag (o
+    primeiro que casa vale, como no ``find`` do bs4). A visita termina assim
+    que não há alvos pendentes, o que só acontece sem campos ``todos``.
+    Funciona com ``bs4.Tag`` e com ``ElementoSelectolax``.
+    """
+
+    def __init__(self, campos: Dict[str, Campo]):
+        self.campos = campos
+        alvos: Dict[Tuple, List[str]] = {}
+        for nome, campo in campos.items():
+            alvos.setdefault(campo.chave, []).append(nome)
+        # alvo: (chave, compostos, atributo, todos, composto do filho)
+        self._escopo = []
+        self._por_tag: Dict[Optional[str], List[Tuple]] = {}
+        for chave in alvos:
+            seletor, atributo, todos, filho = chave
+            compostos = compilar_seletor(seletor)
+            alvo = (chave, compostos, atributo, todos, _composto_filho(filho))
+            if compostos == (None,):
+                self._escopo.append(alvo)
+            else:
+                self._por_tag.setdefault(compostos[-1][0], []).append(alvo)
+        self._alvos = alvos
+
+    @staticmethod
+    def _valor(no, atributo: Optional[str], filho: Composto = None):
+        if filho is not None:
+            no = _primeiro_descendente(no, filho)
+            if no is None:
+                return None
+        if atributo is None:
+            return no.get_text().strip()
+        valor = no.get(atributo)
+        return " ".join(valor) if isinstance(valor, list) else valor
+
+    def _visitar(self, card) -> Dict[Tuple, Any]:
+        encontrados: Dict[Tuple, Any] = {}
+        for chave, _, atributo, todos, filho in self._escopo:
+            valor = self._valor(card, atributo, filho)
+            encontrados[chave] = [valor] if todos else valor
+
+        pendentes = {tag: list(alvos) for tag, alvos in self._por_tag.items()}
+        restantes = sum(len(alvos) for alvos in pendentes.values())
+        quaisquer = pendentes.get(None, [])
+        pilha = [(filho, []) for filho in reversed(list(card.children))]
+        while pilha and restantes:
+            no, ancestrais = pilha.pop()
+            nome_tag = no.name
+            if nome_tag is None:
+                continue  # Texto ou comentário
+            candidatos = pendentes.get(nome_tag)
+            for lista in (candidatos, quaisquer):
+                if not lista:
+                    continue
+                for alvo in list(lista):
+                    chave, compostos, atributo, todos, filho = alvo
+                    if not _casa(no, compostos[-1], card):
+                        continue
+                    if len(compostos) > 1 and not _casa_ancestrais([card] + ancestrais, compostos, card):
+                        continue
+                    valor = self._valor(no, atributo, filho)
+                    if todos:
+                        encontrados.setdefault(chave, []).append(valor)
+                    else:
+                        encontrados[chave] = valor
+                        lista.remove(alvo)
+                        restantes -= 1
+            caminho = ancestrais + [no]
+            pilha.extend((filho, caminho) for filho in reversed(list(no.children)))
+        return encontrados
+
+    def __call__(self, card) -> Optional[Dict[str, Any]]:
+        """Dicionário campo → valor, ou ``None`` se faltar um campo obrigatório."""
+        return montar_campos(self.campos, self._visitar(card))
+
+
+def montar_campos(campos: Dict[str, Campo], encontrados: Dict[Tuple, Any]) -> Optional[Dict[str, Any]]:
+    """Aplica ``pos``, ``padrao`` e ``obrigatorio`` aos valores brutos, indexados por ``Campo.chave``."""
+    dados = {}
+    for nome, campo in campos.items():
+        valor = encontrados.get(campo.chave)
+        if campo.todos and not valor:
+            valor = None
+        if valor is not None and campo.pos is not None:
+            valor = campo.pos(valor)
+        if valor is None or valor == "":
+            if campo.obrigatorio:
+                return None
+            valor = campo.padrao
+        dados[nome] = valor
+    return dados
+
+
+def digitos(texto: str) -> str:
+    """Só os dígitos do texto (``'R$ 1.500,00'`` → ``'150000'``)."""
+    return re.sub(r"\D", "", texto)
+
+
+def primeiro_numero(texto: str) -> Optional[str]:
+    """Primeira sequência de dígitos do texto, ou ``None``."""
+    encontrado = re.search(r"\d+", texto)
+    return encontrado.group() if encontrado else None
+
+
+def item(indice: int, pos: Optional[Callable[[str], Any]] = None) -> Callable[[List[str]], Any]:
+    """Pós-processador de campo ``todos``: o valor na posição ``indice``."""
+
+    def escolher(valores: List[str]):
+        if indice >= len(valores):
+            return None
+        return pos(valores[indice]) if pos else valores[indice]
+
+    return escolher
+
+
+def item_com(trecho: str, pos: Optional[Callable[[str], Any]] = None) -> Callable[[List[str]], Any]:
+    """Pós-processador de campo ``todos``: o primeiro valor que contém ``trecho`` (sem caixa)."""
+    trecho = trecho.lower()
+
+    def escolher(valores: List[str]):
+        valor = next((v for v in valores if trecho in v.lower()), None)
+        if valor is None:
+            return None
+        return pos(valor) if pos else valor
+
+    return escolher
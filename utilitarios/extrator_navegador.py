@@ -0,0 +1,83 @@
+"""Extração de todos os cards de uma página com uma única chamada ``execute_script``."""
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+from utilitarios.extrator import Campo, montar_campos
+from utilitarios.navegador_assincrono import executar_script
+
+logger = logging.getLogger(__name__)
+
+# Recebe os cards e os alvos (seletor, atributo, todos, filho) e devolve, por
+# card, a lista de valores brutos na ordem dos alvos; com ``filho`` o valor vem
+# do primeiro descendente do elemento que casa com ele. O texto é o ``innerText``
+# (o mesmo do ``WebElement.text``); atributos seguem o ``get_attribute`` do
+# Selenium: a propriedade DOM quando existe (``href`` absoluto), senão o
+# atributo do HTML.
+_EXTRAIR = """
+const [seletorCards, raiz, alvos] = arguments;
+const base = raiz ? document.querySelector(raiz) : document;
+if (!base) return null;
+const texto = (no) => (no.innerText === undefined ? no.textContent : no.innerText).trim();
+const valor = (no, atributo, filho) => {
+  if (filho !== null) {
+    no = no.querySelector(filho);
+    if (!no) return null;
+  }
+  if (atributo === null) return texto(no);
+  const propriedade = no[atributo];
+  if (propriedade !== undefined && propriedade !== null && typeof propriedade !== 'object' && typeof propriedade !== 'function') {
+    return String(propriedade);
+  }
+  return no.getAttribute(atributo);
+};
+return Array.from(base.querySelectorAll(seletorCards), (card) => alvos.map(([seletor, atributo, todos, filho]) => {
+  if (seletor === ':scope') return todos ? [valor(card, atributo, filho)] : valor(card, atributo, filho);
+  if (todos) return Array.from(card.querySelectorAll(seletor), (no) => valor(no, atributo, filho));
+  const no = card.querySelector(seletor);
+  return no ? valor(no, atributo, filho) : null;
+}));
+"""
+
+
+class ExtratorNavegador:
+    """A especificação de ``Extrator`` (``Campo`` por campo) avaliada dentro do navegador.
+
+    Ler cada campo com ``find_element``/``.text`` custa uma ida e volta ao
+    WebDriver por campo e por card; aqui todos os cards que casam com
+    ``seletor_cards`` (dentro de ``raiz``, se informada) são lidos por um
+    único ``execute_script``, que devolve só os valores brutos. ``pos``,
+    ``padrao`` e ``obrigatorio`` são aplicados em Python, como no
+    ``Extrator``. Os seletores podem usar CSS completo (``ul > li``,
+    ``:nth-child``), já que quem os avalia é o navegador. ``extrair_async``
+    faz a mesma leitura em uma página do ``NavegadorAssincrono``.
+    """
+
+    def __init__(self, seletor_cards: str, campos: Dict[str, Campo], raiz: Optional[str] = None):
+        self.seletor_cards = seletor_cards
+        self.campos = campos
+        self.raiz = raiz
+        self._alvos: List[Tuple[str, Optional[str], bool, Optional[str]]] = list(
+            dict.fromkeys(campo.chave for campo in campos.values())
+        )
+
+    def _argumentos(self) -> Tuple:
+        return self.seletor_cards, self.raiz, [list(a) for a in self._alvos]
+
+    def _indexar(self, linhas) -> List[Dict[Tuple, Any]]:
+        if linhas is None:
+            logger.warning(f"Elemento '{self.raiz}' não encontrado na página.")
+            return []
+        return [dict(zip(self._alvos, linha)) for linha in linhas]
+
+    def valores_brutos(self, driver) -> List[Dict[Tuple, Any]]:
+        """Valores de cada card indexados por ``Campo.chave``, antes de ``pos``."""
+        return self._indexar(driver.execute_script(_EXTRAIR, *self._argumentos()))
+
+    def __call__(self, driver) -> List[Optional[Dict[str, Any]]]:
+        """Um dicionário por card, na ordem da página; ``None`` nos que não têm um campo obrigatório."""
+        return [montar_campos(self.campos, encontrados) for encontrados in self.valores_brutos(driver)]
+
+    async def extrair_async(self, pagina) -> List[Optional[Dict[str, Any]]]:
+        """Como ``__call__``, em uma página do Playwright."""
+        linhas = await executar_script(pagina, _EXTRAIR, *self._argumentos())
+        return [montar_campos(self.campos, encontrados) for encontrados in self._indexar(linhas)]
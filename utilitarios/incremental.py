@@ -0,0 +1,108 @@
+"""Extração incremental em rolagem infinita e botões "Ver mais": só os cards novos a cada passo."""
+import logging
+from typing import Any, Callable, List, Optional
+
+from utilitarios.espera import QUIETUDE, TEMPO_MAXIMO, ResultadoEspera, acionar_e_aguardar
+
+logger = logging.getLogger(__name__)
+
+# Um buffer por seletor em ``window.__cursores``. Na instalação entram os cards
+# já presentes; depois um MutationObserver acrescenta os que forem inseridos
+# (o próprio nó ou os descendentes que casam com o seletor). O WeakSet impede
+# que um card seja devolvido duas vezes se o site o remover e reinserir.
+_INSTALAR = """
+const [seletor, raiz] = arguments;
+const w = window, cursores = w.__cursores = w.__cursores || {};
+if (!cursores[seletor]) {
+  const c = cursores[seletor] = {buffer: [], vistos: new WeakSet(), total: 0};
+  const guardar = (no) => {
+    if (c.vistos.has(no)) return;
+    c.vistos.add(no);
+    c.buffer.push(no);
+    c.total++;
+  };
+  const examinar = (no) => {
+    if (no.nodeType !== 1) return;
+    if (no.matches(seletor)) guardar(no);
+    else no.querySelectorAll(seletor).forEach(guardar);
+  };
+  const alvo = (raiz && document.querySelector(raiz)) || document.body || document.documentElement;
+  alvo.querySelectorAll(seletor).forEach(guardar);
+  new MutationObserver((mutacoes) => {
+    for (const m of mutacoes) m.addedNodes.forEach(examinar);
+  }).observe(alvo, {childList: true, subtree: true});
+}
+"""
+
+_PENDENTES = _INSTALAR + """
+const c = window.__cursores[seletor];
+return {pendentes: c.buffer.length, total: c.total};
+"""
+
+# Retira do buffer até ``limite`` cards ainda conectados ao documento e
+# devolve o HTML de cada um; o custo depende só de quantos chegaram
+_COLETAR = _INSTALAR + """
+const c = window.__cursores[seletor], limite = arguments[2];
+const lote = limite === null ? c.buffer.splice(0) : c.buffer.splice(0, limite);
+return {html: lote.filter((no) => no.isConnected).map((no) => no.outerHTML), total: c.total};
+"""
+
+
+class CursorCards:
+    """Entrega, a cada chamada, apenas os cards inseridos na página desde a anterior.
+
+    Em vez de reler ``driver.page_source`` inteiro e percorrer de novo os
+    cards já vistos a cada rolagem (custo que cresce com a página), um
+    MutationObserver instalado na página guarda os cards novos que casam com
+    ``seletor`` (dentro de ``raiz``, se informada) e ``coletar`` devolve o
+    HTML só desses. ``total`` conta os cards vistos desde a instalação, sem
+    ``find_elements`` sobre a lista inteira.
+
+    A instalação é refeita sozinha se a página for recarregada; nesse caso os
+    cards presentes voltam a ser entregues e a deduplicação por código fica
+    com o chamador, como já acontece nos scripts.
+    """
+
+    def __init__(self, driver, seletor: str, raiz: Optional[str] = None):
+        self.driver = driver
+        self.seletor = seletor
+        self.raiz = raiz
+        self.total = 0
+
+    def instalar(self) -> int:
+        """Começa a observar a página; retorna quantos cards aguardam coleta."""
+        return self.pendentes()
+
+    def pendentes(self) -> int:
+        dados = self.driver.execute_script(_PENDENTES, self.seletor, self.raiz)
+        self.total = dados["total"]
+        return dados["pendentes"]
+
+    def coletar(self, limite: Optional[int] = None) -> List[str]:
+        """HTML dos cards ainda não coletados, na ordem em que entraram na página."""
+        dados = self.driver.execute_script(_COLETAR, self.seletor, self.raiz, limite)
+        self.total = dados["total"]
+        return dados["html"]
+
+    def avancar(
+        self,
+        acao: Callable[[], Any],
+        quietude: float = QUIETUDE,
+        tempo_maximo: float = TEMPO_MAXIMO,
+        exigir_mudanca: bool = True,
+    ) -> ResultadoEspera:
+        """Executa ``acao`` (rolagem, clique em "Ver mais") e espera a página se estabilizar.
+
+        A espera não conta os cards com ``querySelectorAll``: olha só as
+        mutações e a rede. Os cards novos ficam no buffer para ``coletar``.
+        """
+        self.instalar()
+        antes = self.total
+        resultado = acionar_e_aguardar(
+            self.driver, acao, quietude=quietude, tempo_maximo=tempo_maximo, exigir_mudanca=exigir_mudanca
+        )
+        self.pendentes()
+        resultado.contagem = self.total - antes
+        if not resultado.contagem:
+            logger.debug(f"Nenhum card novo para '{self.seletor}' ({resultado.motivo}).")
+        return resultado
@@ -0,0 +1,376 @@
+"""Configuração compartilhada do Chrome (Selenium) com bloqueio de recursos via DevTools."""
+import json
+import logging
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.chrome.service import Service
+
+from utilitarios.cache_http import modo_offline_ativo
+
+logger = logging.getLogger(__name__)
+
+# Registro da última resolução do ChromeDriver, compartilhado entre execuções e processos
+DIRETORIO_DRIVERS = Path(os.environ.get("SCRAPING_DRIVER_DIR", Path.home() / ".cache" / "scraping"))
+REGISTRO_CHROMEDRIVER = "chromedriver.json"
+VALIDADE_REGISTRO = 7 * 24 * 3600  # Sem Chrome detectável, segundos até conferir de novo na rede
+BINARIOS_CHROME = ("google-chrome", "google-chrome-stable", "chromium", "chromium-browser", "chrome")
+
+
+def _extensoes(*extensoes: str) -> Tuple[str, ...]:
+    # O curinga do Network.setBlockedURLs compara a URL inteira, query string inclusive
+    return tuple(padrao for ext in extensoes for padrao in (f"*.{ext}", f"*.{ext}?*"))
+
+
+# Padrões do Network.setBlockedURLs (``*`` casa qualquer trecho da URL) por categoria
+CATEGORIAS: Dict[str, Tuple[str, ...]] = {
+    "imagens": _extensoes("png", "jpg", "jpeg", "gif", "webp", "avif", "svg", "ico", "bmp"),
+    "fontes": _extensoes("woff", "woff2", "ttf", "otf", "eot"),
+    "estilos": _extensoes("css"),
+    "midia": _extensoes("mp4", "webm", "m3u8", "mp3", "ogg"),
+    "rastreadores": (
+        "*google-analytics.com*",
+        "*googletagmanager.com*",
+        "*analytics.google.com*",
+        "*connect.facebook.net*",
+        "*facebook.com/tr*",
+        "*hotjar.com*",
+        "*clarity.ms*",
+        "*analytics.tiktok.com*",
+        "*bat.bing.com*",
+        "*snap.licdn.com*",
+        "*rdstation.com*",
+        "*cdn.onesignal.com*",
+        "*newrelic.com*",
+        "*nr-data.net*",
+    ),
+    "anuncios": (
+        "*doubleclick.net*",
+        "*googlesyndication.com*",
+        "*googleadservices.com*",
+        "*adservice.google.*",
+        "*amazon-adsystem.com*",
+        "*criteo.com*",
+        "*criteo.net*",
+        "*taboola.com*",
+        "*outbrain.com*",
+    ),
+    "chat": ("*zopim.com*", "*zendesk.com/embeddable*", "*jivosite.com*", "*tawk.to*", "*widget.intercom.io*"),
+}
+
+
+@dataclass(frozen=True)
+class PerfilBloqueio:
+    """O que um site pode deixar de carregar.
+
+    ``categorias`` são chaves de ``CATEGORIAS``; ``bloquear`` acrescenta
+    padrões próprios do site. ``permitir`` retira categorias inteiras ou
+    padrões específicos do bloqueio (o Network.setBlockedURLs não tem
+    exceções, então a lista final é a diferença).
+    """
+
+    categorias: Tuple[str, ...] = tuple(CATEGORIAS)
+    bloquear: Tuple[str, ...] = ()
+    permitir: Tuple[str, ...] = ()
+
+    def padroes(self) -> List[str]:
+        padroes = [p for c in self.categorias if c not in self.permitir for p in CATEGORIAS[c]]
+        padroes += self.bloquear
+        return list(dict.fromkeys(p for p in padroes if p not in self.permitir))
+
+
+PERFIL_PADRAO = PerfilBloqueio()
+# Sites que clicam em "Ver mais"/"Próxima" mantêm os estilos: sem CSS botões
+# fixos e banners se sobrepõem e o clique é interceptado
+PERFIS: Dict[str, PerfilBloqueio] = {
+    "padrao": PERFIL_PADRAO,
+    "vivareal": PerfilBloqueio(permitir=("estilos",), bloquear=("*static.olx.com.br*", "*.map")),
+    "casa_63": PerfilBloqueio(permitir=("estilos",)),
+    "estilo": PerfilBloqueio(permitir=("estilos",)),
+    "invistta": PerfilBloqueio(permitir=("estilos",)),
+    "inov9": PerfilBloqueio(permitir=("estilos",)),
+    "thais": PerfilBloqueio(permitir=("estilos",)),
+    "abreu": PerfilBloqueio(),
+}
+
+
+def obter_perfil(perfil: Union[str, PerfilBloqueio, None]) -> Optional[PerfilBloqueio]:
+    if perfil is None or isinstance(perfil, PerfilBloqueio):
+        return perfil
+    if perfil not in PERFIS:
+        logger.warning(f"Perfil de bloqueio '{perfil}' desconhecido: usando o padrão.")
+    return PERFIS.get(perfil, PERFIL_PADRAO)
+
+
+def aplicar_bloqueio(driver, perfil: Union[str, PerfilBloqueio, None]) -> List[str]:
+    """Liga o bloqueio do perfil no navegador (vale para as próximas navegações)."""
+    padroes = obter_perfil(perfil).padroes() if perfil is not None else []
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": padroes})
+    return padroes
+
+
+def _versao(texto: str) -> Optional[str]:
+    encontrada = re.search(r"\d+\.\d+\.\d+(?:\.\d+)?", texto or "")
+    return encontrada.group() if encontrada else None
+
+
+def _maior(versao: Optional[str]) -> Optional[str]:
+    return versao.split(".")[0] if versao else None
+
+
+def _executar_versao(binario: str) -> Optional[str]:
+    try:
+        saida = subprocess.run([binario, "--version"], capture_output=True, text=True, timeout=10)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return _versao(saida.stdout)
+
+
+@lru_cache(maxsize=None)
+def versao_chrome() -> Optional[str]:
+    """Versão do Chrome instalado, lida localmente (sem rede); ``None`` se não for encontrada."""
+    if sys.platform == "win32":
+        try:
+            import winreg
+
+            with winreg.OpenKey(winreg.HKEY_CURRENT_USER, r"Software\Google\Chrome\BLBeacon") as chave:
+                return _versao(winreg.QueryValueEx(chave, "version")[0])
+        except OSError:
+            return None
+    candidatos = [os.environ.get("CHROME_BINARY"), *map(shutil.which, BINARIOS_CHROME)]
+    if sys.platform == "darwin":
+        candidatos.append("/Applications/Google Chrome.app/Contents/MacOS/Google Chrome")
+    for binario in filter(None, candidatos):
+        versao = _executar_versao(binario)
+        if versao:
+            return versao
+    return None
+
+
+def _ler_registro() -> Optional[Dict[str, Any]]:
+    try:
+        registro = json.loads((DIRETORIO_DRIVERS / REGISTRO_CHROMEDRIVER).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    return registro if os.access(registro.get("caminho", ""), os.X_OK) else None
+
+
+def _gravar_registro(caminho: str, versao: Optional[str], origem: str) -> None:
+    registro = {"caminho": caminho, "versao": versao, "origem": origem, "verificado_em": time.time()}
+    try:
+        DIRETORIO_DRIVERS.mkdir(parents=True, exist_ok=True)
+        # Escrita atômica: outros processos leem o registro enquanto este grava
+        with tempfile.NamedTemporaryFile("w", dir=DIRETORIO_DRIVERS, suffix=".tmp", delete=False) as temporario:
+            json.dump(registro, temporario)
+        os.replace(temporario.name, DIRETORIO_DRIVERS / REGISTRO_CHROMEDRIVER)
+    except OSError as e:
+        logger.debug(f"Não foi possível gravar o registro do ChromeDriver: {e}")
+
+
+def resolver_chromedriver(forcar: bool = False) -> str:
+    """Caminho de um ChromeDriver compatível com o Chrome instalado, consultando a rede só quando preciso.
+
+    Ordem: ``CHROMEDRIVER_PATH``; o registro em disco (``DIRETORIO_DRIVERS``)
+    da última resolução, enquanto o binário existir e a versão maior bater
+    com a do Chrome (sem Chrome detectável, por ``VALIDADE_REGISTRO``); um
+    ``chromedriver`` no PATH com a mesma versão maior; por último o
+    ``webdriver-manager``, que consulta a rede. Offline
+    (``SCRAPING_OFFLINE=1`` ou sem conexão) vale o último registro, mesmo
+    vencido. ``forcar`` ignora o registro.
+    """
+    caminho = os.environ.get("CHROMEDRIVER_PATH")
+    if caminho and os.access(caminho, os.X_OK):
+        return caminho
+
+    chrome = _maior(versao_chrome())
+    registro = _ler_registro()
+    if registro and not forcar:
+        if chrome:
+            compativel = _maior(registro.get("versao")) == chrome
+        else:
+            compativel = time.time() - registro.get("verificado_em", 0) < VALIDADE_REGISTRO
+        if compativel:
+            return registro["caminho"]
+
+    sistema = shutil.which("chromedriver")
+    if sistema:
+        versao = _executar_versao(sistema)
+        if versao and (chrome is None or _maior(versao) == chrome):
+            _gravar_registro(sistema, versao, "PATH")
+            return sistema
+
+    if modo_offline_ativo():
+        if registro:
+            logger.warning(f"Modo offline: usando o ChromeDriver {registro.get('versao')} registrado.")
+            return registro["caminho"]
+        raise FileNotFoundError("Modo offline e nenhum ChromeDriver registrado; defina CHROMEDRIVER_PATH.")
+
+    try:
+        from webdriver_manager.chrome import ChromeDriverManager
+
+        caminho = ChromeDriverManager().install()
+    except Exception as e:  # Sem rede, sem webdriver-manager ou versão não publicada
+        if registro:
+            logger.warning(f"ChromeDriver não resolvido ({e}); usando o {registro.get('versao')} registrado.")
+            return registro["caminho"]
+        raise
+    _gravar_registro(caminho, _executar_versao(caminho), "webdriver-manager")
+    return caminho
+
+
+@lru_cache(maxsize=None)
+def caminho_chromedriver() -> str:
+    """Caminho do ChromeDriver, resolvido uma vez por processo (e lembrado em disco entre execuções)."""
+    return resolver_chromedriver()
+
+
+def criar_chrome(
+    headless: bool = True,
+    argumentos: Sequence[str] = (),
+    prefs: Optional[Dict[str, Any]] = None,
+    user_agent: Optional[str] = None,
+    perfil: Union[str, PerfilBloqueio, None] = None,
+    opcoes: Optional[webdriver.ChromeOptions] = None,
+) -> webdriver.Chrome:
+    """Chrome com as opções usadas pelos scripts (headless, sem /dev/shm e sandbox).
+
+    Com ``perfil`` (nome em ``PERFIS`` ou um ``PerfilBloqueio``) as URLs do
+    perfil são bloqueadas pelo DevTools antes da primeira navegação e o log de
+    rede fica disponível para ``MonitorRecursos``. ``opcoes`` permite partir
+    de um ``ChromeOptions`` já montado pelo script.
+    """
+    opcoes = opcoes or webdriver.ChromeOptions()
+    if headless:
+        opcoes.add_argument("--headless=new")
+    for argumento in ("--disable-dev-shm-usage", "--no-sandbox", "--disable-gpu", *argumentos):
+        opcoes.add_argument(argumento)
+    if user_agent:
+        opcoes.add_argument(f"user-agent={user_agent}")
+    if prefs:
+        opcoes.add_experimental_option("prefs", prefs)
+    if perfil is not None:
+        opcoes.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+    driver = webdriver.Chrome(service=Service(caminho_chromedriver()), options=opcoes)
+    if perfil is not None:
+        aplicar_bloqueio(driver, perfil)
+    return driver
+
+
+@dataclass
+class RelatorioPagina:
+    """Requisições e bytes de rede de uma página (desde a medição anterior)."""
+
+    rotulo: str
+    requisicoes: int
+    bloqueadas: int
+    bytes_recebidos: int
+    tempo_carregamento: Optional[float]  # Segundos até o evento load
+    bytes_economizados: Optional[int] = None  # Em relação à calibração sem bloqueio
+
+    def resumo(self) -> str:
+        texto = (
+            f"{self.rotulo}: {self.requisicoes} requisições, {self.bloqueadas} bloqueadas, "
+            f"{self.bytes_recebidos / 1024:.0f} KiB recebidos"
+        )
+        if self.bytes_economizados is not None:
+            texto += f", {self.bytes_economizados / 1024:.0f} KiB economizados"
+        if self.tempo_carregamento is not None:
+            texto += f", load em {self.tempo_carregamento:.2f}s"
+        return texto + "."
+
+
+def _eventos_rede(driver) -> Iterable[Tuple[str, Dict[str, Any]]]:
+    try:
+        entradas = driver.get_log("performance")
+    except WebDriverException:
+        return  # Navegador criado sem o log de desempenho
+    for entrada in entradas:
+        mensagem = json.loads(entrada["message"])["message"]
+        if mensagem["method"].startswith("Network."):
+            yield mensagem["method"], mensagem.get("params", {})
+
+
+def _tempo_carregamento(driver) -> Optional[float]:
+    try:
+        duracao = driver.execute_script(
+            "const n = performance.getEntriesByType('navigation')[0];"
+            "return n && n.loadEventEnd ? n.loadEventEnd : null;"
+        )
+    except WebDriverException:
+        return None
+    return duracao / 1000 if duracao else None
+
+
+class MonitorRecursos:
+    """Contabiliza, página a página, as requisições feitas e as bloqueadas pelo perfil.
+
+    Cada ``registrar`` lê o log de rede acumulado desde a chamada anterior
+    (um ``driver.get`` e os cliques/rolagens que vieram depois). As
+    requisições economizadas são as bloqueadas; os bytes economizados só são
+    conhecidos depois de ``calibrar``, que carrega uma página sem bloqueio
+    para servir de referência.
+    """
+
+    def __init__(self, driver, perfil: Union[str, PerfilBloqueio, None] = None):
+        self.driver = driver
+        self.perfil = perfil
+        self.referencia: Optional[RelatorioPagina] = None
+        self.relatorios: List[RelatorioPagina] = []
+        self._medir()  # Descarta o que veio antes do monitor
+
+    def _medir(self, rotulo: str = "") -> RelatorioPagina:
+        requisicoes, bloqueadas, recebidos = set(), 0, 0
+        for metodo, params in _eventos_rede(self.driver):
+            if metodo == "Network.requestWillBeSent":
+                requisicoes.add(params.get("requestId"))
+            elif metodo == "Network.loadingFinished":
+                recebidos += int(params.get("encodedDataLength", 0))
+            elif metodo == "Network.loadingFailed" and params.get("blockedReason") == "inspector":
+                bloqueadas += 1
+        return RelatorioPagina(rotulo, len(requisicoes), bloqueadas, recebidos, _tempo_carregamento(self.driver))
+
+    def calibrar(self, url: str) -> RelatorioPagina:
+        """Carrega ``url`` uma vez sem bloqueio; os relatórios seguintes calculam a economia contra ela."""
+        self._medir()
+        aplicar_bloqueio(self.driver, None)
+        try:
+            self.driver.get(url)
+            self.referencia = self._medir(f"{url} (sem bloqueio)")
+        finally:
+            if self.perfil is not None:
+                aplicar_bloqueio(self.driver, self.perfil)
+        logger.info(self.referencia.resumo())
+        return self.referencia
+
+    def registrar(self, rotulo: Optional[str] = None) -> RelatorioPagina:
+        relatorio = self._medir(rotulo or self.driver.current_url)
+        if self.referencia is not None:
+            relatorio.bytes_economizados = max(self.referencia.bytes_recebidos - relatorio.bytes_recebidos, 0)
+        self.relatorios.append(relatorio)
+        logger.info(relatorio.resumo())
+        return relatorio
+
+    def resumo(self) -> str:
+        paginas = len(self.relatorios) or 1
+        bloqueadas = sum(r.bloqueadas for r in self.relatorios)
+        recebidos = sum(r.bytes_recebidos for r in self.relatorios)
+        texto = (
+            f"Recursos: {len(self.relatorios)} páginas, {bloqueadas / paginas:.1f} requisições bloqueadas "
+            f"e {recebidos / paginas / 1024:.0f} KiB recebidos por página"
+        )
+        economizados = [r.bytes_economizados for r in self.relatorios if r.bytes_economizados is not None]
+        if economizados:
+            texto += f", {sum(economizados) / len(economizados) / 1024:.0f} KiB economizados por página"
+        return texto + "."
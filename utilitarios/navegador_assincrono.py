@@ -0,0 +1,251 @@
+"""Backend assíncrono (Playwright) para os scripts do Selenium: várias páginas em um único event loop."""
+import asyncio
+import inspect
+import logging
+import re
+import time
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Iterable, List, Optional, Sequence, Union
+
+from tqdm import tqdm
+
+from utilitarios.abas import EstatisticasAbas
+from utilitarios.espera import _AGUARDAR, _MARCAR, INTERVALO, QUIETUDE, TEMPO_MAXIMO, ResultadoEspera
+from utilitarios.navegador import PerfilBloqueio, obter_perfil
+from utilitarios.pool_navegadores import TEMPO_CARREGAMENTO
+
+try:
+    from playwright.async_api import Error as ErroPlaywright
+    from playwright.async_api import async_playwright
+except ImportError:  # Backend opcional: sem Playwright os scripts seguem no Selenium
+    async_playwright = None
+
+    class ErroPlaywright(Exception):
+        pass
+
+logger = logging.getLogger(__name__)
+
+PAGINAS = 4  # Páginas abertas ao mesmo tempo no mesmo navegador
+
+
+def playwright_disponivel() -> bool:
+    return async_playwright is not None
+
+
+# Os scripts do repositório seguem o formato do ``execute_script`` do Selenium
+# (corpo de função, ``arguments`` e ``return``); aqui viram a função que o
+# ``page.evaluate`` espera. Na versão assíncrona o último argumento é o
+# callback de conclusão, como no ``execute_async_script``.
+@lru_cache(maxsize=None)
+def _envolver(script: str) -> str:
+    return f"(args) => (function () {{\n{script}\n}}).apply(null, args)"
+
+
+@lru_cache(maxsize=None)
+def _envolver_assincrono(script: str) -> str:
+    return f"(args) => new Promise((pronto) => (function () {{\n{script}\n}}).apply(null, args.concat([pronto])))"
+
+
+async def executar_script(pagina, script: str, *args) -> Any:
+    """``driver.execute_script(script, *args)`` em uma página do Playwright."""
+    return await pagina.evaluate(_envolver(script), list(args))
+
+
+async def executar_script_assincrono(pagina, script: str, *args) -> Any:
+    """``driver.execute_async_script(script, *args)`` em uma página do Playwright."""
+    return await pagina.evaluate(_envolver_assincrono(script), list(args))
+
+
+def padrao_bloqueio(padroes: Sequence[str]) -> Optional["re.Pattern"]:
+    """Padrões do ``Network.setBlockedURLs`` (``*`` casa qualquer trecho da URL inteira) em uma regex."""
+    if not padroes:
+        return None
+    alternativas = "|".join(re.escape(p).replace(r"\*", ".*") for p in padroes)
+    return re.compile(f"^(?:{alternativas})$")
+
+
+async def aguardar_estabilidade(
+    pagina,
+    seletor: Optional[str] = None,
+    minimo: Optional[int] = None,
+    quietude: float = QUIETUDE,
+    tempo_maximo: float = TEMPO_MAXIMO,
+    rede: bool = True,
+    exigir_mudanca: bool = False,
+) -> ResultadoEspera:
+    """A espera de ``utilitarios.espera.aguardar_estabilidade``, sem bloquear o event loop."""
+    inicio = time.perf_counter()
+    try:
+        dados = await asyncio.wait_for(
+            executar_script_assincrono(
+                pagina, _AGUARDAR, seletor, minimo, quietude * 1000, tempo_maximo * 1000, rede, exigir_mudanca, INTERVALO
+            ),
+            tempo_maximo + 5,
+        )
+    except asyncio.TimeoutError:
+        dados = {"motivo": "tempo esgotado", "segundos": time.perf_counter() - inicio}
+    except ErroPlaywright as e:
+        # Navegação no meio da espera destrói o contexto do script
+        logger.debug(f"Espera interrompida: {e}")
+        dados = {"motivo": "navegacao", "segundos": time.perf_counter() - inicio}
+    resultado = ResultadoEspera(dados["motivo"], dados["segundos"], dados.get("contagem"))
+    if not resultado.estavel:
+        logger.debug(f"Espera encerrada após {resultado.segundos:.1f}s: {resultado.motivo}.")
+    return resultado
+
+
+async def acionar_e_aguardar(
+    pagina,
+    acao: Callable[[], Any],
+    seletor: Optional[str] = None,
+    crescer: bool = False,
+    quietude: float = QUIETUDE,
+    tempo_maximo: float = TEMPO_MAXIMO,
+    rede: bool = True,
+    exigir_mudanca: bool = True,
+) -> ResultadoEspera:
+    """Executa ``acao`` (função comum ou corrotina) e espera a página reagir e se estabilizar."""
+    antes = await executar_script(pagina, _MARCAR, seletor)
+    retorno = acao()
+    if inspect.isawaitable(retorno):
+        await retorno
+    return await aguardar_estabilidade(
+        pagina,
+        seletor,
+        minimo=antes if crescer else None,
+        quietude=quietude,
+        tempo_maximo=tempo_maximo,
+        rede=rede,
+        exigir_mudanca=exigir_mudanca,
+    )
+
+
+class NavegadorAssincrono:
+    """Um Chromium do Playwright com até ``paginas`` páginas carregando ao mesmo tempo.
+
+    Cada chamada do Selenium bloqueia o script até o navegador responder; aqui
+    navegação, esperas e scripts são ``await`` e as páginas avançam juntas no
+    mesmo event loop. As URLs do ``perfil`` de bloqueio (os mesmos de
+    ``criar_chrome``) são interceptadas e abortadas antes de sair do
+    navegador. ``mapear`` abre cada URL em uma página livre e aplica
+    ``await tarefa(pagina, url)``; erros do navegador (tempo de carregamento
+    esgotado, conexão recusada) repetem a URL até ``tentativas`` vezes.
+
+    Uso::
+
+        async with NavegadorAssincrono(perfil="vivareal") as navegador:
+            linhas = await navegador.mapear(ler_listagem, urls)
+    """
+
+    def __init__(
+        self,
+        paginas: int = PAGINAS,
+        headless: bool = True,
+        perfil: Union[str, PerfilBloqueio, None] = None,
+        user_agent: Optional[str] = None,
+        argumentos: Sequence[str] = (),
+        tempo_carregamento: float = TEMPO_CARREGAMENTO,
+        carregamento: str = "load",
+        tentativas: int = 2,
+    ):
+        self.paginas = max(1, paginas)
+        self.headless = headless
+        self.perfil = perfil
+        self.user_agent = user_agent
+        self.argumentos = argumentos
+        self.tempo_carregamento = tempo_carregamento
+        self.carregamento = carregamento
+        self.tentativas = tentativas
+        self.estatisticas = EstatisticasAbas()
+        self.bloqueadas = 0
+        self.contexto = None
+        self._playwright = None
+        self._navegador = None
+
+    async def __aenter__(self) -> "NavegadorAssincrono":
+        try:
+            await self.iniciar()
+        except BaseException:  # Chromium do Playwright não instalado: não deixa o driver aberto
+            await self.fechar()
+            raise
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.fechar()
+
+    async def iniciar(self) -> None:
+        if not playwright_disponivel():
+            raise RuntimeError("Playwright não instalado: pip install playwright && playwright install chromium")
+        self._playwright = await async_playwright().start()
+        self._navegador = await self._playwright.chromium.launch(
+            headless=self.headless,
+            args=["--disable-dev-shm-usage", "--no-sandbox", "--disable-gpu", *self.argumentos],
+        )
+        self.contexto = await self._navegador.new_context(user_agent=self.user_agent)
+        self.contexto.set_default_navigation_timeout(self.tempo_carregamento * 1000)
+        padrao = padrao_bloqueio(obter_perfil(self.perfil).padroes() if self.perfil is not None else [])
+        if padrao is not None:
+            await self.contexto.route(padrao, self._bloquear)
+
+    async def _bloquear(self, rota) -> None:
+        self.bloqueadas += 1
+        await rota.abort("blockedbyclient")
+
+    async def nova_pagina(self):
+        return await self.contexto.new_page()
+
+    async def mapear(
+        self,
+        tarefa: Callable[[Any, str], Awaitable[Any]],
+        urls: Iterable[str],
+        descricao: Optional[str] = None,
+    ) -> List[Any]:
+        """``await tarefa(pagina, url)`` com a página já em ``url``, na ordem de ``urls``; ``None`` nas que falharam."""
+        urls = list(urls)
+        resultados: List[Any] = [None] * len(urls)
+        livres: "asyncio.Queue" = asyncio.Queue()
+        abertas = [await self.nova_pagina() for _ in range(min(self.paginas, len(urls)))]
+        for pagina in abertas:
+            livres.put_nowait(pagina)
+
+        async def processar(indice: int, url: str, barra) -> None:
+            pagina = await livres.get()
+            try:
+                for tentativa in range(self.tentativas):
+                    try:
+                        await pagina.goto(url, wait_until=self.carregamento)
+                        resultados[indice] = await tarefa(pagina, url)
+                    except ErroPlaywright as e:
+                        if tentativa + 1 < self.tentativas:
+                            self.estatisticas.reenfileiradas += 1
+                            continue
+                        logger.error(f"Desistindo de {url} após {self.tentativas} tentativas: {e}")
+                        self.estatisticas.falhas += 1
+                    except Exception as e:
+                        logger.error(f"Erro ao processar {url}: {e}")
+                        self.estatisticas.falhas += 1
+                    else:
+                        self.estatisticas.concluidas += 1
+                    break
+            finally:
+                livres.put_nowait(pagina)
+                barra.update(1)
+
+        try:
+            with tqdm(total=len(urls), desc=descricao, unit="página", disable=descricao is None) as barra:
+                await asyncio.gather(*(processar(indice, url, barra) for indice, url in enumerate(urls)))
+        finally:
+            for pagina in abertas:
+                await pagina.close()
+        return resultados
+
+    async def fechar(self) -> None:
+        if self.bloqueadas:
+            logger.info(f"{self.bloqueadas} requisições bloqueadas pelo perfil.")
+        if self.contexto is not None:
+            await self.contexto.close()
+        if self._navegador is not None:
+            await self._navegador.close()
+        if self._playwright is not None:
+            await self._playwright.stop()
+        self.contexto = self._navegador = self._playwright = None
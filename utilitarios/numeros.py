@@ -0,0 +1,149 @@
+"""Conversão vetorizada de preços e áreas no formato brasileiro (``R$ 1.234,56``, ``80 m²``, ``2 hectares``)."""
+from typing import Iterable, Union
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:  # Sem pyarrow a mesma expressão roda pelo ``.str`` do pandas
+    pa = pc = None
+
+# Ponto seguido de três dígitos separa milhares; vírgula (ou ponto em outra
+# posição, como em "350000.0") separa os decimais
+_NUMERO = r"(?P<inteiro{n}>\d{{1,3}}(?:\.\d{{3}})+|\d+)(?:[,.](?P<decimal{n}>\d+))?"
+_SUFIXO = r"\s*(?P<sufixo{n}>milh(?:ão|ao|ões|oes)|mil|mi\b)?"
+PADRAO_NUMERO = (
+    "(?i)"
+    + _NUMERO.format(n=1)
+    + _SUFIXO.format(n=1)
+    # Faixas: "R$ 1.000 a R$ 2.000", "80 - 120 m²", "1 até 2 mil"
+    + r"(?:\s*(?:a|até|-|–|~)\s*(?:R\$\s*)?"
+    + _NUMERO.format(n=2)
+    + _SUFIXO.format(n=2)
+    + ")?"
+)
+# Para o Arrow, a expressão completa é dividida: só o número é capturado (a
+# parte cara no RE2); sufixos e hectares são testes sem captura, e o segundo
+# número da faixa é extraído apenas das linhas que têm faixa
+_ANTES_DO_NUMERO = r"^[^\d]*\d[\d.,]*\s*"
+PADRAO_SO_NUMERO = _NUMERO.format(n=1)
+PADRAO_MILHAO = _ANTES_DO_NUMERO + r"(?:milh(?:ão|ao|ões|oes)|mi\b)"
+PADRAO_MIL = _ANTES_DO_NUMERO + r"mil\b"
+PADRAO_FAIXA = r"\d\s*(?:(?:milh(?:ão|ao|ões|oes)|mil|mi\b)\s*)?(?:a|até|-|–|~)\s*(?:R\$\s*)?\d"
+PADRAO_SEGUNDO_NUMERO = (
+    r"\d\s*(?:(?:milh(?:ão|ao|ões|oes)|mil|mi\b)\s*)?(?:a|até|-|–|~)\s*(?:R\$\s*)?"
+    + _NUMERO.format(n=2)
+    + _SUFIXO.format(n=2)
+)
+PADRAO_HECTARES = r"hect|\bha\b"
+M2_POR_HECTARE = 10_000.0
+FAIXAS = ("minimo", "media", "maximo")
+
+
+def _fator_sufixo(sufixo):
+    """mil → 1e3; mi/milhão/milhões → 1e6; vazio → 1."""
+    sufixo = sufixo.fillna("").str.lower()
+    return np.select([sufixo == "", sufixo == "mil"], [1.0, 1e3], 1e6)
+
+
+def _numero_arrow(grupos, n: int) -> np.ndarray:
+    nulo = pa.scalar(None, pa.string())
+    inteiro = pc.struct_field(grupos, f"inteiro{n}")
+    inteiro = pc.if_else(pc.equal(inteiro, ""), nulo, pc.replace_substring(inteiro, ".", ""))
+    decimal = pc.struct_field(grupos, f"decimal{n}")
+    decimal = pc.if_else(pc.equal(decimal, ""), "0", decimal)
+    numero = pc.cast(pc.binary_join_element_wise(inteiro, decimal, "."), pa.float64())
+    return numero.to_numpy(zero_copy_only=False).astype(float)
+
+
+def _contem(texto, padrao: str) -> np.ndarray:
+    encontrado = pc.match_substring_regex(texto, padrao, ignore_case=True)
+    return pc.fill_null(encontrado, False).to_numpy(zero_copy_only=False)
+
+
+def _normalizar_arrow(texto: "pa.Array", faixa: str) -> np.ndarray:
+    valor1 = _numero_arrow(pc.extract_regex(texto, PADRAO_SO_NUMERO), 1)
+    fator1 = np.select([_contem(texto, PADRAO_MILHAO), _contem(texto, PADRAO_MIL)], [1e6, 1e3], 1.0)
+
+    valor2 = np.full(len(texto), np.nan)
+    com_faixa = np.flatnonzero(_contem(texto, PADRAO_FAIXA))
+    if len(com_faixa):
+        grupos = pc.extract_regex(pc.take(texto, pa.array(com_faixa)), "(?i)" + PADRAO_SEGUNDO_NUMERO)
+        sufixo2 = pd.Series(pc.struct_field(grupos, "sufixo2").to_pandas(), dtype=object)
+        fator2 = _fator_sufixo(sufixo2)
+        valor2[com_faixa] = _numero_arrow(grupos, 2) * fator2
+        # "1 a 2 mil": o sufixo do segundo valor vale para o primeiro
+        fator1[com_faixa] = np.where(fator1[com_faixa] == 1.0, fator2, fator1[com_faixa])
+    valor1 = valor1 * fator1
+
+    if faixa == "minimo":
+        valor = np.fmin(valor1, valor2)
+    elif faixa == "maximo":
+        valor = np.fmax(valor1, valor2)
+    else:
+        valor = np.where(np.isnan(valor2), valor1, (valor1 + valor2) / 2)
+    return np.where(_contem(texto, PADRAO_HECTARES), valor * M2_POR_HECTARE, valor)
+
+
+def _normalizar_pandas(texto: pd.Series, faixa: str) -> np.ndarray:
+    grupos = texto.str.extract(PADRAO_NUMERO)
+
+    def numero(n: int) -> pd.Series:
+        inteiro = grupos[f"inteiro{n}"].str.replace(".", "", regex=False)
+        decimal = grupos[f"decimal{n}"].fillna("0")
+        return pd.to_numeric(inteiro + "." + decimal, errors="coerce").astype(float)
+
+    sufixo1 = grupos["sufixo1"].fillna(grupos["sufixo2"])
+    valor1 = numero(1) * _fator_sufixo(sufixo1)
+    valor2 = numero(2) * _fator_sufixo(grupos["sufixo2"])
+    if faixa == "minimo":
+        valor = np.fmin(valor1, valor2)
+    elif faixa == "maximo":
+        valor = np.fmax(valor1, valor2)
+    else:
+        valor = (valor1 + valor2.fillna(valor1)) / 2
+
+    hectares = texto.str.contains(PADRAO_HECTARES, case=False, regex=True).fillna(False).astype(bool)
+    return np.where(hectares, valor * M2_POR_HECTARE, valor).astype(float)
+
+
+def normalizar_numeros(valores: Union[pd.Series, Iterable], faixa: str = "minimo") -> pd.Series:
+    """Converte uma coluna inteira de textos como ``R$ 1.234,56`` em ``float``.
+
+    Aceita símbolos e unidades em volta do número (``R$``, ``m²``, ``/mês``),
+    separador de milhares com ponto e decimais com vírgula, sufixos ``mil`` e
+    ``mi``/``milhões`` e áreas em hectares (convertidas para m²). Em faixas
+    (``R$ 1.000 a R$ 2.000``) vale o ``minimo``, a ``media`` ou o ``maximo``,
+    conforme ``faixa``. Textos sem número (``Sob Consulta``) viram ``NaN``.
+    Colunas já numéricas são apenas convertidas para ``float``.
+
+    Todo o trabalho é feito em uma passada vetorizada: com ``pyarrow``, a
+    expressão regular roda no RE2 do Arrow sobre a coluna inteira; sem ele,
+    pelo ``.str.extract`` do pandas.
+    """
+    if faixa not in FAIXAS:
+        raise ValueError(f"faixa deve ser uma de {FAIXAS}, não {faixa!r}")
+    serie = valores if isinstance(valores, pd.Series) else pd.Series(list(valores), dtype=object)
+    if pd.api.types.is_numeric_dtype(serie.dtype):
+        return serie.astype(float)
+
+    if pc is None:
+        resultado = _normalizar_pandas(serie.astype("string"), faixa)
+    else:
+        try:
+            texto = pa.array(serie, type=pa.string(), from_pandas=True)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            # Números misturados aos textos (estado JSON + HTML) viram "350000.0"
+            texto = pa.array(serie.astype("string"), type=pa.string(), from_pandas=True)
+        resultado = _normalizar_arrow(texto, faixa)
+    return pd.Series(resultado, index=serie.index, name=serie.name)
+
+
+def normalizar_colunas(df: pd.DataFrame, colunas: Iterable[str], faixa: str = "minimo") -> pd.DataFrame:
+    """Aplica ``normalizar_numeros`` às colunas existentes de ``df`` (no próprio DataFrame)."""
+    for coluna in colunas:
+        if coluna in df.columns:
+            df[coluna] = normalizar_numeros(df[coluna], faixa)
+    return df
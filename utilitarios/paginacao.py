@@ -0,0 +1,168 @@
+"""Planejamento de paginação: descobre a última página e para na primeira vazia."""
+import logging
+import re
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from contextlib import ExitStack
+from typing import Callable, Dict, Iterator, List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+LIMITE_PAGINAS = 10000  # Trava de segurança contra paginação infinita
+
+
+def descobrir_ultima_pagina(
+    conteudo: Union[bytes, str],
+    parametro: str = "pagina",
+    padrao: Optional[str] = None,
+) -> Optional[int]:
+    """Maior número de página citado nos links de paginação do HTML.
+
+    Por padrão procura ``<parametro>=N`` em query strings (inclusive ``&amp;``);
+    ``padrao`` permite outra regex com um grupo numérico, como
+    ``r"pagina-(\\d+)\\.html"``.
+    """
+    if isinstance(conteudo, bytes):
+        conteudo = conteudo.decode("utf-8", errors="ignore")
+    regex = padrao or rf"[?&;]{re.escape(parametro)}=(\d+)"
+    numeros = [int(n) for n in re.findall(regex, conteudo)]
+    return max(numeros) if numeros else None
+
+
+class PlanejadorPaginacao:
+    """Busca páginas em paralelo até o fim real da listagem.
+
+    A página 1 é lida primeiro e ``descobrir`` estima a última página; cada
+    página seguinte pode ampliar a estimativa. Sem estimativa, a busca avança
+    especulativamente ``max_workers`` páginas à frente da última com dados.
+    A primeira página vazia (ou repetida, em sites que devolvem a última página
+    para números além do fim) encerra a coleta e cancela o que ainda não
+    começou. Falhas de busca (``None``) não encerram a paginação.
+
+    Com ``processos`` > 0 a extração roda em um ``ProcessPoolExecutor``
+    enquanto as threads continuam buscando (``extrair`` precisa ser uma função
+    de módulo, serializável pelo pickle).
+    """
+
+    def __init__(
+        self,
+        buscar: Callable[[int], Optional[bytes]],
+        extrair: Callable[[bytes], List],
+        descobrir: Optional[Callable[[bytes], Optional[int]]] = descobrir_ultima_pagina,
+        max_workers: int = 20,
+        limite_paginas: int = LIMITE_PAGINAS,
+        processos: int = 0,
+    ):
+        self.buscar = buscar
+        self.extrair = extrair
+        self.descobrir = descobrir
+        self.max_workers = max_workers
+        self.limite_paginas = limite_paginas
+        self.processos = processos
+        self.ultima_pagina = 0
+
+    def _ao_buscar(self, pagina: int, conteudo: bytes) -> None:
+        """Amplia o plano com a última página citada no HTML recebido."""
+        estimativa = self.descobrir(conteudo) if self.descobrir else None
+        if estimativa and estimativa > self._planejado:
+            self._planejado = min(estimativa, self.limite_paginas)
+            self._estimativa_do_site = True
+
+    def _ao_extrair(self, pagina: int, itens: List) -> bool:
+        """Marca o fim da listagem ou avança o plano; retorna se a página tem dados."""
+        assinatura = hash(repr(itens))
+        if not itens or assinatura in self._assinaturas:
+            self._fim = min(self._fim, pagina)
+            return False
+        self._assinaturas.add(assinatura)
+        if self._estimativa_do_site:
+            if pagina >= self._planejado:
+                # Estimativa esgotada com dados: sonda uma página adiante
+                self._planejado = pagina + 1
+                self._estimativa_do_site = False
+        else:
+            self._planejado = max(self._planejado, pagina + self.max_workers)
+        self._planejado = min(self._planejado, self.limite_paginas)
+        return True
+
+    def iterar(self, ao_concluir: Optional[Callable[[], None]] = None) -> Iterator[List]:
+        """Entrega os itens de cada página com dados, em ordem, assim que ficam prontos."""
+        self._planejado = 1
+        self._estimativa_do_site = False
+        self._fim = self.limite_paginas + 1  # Primeira página além do fim
+        self._assinaturas = set()
+        self.ultima_pagina = 0
+
+        prontas: Dict[int, Optional[List]] = {}  # None = sem dados ou falha
+        proxima_entrega = 1
+        proxima_busca = 1
+        buscando: Dict[Future, int] = {}
+        extraindo: Dict[Future, int] = {}
+
+        with ExitStack() as pilha:
+            threads = pilha.enter_context(ThreadPoolExecutor(max_workers=self.max_workers))
+            processos = (
+                pilha.enter_context(ProcessPoolExecutor(max_workers=self.processos))
+                if self.processos
+                else None
+            )
+
+            while True:
+                # A página 1 vai sozinha: é dela que sai a estimativa inicial
+                limite_voo = 1 if proxima_busca == 1 else self.max_workers
+                while (
+                    len(buscando) < limite_voo
+                    and len(extraindo) < self.max_workers
+                    and proxima_busca <= self._planejado
+                    and proxima_busca < self._fim
+                ):
+                    buscando[threads.submit(self.buscar, proxima_busca)] = proxima_busca
+                    proxima_busca += 1
+                if not buscando and not extraindo:
+                    break
+
+                concluidos, _ = wait(
+                    list(buscando) + list(extraindo), return_when=FIRST_COMPLETED
+                )
+                for futuro in concluidos:
+                    if futuro in buscando:
+                        pagina = buscando.pop(futuro)
+                        conteudo = futuro.result()
+                        if conteudo is None or pagina >= self._fim:
+                            prontas[pagina] = None
+                        else:
+                            self._ao_buscar(pagina, conteudo)
+                            if processos:
+                                extraindo[processos.submit(self.extrair, conteudo)] = pagina
+                                continue
+                            itens = self.extrair(conteudo)
+                            prontas[pagina] = itens if self._ao_extrair(pagina, itens) else None
+                    else:
+                        pagina = extraindo.pop(futuro)
+                        itens = futuro.result()
+                        prontas[pagina] = itens if self._ao_extrair(pagina, itens) else None
+                    if ao_concluir:
+                        ao_concluir()
+
+                for pendentes in (buscando, extraindo):
+                    for futuro, pagina in list(pendentes.items()):
+                        if pagina >= self._fim and futuro.cancel():
+                            del pendentes[futuro]
+
+                while proxima_entrega in prontas and proxima_entrega < self._fim:
+                    itens = prontas.pop(proxima_entrega)
+                    if itens is not None:
+                        self.ultima_pagina = proxima_entrega
+                        yield itens
+                    proxima_entrega += 1
+
+        logger.info(f"Paginação encerrada na página {self.ultima_pagina}.")
+
+    def coletar(self, ao_concluir: Optional[Callable[[], None]] = None) -> List:
+        """Retorna os itens de todas as páginas com dados, na ordem das páginas."""
+        return [item for itens in self.iterar(ao_concluir) for item in itens]
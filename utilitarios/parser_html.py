@@ -0,0 +1,242 @@
+"""Escolha do parser de HTML (html.parser, lxml ou selectolax) atrás da API do BeautifulSoup."""
+import logging
+import os
+import re
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from bs4 import BeautifulSoup, SoupStrainer
+from bs4.dammit import UnicodeDammit
+
+logger = logging.getLogger(__name__)
+
+BACKENDS = ("html.parser", "lxml", "selectolax")
+ATRIBUTOS_MULTIVALORADOS = {"class", "rel", "rev", "accept-charset", "headers", "accesskey", "dropzone"}
+
+
+def _modulo_disponivel(nome: str) -> bool:
+    try:
+        __import__(nome)
+    except ImportError:
+        return False
+    return True
+
+
+def backend_padrao() -> str:
+    """``SCRAPING_PARSER`` se definido; senão ``html.parser``, o parser original dos scripts.
+
+    lxml e selectolax seguem as regras do HTML5 para tags não fechadas (um
+    ``<p>`` aberto termina antes de um ``<ul>``, por exemplo), então em HTML
+    malformado podem extrair textos diferentes; confira com
+    ``benchmarks/benchmark_parsers.py`` antes de trocar o backend de um site.
+    """
+    return os.environ.get("SCRAPING_PARSER") or "html.parser"
+
+
+def backends_disponiveis() -> List[str]:
+    return [b for b in BACKENDS if b == "html.parser" or _modulo_disponivel(b)]
+
+
+def _aspas(valor: str) -> str:
+    return '"' + valor.replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+
+class ElementoSelectolax:
+    """Fachada de um nó do selectolax (lexbor) com o subconjunto da API do ``bs4.Tag``
+    usado pelos scripts: ``find``/``find_all``/``findAll``, ``tag['attr']``,
+    ``get``, ``text``/``get_text``, ``string`` e ``tag.filho``.
+
+    ``find`` traduz nome, ``class_`` e atributos em um seletor CSS com a mesma
+    semântica do bs4 (classe com espaços compara a string inteira); regex em
+    ``string``/``text`` ou em atributos é aplicada depois, em Python.
+    """
+
+    __slots__ = ("_no",)
+
+    def __init__(self, no):
+        self._no = no
+
+    @property
+    def name(self) -> str:
+        return self._no.tag
+
+    @property
+    def attrs(self) -> Dict[str, Any]:
+        atributos = {}
+        for nome, valor in self._no.attributes.items():
+            valor = "" if valor is None else valor
+            atributos[nome] = valor.split() if nome in ATRIBUTOS_MULTIVALORADOS else valor
+        return atributos
+
+    def __getitem__(self, nome: str):
+        return self.attrs[nome]
+
+    def get(self, nome: str, padrao=None):
+        atributos = self._no.attributes
+        if nome not in atributos:
+            return padrao
+        valor = atributos[nome] or ""
+        return valor.split() if nome in ATRIBUTOS_MULTIVALORADOS else valor
+
+    def has_attr(self, nome: str) -> bool:
+        return nome in self._no.attributes
+
+    @property
+    def text(self) -> str:
+        return self._no.text(deep=True)
+
+    def get_text(self, separator: str = "", strip: bool = False) -> str:
+        if not separator and not strip:
+            return self.text
+        partes = [
+            no.text_content
+            for no in self._no.traverse(include_text=True)
+            if no.is_text_node and no.text_content
+        ]
+        if strip:
+            partes = [p.strip() for p in partes if p.strip()]
+        return separator.join(partes)
+
+    @property
+    def string(self) -> Optional[str]:
+        """Como no bs4: o texto quando o nó tem um único filho (recursivamente)."""
+        filhos = [f for f in self._no.iter(include_text=True) if not f.is_comment_node]
+        if len(filhos) != 1:
+            return None
+        if filhos[0].is_text_node:
+            return filhos[0].text_content
+        return ElementoSelectolax(filhos[0]).string
+
+    @property
+    def children(self) -> List["ElementoSelectolax"]:
+        """Filhos que são elementos (textos e comentários ficam de fora)."""
+        return [ElementoSelectolax(no) for no in self._no.iter(include_text=False)]
+
+    def __getattr__(self, nome: str):
+        if nome.startswith("_"):
+            raise AttributeError(nome)
+        return self.find(nome)
+
+    def __eq__(self, outro) -> bool:
+        return isinstance(outro, ElementoSelectolax) and outro._no.mem_id == self._no.mem_id
+
+    def __hash__(self) -> int:
+        return self._no.mem_id
+
+    def __str__(self) -> str:
+        return self._no.html
+
+    def _seletor(self, nome, atributos: Dict[str, Any]):
+        seletor = nome if isinstance(nome, str) else "*"
+        filtros = []
+        for atributo, valor in atributos.items():
+            if valor is True:
+                seletor += f"[{atributo}]"
+            elif isinstance(valor, str):
+                if atributo in ATRIBUTOS_MULTIVALORADOS and " " not in valor.strip():
+                    seletor += f"[{atributo}~={_aspas(valor)}]"
+                else:
+                    seletor += f"[{atributo}={_aspas(valor)}]"
+            elif valor is not None:
+                filtros.append((atributo, valor))
+        return seletor, filtros
+
+    @staticmethod
+    def _confere(valor_atual: Optional[str], esperado) -> bool:
+        if valor_atual is None:
+            return False
+        if isinstance(esperado, re.Pattern):
+            return esperado.search(valor_atual) is not None
+        if isinstance(esperado, (list, tuple, set)):
+            return valor_atual in esperado
+        if callable(esperado):
+            return bool(esperado(valor_atual))
+        return valor_atual == esperado
+
+    def find_all(
+        self,
+        name=None,
+        attrs: Union[Dict[str, Any], str, None] = None,
+        recursive: bool = True,
+        string=None,
+        limit: Optional[int] = None,
+        **kwargs,
+    ) -> List["ElementoSelectolax"]:
+        if isinstance(attrs, str):
+            attrs = {"class": attrs}
+        atributos = dict(attrs or {})
+        if "class_" in kwargs:
+            atributos["class"] = kwargs.pop("class_")
+        string = kwargs.pop("text", string)
+        atributos.update(kwargs)
+        if isinstance(name, (list, tuple, set)):
+            resultados = []
+            for nome in name:
+                resultados.extend(self.find_all(nome, atributos, recursive, string))
+            return resultados[:limit] if limit else resultados
+
+        seletor, filtros = self._seletor(name, atributos)
+        encontrados = []
+        for no in self._no.css(seletor):
+            if no.mem_id == self._no.mem_id:
+                continue  # O lexbor inclui o próprio nó; o bs4 busca só descendentes
+            if not recursive and (no.parent is None or no.parent.mem_id != self._no.mem_id):
+                continue
+            if any(not self._confere(no.attributes.get(a), v) for a, v in filtros):
+                continue
+            elemento = ElementoSelectolax(no)
+            if string is not None and not self._confere(elemento.string, string):
+                continue
+            encontrados.append(elemento)
+            if limit and len(encontrados) >= limit:
+                break
+        return encontrados
+
+    findAll = find_all
+
+    def find(self, name=None, attrs=None, recursive: bool = True, string=None, **kwargs):
+        encontrados = self.find_all(name, attrs, recursive, string, limit=1, **kwargs)
+        return encontrados[0] if encontrados else None
+
+    def select(self, seletor: str) -> List["ElementoSelectolax"]:
+        return [ElementoSelectolax(no) for no in self._no.css(seletor) if no.mem_id != self._no.mem_id]
+
+    def select_one(self, seletor: str) -> Optional["ElementoSelectolax"]:
+        encontrados = self.select(seletor)
+        return encontrados[0] if encontrados else None
+
+
+def criar_soup(
+    conteudo: Union[bytes, str],
+    backend: Optional[str] = None,
+    somente: Optional[Tuple[str, Dict[str, str]]] = None,
+    **opcoes,
+):
+    """Substituto de ``BeautifulSoup(conteudo, "html.parser")`` com backend configurável.
+
+    ``backend`` (ou ``SCRAPING_PARSER``) escolhe entre ``html.parser``,
+    ``lxml`` e ``selectolax``; os dois primeiros devolvem um ``BeautifulSoup``
+    comum e o último um ``ElementoSelectolax`` da raiz do documento. Backends
+    ausentes caem para ``html.parser``.
+
+    ``somente=(nome, atributos)`` monta a árvore apenas dos elementos que
+    casam (os cards da listagem) e de seus descendentes, via ``SoupStrainer``;
+    cabeçalho, scripts e rodapé são descartados durante a tokenização. O
+    selectolax ignora a opção: a árvore dele é montada em C e só os nós
+    consultados viram objetos Python.
+    """
+    backend = backend or backend_padrao()
+    if backend not in backends_disponiveis():
+        logger.warning(f"Parser '{backend}' indisponível: usando html.parser.")
+        backend = "html.parser"
+    if backend == "selectolax":
+        from selectolax.lexbor import LexborHTMLParser
+
+        if isinstance(conteudo, bytes):
+            # Mesma detecção de codificação do BeautifulSoup
+            sugestoes = [opcoes["from_encoding"]] if opcoes.get("from_encoding") else []
+            conteudo = UnicodeDammit(conteudo, sugestoes, is_html=True).unicode_markup
+        return ElementoSelectolax(LexborHTMLParser(conteudo).root)
+    if somente:
+        nome, atributos = somente
+        opcoes["parse_only"] = SoupStrainer(nome, attrs=atributos)
+    return BeautifulSoup(conteudo, backend, **opcoes)
@@ -0,0 +1,159 @@
+"""Pipeline listagem → detalhes: as páginas de detalhe começam a baixar enquanto a listagem ainda é lida."""
+import logging
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from itertools import islice
+from typing import Any, Callable, Dict, Hashable, Iterable, Iterator, List, Optional, Tuple
+
+from tqdm import tqdm
+
+logger = logging.getLogger(__name__)
+
+TAMANHO_FILA = 200  # URLs de detalhe aguardando um worker; cheia, a listagem espera
+LOTE_PROCESSOS = 8  # Itens por tarefa enviada a um processo (amortiza a serialização)
+_FIM = object()
+
+
+def lotes_em_paralelo(
+    buscar: Callable[[int], Optional[bytes]],
+    extrair: Callable[[bytes], List],
+    paginas: Iterable[int],
+    max_workers: int,
+    ao_concluir: Optional[Callable[[], None]] = None,
+) -> Iterator[List]:
+    """Busca as ``paginas`` da listagem em paralelo e entrega os itens de cada uma assim que chega."""
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futuros = [executor.submit(buscar, pagina) for pagina in paginas]
+        for futuro in as_completed(futuros):
+            conteudo = futuro.result()
+            if ao_concluir:
+                ao_concluir()
+            if conteudo:
+                yield extrair(conteudo)
+
+
+def _aplicar_lote(funcao: Callable[[Any], Any], lote: List[Any]) -> List[Any]:
+    return [funcao(item) for item in lote]
+
+
+def mapear_em_processos(
+    funcao: Callable[[Any], Any],
+    itens: Iterable[Any],
+    processos: int,
+    lote: int = LOTE_PROCESSOS,
+) -> Iterator[Any]:
+    """``funcao(item)`` em ``processos`` processos, na ordem de ``itens``, lendo ``itens`` aos poucos.
+
+    O ``ProcessPoolExecutor.map`` consome o iterável inteiro antes do
+    primeiro resultado; aqui no máximo ``2 * processos`` lotes de ``lote``
+    itens ficam pendentes, e um novo lote só é lido quando o mais antigo
+    termina. Com ``ArquivoWARC.iterar`` a memória fica proporcional ao
+    número de processos, não ao tamanho do arquivo.
+    """
+    itens = iter(itens)
+    pendentes: "deque" = deque()
+    with ProcessPoolExecutor(max_workers=processos) as executor:
+
+        def enviar() -> bool:
+            bloco = list(islice(itens, lote))
+            if bloco:
+                pendentes.append(executor.submit(_aplicar_lote, funcao, bloco))
+            return bool(bloco)
+
+        for _ in range(2 * processos):
+            if not enviar():
+                break
+        while pendentes:
+            resultados = pendentes.popleft().result()
+            enviar()
+            yield from resultados
+
+
+class PipelineDetalhes:
+    """Produtor/consumidor entre a listagem e as páginas de detalhe.
+
+    ``executar`` percorre os lotes da listagem (os itens de cada página, como
+    entrega ``PlanejadorPaginacao.iterar``) e põe a URL de cada item
+    (``chave(item)``) em uma fila limitada assim que a página é extraída;
+    ``workers`` threads consomem a fila aplicando ``detalhar(url)``. Com a
+    fila cheia a listagem espera (contrapressão), então a memória não cresce
+    se os detalhes forem mais lentos. O tempo total tende ao da fase mais
+    lenta, não à soma das duas.
+
+    URLs repetidas são detalhadas uma vez; itens sem URL entram só na
+    listagem. Um erro em ``detalhar`` vira ``None`` para aquela URL.
+    """
+
+    def __init__(
+        self,
+        detalhar: Callable[[str], Any],
+        workers: int,
+        tamanho_fila: int = TAMANHO_FILA,
+        chave: Callable[[Dict], Optional[Hashable]] = lambda item: item.get("Link"),
+    ):
+        self.detalhar = detalhar
+        self.workers = workers
+        self.tamanho_fila = tamanho_fila
+        self.chave = chave
+        self.tempo_listagem = 0.0
+        self.tempo_total = 0.0
+
+    def _consumir(self, fila: "queue.Queue", resultados: Dict, barra) -> None:
+        while True:
+            url = fila.get()
+            if url is _FIM:
+                return
+            try:
+                resultados[url] = self.detalhar(url)
+            except Exception as e:
+                logger.error(f"Erro ao detalhar {url}: {e}")
+                resultados[url] = None
+            barra.update(1)
+
+    def executar(
+        self,
+        lotes: Iterable[List[Dict]],
+        descricao: Optional[str] = None,
+    ) -> Tuple[List[Dict], Dict[Hashable, Any]]:
+        """Itens da listagem, na ordem dos lotes, e o resultado de ``detalhar`` por URL."""
+        inicio = time.perf_counter()
+        itens: List[Dict] = []
+        resultados: Dict[Hashable, Any] = {}
+        enfileiradas = set()
+        fila: "queue.Queue" = queue.Queue(maxsize=self.tamanho_fila)
+
+        with tqdm(total=0, desc=descricao, unit="página", disable=descricao is None) as barra:
+            threads = [
+                threading.Thread(target=self._consumir, args=(fila, resultados, barra), daemon=True)
+                for _ in range(self.workers)
+            ]
+            for thread in threads:
+                thread.start()
+            try:
+                for lote in lotes:
+                    for item in lote:
+                        if not item:
+                            continue
+                        itens.append(item)
+                        url = self.chave(item)
+                        if url and url not in enfileiradas:
+                            enfileiradas.add(url)
+                            barra.total += 1
+                            barra.refresh()
+                            fila.put(url)
+                self.tempo_listagem = time.perf_counter() - inicio
+            finally:
+                for _ in threads:
+                    fila.put(_FIM)
+                for thread in threads:
+                    thread.join()
+
+        self.tempo_total = time.perf_counter() - inicio
+        logger.info(
+            f"Pipeline: {len(itens)} itens listados em {self.tempo_listagem:.1f}s; "
+            f"{len(resultados)} detalhes concluídos em {self.tempo_total:.1f}s no total."
+        )
+        return itens, resultados
@@ -0,0 +1,238 @@
+"""Pool de navegadores Chrome (Selenium) que consome uma fila de URLs em paralelo."""
+import logging
+import os
+import queue
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from selenium.common.exceptions import WebDriverException
+from tqdm import tqdm
+
+from utilitarios.navegador import criar_chrome
+
+try:
+    import psutil
+except ImportError:  # Sem psutil o limite de memória não é medido; vale só ``reciclar_a_cada``
+    psutil = None
+
+logger = logging.getLogger(__name__)
+
+LIMITE_MEMORIA_MB = 1500  # Por instância: chromedriver + Chrome + processos de renderização
+TEMPO_CARREGAMENTO = 60  # Segundos até o driver.get desistir da página
+
+
+def memoria_mb(driver) -> Optional[float]:
+    """Memória residente do chromedriver e de todos os processos do Chrome abertos por ele."""
+    processo = getattr(getattr(driver, "service", None), "process", None)
+    if psutil is None or processo is None:
+        return None
+    try:
+        raiz = psutil.Process(processo.pid)
+        processos = [raiz, *raiz.children(recursive=True)]
+    except psutil.Error:
+        return None
+    total = 0
+    for p in processos:
+        try:
+            total += p.memory_info().rss
+        except psutil.Error:
+            continue  # Processo de renderização encerrado durante a medição
+    return total / 2**20
+
+
+def driver_vivo(driver) -> bool:
+    """``False`` se o Chrome ou o chromedriver caíram (sessão inválida, conexão recusada)."""
+    try:
+        driver.current_url
+    except WebDriverException:
+        return False
+    except Exception:  # urllib3 sem conexão com o chromedriver
+        return False
+    return True
+
+
+def _encerrar(driver) -> None:
+    try:
+        driver.quit()
+    except Exception as e:
+        logger.debug(f"Erro ao encerrar navegador: {e}")
+
+
+@dataclass
+class EstatisticasNavegadores:
+    """Contadores de um pool de navegadores."""
+
+    concluidas: int = 0
+    falhas: int = 0
+    reenfileiradas: int = 0
+    iniciados: int = 0
+    reinicios_queda: int = 0
+    reinicios_memoria: int = 0
+    _trava: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def somar(self, **contadores: int) -> None:
+        with self._trava:
+            for nome, valor in contadores.items():
+                setattr(self, nome, getattr(self, nome) + valor)
+
+    def resumo(self) -> str:
+        return (
+            f"Navegadores: {self.concluidas} URLs concluídas, {self.falhas} falhas, "
+            f"{self.reenfileiradas} reenfileiradas; {self.iniciados} instâncias iniciadas "
+            f"({self.reinicios_queda} após queda, {self.reinicios_memoria} por memória)."
+        )
+
+
+class PoolNavegadores:
+    """N navegadores consumindo a mesma fila de URLs.
+
+    Cada thread usa um navegador próprio e aplica ``tarefa(driver, url)`` à
+    próxima URL da fila. Se a tarefa levanta ``WebDriverException`` e o
+    navegador não responde mais, ele é encerrado e substituído; a URL volta à
+    fila até ``tentativas`` vezes. Erros de outro tipo (falha de parsing na
+    própria tarefa) contam como falha da URL, sem nova tentativa.
+
+    Depois de cada URL a memória da instância é medida (com ``psutil``); acima
+    de ``limite_memoria_mb`` o navegador é reciclado antes da URL seguinte.
+    ``reciclar_a_cada`` recicla também por número de páginas abertas. Os
+    navegadores continuam abertos entre chamadas de ``mapear`` até ``fechar``
+    (ou o fim do bloco ``with``).
+    """
+
+    def __init__(
+        self,
+        instancias: Optional[int] = None,
+        fabrica: Callable[[], Any] = criar_chrome,
+        limite_memoria_mb: Optional[float] = LIMITE_MEMORIA_MB,
+        tentativas: int = 3,
+        reciclar_a_cada: Optional[int] = None,
+        tempo_carregamento: Optional[float] = TEMPO_CARREGAMENTO,
+    ):
+        self.instancias = instancias or os.cpu_count() or 1
+        self.fabrica = fabrica
+        self.limite_memoria_mb = limite_memoria_mb
+        self.tentativas = tentativas
+        self.reciclar_a_cada = reciclar_a_cada
+        self.tempo_carregamento = tempo_carregamento
+        self.estatisticas = EstatisticasNavegadores()
+        self._livres: "queue.SimpleQueue" = queue.SimpleQueue()
+        self._usos: Dict[int, int] = {}
+        self._abertos: List[Any] = []
+        self._trava = threading.Lock()
+
+    def __enter__(self) -> "PoolNavegadores":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.fechar()
+
+    def _iniciar(self):
+        driver = self.fabrica()
+        if self.tempo_carregamento:
+            driver.set_page_load_timeout(self.tempo_carregamento)
+        with self._trava:
+            self._abertos.append(driver)
+            self._usos[id(driver)] = 0
+        self.estatisticas.somar(iniciados=1)
+        return driver
+
+    def _descartar(self, driver) -> None:
+        with self._trava:
+            if driver in self._abertos:
+                self._abertos.remove(driver)
+            self._usos.pop(id(driver), None)
+        _encerrar(driver)
+
+    def _obter(self):
+        try:
+            return self._livres.get_nowait()
+        except queue.Empty:
+            return self._iniciar()
+
+    def _precisa_reciclar(self, driver) -> bool:
+        usos = self._usos[id(driver)] = self._usos.get(id(driver), 0) + 1
+        if self.reciclar_a_cada and usos >= self.reciclar_a_cada:
+            return True
+        if self.limite_memoria_mb is None:
+            return False
+        memoria = memoria_mb(driver)
+        if memoria is not None and memoria > self.limite_memoria_mb:
+            logger.info(f"Navegador com {memoria:.0f} MiB (limite {self.limite_memoria_mb:.0f} MiB): reciclando.")
+            self.estatisticas.somar(reinicios_memoria=1)
+            return True
+        return False
+
+    def _trabalhar(self, fila: "queue.Queue", tarefa, resultados: List, barra) -> None:
+        driver = None
+        try:
+            while True:
+                try:
+                    indice, url, tentativa = fila.get_nowait()
+                except queue.Empty:
+                    return
+                try:
+                    if driver is None:
+                        driver = self._obter()
+                    resultados[indice] = tarefa(driver, url)
+                except WebDriverException as e:
+                    if driver is None or not driver_vivo(driver):
+                        logger.warning(f"Navegador caiu em {url}: reiniciando.")
+                        if driver is not None:
+                            self._descartar(driver)
+                            self.estatisticas.somar(reinicios_queda=1)
+                        driver = None
+                    if tentativa + 1 < self.tentativas:
+                        fila.put((indice, url, tentativa + 1))
+                        self.estatisticas.somar(reenfileiradas=1)
+                        continue
+                    logger.error(f"Desistindo de {url} após {self.tentativas} tentativas: {e.msg or e}")
+                    self.estatisticas.somar(falhas=1)
+                except Exception as e:
+                    logger.error(f"Erro ao processar {url}: {e}")
+                    self.estatisticas.somar(falhas=1)
+                else:
+                    self.estatisticas.somar(concluidas=1)
+                barra.update(1)
+                if driver is not None and self._precisa_reciclar(driver):
+                    self._descartar(driver)
+                    driver = None
+        finally:
+            if driver is not None:
+                self._livres.put(driver)
+
+    def mapear(
+        self,
+        tarefa: Callable[[Any, str], Any],
+        urls: Iterable[str],
+        descricao: Optional[str] = None,
+    ) -> List[Any]:
+        """``tarefa(driver, url)`` para cada URL, na ordem de ``urls``; ``None`` nas que falharam."""
+        urls = list(urls)
+        resultados: List[Any] = [None] * len(urls)
+        fila: "queue.Queue" = queue.Queue()
+        for indice, url in enumerate(urls):
+            fila.put((indice, url, 0))
+        with tqdm(total=len(urls), desc=descricao, unit="página", disable=descricao is None) as barra:
+            threads = [
+                threading.Thread(target=self._trabalhar, args=(fila, tarefa, resultados, barra), daemon=True)
+                for _ in range(min(self.instancias, len(urls)))
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        return resultados
+
+    def fechar(self) -> None:
+        """Encerra todos os navegadores abertos pelo pool."""
+        while True:
+            try:
+                self._livres.get_nowait()
+            except queue.Empty:
+                break
+        with self._trava:
+            abertos, self._abertos = self._abertos, []
+            self._usos.clear()
+        for driver in abertos:
+            _encerrar(driver)
@@ -0,0 +1,178 @@
+"""Pool de proxies com sondagem em segundo plano e escolha ponderada pela latência."""
+import logging
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+URL_TESTE = "http://www.google.com"
+STATUS_BLOQUEIO = {403, 407, 429}  # Respostas que indicam proxy barrado pelo destino
+
+
+@dataclass
+class EstatisticasProxy:
+    """Médias móveis exponenciais (EWMA) de um proxy."""
+
+    sucesso: float = 1.0  # Fração de sucesso recente (otimista até a primeira medição)
+    latencia: Optional[float] = None  # Segundos; None = ainda não medido
+    usos: int = 0
+    falhas_seguidas: int = 0
+    removido: bool = False
+    aprovado: Optional[bool] = None  # Resultado da última sondagem; None = ainda não sondado
+
+
+class PoolProxies:
+    """Mantém a saúde de cada proxy e encaminha as requisições aos melhores.
+
+    ``sondar`` testa todos os proxies ativos em paralelo contra ``url_teste``;
+    ``iniciar`` repete a sondagem a cada ``intervalo_sondagem`` segundos em uma
+    thread de fundo. Cada resultado (sondagem ou uso real, via ``registrar``)
+    atualiza as médias de sucesso e latência com peso ``alfa``. ``escolher``
+    sorteia um proxy com peso ``sucesso / latência`` entre os que não
+    falharam na última sondagem (um uso real bem-sucedido também o aprova),
+    e proxies com ``falhas_para_remover`` falhas seguidas ou sucesso abaixo
+    de ``sucesso_minimo`` saem do pool. Entradas duplicadas são ignoradas.
+    """
+
+    def __init__(
+        self,
+        proxies: Iterable[str],
+        url_teste: str = URL_TESTE,
+        intervalo_sondagem: float = 60.0,
+        timeout: float = 5.0,
+        alfa: float = 0.3,
+        sucesso_minimo: float = 0.3,
+        falhas_para_remover: int = 3,
+        max_workers: int = 20,
+    ):
+        self.url_teste = url_teste
+        self.intervalo_sondagem = intervalo_sondagem
+        self.timeout = timeout
+        self.alfa = alfa
+        self.sucesso_minimo = sucesso_minimo
+        self.falhas_para_remover = falhas_para_remover
+        self.max_workers = max_workers
+        self._proxies: Dict[str, EstatisticasProxy] = {
+            proxy: EstatisticasProxy() for proxy in dict.fromkeys(proxies)
+        }
+        self._trava = threading.Lock()
+        self._parar = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def ativos(self) -> List[str]:
+        """Proxies ainda no pool, do mais rápido ao mais lento."""
+        with self._trava:
+            ativos = [p for p, e in self._proxies.items() if not e.removido]
+            return sorted(ativos, key=lambda p: self._proxies[p].latencia or self.timeout)
+
+    def estatisticas(self, proxy: str) -> EstatisticasProxy:
+        return self._proxies[proxy]
+
+    def registrar(
+        self, proxy: str, sucesso: bool, latencia: Optional[float] = None, sondagem: bool = False
+    ) -> None:
+        """Atualiza as médias do proxy e o remove do pool se estiver ruim."""
+        with self._trava:
+            estado = self._proxies.get(proxy)
+            if estado is None or estado.removido:
+                return
+            if sondagem or sucesso:
+                estado.aprovado = sucesso
+            estado.usos += 1
+            estado.sucesso += self.alfa * (float(sucesso) - estado.sucesso)
+            if sucesso:
+                estado.falhas_seguidas = 0
+                if latencia is not None:
+                    estado.latencia = (
+                        latencia
+                        if estado.latencia is None
+                        else estado.latencia + self.alfa * (latencia - estado.latencia)
+                    )
+            else:
+                estado.falhas_seguidas += 1
+            if (
+                estado.falhas_seguidas >= self.falhas_para_remover
+                or estado.sucesso < self.sucesso_minimo
+            ):
+                estado.removido = True
+                logger.warning(
+                    f"Proxy {proxy} removido do pool ({estado.falhas_seguidas} falhas "
+                    f"seguidas, {estado.sucesso:.0%} de sucesso)."
+                )
+
+    def registrar_resposta(
+        self, proxy: str, resposta: Optional[requests.Response], latencia: float
+    ) -> None:
+        """Registra o resultado de uma requisição real (``None`` = erro de conexão)."""
+        sucesso = resposta is not None and resposta.status_code not in STATUS_BLOQUEIO
+        self.registrar(proxy, sucesso, latencia if sucesso else None)
+
+    def _sondar_proxy(self, proxy: str) -> bool:
+        inicio = time.monotonic()
+        try:
+            resposta = requests.get(
+                self.url_teste, proxies={"http": proxy, "https": proxy}, timeout=self.timeout
+            )
+            sucesso = resposta.status_code == 200
+        except requests.exceptions.RequestException as e:
+            logger.debug(f"Sondagem do proxy {proxy} falhou: {e}")
+            sucesso = False
+        self.registrar(proxy, sucesso, time.monotonic() - inicio, sondagem=True)
+        return sucesso
+
+    def sondar(self) -> List[str]:
+        """Testa em paralelo todos os proxies ativos; retorna os que passaram, do mais rápido ao mais lento."""
+        proxies = self.ativos()
+        aprovados = []
+        if proxies:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(proxies))) as executor:
+                aprovados = [p for p, ok in zip(proxies, executor.map(self._sondar_proxy, proxies)) if ok]
+        aprovados = [p for p in self.ativos() if p in aprovados]
+        logger.info(
+            f"Sondagem de proxies: {len(aprovados)} aprovados, "
+            f"{len(self.ativos())} de {len(self._proxies)} ativos."
+        )
+        return aprovados
+
+    def _laco_sondagem(self) -> None:
+        while not self._parar.wait(self.intervalo_sondagem):
+            self.sondar()
+
+    def iniciar(self) -> "PoolProxies":
+        """Faz a primeira sondagem e mantém as seguintes em uma thread de fundo."""
+        self.sondar()
+        self._parar.clear()
+        self._thread = threading.Thread(target=self._laco_sondagem, daemon=True)
+        self._thread.start()
+        return self
+
+    def parar(self) -> None:
+        self._parar.set()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self):
+        return self.iniciar()
+
+    def __exit__(self, *exc):
+        self.parar()
+
+    def escolher(self) -> Optional[str]:
+        """Sorteia um proxy ativo, favorecendo os rápidos e confiáveis; ``None`` se nenhum passou na sondagem."""
+        with self._trava:
+            candidatos = [
+                (p, e) for p, e in self._proxies.items() if not e.removido and e.aprovado is not False
+            ]
+            if not candidatos:
+                return None
+            pesos = [e.sucesso / (e.latencia or self.timeout) for _, e in candidatos]
+        if not any(pesos):
+            return None
+        return random.choices([p for p, _ in candidatos], weights=pesos)[0]
@@ -0,0 +1,143 @@
+"""Fábrica de sessões HTTP com pool dimensionado pela concorrência e estatísticas de reuso."""
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from utilitarios.controle_taxa import AdaptadorControlado, ControladorTaxa
+from utilitarios.disjuntor import Disjuntor
+from utilitarios.transporte_http2 import AdaptadorHTTP2, codificacoes_aceitas
+
+logger = logging.getLogger(__name__)
+
+LIMIAR_ESPERA = 0.01  # Abaixo disso (troca de GIL, checagem do socket) não conta como espera
+
+
+@dataclass
+class EstatisticasPool:
+    """Contadores de uso do pool de conexões de uma sessão."""
+
+    conexoes_obtidas: int = 0
+    conexoes_novas: int = 0
+    esperas: int = 0
+    tempo_espera: float = 0.0
+    espera_maxima: float = 0.0
+    _trava: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    @property
+    def reutilizacoes(self) -> int:
+        return self.conexoes_obtidas - self.conexoes_novas
+
+    @property
+    def taxa_reuso(self) -> float:
+        return self.reutilizacoes / self.conexoes_obtidas if self.conexoes_obtidas else 0.0
+
+    def registrar_nova(self) -> None:
+        with self._trava:
+            self.conexoes_novas += 1
+
+    def registrar_obtencao(self, espera: float) -> None:
+        with self._trava:
+            self.conexoes_obtidas += 1
+            if espera >= LIMIAR_ESPERA:
+                self.esperas += 1
+                self.tempo_espera += espera
+                self.espera_maxima = max(self.espera_maxima, espera)
+
+    def resumo(self) -> str:
+        return (
+            f"Pool: {self.conexoes_obtidas} usos, {self.conexoes_novas} conexões novas "
+            f"({self.taxa_reuso:.0%} de reuso), {self.esperas} esperas por conexão livre "
+            f"({self.tempo_espera:.2f}s no total, máx. {self.espera_maxima:.2f}s)."
+        )
+
+
+class _PoolInstrumentado:
+    """Mixin para os pools do urllib3 que alimenta ``EstatisticasPool``."""
+
+    estatisticas: EstatisticasPool
+
+    def _new_conn(self):
+        self.estatisticas.registrar_nova()
+        return super()._new_conn()
+
+    def _get_conn(self, timeout=None):
+        inicio = time.perf_counter()
+        conexao = super()._get_conn(timeout)
+        self.estatisticas.registrar_obtencao(time.perf_counter() - inicio)
+        return conexao
+
+
+def _instrumentar(adaptador: HTTPAdapter, estatisticas: EstatisticasPool) -> None:
+    """Troca as classes de pool do PoolManager do adapter pelas instrumentadas."""
+    gerenciador = adaptador.poolmanager
+    gerenciador.pool_classes_by_scheme = {
+        esquema: type(
+            f"{classe.__name__}Instrumentado",
+            (_PoolInstrumentado, classe),
+            {"estatisticas": estatisticas},
+        )
+        for esquema, classe in gerenciador.pool_classes_by_scheme.items()
+    }
+
+
+class SessaoHTTP(requests.Session):
+    """``requests.Session`` que guarda as estatísticas do pool e as registra ao fechar."""
+
+    def __init__(self):
+        super().__init__()
+        self.estatisticas = EstatisticasPool()
+
+    def close(self):
+        if self.estatisticas.conexoes_obtidas:
+            logger.info(self.estatisticas.resumo())
+        super().close()
+
+
+def criar_sessao_http(
+    concorrencia: int,
+    headers: Optional[Dict[str, str]] = None,
+    controlador: Optional[ControladorTaxa] = None,
+    max_retries: Union[Retry, int] = 0,
+    hosts: int = 10,
+    http2: bool = False,
+    disjuntor: Optional[Disjuntor] = None,
+) -> SessaoHTTP:
+    """Cria a sessão compartilhada por todas as fases (listagem e detalhes) de um script.
+
+    O pool guarda ``concorrencia`` conexões por host (o número de workers que
+    usam a sessão) e bloqueia quando todas estão ocupadas, em vez de abrir
+    conexões extras que seriam descartadas com "Connection pool is full".
+    ``hosts`` é quantos hosts distintos mantêm pool aberto. Com ``http2`` o
+    transporte é o ``AdaptadorHTTP2`` e as estatísticas do pool não se aplicam.
+    Um ``disjuntor`` recusa na hora requisições a domínios fora do ar.
+    """
+    sessao = SessaoHTTP()
+    sessao.headers.update(headers or {})
+    sessao.headers["Accept-Encoding"] = codificacoes_aceitas()
+
+    if http2:
+        adaptador = AdaptadorHTTP2(
+            controlador, max_conexoes=max(2, concorrencia // 10), disjuntor=disjuntor
+        )
+    else:
+        opcoes = dict(
+            pool_connections=hosts,
+            pool_maxsize=concorrencia,
+            pool_block=True,
+            max_retries=max_retries,
+        )
+        if controlador or disjuntor:
+            adaptador = AdaptadorControlado(controlador, disjuntor=disjuntor, **opcoes)
+        else:
+            adaptador = HTTPAdapter(**opcoes)
+        _instrumentar(adaptador, sessao.estatisticas)
+
+    sessao.mount("https://", adaptador)
+    sessao.mount("http://", adaptador)
+    return sessao
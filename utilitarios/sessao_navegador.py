@@ -0,0 +1,169 @@
+"""Passagem de sessão do navegador para o HTTP: o Chrome só atravessa os portões e o ``requests`` busca o resto."""
+import logging
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+import requests
+from requests.cookies import create_cookie
+from selenium.common.exceptions import WebDriverException
+
+from utilitarios.espera import aguardar_estabilidade
+from utilitarios.navegador import criar_chrome
+from utilitarios.sessao import SessaoHTTP, criar_sessao_http
+
+logger = logging.getLogger(__name__)
+
+STATUS_PORTAO = {401, 403}  # Sessão recusada: cookies expirados ou desafio anti-bot de novo
+
+# Identidade do navegador e tokens que as páginas publicam para requisições
+# próprias (CSRF em meta tags, no padrão Rails/Laravel/Spring)
+_IDENTIDADE = """
+const meta = (nome) => { const m = document.querySelector(`meta[name="${nome}"]`); return m ? m.content : null; };
+return {
+  userAgent: navigator.userAgent,
+  idiomas: Array.from(navigator.languages || []),
+  csrf: meta('csrf-token') || meta('csrf_token') || meta('_csrf') || meta('x-csrf-token'),
+  cabecalhoCsrf: meta('_csrf_header'),
+};
+"""
+
+
+@dataclass
+class EstadoNavegador:
+    """O que uma sessão HTTP precisa para seguir de onde o navegador parou."""
+
+    url: str
+    cookies: List[Dict[str, Any]] = field(default_factory=list)
+    headers: Dict[str, str] = field(default_factory=dict)
+
+
+def _accept_language(idiomas: List[str]) -> Optional[str]:
+    """``['pt-BR', 'pt', 'en']`` → ``pt-BR,pt;q=0.9,en;q=0.8``, como o Chrome envia."""
+    partes = [
+        idioma if i == 0 else f"{idioma};q={max(1 - i / 10, 0.1):.1f}"
+        for i, idioma in enumerate(idiomas)
+    ]
+    return ",".join(partes) or None
+
+
+def _cookies(driver) -> List[Dict[str, Any]]:
+    """Todos os cookies do navegador pelo DevTools (inclusive de outros domínios); sem ele, os da página atual."""
+    try:
+        return [
+            {
+                "name": c["name"],
+                "value": c["value"],
+                "domain": c.get("domain"),
+                "path": c.get("path", "/"),
+                "secure": c.get("secure", False),
+                "httpOnly": c.get("httpOnly", False),
+                "expiry": int(c["expires"]) if c.get("expires", -1) > 0 else None,
+            }
+            for c in driver.execute_cdp_cmd("Network.getAllCookies", {})["cookies"]
+        ]
+    except (AttributeError, WebDriverException):
+        return driver.get_cookies()
+
+
+def exportar_estado(driver) -> EstadoNavegador:
+    """Cookies, User-Agent, idiomas, ``Referer`` e token CSRF da página aberta no navegador."""
+    identidade = driver.execute_script(_IDENTIDADE)
+    url = driver.current_url
+    headers = {"User-Agent": identidade["userAgent"], "Referer": url}
+    idiomas = _accept_language(identidade["idiomas"])
+    if idiomas:
+        headers["Accept-Language"] = idiomas
+    if identidade["csrf"]:
+        headers[identidade["cabecalhoCsrf"] or "X-CSRF-Token"] = identidade["csrf"]
+    return EstadoNavegador(url, _cookies(driver), headers)
+
+
+def aplicar_estado(sessao: requests.Session, estado: EstadoNavegador) -> None:
+    """Copia cookies (com domínio, caminho e validade) e headers do navegador para ``sessao``."""
+    sessao.headers.update(estado.headers)
+    for cookie in estado.cookies:
+        sessao.cookies.set_cookie(
+            create_cookie(
+                cookie["name"],
+                cookie["value"],
+                domain=cookie.get("domain") or "",
+                path=cookie.get("path") or "/",
+                secure=bool(cookie.get("secure")),
+                expires=cookie.get("expiry"),
+                rest={"HttpOnly": None} if cookie.get("httpOnly") else {},
+            )
+        )
+
+
+class PortaoNavegador:
+    """Abre o site no navegador só para passar os portões e entrega a sessão a um pool HTTP.
+
+    ``abrir`` carrega ``url`` no Chrome, espera a página se estabilizar (os
+    desafios anti-bot terminam com um redirecionamento ou uma nova página),
+    executa ``preparar(driver)`` (aceitar cookies, escolher a cidade), copia
+    cookies e headers para a sessão do ``criar_sessao_http`` e fecha o
+    navegador. Retorna o HTML da página, que já pode ser processado.
+
+    ``get`` busca pela sessão; se o site responder com um status de
+    ``STATUS_PORTAO``, o navegador é reaberto uma única vez (mesmo com várias
+    threads esbarrando no portão ao mesmo tempo) e a requisição é repetida
+    com os cookies novos.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        concorrencia: int,
+        fabrica: Callable[[], Any] = criar_chrome,
+        preparar: Optional[Callable[[Any], None]] = None,
+        tempo_maximo: float = 30.0,
+        **opcoes_sessao,
+    ):
+        self.url = url
+        self.fabrica = fabrica
+        self.preparar = preparar
+        self.tempo_maximo = tempo_maximo
+        self.sessao: SessaoHTTP = criar_sessao_http(concorrencia, **opcoes_sessao)
+        self.aberturas = 0
+        self._trava = threading.Lock()
+
+    def __enter__(self) -> "PortaoNavegador":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.fechar()
+
+    def abrir(self) -> str:
+        """Passa pelos portões no navegador e transfere o estado para a sessão; retorna o HTML da página."""
+        driver = self.fabrica()
+        try:
+            driver.get(self.url)
+            aguardar_estabilidade(driver, tempo_maximo=self.tempo_maximo)
+            if self.preparar:
+                self.preparar(driver)
+            estado = exportar_estado(driver)
+            aplicar_estado(self.sessao, estado)
+            html = driver.page_source
+        finally:
+            driver.quit()
+        self.aberturas += 1
+        logger.info(f"Sessão do navegador transferida: {len(estado.cookies)} cookies de {estado.url}.")
+        return html
+
+    def _renovar(self, abertura_vista: int) -> None:
+        with self._trava:
+            if self.aberturas == abertura_vista:  # Outra thread já renovou
+                logger.warning("Sessão recusada pelo site: reabrindo o navegador.")
+                self.abrir()
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        abertura_vista = self.aberturas
+        resposta = self.sessao.get(url, **kwargs)
+        if resposta.status_code in STATUS_PORTAO:
+            self._renovar(abertura_vista)
+            resposta = self.sessao.get(url, **kwargs)
+        return resposta
+
+    def fechar(self) -> None:
+        self.sessao.close()
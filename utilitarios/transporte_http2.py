@@ -0,0 +1,203 @@
+"""Transporte HTTP/2 (httpx) para sessões ``requests`` e negociação de compressão."""
+import io
+import logging
+import os
+import ssl
+import threading
+import time
+from datetime import timedelta
+from typing import Dict, Optional, Tuple
+
+import httpx
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import DEFAULT_CA_BUNDLE_PATH, get_encoding_from_headers, select_proxy
+from urllib3.util.request import ACCEPT_ENCODING
+
+from utilitarios.controle_taxa import ControladorTaxa
+from utilitarios.disjuntor import Disjuntor
+
+logger = logging.getLogger(__name__)
+
+
+def _modulo_disponivel(nome: str) -> bool:
+    try:
+        __import__(nome)
+    except ImportError:
+        return False
+    return True
+
+
+def codificacoes_aceitas() -> str:
+    """Valor de ``Accept-Encoding`` com o melhor que o ambiente sabe decodificar.
+
+    Usa só as codificações que urllib3 *e* httpx conseguem descomprimir aqui
+    (``br``/``zstd`` dependem de pacotes opcionais), para que o mesmo
+    cabeçalho sirva aos dois transportes.
+    """
+    urllib3_suporta = set(ACCEPT_ENCODING.split(","))
+    try:
+        from httpx._decoders import SUPPORTED_DECODERS
+
+        httpx_suporta = set(SUPPORTED_DECODERS)
+    except ImportError:
+        httpx_suporta = {"gzip", "deflate"}
+    preferencia = ["zstd", "br", "gzip", "deflate"]
+    return ", ".join(c for c in preferencia if c in urllib3_suporta & httpx_suporta)
+
+
+def http2_disponivel() -> bool:
+    """Indica se o pacote ``h2`` (exigido pelo httpx para HTTP/2) está instalado."""
+    return _modulo_disponivel("h2")
+
+
+def _contexto_ssl(verify, cert) -> ssl.SSLContext:
+    """``verify``/``cert`` do requests (bool ou caminho do bundle; arquivo ou par certificado/chave)."""
+    if verify is False:
+        contexto = ssl.create_default_context()
+        contexto.check_hostname = False
+        contexto.verify_mode = ssl.CERT_NONE
+    else:
+        bundle = DEFAULT_CA_BUNDLE_PATH if verify is True else verify
+        if os.path.isdir(bundle):
+            contexto = ssl.create_default_context(capath=bundle)
+        else:
+            contexto = ssl.create_default_context(cafile=bundle)
+    if cert:
+        if isinstance(cert, tuple):
+            contexto.load_cert_chain(*cert)
+        else:
+            contexto.load_cert_chain(cert)
+    return contexto
+
+
+def _timeout_httpx(timeout) -> httpx.Timeout:
+    """Converte o timeout do requests (número ou tupla conexão/leitura)."""
+    if isinstance(timeout, tuple):
+        conexao, leitura = timeout
+        return httpx.Timeout(leitura, connect=conexao)
+    return httpx.Timeout(timeout)
+
+
+class AdaptadorHTTP2(BaseAdapter):
+    """Adapter do ``requests`` que envia as requisições por um ``httpx.Client``.
+
+    Com HTTP/2 as páginas de um domínio são multiplexadas em poucas conexões
+    em vez de uma conexão TCP+TLS por vaga do pool. Redirecionamentos
+    continuam com a sessão; cookies de resposta ficam no cliente httpx.
+    Exceções do httpx viram as equivalentes do ``requests``, então os
+    ``except requests.exceptions...`` dos scripts seguem funcionando.
+
+    ``proxies``, ``verify`` e ``cert`` vêm da sessão como no adapter padrão;
+    o httpx fixa proxy e TLS no cliente, então há um ``httpx.Client`` por
+    combinação usada (na prática, um só).
+    """
+
+    def __init__(
+        self,
+        controlador: Optional[ControladorTaxa] = None,
+        max_conexoes: int = 10,
+        http2: bool = True,
+        disjuntor: Optional[Disjuntor] = None,
+    ):
+        super().__init__()
+        if http2 and not http2_disponivel():
+            logger.warning("Pacote 'h2' ausente: usando HTTP/1.1 no AdaptadorHTTP2.")
+            http2 = False
+        self.controlador = controlador
+        self.disjuntor = disjuntor
+        self.http2 = http2
+        self.max_conexoes = max_conexoes
+        self._clientes: Dict[Tuple, httpx.Client] = {}
+        self._trava = threading.Lock()
+
+    def cliente(self, proxy: Optional[str] = None, verify=True, cert=None) -> httpx.Client:
+        """Cliente httpx para a combinação de proxy e TLS, criado no primeiro uso."""
+        chave = (proxy, verify, cert)
+        with self._trava:
+            cliente = self._clientes.get(chave)
+            if cliente is None:
+                cliente = self._clientes[chave] = httpx.Client(
+                    http2=self.http2,
+                    limits=httpx.Limits(
+                        max_connections=self.max_conexoes, max_keepalive_connections=self.max_conexoes
+                    ),
+                    follow_redirects=False,
+                    proxy=proxy,
+                    verify=_contexto_ssl(verify, cert),
+                    trust_env=False,  # Proxies do ambiente já chegam resolvidos pela sessão
+                )
+            return cliente
+
+    def _enviar(self, request, timeout, verify=True, cert=None, proxies=None) -> httpx.Response:
+        try:
+            cliente = self.cliente(select_proxy(request.url, proxies or {}), verify, cert)
+        except OSError as e:  # Bundle ou certificado cliente ilegível (ssl.SSLError inclusive)
+            raise requests.exceptions.SSLError(e, request=request)
+        try:
+            return cliente.request(
+                request.method,
+                request.url,
+                headers=dict(request.headers),
+                content=request.body,
+                timeout=_timeout_httpx(timeout),
+            )
+        except httpx.ConnectTimeout as e:
+            raise requests.exceptions.ConnectTimeout(e, request=request)
+        except httpx.TimeoutException as e:
+            raise requests.exceptions.ReadTimeout(e, request=request)
+        except httpx.ProxyError as e:
+            raise requests.exceptions.ProxyError(e, request=request)
+        except (httpx.InvalidURL, httpx.UnsupportedProtocol) as e:
+            raise requests.exceptions.InvalidURL(e, request=request)
+        except httpx.TransportError as e:
+            raise requests.exceptions.ConnectionError(e, request=request)
+
+    def _montar_resposta(self, request, resposta_httpx: httpx.Response) -> requests.Response:
+        """Converte a resposta do httpx (já descomprimida) em ``requests.Response``."""
+        resposta = requests.Response()
+        resposta.status_code = resposta_httpx.status_code
+        resposta.headers = CaseInsensitiveDict(dict(resposta_httpx.headers))
+        resposta.encoding = get_encoding_from_headers(resposta.headers)
+        resposta.reason = resposta_httpx.reason_phrase
+        resposta.url = request.url
+        resposta.request = request
+        resposta.connection = self
+        resposta._content = resposta_httpx.content
+        resposta._content_consumed = True
+        resposta.raw = io.BytesIO(resposta._content)
+        return resposta
+
+    def _registrar(self, url: str, status: Optional[int], latencia: float, retry_after=None):
+        if self.controlador:
+            self.controlador.registrar(url, status, latencia, retry_after)
+        if self.disjuntor:
+            self.disjuntor.registrar(url, status)
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        if self.disjuntor:
+            self.disjuntor.verificar(request.url)
+        if self.controlador:
+            self.controlador.aguardar(request.url)
+        inicio = time.monotonic()
+        try:
+            resposta_httpx = self._enviar(request, timeout, verify, cert, proxies)
+        except requests.exceptions.RequestException:
+            self._registrar(request.url, None, time.monotonic() - inicio)
+            raise
+        self._registrar(
+            request.url,
+            resposta_httpx.status_code,
+            time.monotonic() - inicio,
+            resposta_httpx.headers.get("Retry-After"),
+        )
+        resposta = self._montar_resposta(request, resposta_httpx)
+        resposta.elapsed = timedelta(seconds=time.monotonic() - inicio)
+        return resposta
+
+    def close(self):
+        with self._trava:
+            clientes, self._clientes = list(self._clientes.values()), {}
+        for cliente in clientes:
+            cliente.close()